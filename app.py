@@ -1,30 +1,44 @@
 import os
-from random import randint
 from flask_cors import CORS,cross_origin
 
 
-from sqlmodel import SQLModel, Session, select
+from sqlmodel import Session, select
 
+import db_audit
 import db_models
+import db_schema
+import db_seed
 from db import engine
+from db_queries import select_monuments
 
 from geodetic_monument_finder import create_app
-from geodetic_monument_finder.monuments import monuments
+from geodetic_monument_finder.cache.cache import cache
+from geodetic_monument_finder.monuments import bundle, monuments, name_index, spatial_index
 
 
 from geodetic_monument_finder.models.network_response import NetworkResponse, NetworkingStatus, HttpStatusCode
-from geodetic_monument_finder.reports import reports
-from raw_database import DATABASE
+from geodetic_monument_finder.reports import intake, open_reports, reports
+from geodetic_monument_finder.sync import sync
 
 app = create_app()
 CORS(app)
 
 # Create Database Tables
-SQLModel.metadata.create_all(engine)
+db_schema.create_all(engine)
+# Write reports queued by workers that exited before committing them
+intake.intake.recover()
 
 
 app.register_blueprint(reports.bp)
 app.register_blueprint(monuments.bp)
+app.register_blueprint(sync.bp)
+
+# Build the per-worker nearest-monument, name and open-report indexes up front
+spatial_index.index.warm()
+name_index.index.warm()
+open_reports.index.warm()
+# Bring the offline bundle up to date in the background
+bundle.builder.schedule()
 
 
 
@@ -51,70 +65,14 @@ def hello():
 
 @app.route("/populate", methods=["GET"])
 def populate():
-
-    conditions = ["MISSING", "DAMAGED", "GOOD"]
-    monument_images = ["https://th.bing.com/th/id/OIP.kRTSB1eMfyt_kT-yrLLnCgHaJ4?w=675&h=900&rs=1&pid=ImgDetMain", "https://th.bing.com/th/id/OIP.IA8Uu-qkntysI3BLoSPYtQAAAA?w=320&h=240&rs=1&pid=ImgDetMain","https://th.bing.com/th/id/R.a6b88261342c63fee812ac7b39a1c2b9?rik=pJb7bkWdtn2I4g&riu=http%3a%2f%2fphotos1.blogger.com%2fblogger%2f4606%2f983%2f1024%2fPA290003.jpg&ehk=hO5MuiFIS6Yam1oh993MrmeS%2faFcvMbHROjBAhl2DS8%3d&risl=&pid=ImgRaw&r=0", "https://th.bing.com/th/id/R.cd15bb4544dfebe21828bc5ab8e395c8?rik=Wx3gGMDGXQ%2fzPQ&riu=http%3a%2f%2fwww.alexkershaw.com.au%2fimages%2ffullsize%2fGeodetic07_big.jpg&ehk=0H9J5TCuO7o%2bZ%2ba5P7lw%2bnVosP6kjswRLM%2bp6M2jUFM%3d&risl=&pid=ImgRaw&r=0", "https://thumbs.dreamstime.com/b/survey-mark-found-ground-detail-marker-also-called-monument-geodetic-74245078.jpg", "https://s0.geograph.org.uk/geophotos/03/55/05/3550547_407fea12.jpg"]
-
-
-
-    for database in DATABASE:
-        print(f"Adding {database['MONUNUM']} to Database")
-        with Session(engine) as session:
-            gauss = db_models.GaussPoints(
-                gauss_lo=database["GAUSS_LO"],
-                gauss_x=database["GAUSS_X"],
-                gauss_y=database["GAUSS_Y"]
-            )
-            session.add(gauss)
-            session.commit()
-
-            wgs84 = db_models.WGS84Points(
-                wgs84_lat=database["LAT_WGS84"],
-                wgs84_lon=database["LON_WGS84"]
-            )
-            session.add(wgs84)
-            session.commit()
-
-            utm = db_models.UTMPoints(
-                utm_cm=database["UTM_CM"],
-                utm_north=database["UTM_N"],
-                utm_east=database["UTM_E"]
-            )
-            session.add(utm)
-            session.commit()
-
-            delta = db_models.DeltaPoints(
-                delta_lat = database["DELTA_LAT"],
-                delta_lon = database["DELTA_LON"],
-                delta_x=database["DELTA_X"],
-                delta_y=database["DELTA_Y"],
-                delta_e=database["DELTA_E"],
-                delta_n=database["DELTA_N"]
-
-            )
-            session.add(delta)
-            session.commit()
-
-            index = randint(0, 2)
-            image_index = randint(0, len(monument_images) - 1)
-
-            monument = db_models.Monuments(
-                monument_name=database["MONUNUM"],
-                topo=database["TOPO"],
-                condition = conditions[index],
-                monument_image=monument_images[image_index],
-                gauss_id=gauss.id,
-                wgs84_id=wgs84.id,
-                utm_id=utm.id,
-                delta_id=delta.id
-
-            )
-            session.add(monument)
-            session.commit()
-        print(f"Added to Database")
-    print("Database Populated")
+    added = db_seed.populate(db_seed.read_seed_records())
+    print(f"Database Populated with {added} monuments")
+    spatial_index.index.reset()
+    name_index.index.reset()
+    cache.invalidate("monuments")
+    bundle.builder.schedule()
     with Session(engine) as session:
-        statement = select(db_models.Monuments)
+        statement = select_monuments()
         result = session.exec(statement).all()
         return NetworkResponse(
             status=NetworkingStatus.SUCCESS.value,
@@ -125,8 +83,17 @@ def populate():
         ).to_json(), HttpStatusCode.OK.value,
 
 
+@app.cli.command("populate")
+def populate_command():
+    """Bulk load the seed monument records into the database."""
+    added = db_seed.populate(db_seed.read_seed_records())
+    print(f"Database Populated with {added} monuments")
+
 
-    return "Populating Database"
+@app.cli.command("audit-indexes")
+def audit_indexes_command():
+    """EXPLAIN every endpoint query and fail on unindexed full table scans."""
+    raise SystemExit(db_audit.main(app))
 
 
 
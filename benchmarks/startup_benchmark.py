@@ -0,0 +1,39 @@
+"""Measure gunicorn-worker style startup: importing app in a fresh interpreter.
+
+Reports the median wall time of `import app` and the peak RSS of the process
+across several runs. Run from the repository root:
+
+    python benchmarks/startup_benchmark.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+PROBE = """
+import resource, time
+start = time.perf_counter()
+import app
+elapsed = time.perf_counter() - start
+print(elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+
+def measure(runs):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=root)
+    timings, peaks = [], []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE], cwd=root, env=env, check=True,
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+        ).stdout.split()
+        timings.append(float(output[-2]))
+        peaks.append(int(output[-1]))
+    return statistics.median(timings), statistics.median(peaks)
+
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    seconds, max_rss_kb = measure(runs)
+    print(f"import app: {seconds * 1000:.0f} ms, peak RSS: {max_rss_kb / 1024:.1f} MiB (median of {runs})")
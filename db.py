@@ -1,3 +1,5 @@
+from flask import g, has_request_context
+from sqlalchemy import event
 from sqlmodel import create_engine
 
 # MySQL Credentials
@@ -17,3 +19,14 @@ sqlite_url = f"sqlite:///{sqlite_file_name}"
 
 # Database engine
 engine = create_engine(sqlite_url, echo=True)
+
+
+# Per-request query counter, exposed as the X-Query-Count response header
+@event.listens_for(engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    if has_request_context():
+        g.query_count = g.get("query_count", 0) + 1
+
+
+def get_query_count():
+    return g.get("query_count", 0) if has_request_context() else 0
@@ -0,0 +1,161 @@
+"""EXPLAIN QUERY PLAN audit of the statements every endpoint issues.
+
+Each request in AUDITED_REQUESTS is sent through the Flask test client
+against a scratch copy of the database. Every statement it executes is
+captured and explained. A plan step that reads a whole table without an
+index fails the audit, unless the request lists that table in its allowed
+scans with a reason. A request that fails with a 5xx also fails the audit.
+
+    flask --app app audit-indexes
+"""
+import contextlib
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sqlalchemy import event
+
+from db import engine, sqlite_file_name
+from geodetic_monument_finder.monuments.bundle import builder
+from geodetic_monument_finder.pagination.cursor import encode_cursor
+from geodetic_monument_finder.reports.intake import intake
+
+
+@dataclass
+class AuditedRequest:
+    method: str
+    url: str
+    json: Optional[dict] = None
+    # table name -> why a full scan is acceptable for this request
+    allowed_scans: Dict[str, str] = field(default_factory=dict)
+
+
+AUDITED_REQUESTS = [
+    AuditedRequest("GET", "/", allowed_scans={"test2": "demo endpoint returns the whole table"}),
+    AuditedRequest("GET", "/monuments?page=3&per_page=10", allowed_scans={
+        "monument_view": "offset paging walks the rowid b-tree in order and stops at the limit",
+    }),
+    AuditedRequest("GET", f"/monuments?per_page=10&cursor={encode_cursor('monuments', 100)}"),
+    AuditedRequest("GET", "/monuments?per_page=10&condition=GOOD"),
+    AuditedRequest("GET", "/monuments?per_page=10&condition=GOOD&fields=id,monument_name,wgs84points"),
+    AuditedRequest("GET", "/monuments/nearest?lat=-17.83&lon=31.05&k=10"),
+    AuditedRequest("GET", "/monuments/bbox?min_lat=-17.9&min_lon=31.0&max_lat=-17.8&max_lon=31.1"),
+    AuditedRequest("GET", "/monuments/autocomplete?q=tsm"),
+    AuditedRequest("POST", "/monuments/search", json={"monument_name": "tsm85"}),
+    AuditedRequest("POST", "/monuments/search", json={"monument_name": "P1"}, allowed_scans={
+        "monument_view": "queries shorter than a trigram fall back to LIKE",
+    }),
+    AuditedRequest("GET", "/monuments/export?format=ndjson", allowed_scans={
+        "monument_view": "a full export reads every row",
+    }),
+    AuditedRequest("GET", "/monuments/export?format=csv", allowed_scans={
+        "monument_view": "a full export reads every row",
+    }),
+    AuditedRequest("PUT", "/monuments/condition/1", json={"condition": "GOOD"}),
+    AuditedRequest("GET", "/reports/?page=1&per_page=10"),
+    AuditedRequest("GET", "/reports/?per_page=10&monument_map=1"),
+    AuditedRequest("GET", f"/reports/?per_page=10&cursor={encode_cursor('reports', 0, 1)}"),
+    AuditedRequest("GET", f"/reports/?per_page=10&cursor={encode_cursor('reports', 0, 1)}"
+                          "&fields=id,condition,monument.monument_name"),
+    AuditedRequest("POST", "/reports/search", json={"monument_name": "tsm"}),
+    AuditedRequest("POST", f"/reports/search?per_page=5&cursor={encode_cursor('reports', 0, 1)}",
+                   json={"monument_name": "tsm85"}),
+    AuditedRequest("POST", "/reports/search", json={"monument_name": "P1"}, allowed_scans={
+        "monument_view": "queries shorter than a trigram fall back to LIKE",
+    }),
+    AuditedRequest("GET", "/reports/summary?per_page=20"),
+    AuditedRequest("GET", "/reports/summary?page=1&per_page=20&sort=last_reported_at&order=asc"),
+    AuditedRequest("GET", "/sync?since=1"),
+    AuditedRequest("POST", "/reports", json={"monument_id": 1, "condition": "MISSING"}),
+    AuditedRequest("PUT", "/reports/resolve", json={"monument_id": 1, "condition": "GOOD"}),
+    AuditedRequest("PUT", "/reports/resolve/bulk", json={"monument_ids": [2, 3], "condition": "GOOD"}),
+]
+
+
+@dataclass
+class Finding:
+    request: str
+    statement: str
+    detail: str
+
+
+def _full_scan_table(detail):
+    """Table name if this plan step reads a whole table without an index."""
+    if not detail.startswith("SCAN ") or "VIRTUAL TABLE" in detail or " USING " in detail:
+        return None
+    if detail.startswith("SCAN CONSTANT ROW"):
+        return None
+    return detail.split()[1]
+
+
+@contextlib.contextmanager
+def _scratch_database():
+    # Redirect every new pooled connection to a throwaway copy so the write
+    # endpoints can run for real without touching the live database.
+    with tempfile.TemporaryDirectory() as scratch_dir:
+        scratch_file = os.path.join(scratch_dir, os.path.basename(sqlite_file_name))
+        shutil.copy(sqlite_file_name, scratch_file)
+
+        def connect_to_scratch(dialect, connection_record, cargs, cparams):
+            cargs[0] = scratch_file
+
+        engine.dispose()
+        event.listen(engine, "do_connect", connect_to_scratch)
+        echo, engine.echo = engine.echo, False
+        # The bundle would otherwise be rebuilt from the scratch copy
+        enabled, builder.enabled = builder.enabled, False
+        try:
+            yield
+        finally:
+            builder.enabled = enabled
+            engine.echo = echo
+            event.remove(engine, "do_connect", connect_to_scratch)
+            engine.dispose()
+
+
+def audit(app, requests=AUDITED_REQUESTS):
+    """Run every request and return the unexpected full scans as Findings."""
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            captured.append((statement, parameters))
+
+    findings: List[Finding] = []
+    with _scratch_database():
+        client = app.test_client()
+        event.listen(engine, "before_cursor_execute", capture)
+        try:
+            for audited in requests:
+                captured.clear()
+                response = client.open(audited.url, method=audited.method, json=audited.json)
+                response.get_data()  # streamed responses only query while being read
+                intake.flush()  # queued report writes belong to this request
+                statements = list(captured)
+                label = f"{audited.method} {audited.url}"
+                if response.status_code >= 500:
+                    # A failing endpoint may have skipped the queries we meant to check
+                    findings.append(Finding(label, "", f"request failed with HTTP {response.status_code}"))
+
+                with engine.connect() as connection:
+                    for statement, parameters in statements:
+                        if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "INSERT")):
+                            continue
+                        plan = connection.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters).all()
+                        for row in plan:
+                            table = _full_scan_table(row[3])
+                            if table is not None and table not in audited.allowed_scans:
+                                findings.append(Finding(label, " ".join(statement.split()), row[3]))
+        finally:
+            event.remove(engine, "before_cursor_execute", capture)
+    return findings
+
+
+def main(app):
+    findings = audit(app)
+    for finding in findings:
+        print(f"{finding.request}: {finding.detail}\n    {finding.statement}")
+    print(f"Audited {len(AUDITED_REQUESTS)} requests: {len(findings)} problems")
+    return 1 if findings else 0
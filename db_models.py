@@ -1,19 +1,70 @@
 import datetime
 import json
+import operator
+from sqlalchemy import Index, text
 from sqlmodel import Field, Relationship, SQLModel
 from typing import Optional, List
 
 
+class _Fields:
+    """Precompiled reader for two or more column attributes.
+
+    Loaded values are read straight from the instance ``__dict__``, skipping
+    SQLAlchemy's attribute instrumentation; expired or unloaded attributes
+    fall back to normal attribute access so they still load.
+    """
+
+    def __init__(self, *names):
+        self.names = names
+        self._from_state = operator.itemgetter(*names)
+        self._from_attributes = operator.attrgetter(*names)
+
+    def values(self, instance):
+        try:
+            return self._from_state(instance.__dict__)
+        except KeyError:
+            return self._from_attributes(instance)
+
+    def to_dict(self, instance):
+        return dict(zip(self.names, self.values(instance)))
+
+
+MONUMENT_FIELDS = _Fields("id", "monument_name", "topo", "condition", "monument_image",
+                          "gauss_id", "wgs84_id", "utm_id", "delta_id")
+REPORT_FIELDS = _Fields("id", "monument_id", "condition", "is_resolved", "report_count")
+REPORT_SUMMARY_FIELDS = _Fields("monument_id", "open_missing", "open_damaged", "total", "last_reported_at")
+GAUSS_FIELDS = _Fields("id", "gauss_lo", "gauss_x", "gauss_y")
+WGS84_FIELDS = _Fields("id", "wgs84_lat", "wgs84_lon")
+UTM_FIELDS = _Fields("id", "utm_cm", "utm_north", "utm_east")
+DELTA_FIELDS = _Fields("id", "delta_lat", "delta_lon", "delta_x", "delta_y", "delta_e", "delta_n")
+
+# (point table, monument foreign key column, point columns): monument_view
+# copies the point columns inline and to_json nests them back under the
+# table name, with the foreign key as the point's id.
+MONUMENT_VIEW_POINTS = (
+    ("gausspoints", "gauss_id", ("gauss_lo", "gauss_x", "gauss_y")),
+    ("wgs84points", "wgs84_id", ("wgs84_lat", "wgs84_lon")),
+    ("utmpoints", "utm_id", ("utm_cm", "utm_north", "utm_east")),
+    ("deltapoints", "delta_id", ("delta_lat", "delta_lon", "delta_x", "delta_y", "delta_e", "delta_n")),
+)
+_MONUMENT_VIEW_POINT_FIELDS = tuple(
+    (point_table, foreign_key, _Fields(*columns)) for point_table, foreign_key, columns in MONUMENT_VIEW_POINTS
+)
+
+
 class Monuments(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    monument_name: str
+    monument_name: str = Field(index=True)
     topo: str
-    condition: str
+    condition: str = Field(index=True)
     monument_image: str
-    gauss_id: int = Field(foreign_key="gausspoints.id")
-    wgs84_id: int = Field(foreign_key="wgs84points.id")
-    utm_id: int = Field(foreign_key="utmpoints.id")
-    delta_id: int = Field(foreign_key="deltapoints.id")
+    gauss_id: int = Field(foreign_key="gausspoints.id", index=True)
+    wgs84_id: int = Field(foreign_key="wgs84points.id", index=True)
+    utm_id: int = Field(foreign_key="utmpoints.id", index=True)
+    delta_id: int = Field(foreign_key="deltapoints.id", index=True)
+    # Dataset version of the last change, stamped by triggers (see db_schema)
+    version: int = Field(default=0, index=True, sa_column_kwargs={"server_default": "0"})
+    updated_at: Optional[datetime.datetime] = None
 
     # Relationships
     reports: List["Reports"] = Relationship(back_populates="monument")
@@ -42,50 +93,52 @@ class Monuments(SQLModel, table=True):
         return cls(**json_dict)
 
     def to_json(self):
-        return {
-            "id": self.id,
-            "monument_name": self.monument_name,
-            "topo": self.topo,
-            "condition": self.condition,
-            "monument_image": self.monument_image,
-            "gauss_id": self.gauss_id,
-            "wgs84_id": self.wgs84_id,
-            "utm_id": self.utm_id,
-            "delta_id": self.delta_id,
-
-            # onjects
-            "gausspoints": self.gausspoints.to_json(),
-            "wgs84points": self.wgs84points.to_json(),
-            "utmpoints": self.utmpoints.to_json(),
-            "deltapoints": self.deltapoints.to_json()
-
-        }
+        monument = MONUMENT_FIELDS.to_dict(self)
+        monument["gausspoints"] = self.gausspoints.to_json()
+        monument["wgs84points"] = self.wgs84points.to_json()
+        monument["utmpoints"] = self.utmpoints.to_json()
+        monument["deltapoints"] = self.deltapoints.to_json()
+        return monument
 
 
 class Reports(SQLModel, table=True):
+    __table_args__ = (
+        # Listings page through reports ordered by (is_resolved, id)
+        Index("ix_reports_is_resolved_id", "is_resolved", "id"),
+        # Per-monument lookups, usually restricted to open reports
+        Index("ix_reports_monument_id_is_resolved", "monument_id", "is_resolved"),
+        # At most one open report per monument and condition; repeats bump
+        # its report_count instead
+        Index("ix_reports_open_monument_id_condition", "monument_id", "condition",
+              unique=True, sqlite_where=text("is_resolved = 0")),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     monument_id: int = Field(foreign_key="monuments.id")
     condition: str
     is_resolved: bool = Field(default=False)
+    report_count: int = Field(default=1, sa_column_kwargs={"server_default": "1"})
+    version: int = Field(default=0, index=True, sa_column_kwargs={"server_default": "0"})
+    updated_at: Optional[datetime.datetime] = None
 
     # Relationships
     monument: Optional["Monuments"] = Relationship(back_populates="reports")
+    monument_view: Optional["MonumentView"] = Relationship(sa_relationship_kwargs={
+        "primaryjoin": "foreign(Reports.monument_id) == MonumentView.id",
+        "viewonly": True,
+    })
 
 
     def to_json(self):
-        return {
-            "id": self.id,
-            "monument_id": self.monument_id,
-            "condition": self.condition,
-            "is_resolved" : self.is_resolved,
-            "monument": self.monument.to_json()
-        }
+        report = REPORT_FIELDS.to_dict(self)
+        report["monument"] = self.monument_view.to_json()
+        return report
 
 class GaussPoints(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    gauss_lo: str
-    gauss_x: str
-    gauss_y: str
+    gauss_lo: float
+    gauss_x: float
+    gauss_y: float
 
     # Relationships
     monuments: List["Monuments"] = Relationship(back_populates="gausspoints")
@@ -96,18 +149,13 @@ class GaussPoints(SQLModel, table=True):
         return cls(**json_dict)
 
     def to_json(self):
-        return {
-            "id": self.id,
-            "gauss_lo": self.gauss_lo,
-            "gauss_x": self.gauss_x,
-            "gauss_y": self.gauss_y
-        }
+        return GAUSS_FIELDS.to_dict(self)
 
 
 class WGS84Points(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    wgs84_lat: str
-    wgs84_lon: str
+    wgs84_lat: float = Field(index=True)
+    wgs84_lon: float = Field(index=True)
 
     # Relationships
     monuments: List["Monuments"] = Relationship(back_populates="wgs84points")
@@ -118,18 +166,14 @@ class WGS84Points(SQLModel, table=True):
         return cls(**json_dict)
 
     def to_json(self):
-        return {
-            "id": self.id,
-            "wgs84_lat": self.wgs84_lat,
-            "wgs84_lon": self.wgs84_lon
-        }
+        return WGS84_FIELDS.to_dict(self)
 
 
 class UTMPoints(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    utm_cm: str
-    utm_north: str
-    utm_east: str
+    utm_cm: float
+    utm_north: float = Field(index=True)
+    utm_east: float = Field(index=True)
 
     # Relationships
     monuments: List["Monuments"] = Relationship(back_populates="utmpoints")
@@ -140,22 +184,17 @@ class UTMPoints(SQLModel, table=True):
         return cls(**json_dict)
 
     def to_json(self):
-        return {
-            "id": self.id,
-            "utm_cm": self.utm_cm,
-            "utm_north": self.utm_north,
-            "utm_east": self.utm_east
-        }
+        return UTM_FIELDS.to_dict(self)
 
 
 class DeltaPoints(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
-    delta_lat: str
-    delta_lon: str
-    delta_x: str
-    delta_y: str
-    delta_e: str
-    delta_n: str
+    delta_lat: Optional[float] = None
+    delta_lon: Optional[float] = None
+    delta_x: Optional[float] = None
+    delta_y: Optional[float] = None
+    delta_e: Optional[float] = None
+    delta_n: Optional[float] = None
 
     # Relationships
     monuments: List["Monuments"] = Relationship(back_populates="deltapoints")
@@ -166,15 +205,97 @@ class DeltaPoints(SQLModel, table=True):
         return cls(**json_dict)
 
     def to_json(self):
-        return {
-            "id": self.id,
-            "delta_lat": self.delta_lat,
-            "delta_lon": self.delta_lon,
-            "delta_x": self.delta_x,
-            "delta_y": self.delta_y,
-            "delta_e": self.delta_e,
-            "delta_n": self.delta_n
-        }
+        return DELTA_FIELDS.to_dict(self)
+
+
+class MonumentView(SQLModel, table=True):
+    """Read-optimized copy of a monument with its coordinates inline.
+
+    One row per monument, maintained by triggers on monuments and the point
+    tables (see db_schema), so reads need no joins. ``to_json`` produces the
+    same nested shape as ``Monuments.to_json``.
+    """
+    __tablename__ = "monument_view"
+
+    id: int = Field(primary_key=True)
+    monument_name: str = Field(index=True)
+    topo: str
+    condition: str = Field(index=True)
+    monument_image: str
+    gauss_id: int = Field(index=True)
+    wgs84_id: int = Field(index=True)
+    utm_id: int = Field(index=True)
+    delta_id: int = Field(index=True)
+
+    gauss_lo: Optional[float] = None
+    gauss_x: Optional[float] = None
+    gauss_y: Optional[float] = None
+    wgs84_lat: Optional[float] = None
+    wgs84_lon: Optional[float] = None
+    utm_cm: Optional[float] = None
+    utm_north: Optional[float] = None
+    utm_east: Optional[float] = None
+    delta_lat: Optional[float] = None
+    delta_lon: Optional[float] = None
+    delta_x: Optional[float] = None
+    delta_y: Optional[float] = None
+    delta_e: Optional[float] = None
+    delta_n: Optional[float] = None
+
+    def to_json(self):
+        monument = MONUMENT_FIELDS.to_dict(self)
+        for point_table, foreign_key, fields in _MONUMENT_VIEW_POINT_FIELDS:
+            point = {"id": monument[foreign_key]}
+            point.update(zip(fields.names, fields.values(self)))
+            monument[point_table] = point
+        return monument
+
+
+class RowCounts(SQLModel, table=True):
+    # Maintained by triggers (see db_schema): "monuments", "reports" and
+    # "monuments.condition.<CONDITION>"
+    name: str = Field(primary_key=True)
+    count: int = Field(default=0)
+
+
+class DatasetVersion(SQLModel, table=True):
+    # The "dataset" row is bumped by triggers on every write to monuments,
+    # reports and the point tables; narrower rows track what the per-worker
+    # indexes hold (see db_schema)
+    name: str = Field(primary_key=True)
+    version: int = Field(default=0)
+    updated_at: datetime.datetime
+
+
+class ReportIntake(SQLModel, table=True):
+    # Provisional id handed out by POST /reports -> the report it became
+    intake_id: str = Field(primary_key=True)
+    report_id: int = Field(foreign_key="reports.id")
+
+
+class MonumentReportSummary(SQLModel, table=True):
+    """Report counts per monument, maintained by triggers on reports (see
+    db_schema). Counts are submissions, so a coalesced report contributes
+    its report_count; ``total`` includes resolved reports."""
+    __tablename__ = "monument_report_summary"
+
+    monument_id: int = Field(primary_key=True, foreign_key="monuments.id")
+    open_missing: int = Field(default=0, index=True)
+    open_damaged: int = Field(default=0, index=True)
+    total: int = Field(default=0, index=True)
+    last_reported_at: Optional[datetime.datetime] = Field(default=None, index=True)
+
+    def to_json(self):
+        return REPORT_SUMMARY_FIELDS.to_dict(self)
+
+
+class Tombstones(SQLModel, table=True):
+    # One row per deleted monument or report, so /sync can report deletions
+    id: Optional[int] = Field(default=None, primary_key=True)
+    table_name: str
+    row_id: int
+    version: int = Field(index=True)
+    deleted_at: datetime.datetime
 
 
 class Test(SQLModel, table=True):
@@ -0,0 +1,119 @@
+from sqlalchemy import func, literal_column
+from sqlalchemy.orm import selectinload
+from sqlmodel import col, select
+
+import db_models
+from db_schema import DATASET_VERSION, MONUMENT_CONDITION_COUNT, monuments_fts
+
+# The trigram tokenizer cannot match anything shorter than one trigram
+MIN_FTS_QUERY_LENGTH = 3
+
+
+def select_monuments(fields=None):
+    """Monuments read from the flattened monument_view: one row, no joins.
+
+    With a MonumentFields projection only its columns are selected.
+    """
+    if fields is not None:
+        return select(*fields.columns)
+    return select(db_models.MonumentView)
+
+
+def select_reports(fields=None):
+    """Reports, with their flattened monuments loaded by a second SELECT.
+
+    The second query fetches each distinct monument once by id, instead of
+    repeating the monument's columns on every report row of a join.
+
+    With a ReportFields projection only its columns are selected, and the
+    monument is joined only if one of its fields was asked for.
+    """
+    if fields is not None:
+        statement = select(*fields.columns).select_from(db_models.Reports)
+        if fields.monument is not None:
+            statement = statement.outerjoin(
+                db_models.MonumentView, db_models.MonumentView.id == db_models.Reports.monument_id)
+        return statement
+    return select(db_models.Reports).options(selectinload(db_models.Reports.monument_view))
+
+
+def _fts_phrase(query):
+    # Quote the whole query as one FTS5 string so operators and punctuation in
+    # user input are matched literally.
+    return '"' + query.replace('"', '""') + '"'
+
+
+def _fts_match(query, column=None):
+    # An FTS5 column filter ("monument_name : ...") limits the match to one column
+    expression = _fts_phrase(query) if column is None else f"{column} : {_fts_phrase(query)}"
+    return literal_column("monuments_fts").op("MATCH")(expression)
+
+
+def select_monuments_matching(query, fields=None):
+    """Monuments whose name or topo contains ``query``, best matches first."""
+    if len(query) < MIN_FTS_QUERY_LENGTH:
+        return select_monuments(fields).where(col(db_models.MonumentView.monument_name).contains(query)).order_by(
+            db_models.MonumentView.id.asc())
+
+    matches = select(monuments_fts.c.rowid, monuments_fts.c.rank).where(_fts_match(query)).subquery()
+    return select_monuments(fields).join(matches, matches.c.rowid == db_models.MonumentView.id).order_by(
+        matches.c.rank, db_models.MonumentView.id.asc())
+
+
+def select_monument_ids_named(query):
+    """ids of monuments whose name contains ``query``, for IN filters."""
+    if len(query) < MIN_FTS_QUERY_LENGTH:
+        return select(db_models.MonumentView.id).where(col(db_models.MonumentView.monument_name).contains(query))
+    return select(monuments_fts.c.rowid).where(_fts_match(query, "monument_name"))
+
+
+def count_monuments_matching(query):
+    if len(query) < MIN_FTS_QUERY_LENGTH:
+        return select(func.count()).select_from(db_models.MonumentView).where(
+            col(db_models.MonumentView.monument_name).contains(query))
+    return select(func.count()).select_from(monuments_fts).where(_fts_match(query))
+
+
+def get_row_count(session, name):
+    """Read a trigger-maintained counter instead of running COUNT(*)."""
+    counter = session.get(db_models.RowCounts, name)
+    return counter.count if counter is not None else 0
+
+
+def get_monument_count(session, condition=None):
+    if condition is None:
+        return get_row_count(session, "monuments")
+    return get_row_count(session, MONUMENT_CONDITION_COUNT + condition)
+
+
+def get_dataset_version(session, name=DATASET_VERSION):
+    """(version, updated_at) of a trigger-maintained version row."""
+    row = session.get(db_models.DatasetVersion, name)
+    if row is None:
+        return 0, None
+    return row.version, row.updated_at
+
+
+def get_monuments_revision(session):
+    """A value that changes whenever any monument or its points change.
+
+    Updates stamp monuments.version with a new dataset version, so its max
+    (one index seek) moves; deletes move the row counter instead. Reports
+    leave it alone, unlike the dataset version.
+    """
+    counter = select(db_models.RowCounts.count).where(db_models.RowCounts.name == "monuments")
+    statement = select(func.max(db_models.Monuments.version), counter.scalar_subquery())
+    return tuple(session.exec(statement).one())
+
+
+def stream_instances(session, statement, batch_size=500):
+    """Yield ORM instances through a server-side cursor with flat memory.
+
+    Each batch is expunged once the caller has moved past it; otherwise
+    the session keeps every instance it loaded alive until it closes.
+    """
+    result = session.exec(statement.execution_options(yield_per=batch_size))
+    for partition in result.partitions():
+        yield from partition
+        for instance in partition:
+            session.expunge(instance)
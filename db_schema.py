@@ -0,0 +1,404 @@
+from sqlalchemy import column, table, text
+from sqlmodel import SQLModel
+
+import db_models  # registers the table models on SQLModel.metadata
+
+# SQLite R*Tree over WGS84Points, keyed by wgs84points.id. Each point is stored
+# as a degenerate box (min == max).
+wgs84points_rtree = table(
+    "wgs84points_rtree",
+    column("id"),
+    column("min_lat"),
+    column("max_lat"),
+    column("min_lon"),
+    column("max_lon"),
+)
+
+# External-content FTS5 index over Monuments, keyed by monuments.id. The
+# trigram tokenizer gives case-insensitive substring matching for queries of
+# three or more characters.
+monuments_fts = table(
+    "monuments_fts",
+    column("rowid"),
+    column("monument_name"),
+    column("topo"),
+    column("rank"),
+)
+
+
+def _table_exists(connection, name):
+    statement = text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name")
+    return connection.execute(statement, {"name": name}).first() is not None
+
+
+def _create_missing_indexes(connection):
+    # metadata.create_all only creates indexes together with their table, so
+    # indexes declared after a table already exists have to be added here.
+    for model_table in SQLModel.metadata.sorted_tables:
+        for index in model_table.indexes:
+            index.create(connection, checkfirst=True)
+
+
+def _create_wgs84points_rtree(connection):
+    if not _table_exists(connection, "wgs84points_rtree"):
+        connection.execute(text(
+            "CREATE VIRTUAL TABLE wgs84points_rtree USING rtree(id, min_lat, max_lat, min_lon, max_lon)"
+        ))
+        connection.execute(text(
+            "INSERT INTO wgs84points_rtree (id, min_lat, max_lat, min_lon, max_lon) "
+            "SELECT id, wgs84_lat, wgs84_lat, wgs84_lon, wgs84_lon FROM wgs84points"
+        ))
+
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS wgs84points_rtree_insert AFTER INSERT ON wgs84points BEGIN
+            INSERT INTO wgs84points_rtree (id, min_lat, max_lat, min_lon, max_lon)
+            VALUES (NEW.id, NEW.wgs84_lat, NEW.wgs84_lat, NEW.wgs84_lon, NEW.wgs84_lon);
+        END
+    """))
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS wgs84points_rtree_update AFTER UPDATE ON wgs84points BEGIN
+            DELETE FROM wgs84points_rtree WHERE id = OLD.id;
+            INSERT INTO wgs84points_rtree (id, min_lat, max_lat, min_lon, max_lon)
+            VALUES (NEW.id, NEW.wgs84_lat, NEW.wgs84_lat, NEW.wgs84_lon, NEW.wgs84_lon);
+        END
+    """))
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS wgs84points_rtree_delete AFTER DELETE ON wgs84points BEGIN
+            DELETE FROM wgs84points_rtree WHERE id = OLD.id;
+        END
+    """))
+
+
+def _create_monuments_fts(connection):
+    if not _table_exists(connection, "monuments_fts"):
+        connection.execute(text(
+            "CREATE VIRTUAL TABLE monuments_fts USING fts5("
+            "monument_name, topo, content='monuments', content_rowid='id', tokenize='trigram')"
+        ))
+        connection.execute(text("INSERT INTO monuments_fts (monuments_fts) VALUES ('rebuild')"))
+
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS monuments_fts_insert AFTER INSERT ON monuments BEGIN
+            INSERT INTO monuments_fts (rowid, monument_name, topo) VALUES (NEW.id, NEW.monument_name, NEW.topo);
+        END
+    """))
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS monuments_fts_update AFTER UPDATE OF monument_name, topo ON monuments BEGIN
+            INSERT INTO monuments_fts (monuments_fts, rowid, monument_name, topo)
+            VALUES ('delete', OLD.id, OLD.monument_name, OLD.topo);
+            INSERT INTO monuments_fts (rowid, monument_name, topo) VALUES (NEW.id, NEW.monument_name, NEW.topo);
+        END
+    """))
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS monuments_fts_delete AFTER DELETE ON monuments BEGIN
+            INSERT INTO monuments_fts (monuments_fts, rowid, monument_name, topo)
+            VALUES ('delete', OLD.id, OLD.monument_name, OLD.topo);
+        END
+    """))
+
+
+MONUMENT_CONDITION_COUNT = "monuments.condition."
+
+
+def _create_row_counts(connection):
+    # Seed the counters once; from then on the triggers keep them exact
+    if connection.execute(text("SELECT 1 FROM rowcounts LIMIT 1")).first() is None:
+        connection.execute(text(
+            "INSERT INTO rowcounts (name, count) "
+            "SELECT 'monuments', count(*) FROM monuments UNION ALL "
+            "SELECT 'reports', count(*) FROM reports UNION ALL "
+            "SELECT :prefix || condition, count(*) FROM monuments GROUP BY condition"
+        ), {"prefix": MONUMENT_CONDITION_COUNT})
+
+    connection.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS rowcounts_monuments_insert AFTER INSERT ON monuments BEGIN
+            INSERT INTO rowcounts (name, count) VALUES ('monuments', 1)
+                ON CONFLICT (name) DO UPDATE SET count = count + 1;
+            INSERT INTO rowcounts (name, count) VALUES ('{MONUMENT_CONDITION_COUNT}' || NEW.condition, 1)
+                ON CONFLICT (name) DO UPDATE SET count = count + 1;
+        END
+    """))
+    connection.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS rowcounts_monuments_update AFTER UPDATE OF condition ON monuments
+        WHEN OLD.condition IS NOT NEW.condition BEGIN
+            UPDATE rowcounts SET count = count - 1 WHERE name = '{MONUMENT_CONDITION_COUNT}' || OLD.condition;
+            INSERT INTO rowcounts (name, count) VALUES ('{MONUMENT_CONDITION_COUNT}' || NEW.condition, 1)
+                ON CONFLICT (name) DO UPDATE SET count = count + 1;
+        END
+    """))
+    connection.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS rowcounts_monuments_delete AFTER DELETE ON monuments BEGIN
+            UPDATE rowcounts SET count = count - 1 WHERE name = 'monuments';
+            UPDATE rowcounts SET count = count - 1 WHERE name = '{MONUMENT_CONDITION_COUNT}' || OLD.condition;
+        END
+    """))
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS rowcounts_reports_insert AFTER INSERT ON reports BEGIN
+            INSERT INTO rowcounts (name, count) VALUES ('reports', 1)
+                ON CONFLICT (name) DO UPDATE SET count = count + 1;
+        END
+    """))
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS rowcounts_reports_delete AFTER DELETE ON reports BEGIN
+            UPDATE rowcounts SET count = count - 1 WHERE name = 'reports';
+        END
+    """))
+
+
+SUMMARY_CONDITIONS = {"open_missing": "MISSING", "open_damaged": "DAMAGED"}
+
+
+def _summary_values(report):
+    # What ``report`` (a trigger's NEW or OLD row) adds to its monument's summary
+    return {
+        **{
+            column: f"CASE WHEN {report}.is_resolved = 0 AND {report}.condition = '{condition}' "
+                    f"THEN {report}.report_count ELSE 0 END"
+            for column, condition in SUMMARY_CONDITIONS.items()
+        },
+        "total": f"{report}.report_count",
+    }
+
+
+def _add_to_summary(report, last_reported_at):
+    values = _summary_values(report)
+    added = ", ".join(f"{column} = {column} + excluded.{column}" for column in values)
+    return (
+        f"INSERT INTO monument_report_summary (monument_id, {', '.join(values)}, last_reported_at) "
+        f"VALUES ({report}.monument_id, {', '.join(values.values())}, CURRENT_TIMESTAMP) "
+        f"ON CONFLICT (monument_id) DO UPDATE SET {added}, last_reported_at = {last_reported_at};"
+    )
+
+
+def _subtract_from_summary(report):
+    subtracted = ", ".join(f"{column} = {column} - {value}" for column, value in _summary_values(report).items())
+    return f"UPDATE monument_report_summary SET {subtracted} WHERE monument_id = {report}.monument_id;"
+
+
+def _create_report_summary(connection):
+    # Seed once; from then on the triggers keep the counts exact
+    if connection.execute(text("SELECT 1 FROM monument_report_summary LIMIT 1")).first() is None:
+        seeded = ", ".join(f"sum({value})" for value in _summary_values("reports").values())
+        connection.execute(text(
+            f"INSERT INTO monument_report_summary (monument_id, {', '.join(_summary_values('reports'))}, "
+            f"last_reported_at) SELECT monument_id, {seeded}, max(updated_at) FROM reports GROUP BY monument_id"
+        ))
+
+    connection.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS report_summary_reports_insert AFTER INSERT ON reports BEGIN
+            {_add_to_summary("NEW", "excluded.last_reported_at")}
+        END
+    """))
+    # A coalesced repeat shows up as a report_count increase, which counts
+    # as a new submission for last_reported_at
+    connection.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS report_summary_reports_update
+        AFTER UPDATE OF monument_id, condition, is_resolved, report_count ON reports BEGIN
+            {_subtract_from_summary("OLD")}
+            {_add_to_summary("NEW", "CASE WHEN NEW.report_count > OLD.report_count "
+                                    "THEN excluded.last_reported_at ELSE last_reported_at END")}
+        END
+    """))
+    connection.execute(text(f"""
+        CREATE TRIGGER IF NOT EXISTS report_summary_reports_delete AFTER DELETE ON reports BEGIN
+            {_subtract_from_summary("OLD")}
+        END
+    """))
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS report_summary_monuments_delete AFTER DELETE ON monuments BEGIN
+            DELETE FROM monument_report_summary WHERE monument_id = OLD.id;
+        END
+    """))
+
+
+MONUMENT_VIEW_COLUMNS = (
+    "id, monument_name, topo, condition, monument_image, gauss_id, wgs84_id, utm_id, delta_id, "
+    "gauss_lo, gauss_x, gauss_y, wgs84_lat, wgs84_lon, utm_cm, utm_north, utm_east, "
+    "delta_lat, delta_lon, delta_x, delta_y, delta_e, delta_n"
+)
+
+
+def _monument_view_select(monument):
+    # ``monument`` is either the monuments table alias or a trigger's NEW row
+    return (
+        f"SELECT {monument}.id, {monument}.monument_name, {monument}.topo, {monument}.condition, "
+        f"{monument}.monument_image, {monument}.gauss_id, {monument}.wgs84_id, {monument}.utm_id, "
+        f"{monument}.delta_id, g.gauss_lo, g.gauss_x, g.gauss_y, w.wgs84_lat, w.wgs84_lon, "
+        f"u.utm_cm, u.utm_north, u.utm_east, "
+        f"d.delta_lat, d.delta_lon, d.delta_x, d.delta_y, d.delta_e, d.delta_n "
+        f"FROM (SELECT 1) "
+        f"LEFT JOIN gausspoints g ON g.id = {monument}.gauss_id "
+        f"LEFT JOIN wgs84points w ON w.id = {monument}.wgs84_id "
+        f"LEFT JOIN utmpoints u ON u.id = {monument}.utm_id "
+        f"LEFT JOIN deltapoints d ON d.id = {monument}.delta_id"
+    )
+
+
+# (point table, monument_view foreign key column, point columns copied inline)
+MONUMENT_VIEW_POINTS = db_models.MONUMENT_VIEW_POINTS
+
+
+def _create_monument_view(connection):
+    # Fill in any monuments the view is missing (first run, or rows written
+    # before the triggers existed).
+    connection.execute(text(
+        f"INSERT INTO monument_view ({MONUMENT_VIEW_COLUMNS}) "
+        + _monument_view_select("m").replace("FROM (SELECT 1) ", "FROM monuments m ")
+        + " WHERE m.id NOT IN (SELECT id FROM monument_view)"
+    ))
+
+    monument_columns = ", ".join(SYNCED_TABLES["monuments"])
+    for event in ("INSERT", f"UPDATE OF {monument_columns}"):
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS monument_view_monuments_{event.split()[0].lower()} AFTER {event} ON monuments BEGIN
+                INSERT OR REPLACE INTO monument_view ({MONUMENT_VIEW_COLUMNS}) {_monument_view_select("NEW")};
+            END
+        """))
+    connection.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS monument_view_monuments_delete AFTER DELETE ON monuments BEGIN
+            DELETE FROM monument_view WHERE id = OLD.id;
+        END
+    """))
+
+    for point_table, foreign_key, columns in MONUMENT_VIEW_POINTS:
+        copied = ", ".join(f"{column} = NEW.{column}" for column in columns)
+        cleared = ", ".join(f"{column} = NULL" for column in columns)
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS monument_view_{point_table}_update AFTER UPDATE ON {point_table} BEGIN
+                UPDATE monument_view SET {copied} WHERE {foreign_key} = NEW.id;
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS monument_view_{point_table}_delete AFTER DELETE ON {point_table} BEGIN
+                UPDATE monument_view SET {cleared} WHERE {foreign_key} = OLD.id;
+            END
+        """))
+
+
+def _bump_version(name):
+    return (
+        "UPDATE datasetversion SET version = version + 1, updated_at = CURRENT_TIMESTAMP "
+        f"WHERE name = '{name}';"
+    )
+
+
+DATASET_VERSION = "dataset"
+CURRENT_VERSION = f"(SELECT version FROM datasetversion WHERE name = '{DATASET_VERSION}')"
+BUMP_VERSION = _bump_version(DATASET_VERSION)
+
+# Synced table -> the columns whose changes count as a change of the row.
+# Leaving out version/updated_at keeps the stamping UPDATE from re-firing.
+SYNCED_TABLES = {
+    "monuments": ("monument_name", "topo", "condition", "monument_image",
+                  "gauss_id", "wgs84_id", "utm_id", "delta_id"),
+    "reports": ("monument_id", "condition", "is_resolved", "report_count"),
+}
+
+
+def _stamp(table_name, where):
+    return (
+        f"UPDATE {table_name} SET version = {CURRENT_VERSION}, updated_at = CURRENT_TIMESTAMP "
+        f"WHERE {where};"
+    )
+
+
+def _create_dataset_version(connection):
+    connection.execute(text(
+        "INSERT OR IGNORE INTO datasetversion (name, version, updated_at) VALUES (:name, 0, CURRENT_TIMESTAMP)"
+    ), {"name": DATASET_VERSION})
+
+    # Rows written before these triggers existed join the dataset at the
+    # next version, so a client syncing from 0 still receives them.
+    unstamped = " OR ".join(f"EXISTS (SELECT 1 FROM {table_name} WHERE version = 0)" for table_name in SYNCED_TABLES)
+    if connection.execute(text(f"SELECT {unstamped}")).scalar():
+        connection.execute(text(BUMP_VERSION))
+        for table_name in SYNCED_TABLES:
+            connection.execute(text(_stamp(table_name, "version = 0")))
+
+    # Every write bumps the dataset version and stamps the rows it changed
+    # with the new value, so "changed since v" is a range scan on version.
+    for table_name, columns in SYNCED_TABLES.items():
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS sync_{table_name}_insert AFTER INSERT ON {table_name} BEGIN
+                {BUMP_VERSION}
+                {_stamp(table_name, "id = NEW.id")}
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS sync_{table_name}_update AFTER UPDATE OF {", ".join(columns)}
+            ON {table_name} BEGIN
+                {BUMP_VERSION}
+                {_stamp(table_name, "id = NEW.id")}
+            END
+        """))
+        connection.execute(text(f"""
+            CREATE TRIGGER IF NOT EXISTS sync_{table_name}_delete AFTER DELETE ON {table_name} BEGIN
+                {BUMP_VERSION}
+                INSERT INTO tombstones (table_name, row_id, version, deleted_at)
+                VALUES ('{table_name}', OLD.id, {CURRENT_VERSION}, CURRENT_TIMESTAMP);
+            END
+        """))
+
+    # Moving a point changes every monument that references it. Points are
+    # inserted before their monument, so inserts need no trigger.
+    for point_table, foreign_key, _ in MONUMENT_VIEW_POINTS:
+        for event, row in (("UPDATE", "NEW"), ("DELETE", "OLD")):
+            connection.execute(text(f"""
+                CREATE TRIGGER IF NOT EXISTS sync_{point_table}_{event.lower()} AFTER {event} ON {point_table} BEGIN
+                    {BUMP_VERSION}
+                    {_stamp("monuments", f"{foreign_key} = {row}.id")}
+                END
+            """))
+
+
+# Narrower versions for the per-worker in-memory indexes, so they rebuild only
+# when the columns they hold change. Version name -> {table: columns}; an
+# insert, a delete or a change to one of the columns bumps the version.
+MONUMENT_NAMES_VERSION = "monument_names"
+MONUMENT_POINTS_VERSION = "monument_points"
+
+INDEX_VERSIONS = {
+    MONUMENT_NAMES_VERSION: {
+        "monuments": ("monument_name",),
+    },
+    MONUMENT_POINTS_VERSION: {
+        "monuments": ("wgs84_id",),
+        "wgs84points": ("wgs84_lat", "wgs84_lon"),
+    },
+}
+
+
+def _create_index_versions(connection):
+    for name, tables in INDEX_VERSIONS.items():
+        connection.execute(text(
+            "INSERT OR IGNORE INTO datasetversion (name, version, updated_at) VALUES (:name, 0, CURRENT_TIMESTAMP)"
+        ), {"name": name})
+        for table_name, columns in tables.items():
+            changed = " OR ".join(f"OLD.{column} IS NOT NEW.{column}" for column in columns)
+            events = (
+                ("insert", "AFTER INSERT"),
+                ("delete", "AFTER DELETE"),
+                ("update", f"AFTER UPDATE OF {', '.join(columns)}"),
+            )
+            for suffix, event in events:
+                when = f"WHEN {changed}" if suffix == "update" else ""
+                connection.execute(text(f"""
+                    CREATE TRIGGER IF NOT EXISTS {name}_{table_name}_{suffix} {event} ON {table_name} {when} BEGIN
+                        {_bump_version(name)}
+                    END
+                """))
+
+
+def create_all(engine):
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as connection:
+        _create_missing_indexes(connection)
+        _create_wgs84points_rtree(connection)
+        _create_monuments_fts(connection)
+        _create_row_counts(connection)
+        _create_monument_view(connection)
+        _create_dataset_version(connection)
+        _create_index_versions(connection)
+        # After the version stamp, which gives unstamped reports the
+        # updated_at the summary seeds last_reported_at from
+        _create_report_summary(connection)
@@ -0,0 +1,122 @@
+import csv
+import os
+from random import Random
+
+from sqlalchemy import func, select
+
+import db_models
+from db import engine
+
+CONDITIONS = ["MISSING", "DAMAGED", "GOOD"]
+MONUMENT_IMAGES = ["https://th.bing.com/th/id/OIP.kRTSB1eMfyt_kT-yrLLnCgHaJ4?w=675&h=900&rs=1&pid=ImgDetMain", "https://th.bing.com/th/id/OIP.IA8Uu-qkntysI3BLoSPYtQAAAA?w=320&h=240&rs=1&pid=ImgDetMain","https://th.bing.com/th/id/R.a6b88261342c63fee812ac7b39a1c2b9?rik=pJb7bkWdtn2I4g&riu=http%3a%2f%2fphotos1.blogger.com%2fblogger%2f4606%2f983%2f1024%2fPA290003.jpg&ehk=hO5MuiFIS6Yam1oh993MrmeS%2faFcvMbHROjBAhl2DS8%3d&risl=&pid=ImgRaw&r=0", "https://th.bing.com/th/id/R.cd15bb4544dfebe21828bc5ab8e395c8?rik=Wx3gGMDGXQ%2fzPQ&riu=http%3a%2f%2fwww.alexkershaw.com.au%2fimages%2ffullsize%2fGeodetic07_big.jpg&ehk=0H9J5TCuO7o%2bZ%2ba5P7lw%2bnVosP6kjswRLM%2bp6M2jUFM%3d&risl=&pid=ImgRaw&r=0", "https://thumbs.dreamstime.com/b/survey-mark-found-ground-detail-marker-also-called-monument-geodetic-74245078.jpg", "https://s0.geograph.org.uk/geophotos/03/55/05/3550547_407fea12.jpg"]
+
+SEED_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seed_data", "monuments.csv")
+TEXT_COLUMNS = ("MONUNUM", "TOPO")
+
+# Rows per executemany; keeps memory flat for the national dataset while the
+# whole load still commits as one transaction.
+BATCH_SIZE = 5000
+
+POINT_MODELS = (
+    db_models.GaussPoints,
+    db_models.WGS84Points,
+    db_models.UTMPoints,
+    db_models.DeltaPoints,
+)
+
+
+DELTA_COLUMNS = ("id", "delta_lat", "delta_lon", "delta_x", "delta_y", "delta_e", "delta_n")
+MONUMENT_COLUMNS = ("id", "monument_name", "topo", "condition", "monument_image",
+                    "gauss_id", "wgs84_id", "utm_id", "delta_id")
+
+
+def _optional(value):
+    return None if value == "" else value
+
+
+def read_seed_records(path=SEED_FILE):
+    """Stream the raw monument records from the seed CSV, one dict per row."""
+    with open(path, newline="") as seed_file:
+        for row in csv.DictReader(seed_file):
+            yield {
+                column: value if column in TEXT_COLUMNS or value == "" else float(value)
+                for column, value in row.items()
+            }
+
+
+def _next_id(connection, model):
+    return (connection.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _insert_many(connection, model, columns, rows):
+    # Plain DB-API executemany with tuples; going through insert() adds
+    # SQLAlchemy's per-row parameter processing on every bulk row.
+    statement = f"INSERT INTO {model.__tablename__} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+    connection.exec_driver_sql(statement, rows)
+
+
+def _batches(records, size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def populate(records, batch_size=BATCH_SIZE):
+    """Bulk insert raw monument records in a single transaction.
+
+    Ids are assigned up front so the point rows and the monuments that
+    reference them can each go in with one executemany per table per batch.
+    Returns the number of monuments added.
+    """
+    random = Random()
+    added = 0
+
+    with engine.begin() as connection:
+        next_point_id = max(_next_id(connection, model) for model in POINT_MODELS)
+        next_monument_id = _next_id(connection, db_models.Monuments)
+
+        for batch in _batches(records, batch_size):
+            point_ids = range(next_point_id, next_point_id + len(batch))
+            monument_ids = range(next_monument_id, next_monument_id + len(batch))
+            next_point_id += len(batch)
+            next_monument_id += len(batch)
+
+            _insert_many(connection, db_models.GaussPoints, ("id", "gauss_lo", "gauss_x", "gauss_y"), [(
+                point_id, record["GAUSS_LO"], record["GAUSS_X"], record["GAUSS_Y"]
+            ) for point_id, record in zip(point_ids, batch)])
+
+            _insert_many(connection, db_models.WGS84Points, ("id", "wgs84_lat", "wgs84_lon"), [(
+                point_id, record["LAT_WGS84"], record["LON_WGS84"]
+            ) for point_id, record in zip(point_ids, batch)])
+
+            _insert_many(connection, db_models.UTMPoints, ("id", "utm_cm", "utm_north", "utm_east"), [(
+                point_id, record["UTM_CM"], record["UTM_N"], record["UTM_E"]
+            ) for point_id, record in zip(point_ids, batch)])
+
+            _insert_many(connection, db_models.DeltaPoints, DELTA_COLUMNS, [(
+                point_id,
+                _optional(record["DELTA_LAT"]),
+                _optional(record["DELTA_LON"]),
+                _optional(record["DELTA_X"]),
+                _optional(record["DELTA_Y"]),
+                _optional(record["DELTA_E"]),
+                _optional(record["DELTA_N"]),
+            ) for point_id, record in zip(point_ids, batch)])
+
+            _insert_many(connection, db_models.Monuments, MONUMENT_COLUMNS, [(
+                monument_id,
+                record["MONUNUM"],
+                record["TOPO"],
+                random.choice(CONDITIONS),
+                random.choice(MONUMENT_IMAGES),
+                point_id, point_id, point_id, point_id,
+            ) for monument_id, point_id, record in zip(monument_ids, point_ids, batch)])
+
+            added += len(batch)
+
+    return added
@@ -2,20 +2,40 @@ import os
 
 from flask import Flask, jsonify
 
+from db import get_query_count
+from geodetic_monument_finder.cache.cache import cache
+from geodetic_monument_finder.models.serializer import SerializerJSONProvider
+from geodetic_monument_finder.monuments.bundle import builder
+from geodetic_monument_finder.reports.intake import intake
+
 
 basedir = os.path.abspath(os.path.dirname(__file__))
 
 
-def create_app():
+def create_app(test_config=None):
     app = Flask(__name__, instance_relative_config=True)
     app.config.from_mapping(
         SECRET_KEY="dev",
+        # Adds the per-request statement count as X-Query-Count; always on when testing
+        QUERY_COUNT_HEADER=False,
     )
+    if test_config is not None:
+        app.config.from_mapping(test_config)
 
     try:
         os.makedirs(app.instance_path)
     except OSError:
         pass
 
+    app.json = SerializerJSONProvider(app)
+    cache.init_app(app)
+    builder.init_app(app)
+    intake.init_app(app)
+
+    if app.testing or app.config["QUERY_COUNT_HEADER"]:
+        @app.after_request
+        def add_query_count(response):
+            response.headers["X-Query-Count"] = str(get_query_count())
+            return response
 
     return app
@@ -0,0 +1,185 @@
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from flask import request
+from sqlmodel import Session
+
+from db import engine
+from db_queries import get_monuments_revision
+from geodetic_monument_finder.models.serializer import dumps, loads
+
+# Namespace -> revision read on every lookup and folded into the key. Writes
+# from any worker, or from outside the app, move it, so stale entries are
+# orphaned in every worker rather than only the one that called invalidate().
+NAMESPACE_REVISIONS = {
+    "monuments": get_monuments_revision,
+}
+
+
+class MemoryCache:
+    """In-process LRU cache with a per-entry TTL.
+
+    Only invalidates entries in the current worker; other workers serve
+    their copy until it expires.
+    """
+
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        # Generation counters live outside the LRU so they are never evicted
+        self._counters = {}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def counter(self, key):
+        with self._lock:
+            return self._counters.get(key, 0)
+
+    def incr(self, key):
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + 1
+            return self._counters[key]
+
+
+class SharedCache:
+    """Cache stored in a shared key-value server, visible to every worker.
+
+    ``client`` needs the redis-py subset ``get``, ``set(key, value, ex=)`` and
+    ``incr``; values are stored as JSON.
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    def get(self, key):
+        value = self.client.get(key)
+        return None if value is None else loads(value)
+
+    def set(self, key, value, ttl):
+        self.client.set(key, dumps(value), ex=ttl)
+
+    def counter(self, key):
+        value = self.client.get(key)
+        return 0 if value is None else int(value)
+
+    def incr(self, key):
+        return self.client.incr(key)
+
+
+class LocalSharedClient:
+    """Single-process stand-in for a redis client, for tests and local runs."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {}
+
+    def get(self, key):
+        with self._lock:
+            value, expires_at = self._values.get(key, (None, None))
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key, value, ex=None):
+        with self._lock:
+            self._values[key] = (value, None if ex is None else time.monotonic() + ex)
+
+    def incr(self, key):
+        with self._lock:
+            value, expires_at = self._values.get(key, (0, None))
+            self._values[key] = (int(value) + 1, expires_at)
+            return int(value) + 1
+
+
+class ResponseCache:
+    """Caches successful view responses keyed by route, query args and body.
+
+    Each namespace has a generation counter in the backend; ``invalidate``
+    bumps it, which orphans every entry cached under the old generation.
+    """
+
+    def __init__(self):
+        self.backend = MemoryCache()
+        self.ttl = 60
+
+    def init_app(self, app):
+        app.config.setdefault("CACHE_BACKEND", "memory")
+        app.config.setdefault("CACHE_TTL", 60)
+        app.config.setdefault("CACHE_MAX_ENTRIES", 1024)
+        app.config.setdefault("CACHE_REDIS_URL", None)
+
+        backend = app.config["CACHE_BACKEND"]
+        if backend == "memory":
+            self.backend = MemoryCache(app.config["CACHE_MAX_ENTRIES"])
+        elif backend == "local-shared":
+            self.backend = SharedCache(LocalSharedClient())
+        elif backend == "redis":
+            import redis  # optional dependency, only needed for this backend
+            self.backend = SharedCache(redis.Redis.from_url(app.config["CACHE_REDIS_URL"]))
+        else:
+            raise ValueError(f"Unknown CACHE_BACKEND {backend!r}")
+        self.ttl = app.config["CACHE_TTL"]
+
+    def _revision(self, namespace):
+        get_revision = NAMESPACE_REVISIONS.get(namespace)
+        if get_revision is None:
+            return ""
+        with Session(engine) as session:
+            return "-".join(str(part) for part in get_revision(session))
+
+    def _key(self, namespace):
+        generation = self.backend.counter(f"{namespace}:generation")
+        revision = self._revision(namespace)
+        args = urlencode(sorted(request.args.items(multi=True)))
+        body = hashlib.sha1(request.get_data()).hexdigest()
+        return f"{namespace}:{generation}:{revision}:{request.path}?{args}:{body}"
+
+    def cached(self, namespace):
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                key = self._key(namespace)
+                hit = self.backend.get(key)
+                if hit is not None:
+                    body, status = hit
+                    return body, status
+
+                rv = view(*args, **kwargs)
+                body, status = rv[0], rv[1]
+                if status == 200:
+                    self.backend.set(key, [body, status], self.ttl)
+                return rv
+
+            return wrapper
+
+        return decorator
+
+    def invalidate(self, *namespaces):
+        for namespace in namespaces:
+            self.backend.incr(f"{namespace}:generation")
+
+
+cache = ResponseCache()
@@ -0,0 +1,54 @@
+import datetime
+import functools
+import hashlib
+
+from flask import make_response, request
+from sqlmodel import Session
+
+from db import engine
+from db_queries import get_dataset_version
+
+
+def _etag(version):
+    # The version alone is not enough: /search takes its query in the body,
+    # so two different searches share a URL.
+    representation = hashlib.sha1(request.full_path.encode() + b"\0" + request.get_data()).hexdigest()[:16]
+    return f"{version}-{representation}"
+
+
+def _not_modified(etag):
+    # Only the ETag can answer 304. datasetversion.updated_at has one-second
+    # resolution, so a write in the same second as the client's
+    # Last-Modified would pass an If-Modified-Since check unseen.
+    return bool(request.if_none_match) and request.if_none_match.contains_weak(etag)
+
+
+def conditional(view):
+    """Answer unchanged reads with 304 Not Modified.
+
+    Every write to monuments, reports or the point tables bumps the dataset
+    version, so a matching ETag means the response cannot have changed. The
+    check costs one primary-key lookup.
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        with Session(engine) as session:
+            version, updated_at = get_dataset_version(session)
+        if updated_at is not None:
+            updated_at = updated_at.replace(tzinfo=datetime.timezone.utc)
+        etag = _etag(version)
+
+        if _not_modified(etag):
+            response = make_response("", 304)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+
+        response.set_etag(etag, weak=True)
+        if updated_at is not None:
+            response.last_modified = updated_at
+        response.cache_control.no_cache = True
+        return response
+
+    return wrapper
@@ -0,0 +1,168 @@
+import db_models
+
+MONUMENT_PREFIX = "monument."
+
+
+class InvalidFields(ValueError):
+    pass
+
+
+def _split(value):
+    return [path.strip() for path in value.split(",") if path.strip()]
+
+
+# Every leaf of the monument JSON shape as (group, key, monument_view column),
+# in to_json order. group is None for top-level keys.
+_MONUMENT_LEAVES = tuple((None, name, name) for name in db_models.MONUMENT_FIELDS.names) + tuple(
+    leaf
+    for point_table, foreign_key, columns in db_models.MONUMENT_VIEW_POINTS
+    for leaf in ((point_table, "id", foreign_key), *((point_table, column, column) for column in columns))
+)
+
+
+def _monument_paths():
+    # ?fields= path -> the leaves it selects: "monument_name", "wgs84points"
+    # or "wgs84points.wgs84_lat"
+    paths = {}
+    for leaf in _MONUMENT_LEAVES:
+        group, key, _ = leaf
+        if group is None:
+            paths[key] = (leaf,)
+        else:
+            paths[f"{group}.{key}"] = (leaf,)
+            paths[group] = paths.get(group, ()) + (leaf,)
+    return paths
+
+
+_MONUMENT_PATHS = _monument_paths()
+
+
+class MonumentFields:
+    """The monument keys a client asked for with ``?fields=``.
+
+    ``columns`` is what the SELECT reads instead of whole MonumentView rows
+    (always including the id, which paging and /nearest need); ``to_json``
+    rebuilds the usual nested shape with only the requested keys. Column
+    labels carry ``prefix`` so a monument can share a row with a report.
+    """
+
+    def __init__(self, paths, prefix=""):
+        wanted = set()
+        for path in paths:
+            if path not in _MONUMENT_PATHS:
+                raise InvalidFields(f"Unknown monument field {path!r}")
+            wanted.update(_MONUMENT_PATHS[path])
+
+        self.prefix = prefix
+        self._leaves = [leaf for leaf in _MONUMENT_LEAVES if leaf in wanted]
+        column_names = {"id"} | {column for _, _, column in self._leaves}
+        self.columns = tuple(
+            getattr(db_models.MonumentView, column.name).label(prefix + column.name)
+            for column in db_models.MonumentView.__table__.columns if column.name in column_names
+        )
+
+    def to_json(self, row):
+        mapping = row._mapping
+        monument = {}
+        for group, key, column in self._leaves:
+            value = mapping[self.prefix + column]
+            if group is None:
+                monument[key] = value
+            else:
+                monument.setdefault(group, {})[key] = value
+        return monument
+
+
+class ReportFields:
+    """The report keys a client asked for; ``monument.<path>`` reaches into
+    the report's monument with the same paths as MonumentFields."""
+
+    def __init__(self, paths):
+        own = set()
+        monument_paths = []
+        for path in paths:
+            if path in db_models.REPORT_FIELDS.names:
+                own.add(path)
+            elif path == "monument":
+                monument_paths.extend(_MONUMENT_PATHS)
+            elif path.startswith(MONUMENT_PREFIX):
+                monument_paths.append(path[len(MONUMENT_PREFIX):])
+            else:
+                raise InvalidFields(f"Unknown report field {path!r}")
+
+        self._keys = [name for name in db_models.REPORT_FIELDS.names if name in own]
+        self.monument = MonumentFields(monument_paths, prefix="monument__") if monument_paths else None
+        # id and is_resolved are the keyset cursor and monument_id keys the
+        # monuments side-map, so they are always read
+        column_names = {"id", "is_resolved", "monument_id"} | own
+        self.columns = tuple(
+            getattr(db_models.Reports, name) for name in db_models.REPORT_FIELDS.names if name in column_names
+        ) + (self.monument.columns if self.monument is not None else ())
+
+    def report_json(self, row):
+        mapping = row._mapping
+        return {key: mapping[key] for key in self._keys}
+
+    def monument_json(self, row):
+        if row._mapping[self.monument.prefix + "id"] is None:
+            return None
+        return self.monument.to_json(row)
+
+    def to_json(self, row):
+        report = self.report_json(row)
+        if self.monument is not None:
+            report["monument"] = self.monument_json(row)
+        return report
+
+
+def parse_monument_fields(value):
+    """MonumentFields for a ``?fields=`` value, or None for the full shape."""
+    paths = _split(value or "")
+    return MonumentFields(paths) if paths else None
+
+
+def parse_report_fields(value):
+    paths = _split(value or "")
+    return ReportFields(paths) if paths else None
+
+
+def fetch_all(session, statement, fields):
+    """Model instances for the full shape, Rows for a projection; both have ``.id``."""
+    if fields is None:
+        return session.exec(statement).all()
+    return session.execute(statement).all()
+
+
+def to_json(row, fields):
+    return row.to_json() if fields is None else fields.to_json(row)
+
+
+def reports_to_json(rows, fields, monument_map=False):
+    """Serialize a page of reports, building each distinct monument only once.
+
+    Returns ``(reports, monuments)``. By default every report embeds its
+    monument, and reports on the same monument share one dict. With
+    ``monument_map`` the reports carry only ``monument_id`` and ``monuments``
+    maps each id to its monument; otherwise ``monuments`` is None.
+    """
+    reports = []
+    monuments = {}
+    embeds_monument = fields is None or fields.monument is not None
+    for row in rows:
+        monument_id = row.monument_id
+        if fields is None:
+            report = db_models.REPORT_FIELDS.to_dict(row)
+            if monument_id not in monuments:
+                view = row.monument_view
+                monuments[monument_id] = view.to_json() if view is not None else None
+        else:
+            report = fields.report_json(row)
+            if embeds_monument and monument_id not in monuments:
+                monuments[monument_id] = fields.monument_json(row)
+
+        if monument_map:
+            report["monument_id"] = monument_id
+        elif embeds_monument:
+            report["monument"] = monuments[monument_id]
+        reports.append(report)
+    return reports, monuments if monument_map else None
@@ -24,7 +24,10 @@ class NetworkingStatus(Enum):
 
 class HttpStatusCode(Enum):
     OK = 200
+    ACCEPTED = 202
+    BAD_REQUEST = 400
     NOT_FOUND = 404
     EXCEPTION = 500
     UNAUTHORIZED = 401
-    FORBIDEN = 403
\ No newline at end of file
+    FORBIDEN = 403
+    SERVICE_UNAVAILABLE = 503
\ No newline at end of file
@@ -0,0 +1,181 @@
+import fcntl
+import gzip
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import time
+
+from sqlmodel import Session, select
+
+import db_models
+from db import engine
+from db_queries import get_dataset_version
+
+BUNDLE_FILE = "monuments.sqlite.gz"
+WORKING_FILE = "monuments.sqlite"
+LOCK_FILE = "build.lock"
+# Seconds before retrying a failed build, doubling up to the maximum
+RETRY_DELAY = 5.0
+MAX_RETRY_DELAY = 300.0
+
+# Columns shipped to devices, in the bundle table's column order
+BUNDLE_COLUMNS = (
+    db_models.MonumentView.id,
+    db_models.MonumentView.monument_name,
+    db_models.MonumentView.condition,
+    db_models.MonumentView.wgs84_lat,
+    db_models.MonumentView.wgs84_lon,
+    db_models.MonumentView.utm_cm,
+    db_models.MonumentView.utm_north,
+    db_models.MonumentView.utm_east,
+)
+
+
+class BundleBuilder:
+    """Keeps a gzip'd, trimmed SQLite copy of the monuments ready to download.
+
+    A working SQLite file is brought forward from the sync versions, so a
+    build only rewrites the monuments changed since the bundle's version.
+    It is then compacted, compressed and renamed over the published file,
+    so a download in progress keeps reading the file it opened. Builds run
+    on a background thread after writes in this worker, and every
+    ``check_interval`` seconds to catch writes made elsewhere (other
+    workers, ``flask populate``, direct SQL). A file lock stops workers
+    from building at the same time.
+    """
+
+    def __init__(self):
+        self.directory = None
+        self.delay = 2.0
+        self.check_interval = 60.0
+        # Cleared while the index audit points the engine at a scratch copy
+        self.enabled = True
+        self.logger = logging.getLogger(__name__)
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def init_app(self, app):
+        app.config.setdefault("BUNDLE_DIR", os.path.join(app.instance_path, "bundle"))
+        app.config.setdefault("BUNDLE_BUILD_DELAY", 2.0)
+        app.config.setdefault("BUNDLE_CHECK_INTERVAL", 60.0)
+        self.directory = app.config["BUNDLE_DIR"]
+        self.delay = app.config["BUNDLE_BUILD_DELAY"]
+        self.check_interval = app.config["BUNDLE_CHECK_INTERVAL"]
+        self.logger = app.logger
+        os.makedirs(self.directory, exist_ok=True)
+
+    @property
+    def path(self):
+        return os.path.join(self.directory, BUNDLE_FILE)
+
+    def is_ready(self):
+        return self.directory is not None and os.path.exists(self.path)
+
+    def schedule(self):
+        """Ask the background thread to bring the bundle up to date."""
+        if self.directory is None:
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="bundle-builder", daemon=True)
+                self._thread.start()
+        self._wake.set()
+
+    def _run(self):
+        retry_delay = RETRY_DELAY
+        while True:
+            # Without a wake-up this is the periodic check: the build compares
+            # the bundle's version with the database and returns early when
+            # no monument changed
+            if self._wake.wait(self.check_interval):
+                # Let a burst of writes land so they share one build
+                time.sleep(self.delay)
+            self._wake.clear()
+            if not self.enabled:
+                continue
+            try:
+                self.build()
+            except Exception:
+                # Usually "database is locked" under a bulk load; try again
+                # rather than leave the bundle stale until the next write
+                self.logger.exception("Failed to build the monument bundle, retrying in %.0fs", retry_delay)
+                time.sleep(retry_delay)
+                retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+                self._wake.set()
+            else:
+                retry_delay = RETRY_DELAY
+
+    def build(self):
+        with open(os.path.join(self.directory, LOCK_FILE), "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            working = sqlite3.connect(os.path.join(self.directory, WORKING_FILE))
+            try:
+                if self._refresh(working) or not os.path.exists(self.path):
+                    self._publish(working)
+            finally:
+                working.close()
+
+    def _refresh(self, working):
+        """Bring the working copy up to the dataset version; True if a monument changed."""
+        working.execute(
+            "CREATE TABLE IF NOT EXISTS monuments (id INTEGER PRIMARY KEY, monument_name TEXT NOT NULL, "
+            "condition TEXT NOT NULL, wgs84_lat REAL, wgs84_lon REAL, utm_cm REAL, utm_north REAL, utm_east REAL)"
+        )
+        working.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value)")
+        row = working.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        since = row[0] if row is not None else 0
+
+        with Session(engine) as session:
+            version, _ = get_dataset_version(session)
+            if version == since:
+                return False
+            replaced = version < since
+            if replaced:
+                # The database was replaced under us; start over
+                working.execute("DELETE FROM monuments")
+                since = 0
+
+            in_range = (db_models.Monuments.version > since, db_models.Monuments.version <= version)
+            changed = session.exec(
+                select(*BUNDLE_COLUMNS)
+                .join(db_models.Monuments, db_models.Monuments.id == db_models.MonumentView.id)
+                .where(*in_range)
+            ).all()
+            deleted = session.exec(
+                select(db_models.Tombstones.row_id).where(
+                    db_models.Tombstones.table_name == "monuments",
+                    db_models.Tombstones.version > since,
+                    db_models.Tombstones.version <= version,
+                )
+            ).all()
+
+        with working:
+            # Deletes first: an id can be deleted and then reused by an insert
+            working.executemany("DELETE FROM monuments WHERE id = ?", [(row_id,) for row_id in deleted])
+            working.executemany(
+                f"INSERT OR REPLACE INTO monuments VALUES ({', '.join('?' * len(BUNDLE_COLUMNS))})",
+                [tuple(row) for row in changed],
+            )
+            # Devices pass this to /sync?since= to catch up after installing
+            working.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (version,))
+        # Report writes move the dataset version too; they alone are no
+        # reason to publish, and the older version in the published bundle
+        # only makes a device's first /sync fetch a little more
+        return replaced or bool(changed) or bool(deleted)
+
+    def _publish(self, working):
+        compact = os.path.join(self.directory, WORKING_FILE + ".compact")
+        staged = self.path + ".tmp"
+        if os.path.exists(compact):
+            os.remove(compact)
+        working.execute("VACUUM INTO ?", (compact,))
+        with open(compact, "rb") as source, gzip.open(staged, "wb", compresslevel=9) as target:
+            shutil.copyfileobj(source, target)
+        os.replace(staged, self.path)
+        os.remove(compact)
+
+
+builder = BundleBuilder()
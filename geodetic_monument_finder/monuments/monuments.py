@@ -1,38 +1,225 @@
-import json
+import csv
+import io
 
-from flask import Blueprint, request
+from flask import Blueprint, Response, request, send_file, stream_with_context
+from sqlalchemy import func
 from sqlmodel import Session, select, col
 
 import db_models
 from db import engine
+from db_queries import (count_monuments_matching, get_monument_count, select_monuments, select_monuments_matching,
+                        stream_instances)
+from db_schema import wgs84points_rtree
+from geodetic_monument_finder.cache.cache import cache
+from geodetic_monument_finder.cache.conditional import conditional
+from geodetic_monument_finder.models.fields import InvalidFields, fetch_all, parse_monument_fields, to_json
 from geodetic_monument_finder.models.network_response import NetworkResponse, NetworkingStatus, HttpStatusCode
+from geodetic_monument_finder.models.serializer import dumps
+from geodetic_monument_finder.monuments import bundle, name_index, spatial_index
+from geodetic_monument_finder.pagination.cursor import InvalidCursor, decode_cursor, encode_cursor
+from geodetic_monument_finder.pagination.params import get_per_page
 
 bp = Blueprint('monuments', __name__, url_prefix='/monuments')
 
+MAX_NEAREST = 100
+MAX_AUTOCOMPLETE = 50
+EXPORT_BATCH_SIZE = 500
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
 
 @bp.route('', methods=['GET'])
+@conditional
+@cache.cached("monuments")
 def get_monuments():
     try:
         page = request.args.get('page', default=0, type=int)
-        per_page = request.args.get('per_page', default=10, type=int)
+        per_page = get_per_page(10)
+        cursor = request.args.get('cursor', default=None, type=str)
+        condition = request.args.get('condition', default=None, type=str)
+        fields = parse_monument_fields(request.args.get('fields', default=None, type=str))
 
         with Session(engine) as session:
-            statement = select(db_models.Monuments).limit(per_page).offset(page * per_page).order_by(
-                db_models.Monuments.id.asc())
-            result = session.exec(statement).all()
+            # One extra row tells us whether there is a next page
+            statement = select_monuments(fields).limit(per_page + 1).order_by(db_models.MonumentView.id.asc())
+            if condition is not None:
+                statement = statement.where(db_models.MonumentView.condition == condition)
+            if cursor:
+                (last_id,) = decode_cursor(cursor, "monuments", 1)
+                statement = statement.where(db_models.MonumentView.id > last_id)
+            else:
+                statement = statement.offset(page * per_page)
+            result = fetch_all(session, statement, fields)
+
+            has_more = len(result) > per_page
+            result = result[:per_page]
             return NetworkResponse(
                 status=NetworkingStatus.SUCCESS.value,
                 message="Monuments Retrieved!",
                 data={
-                    "monuments": [monument.to_json() for monument in result],
+                    "monuments": [to_json(monument, fields) for monument in result],
+                    "total": get_monument_count(session, condition),
+                    "is_empty": len(result) == 0,
+                    "page": page,
+                    "per_page": per_page,
+                    "condition": condition,
+                    "cursor": cursor,
+                    "next_cursor": encode_cursor("monuments", result[-1].id) if has_more else None
+                },
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.OK.value,
+    except InvalidCursor as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid cursor",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+    except InvalidFields as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid fields",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+    except Exception as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Failed to get monuments",
+            data=None,
+            is_exception=True,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.EXCEPTION.value,
+
+
+@bp.route('/nearest', methods=['GET'])
+@conditional
+def get_nearest_monuments():
+    try:
+        lat = request.args.get('lat', type=float)
+        lon = request.args.get('lon', type=float)
+        k = request.args.get('k', default=10, type=int)
+        fields = parse_monument_fields(request.args.get('fields', default=None, type=str))
+
+        if lat is None or lon is None or not -90 <= lat <= 90 or not -180 <= lon <= 180:
+            return NetworkResponse(
+                status=NetworkingStatus.FAILED.value,
+                message="lat and lon are required and must be valid WGS84 coordinates",
+                data=None,
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+
+        k = max(1, min(k, MAX_NEAREST))
+        nearest = spatial_index.index.nearest(lat, lon, k)
+
+        with Session(engine) as session:
+            statement = select_monuments(fields).where(
+                col(db_models.MonumentView.id).in_([monument_id for monument_id, _ in nearest]))
+            monuments = {monument.id: monument for monument in fetch_all(session, statement, fields)}
+
+            result = []
+            for monument_id, distance in nearest:
+                monument = monuments.get(monument_id)
+                if monument is not None:
+                    result.append({**to_json(monument, fields), "distance_m": round(distance, 1)})
+
+            return NetworkResponse(
+                status=NetworkingStatus.SUCCESS.value,
+                message="Nearest Monuments Retrieved!",
+                data={
+                    "monuments": result,
                     "total": len(result),
                     "is_empty": len(result) == 0,
+                    "lat": lat,
+                    "lon": lon,
+                    "k": k
+                },
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.OK.value,
+    except InvalidFields as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid fields",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+    except Exception as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Failed to get nearest monuments",
+            data=None,
+            is_exception=True,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.EXCEPTION.value,
+
+
+@bp.route('/bbox', methods=['GET'])
+@conditional
+def get_monuments_in_bbox():
+    try:
+        min_lat = request.args.get('min_lat', type=float)
+        min_lon = request.args.get('min_lon', type=float)
+        max_lat = request.args.get('max_lat', type=float)
+        max_lon = request.args.get('max_lon', type=float)
+        page = request.args.get('page', default=0, type=int)
+        per_page = get_per_page(100)
+        fields = parse_monument_fields(request.args.get('fields', default=None, type=str))
+
+        if None in (min_lat, min_lon, max_lat, max_lon) or min_lat > max_lat or min_lon > max_lon:
+            return NetworkResponse(
+                status=NetworkingStatus.FAILED.value,
+                message="min_lat, min_lon, max_lat and max_lon are required and must describe a valid box",
+                data=None,
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+
+        with Session(engine) as session:
+            # R*Tree boxes are rounded outwards to 32-bit floats, so the overlap
+            # test only narrows the candidates; the exact coordinates decide.
+            in_box = (
+                wgs84points_rtree.c.max_lat >= min_lat,
+                wgs84points_rtree.c.min_lat <= max_lat,
+                wgs84points_rtree.c.max_lon >= min_lon,
+                wgs84points_rtree.c.min_lon <= max_lon,
+                db_models.MonumentView.wgs84_lat.between(min_lat, max_lat),
+                db_models.MonumentView.wgs84_lon.between(min_lon, max_lon),
+            )
+            statement = select_monuments(fields).join(
+                wgs84points_rtree, wgs84points_rtree.c.id == db_models.MonumentView.wgs84_id).where(
+                *in_box).limit(per_page).offset(page * per_page).order_by(db_models.MonumentView.id.asc())
+            result = fetch_all(session, statement, fields)
+            total = session.exec(select(func.count()).select_from(db_models.MonumentView).join(
+                wgs84points_rtree, wgs84points_rtree.c.id == db_models.MonumentView.wgs84_id).where(*in_box)).one()
+            return NetworkResponse(
+                status=NetworkingStatus.SUCCESS.value,
+                message="Monuments Retrieved!",
+                data={
+                    "monuments": [to_json(monument, fields) for monument in result],
+                    "total": total,
+                    "is_empty": len(result) == 0,
                     "page": page,
                     "per_page": per_page
                 },
                 is_exception=False,
                 error_message=None
             ).to_json(), HttpStatusCode.OK.value,
+    except InvalidFields as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid fields",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
     except Exception as e:
         return NetworkResponse(
             status=NetworkingStatus.FAILED.value,
@@ -43,6 +230,105 @@ def get_monuments():
         ).to_json(), HttpStatusCode.EXCEPTION.value,
 
 
+@bp.route('/autocomplete', methods=['GET'])
+def autocomplete_monuments():
+    try:
+        q = request.args.get('q', default='', type=str)
+        limit = request.args.get('limit', default=10, type=int)
+        limit = max(1, min(limit, MAX_AUTOCOMPLETE))
+
+        matches = name_index.index.complete(q, limit) if q.strip() else []
+        return NetworkResponse(
+            status=NetworkingStatus.SUCCESS.value,
+            message="Monument Names Retrieved!",
+            data={
+                "monuments": [{"id": monument_id, "monument_name": name} for monument_id, name in matches],
+                "total": len(matches),
+                "is_empty": len(matches) == 0,
+                "q": q,
+                "limit": limit
+            },
+            is_exception=False,
+            error_message=None
+        ).to_json(), HttpStatusCode.OK.value,
+    except Exception as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Failed to autocomplete monument names",
+            data=None,
+            is_exception=True,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.EXCEPTION.value,
+
+
+@bp.route('/bundle', methods=['GET'])
+def get_monument_bundle():
+    # Only ever serves the file the background builder published
+    if not bundle.builder.is_ready():
+        bundle.builder.schedule()
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Monument bundle is not ready yet",
+            data=None,
+            is_exception=False,
+            error_message="The bundle is being built, try again shortly"
+        ).to_json(), HttpStatusCode.SERVICE_UNAVAILABLE.value, {"Retry-After": "10"}
+
+    # conditional=True answers Range and If-Range, so interrupted downloads resume
+    response = send_file(bundle.builder.path, mimetype="application/gzip", as_attachment=True,
+                         download_name=bundle.BUNDLE_FILE, conditional=True, max_age=0)
+    # Werkzeug only advertises ranges when answering one
+    response.accept_ranges = "bytes"
+    return response
+
+
+def _export_ndjson():
+    with Session(engine) as session:
+        statement = select_monuments().order_by(db_models.MonumentView.id.asc())
+        for monument in stream_instances(session, statement, EXPORT_BATCH_SIZE):
+            yield dumps(monument.to_json()) + b"\n"
+
+
+def _export_csv():
+    columns = list(db_models.MonumentView.__table__.columns)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    # Header goes out before the query runs
+    writer.writerow([column.name for column in columns])
+    yield buffer.getvalue()
+
+    with Session(engine) as session:
+        statement = select(*columns).order_by(db_models.MonumentView.id.asc()).execution_options(
+            yield_per=EXPORT_BATCH_SIZE)
+        for partition in session.exec(statement).partitions():
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(partition)
+            yield buffer.getvalue()
+
+
+@bp.route('/export', methods=['GET'])
+@conditional
+def export_monuments():
+    export_format = request.args.get('format', default='ndjson', type=str)
+    if export_format not in EXPORT_FORMATS:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message=f"format must be one of {', '.join(EXPORT_FORMATS)}",
+            data=None,
+            is_exception=False,
+            error_message=None
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+
+    # Rows are fetched in batches through a server-side cursor and written as
+    # they arrive, so memory stays flat however large the catalogue gets.
+    rows = _export_ndjson() if export_format == "ndjson" else _export_csv()
+    return Response(stream_with_context(rows), mimetype=EXPORT_FORMATS[export_format], headers={
+        "Content-Disposition": f"attachment; filename=monuments.{export_format}",
+    })
+
+
 @bp.route('condition/<monument_id>', methods=['PUT'])
 def update_monument_condition(monument_id):
     try:
@@ -55,12 +341,16 @@ def update_monument_condition(monument_id):
 
             session.add(monument)
             session.commit()
-            session.refresh(monument)
+            cache.invalidate("monuments")
+            bundle.builder.schedule()
+
+            # The monument_view row was refreshed by trigger in the same commit
+            monument_view = session.get(db_models.MonumentView, monument.id)
 
             return NetworkResponse(
                 status=NetworkingStatus.SUCCESS.value,
                 message="Monument Updated!",
-                data=monument.to_json(),
+                data=monument_view.to_json(),
                 is_exception=False,
                 error_message=None
             ).to_json(), HttpStatusCode.OK.value,
@@ -76,24 +366,27 @@ def update_monument_condition(monument_id):
 
 
 @bp.route("/search", methods=['GET', 'POST'])
+@conditional
+@cache.cached("monuments")
 def get_monument_by_name():
     try:
         data = request.get_json()
         monument_name = data["monument_name"]
         print("Monument Name: ", monument_name)
         page = request.args.get('page', default=0, type=int)
-        per_page = request.args.get('per_page', default=10, type=int)
+        per_page = get_per_page(10)
+        fields = parse_monument_fields(request.args.get('fields', default=None, type=str))
 
         with Session(engine) as session:
-            statement = select(db_models.Monuments).where(
-                col(db_models.Monuments.monument_name).contains(monument_name)).limit(per_page).offset(page * per_page).order_by(db_models.Monuments.id.asc())
-            result = session.exec(statement).all()
+            statement = select_monuments_matching(monument_name, fields).limit(per_page).offset(page * per_page)
+            result = fetch_all(session, statement, fields)
+            total = session.exec(count_monuments_matching(monument_name)).one()
             return NetworkResponse(
                 status=NetworkingStatus.SUCCESS.value,
                 message="Monument Retrieved!",
                 data={
-                    "monuments": [monument.to_json() for monument in result],
-                    "total": len(result),
+                    "monuments": [to_json(monument, fields) for monument in result],
+                    "total": total,
                     "is_empty": len(result) == 0,
                     "page": page,
                     "per_page": per_page
@@ -101,6 +394,14 @@ def get_monument_by_name():
                 is_exception=False,
                 error_message=None
             ).to_json(), HttpStatusCode.OK.value,
+    except InvalidFields as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid fields",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
     except Exception as e:
         return NetworkResponse(
             status=NetworkingStatus.FAILED.value,
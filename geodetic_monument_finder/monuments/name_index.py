@@ -0,0 +1,49 @@
+import bisect
+
+from sqlmodel import select
+
+import db_models
+from db_schema import MONUMENT_NAMES_VERSION
+from geodetic_monument_finder.monuments.versioned_index import VersionedIndex
+
+
+def normalize(name):
+    return name.strip().casefold()
+
+
+class NameIndex(VersionedIndex):
+    """Per-worker sorted array of normalized monument names for prefix lookups.
+
+    Entries are ``(normalized_name, id, monument_name)`` tuples kept in sorted
+    order, so every name sharing a prefix sits in one contiguous run found with
+    a single bisect. The set of monument ids comes along for free and lets
+    report submissions be checked without a query. Rebuilt in the background
+    when the ``monument_names`` version moves, which only renames and
+    monument inserts or deletes do.
+    """
+
+    version_name = MONUMENT_NAMES_VERSION
+
+    def _load(self, session):
+        statement = select(db_models.Monuments.id, db_models.Monuments.monument_name)
+        rows = session.exec(statement).all()
+        entries = sorted((normalize(name), monument_id, name) for monument_id, name in rows)
+        return entries, frozenset(monument_id for monument_id, _ in rows)
+
+    def has_monument(self, monument_id):
+        _, ids = self._current()
+        return monument_id in ids
+
+    def complete(self, prefix, limit):
+        entries, _ = self._current()
+        key = normalize(prefix)
+        start = bisect.bisect_left(entries, (key,))
+        result = []
+        for normalized_name, monument_id, name in entries[start:start + limit]:
+            if not normalized_name.startswith(key):
+                break
+            result.append((monument_id, name))
+        return result
+
+
+index = NameIndex()
@@ -0,0 +1,107 @@
+import heapq
+import math
+
+from sqlmodel import select
+
+import db_models
+from db_schema import MONUMENT_POINTS_VERSION
+from geodetic_monument_finder.monuments.versioned_index import VersionedIndex
+
+EARTH_RADIUS_M = 6371008.8
+
+
+def _to_unit_vector(lat, lon):
+    # Points live on the unit sphere so straight-line (chord) distance orders
+    # them exactly like great-circle distance, without any haversine per node.
+    lat_r = math.radians(lat)
+    lon_r = math.radians(lon)
+    cos_lat = math.cos(lat_r)
+    return cos_lat * math.cos(lon_r), cos_lat * math.sin(lon_r), math.sin(lat_r)
+
+
+def _chord_to_metres(chord_squared):
+    return 2 * EARTH_RADIUS_M * math.asin(min(1.0, math.sqrt(chord_squared) / 2))
+
+
+class KDTree:
+    """Static 3-d tree stored as a median-ordered array (no node objects)."""
+
+    def __init__(self, points):
+        items = [(monument_id, _to_unit_vector(lat, lon)) for monument_id, lat, lon in points]
+        self._build(items, 0, len(items), 0)
+        self._ids = [monument_id for monument_id, _ in items]
+        self._coords = [vector for _, vector in items]
+
+    def __len__(self):
+        return len(self._ids)
+
+    def _build(self, items, lo, hi, depth):
+        if hi - lo <= 1:
+            return
+        axis = depth % 3
+        items[lo:hi] = sorted(items[lo:hi], key=lambda item: item[1][axis])
+        mid = (lo + hi) >> 1
+        self._build(items, lo, mid, depth + 1)
+        self._build(items, mid + 1, hi, depth + 1)
+
+    def nearest(self, lat, lon, k):
+        if k <= 0 or not self._ids:
+            return []
+
+        target = _to_unit_vector(lat, lon)
+        ids = self._ids
+        coords = self._coords
+        heap = []  # max-heap on squared chord distance: (-d2, id)
+
+        def search(lo, hi, depth):
+            if lo >= hi:
+                return
+            mid = (lo + hi) >> 1
+            point = coords[mid]
+            dx = target[0] - point[0]
+            dy = target[1] - point[1]
+            dz = target[2] - point[2]
+            d2 = dx * dx + dy * dy + dz * dz
+            if len(heap) < k:
+                heapq.heappush(heap, (-d2, ids[mid]))
+            elif d2 < -heap[0][0]:
+                heapq.heapreplace(heap, (-d2, ids[mid]))
+
+            diff = target[depth % 3] - point[depth % 3]
+            if diff < 0:
+                near, far = (lo, mid), (mid + 1, hi)
+            else:
+                near, far = (mid + 1, hi), (lo, mid)
+            search(near[0], near[1], depth + 1)
+            if len(heap) < k or diff * diff < -heap[0][0]:
+                search(far[0], far[1], depth + 1)
+
+        search(0, len(ids), 0)
+        return [(monument_id, _chord_to_metres(-neg_d2)) for neg_d2, monument_id in sorted(heap, reverse=True)]
+
+
+class SpatialIndex(VersionedIndex):
+    """Per-worker nearest-monument index over the WGS84 coordinates.
+
+    Rebuilt in the background when the ``monument_points`` version moves,
+    which only coordinate changes and monument inserts or deletes do.
+    """
+
+    version_name = MONUMENT_POINTS_VERSION
+
+    def _load(self, session):
+        statement = select(db_models.MonumentView.id, db_models.MonumentView.wgs84_lat,
+                           db_models.MonumentView.wgs84_lon)
+        points = []
+        for monument_id, lat, lon in session.exec(statement).all():
+            try:
+                points.append((monument_id, float(lat), float(lon)))
+            except (TypeError, ValueError):
+                continue
+        return KDTree(points)
+
+    def nearest(self, lat, lon, k):
+        return self._current().nearest(lat, lon, k)
+
+
+index = SpatialIndex()
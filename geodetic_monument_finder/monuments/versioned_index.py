@@ -0,0 +1,84 @@
+import logging
+import threading
+import time
+
+from sqlmodel import Session
+
+from db import engine
+from db_queries import get_dataset_version
+
+# Seconds between the background thread's version checks
+REFRESH_INTERVAL = 1.0
+
+
+class VersionedIndex:
+    """Per-worker in-memory snapshot rebuilt when a named version moves.
+
+    Lookups read the current snapshot without touching the database. A
+    daemon thread checks the version every ``REFRESH_INTERVAL`` seconds and
+    swaps in a rebuilt snapshot once it is ready, so writes from any worker
+    or ``flask populate`` show up within that interval and never stall a
+    request. Subclasses set ``version_name`` and implement ``_load``.
+    """
+
+    version_name = None
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        # Serializes loads, so reset() waits out a rebuild in progress
+        self._lock = threading.Lock()
+        self._thread_lock = threading.Lock()
+        self._snapshot = None
+        self._version = None
+        self._thread = None
+
+    def _load(self, session):
+        raise NotImplementedError
+
+    def refresh(self):
+        """Rebuild if the version moved; True when a new snapshot was swapped in."""
+        with self._lock:
+            with Session(engine) as session:
+                version, _ = get_dataset_version(session, self.version_name)
+                if self._snapshot is not None and version == self._version:
+                    return False
+                snapshot = self._load(session)
+            self._snapshot, self._version = snapshot, version
+            return True
+
+    def _current(self):
+        snapshot = self._snapshot
+        while snapshot is None:
+            # Only the first lookup in a worker (or after reset) loads inline
+            self.refresh()
+            snapshot = self._snapshot
+        self._start()
+        return snapshot
+
+    def _start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                name = f"{self.version_name}-refresh"
+                self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            time.sleep(REFRESH_INTERVAL)
+            if self._snapshot is None:
+                continue
+            try:
+                self.refresh()
+            except Exception:
+                # Keep serving the last snapshot; the next check tries again
+                self.logger.exception("Failed to refresh the %s index", self.version_name)
+
+    def reset(self):
+        with self._lock:
+            self._snapshot = None
+            self._version = None
+
+    def warm(self):
+        self._current()
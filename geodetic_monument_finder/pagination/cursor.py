@@ -0,0 +1,27 @@
+import base64
+import json
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(kind, *keys):
+    """Opaque, URL-safe token holding the sort keys of the last row served."""
+    raw = json.dumps([kind, *keys], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor, kind, size):
+    """Return the ``size`` sort keys stored in ``cursor``, checking its kind."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (ValueError, TypeError):
+        raise InvalidCursor("Malformed cursor")
+
+    if not isinstance(values, list) or len(values) != size + 1 or values[0] != kind:
+        raise InvalidCursor(f"Not a {kind} cursor")
+    if not all(isinstance(value, int) for value in values[1:]):
+        raise InvalidCursor("Malformed cursor")
+    return values[1:]
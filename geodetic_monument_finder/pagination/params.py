@@ -0,0 +1,13 @@
+from flask import request
+
+MAX_PER_PAGE = 1000
+
+
+def get_per_page(default):
+    """``?per_page=`` clamped to 1..MAX_PER_PAGE.
+
+    Zero or negative sizes would otherwise slice off the look-ahead row the
+    next_cursor is built from, and SQLite reads LIMIT -1 as no limit.
+    """
+    per_page = request.args.get('per_page', default=default, type=int)
+    return max(1, min(per_page, MAX_PER_PAGE))
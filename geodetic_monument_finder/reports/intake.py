@@ -0,0 +1,357 @@
+import atexit
+import collections
+import fcntl
+import glob
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, col, select
+
+import db_models
+from db import engine
+from geodetic_monument_finder.reports import open_reports
+
+LOG_PATTERN = "intake-*.log"
+DEAD_LETTER_FILE = "dead-letter.log"
+# SQLite INTEGER is a signed 64-bit value
+MIN_ID = -2 ** 63
+MAX_ID = 2 ** 63 - 1
+
+
+def is_valid_report(monument_id, condition):
+    """Whether a submission can be written at all; bad ones would sink their batch."""
+    return (
+        type(monument_id) is int and MIN_ID <= monument_id <= MAX_ID
+        and isinstance(condition, str) and bool(condition)
+    )
+
+
+class ReportIntake:
+    """Write-behind buffer for public report submissions.
+
+    ``submit`` appends the report to this worker's append-only log, waits
+    for it to be fsync'd and queues it, then returns a provisional intake id
+    without touching the database. Submissions arriving together share one
+    fsync. A background thread group-commits the queue every
+    ``batch_size`` reports or ``flush_interval`` seconds, whichever comes
+    first, and records each intake id in ``reportintake`` in the same
+    transaction.
+
+    Once the log passes ``max_log_bytes`` the next submission starts a new
+    one, and a retired log is deleted when every line in it has been
+    written, so the logs stay bounded under steady load.
+
+    Each worker holds an flock on its own logs. On startup ``recover``
+    replays the logs nobody holds, which belong to workers that died. Ids
+    already recorded are skipped, so a replay never duplicates a report.
+    """
+
+    def __init__(self):
+        self.directory = None
+        self.batch_size = 500
+        self.flush_interval = 0.05
+        self.max_log_bytes = 1024 * 1024
+        self.logger = logging.getLogger(__name__)
+        # Guards _pending, (log, record) pairs, and wakes the writer thread
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._pending = []
+        # Guards the current log, the line counter and each open log's
+        # count of lines not yet written to the database
+        self._log_lock = threading.Lock()
+        self._log = None
+        self._logged = 0
+        self._unwritten = {}
+        # Group fsync: lines up to _synced are durable
+        self._sync_condition = threading.Condition()
+        self._syncing = False
+        self._synced = 0
+        self._thread = None
+
+    def init_app(self, app):
+        app.config.setdefault("INTAKE_DIR", os.path.join(app.instance_path, "intake"))
+        app.config.setdefault("INTAKE_BATCH_SIZE", 500)
+        app.config.setdefault("INTAKE_FLUSH_INTERVAL", 0.05)
+        app.config.setdefault("INTAKE_MAX_LOG_BYTES", 1024 * 1024)
+        self.directory = app.config["INTAKE_DIR"]
+        self.batch_size = app.config["INTAKE_BATCH_SIZE"]
+        self.flush_interval = app.config["INTAKE_FLUSH_INTERVAL"]
+        self.max_log_bytes = app.config["INTAKE_MAX_LOG_BYTES"]
+        self.logger = app.logger
+        os.makedirs(self.directory, exist_ok=True)
+        # Anything still queued at a clean shutdown is written now rather
+        # than left for the next start to replay
+        atexit.register(self.close)
+
+    def _open_log(self):
+        path = os.path.join(self.directory, f"intake-{os.getpid()}-{uuid.uuid4().hex[:8]}.log")
+        log = open(path, "ab")
+        fcntl.flock(log, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return log
+
+    def submit(self, monument_id, condition):
+        record = {"intake_id": uuid.uuid4().hex, "monument_id": monument_id, "condition": condition}
+        line = json.dumps(record).encode() + b"\n"
+        with self._log_lock:
+            if self._log is None:
+                self._log = self._open_log()
+                self._unwritten[self._log] = 0
+            log = self._log
+            log.write(line)
+            log.flush()
+            self._logged += 1
+            self._unwritten[log] += 1
+            position = self._logged
+        self._sync(position)
+        with self._condition:
+            self._pending.append((log, record))
+            self._ensure_writer()
+            self._condition.notify()
+        return record["intake_id"]
+
+    def _sync(self, position):
+        """Return once the logs are fsync'd through line ``position``.
+
+        The first caller to find no fsync running becomes the leader and
+        fsyncs every line appended so far; the others wait on it and return
+        together, so concurrent submissions pay for one fsync between them.
+        """
+        while True:
+            with self._sync_condition:
+                while self._syncing and self._synced < position:
+                    self._sync_condition.wait()
+                if self._synced >= position:
+                    return
+                self._syncing = True
+            synced = self._synced
+            try:
+                # Held through the fsync so the log cannot be retired under
+                # it; a retired log was fsync'd when it was retired
+                with self._log_lock:
+                    target = self._logged
+                    if self._log is not None:
+                        os.fsync(self._log.fileno())
+                synced = target
+            finally:
+                with self._sync_condition:
+                    self._syncing = False
+                    self._synced = max(self._synced, synced)
+                    self._sync_condition.notify_all()
+
+    def is_pending(self, intake_id):
+        with self._condition:
+            return any(record["intake_id"] == intake_id for _, record in self._pending)
+
+    def _ensure_writer(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="report-intake", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                # Give the batch up to flush_interval to fill
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._pending) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+            try:
+                self.flush()
+            except Exception:
+                self.logger.exception("Failed to write queued reports, retrying")
+                time.sleep(1)
+
+    def flush(self):
+        """Write every queued report now, in batches of ``batch_size``."""
+        with self._flush_lock:
+            while True:
+                with self._condition:
+                    batch = self._pending[:self.batch_size]
+                if not batch:
+                    return
+                _write([record for _, record in batch], self._dead_letter)
+                with self._condition:
+                    del self._pending[:len(batch)]
+                with self._log_lock:
+                    for log, _ in batch:
+                        self._unwritten[log] -= 1
+                    self._trim_logs()
+
+    def _trim_logs(self):
+        # Counts rather than the queue decide, because a line can be logged
+        # but not yet queued while it waits for its fsync
+        for log, unwritten in list(self._unwritten.items()):
+            if unwritten:
+                continue
+            if log is self._log:
+                log.truncate(0)
+            else:
+                self._remove_log(log)
+        log = self._log
+        if log is not None and self._unwritten[log] and os.fstat(log.fileno()).st_size >= self.max_log_bytes:
+            # Retire it; the next submission opens a fresh log
+            os.fsync(log.fileno())
+            self._log = None
+
+    def _remove_log(self, log):
+        log.close()
+        os.remove(log.name)
+        del self._unwritten[log]
+
+    def close(self):
+        """Write everything queued, then close and delete this worker's logs."""
+        self.flush()
+        with self._log_lock:
+            for log, unwritten in list(self._unwritten.items()):
+                if not unwritten:
+                    self._remove_log(log)
+            if self._log not in self._unwritten:
+                self._log = None
+
+    def recover(self):
+        """Replay the logs of workers that exited before writing their queue.
+
+        Called at import, so it logs failures instead of raising; a log that
+        could not be replayed is kept for the next start.
+        """
+        if self.directory is None:
+            return 0
+        replayed = 0
+        for path in glob.glob(os.path.join(self.directory, LOG_PATTERN)):
+            try:
+                replayed += self._replay(path)
+            except Exception:
+                self.logger.exception("Failed to replay report intake log %s", path)
+        return replayed
+
+    def _replay(self, path):
+        with open(path, "rb") as log:
+            try:
+                fcntl.flock(log, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return 0  # a live worker's log
+            records = []
+            for line in log:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # torn final line from a crash mid-append
+            replayed = 0
+            for start in range(0, len(records), self.batch_size):
+                replayed += _write(records[start:start + self.batch_size], self._dead_letter)
+            os.remove(path)
+        return replayed
+
+    def _dead_letter(self, records, error):
+        """Set aside records that cannot be written, so they stop blocking the queue."""
+        self.logger.error("Moved %d report(s) to the dead-letter log: %s", len(records), error)
+        with open(os.path.join(self.directory, DEAD_LETTER_FILE), "ab") as dead_letter:
+            for record in records:
+                dead_letter.write(json.dumps({"record": record, "error": str(error)}).encode() + b"\n")
+            dead_letter.flush()
+            os.fsync(dead_letter.fileno())
+
+
+def _upsert_open_report(session, monument_id, condition, count):
+    # Inserts a new open report, or bumps the one the unique partial index
+    # already holds for this monument and condition
+    statement = sqlite_insert(db_models.Reports).values(
+        monument_id=monument_id, condition=condition, report_count=count)
+    statement = statement.on_conflict_do_update(
+        index_elements=[db_models.Reports.monument_id, db_models.Reports.condition],
+        index_where=db_models.Reports.is_resolved == False,  # noqa: E712
+        set_={"report_count": db_models.Reports.report_count + statement.excluded.report_count},
+    ).returning(db_models.Reports.id)
+    return session.exec(statement).scalar_one()
+
+
+def _bump_open_report(session, report_id, count):
+    # False when the report was resolved since the open index last saw it
+    result = session.exec(update(db_models.Reports).where(
+        db_models.Reports.id == report_id,
+        db_models.Reports.is_resolved == False,  # noqa: E712
+    ).values(report_count=db_models.Reports.report_count + count))
+    return result.rowcount == 1
+
+
+def _write_batch(records):
+    """Write records in a single transaction.
+
+    Repeats of an open report, within the records or against the table,
+    bump its report_count rather than adding rows. Returns how many records
+    were new; ids already in reportintake are skipped.
+    """
+    with Session(engine) as session:
+        intake_ids = [record["intake_id"] for record in records]
+        written = set(session.exec(select(db_models.ReportIntake.intake_id).where(
+            col(db_models.ReportIntake.intake_id).in_(intake_ids))).all())
+        records = [record for record in records if record["intake_id"] not in written]
+
+        counts = collections.Counter((record["monument_id"], record["condition"]) for record in records)
+        report_ids = {}
+        for (monument_id, condition), count in counts.items():
+            report_id = open_reports.index.get(monument_id, condition)
+            if report_id is None or not _bump_open_report(session, report_id, count):
+                report_id = _upsert_open_report(session, monument_id, condition, count)
+            report_ids[(monument_id, condition)] = report_id
+
+        session.add_all([
+            db_models.ReportIntake(
+                intake_id=record["intake_id"],
+                report_id=report_ids[(record["monument_id"], record["condition"])])
+            for record in records
+        ])
+        session.commit()
+
+    for (monument_id, condition), report_id in report_ids.items():
+        open_reports.index.add(monument_id, condition, report_id)
+    return len(records)
+
+
+def _write(records, dead_letter):
+    """Write one batch, isolating records that cannot be written.
+
+    The batch normally goes in one transaction. If that fails for a reason
+    other than the database being unavailable, each (monument_id, condition)
+    group is retried on its own and the groups that still fail are handed
+    to ``dead_letter``. OperationalError ("database is locked") propagates
+    so the caller retries the whole batch.
+    """
+    malformed = [record for record in records if not isinstance(record, dict) or "intake_id" not in record
+                 or not is_valid_report(record.get("monument_id"), record.get("condition"))]
+    if malformed:
+        dead_letter(malformed, "malformed record")
+        records = [record for record in records if record not in malformed]
+    try:
+        return _write_batch(records)
+    except OperationalError:
+        raise
+    except Exception:
+        pass
+
+    groups = {}
+    for record in records:
+        groups.setdefault((record["monument_id"], record["condition"]), []).append(record)
+    written = 0
+    for group in groups.values():
+        try:
+            written += _write_batch(group)
+        except OperationalError:
+            raise
+        except Exception as e:
+            dead_letter(group, e)
+    return written
+
+
+intake = ReportIntake()
@@ -0,0 +1,66 @@
+import threading
+
+from sqlmodel import Session, select
+
+import db_models
+from db import engine
+
+
+class OpenReportIndex:
+    """Per-worker map of ``(monument_id, condition)`` to the open report's id.
+
+    It mirrors the unique partial index on unresolved reports, so a repeat
+    submission finds the report to bump with one dict lookup. Other workers
+    write too, so an entry can go stale. Writers treat it as a hint and fall
+    back to the database index when it misses or is out of date.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._open = None
+
+    def _load(self):
+        with Session(engine) as session:
+            statement = select(
+                db_models.Reports.monument_id, db_models.Reports.condition, db_models.Reports.id
+            ).where(db_models.Reports.is_resolved == False)  # noqa: E712
+            rows = session.exec(statement).all()
+        self._open = {(monument_id, condition): report_id for monument_id, condition, report_id in rows}
+
+    def _ensure_loaded(self):
+        if self._open is None:
+            with self._lock:
+                if self._open is None:
+                    self._load()
+        return self._open
+
+    def get(self, monument_id, condition):
+        return self._ensure_loaded().get((monument_id, condition))
+
+    def add(self, monument_id, condition, report_id):
+        with self._lock:
+            if self._open is not None:
+                self._open[(monument_id, condition)] = report_id
+
+    def discard(self, monument_id, condition):
+        with self._lock:
+            if self._open is not None:
+                self._open.pop((monument_id, condition), None)
+
+    def discard_monuments(self, monument_ids):
+        """Forget every open report on these monuments, after a resolve."""
+        monument_ids = set(monument_ids)
+        with self._lock:
+            if self._open is not None:
+                for key in [key for key in self._open if key[0] in monument_ids]:
+                    del self._open[key]
+
+    def reset(self):
+        with self._lock:
+            self._open = None
+
+    def warm(self):
+        self._ensure_loaded()
+
+
+index = OpenReportIndex()
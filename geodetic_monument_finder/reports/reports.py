@@ -1,39 +1,91 @@
 from flask import Blueprint, request
+from sqlalchemy import func, tuple_, update
 from sqlmodel import Session, select, col
 
 import db_models
 from db import engine
+from db_queries import get_row_count, select_monument_ids_named, select_reports
+from geodetic_monument_finder.cache.cache import cache
+from geodetic_monument_finder.cache.conditional import conditional
+from geodetic_monument_finder.monuments import bundle, name_index
+from geodetic_monument_finder.reports import intake, open_reports
+from geodetic_monument_finder.models.fields import InvalidFields, fetch_all, parse_report_fields, reports_to_json
 from geodetic_monument_finder.models.network_response import NetworkResponse, NetworkingStatus, HttpStatusCode
+from geodetic_monument_finder.pagination.cursor import InvalidCursor, decode_cursor, encode_cursor
+from geodetic_monument_finder.pagination.params import get_per_page
 
 bp = Blueprint('reports', __name__, url_prefix='/reports')
 
 
+def _report_page(session, statement, fields, page, per_page, cursor):
+    """One page of ``statement``'s reports and the cursor for the next one."""
+    # Open reports first; id breaks ties so pages never overlap
+    statement = statement.limit(per_page + 1).order_by(
+        db_models.Reports.is_resolved.asc(), db_models.Reports.id.asc())
+    if cursor:
+        is_resolved, last_id = decode_cursor(cursor, "reports", 2)
+        statement = statement.where(
+            tuple_(db_models.Reports.is_resolved, db_models.Reports.id) > tuple_(is_resolved, last_id))
+    else:
+        statement = statement.offset(page * per_page)
+    reports = fetch_all(session, statement, fields)
+
+    next_cursor = None
+    if len(reports) > per_page:
+        reports = reports[:per_page]
+        next_cursor = encode_cursor("reports", int(reports[-1].is_resolved), reports[-1].id)
+    return reports, next_cursor
+
+
 @bp.route('/', methods=["GET"])
+@conditional
 def get_reports():
     try:
 
         page = request.args.get('page', default=0, type=int)
-        per_page = request.args.get('per_page', default=10, type=int)
+        per_page = get_per_page(10)
+        cursor = request.args.get('cursor', default=None, type=str)
+        fields = parse_report_fields(request.args.get('fields', default=None, type=str))
+        # 1: reports carry monument_id and the monuments come once each in a side-map
+        monument_map = request.args.get('monument_map', default=0, type=int) == 1
 
         with Session(engine) as session:
-            statement = select(db_models.Reports).limit(per_page).offset(page * per_page).order_by(
-                db_models.Reports.is_resolved.asc())
-            reports = session.exec(statement).all()
+            reports, next_cursor = _report_page(session, select_reports(fields), fields, page, per_page, cursor)
 
+            reports_json, monuments = reports_to_json(reports, fields, monument_map)
             return NetworkResponse(
                 status=NetworkingStatus.SUCCESS.value,
                 message="Successfully fetched Reports",
                 data={
-                    "reports": [report.to_json() for report in reports],
-                    "total": len(reports),
+                    "reports": reports_json,
+                    "monuments": monuments,
+                    "total": get_row_count(session, "reports"),
                     "is_empty": len(reports) == 0,
                     "page": page,
-                    "per_page": per_page
+                    "per_page": per_page,
+                    "cursor": cursor,
+                    "next_cursor": next_cursor
                 },
                 is_exception=False,
                 error_message=None
             ).to_json(), HttpStatusCode.OK.value,
 
+    except InvalidCursor as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid cursor",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+    except InvalidFields as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid fields",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
     except Exception as e:
         return NetworkResponse(
             status=NetworkingStatus.FAILED.value,
@@ -45,35 +97,61 @@ def get_reports():
 
 
 @bp.route('/search', methods=["GET", "POST"])
+@conditional
 def get_report_by_monument_name():
     try:
         page = request.args.get('page', default=0, type=int)
-        per_page = request.args.get('per_page', default=10, type=int)
+        per_page = get_per_page(10)
+        cursor = request.args.get('cursor', default=None, type=str)
+        fields = parse_report_fields(request.args.get('fields', default=None, type=str))
+        # 1: reports carry monument_id and the monuments come once each in a side-map
+        monument_map = request.args.get('monument_map', default=0, type=int) == 1
 
         data = request.get_json()
         monument_name = data['monument_name']
 
         with Session(engine) as session:
-            statement = select(db_models.Reports).join(db_models.Monuments).where(
-                col(db_models.Monuments.monument_name).contains(monument_name))
-
-            reports = session.exec(statement).all()
+            # Names are matched through the FTS index, then reports are read in
+            # index order and the page stops at per_page
+            named = col(db_models.Reports.monument_id).in_(select_monument_ids_named(monument_name))
+            reports, next_cursor = _report_page(
+                session, select_reports(fields).where(named), fields, page, per_page, cursor)
+            total = session.exec(select(func.count()).select_from(db_models.Reports).where(named)).one()
 
+            reports_json, monuments = reports_to_json(reports, fields, monument_map)
             return NetworkResponse(
                 status=NetworkingStatus.SUCCESS.value,
                 message="Successfully fetched Reports",
                 data={
-                    "reports": [report.to_json() for report in reports],
-                    "total": len(reports),
+                    "reports": reports_json,
+                    "monuments": monuments,
+                    "total": total,
                     "is_empty": len(reports) == 0,
                     "page": page,
-                    "per_page": per_page
+                    "per_page": per_page,
+                    "cursor": cursor,
+                    "next_cursor": next_cursor
                 },
                 is_exception=False,
                 error_message=None
             ).to_json(), HttpStatusCode.OK.value,
 
-
+    except InvalidCursor as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid cursor",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+    except InvalidFields as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid fields",
+            data=None,
+            is_exception=False,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
     except Exception as e:
         return NetworkResponse(
             status=NetworkingStatus.FAILED.value,
@@ -84,6 +162,92 @@ def get_report_by_monument_name():
         ).to_json(), HttpStatusCode.EXCEPTION.value,
 
 
+SUMMARY_SORTS = {
+    "open_missing": db_models.MonumentReportSummary.open_missing,
+    "open_damaged": db_models.MonumentReportSummary.open_damaged,
+    "total": db_models.MonumentReportSummary.total,
+    "last_reported_at": db_models.MonumentReportSummary.last_reported_at,
+    "monument_id": db_models.MonumentReportSummary.monument_id,
+}
+SUMMARY_ORDERS = ("asc", "desc")
+
+
+@bp.route('/summary', methods=["GET"])
+@conditional
+def get_report_summary():
+    try:
+        page = request.args.get('page', default=0, type=int)
+        per_page = get_per_page(50)
+        sort = request.args.get('sort', default="open_missing", type=str)
+        order = request.args.get('order', default="desc", type=str)
+
+        if sort not in SUMMARY_SORTS or order not in SUMMARY_ORDERS:
+            return NetworkResponse(
+                status=NetworkingStatus.FAILED.value,
+                message=f"sort must be one of {', '.join(SUMMARY_SORTS)} and order asc or desc",
+                data=None,
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+
+        # monument_id breaks ties in the same direction, so the sort column's
+        # index serves the whole ORDER BY
+        direction = getattr(SUMMARY_SORTS[sort], order)
+        tie_break = getattr(db_models.MonumentReportSummary.monument_id, order)
+        statement = (
+            select(db_models.MonumentReportSummary, db_models.MonumentView.monument_name)
+            .outerjoin(db_models.MonumentView,
+                       db_models.MonumentView.id == db_models.MonumentReportSummary.monument_id)
+            .order_by(direction(), tie_break())
+            .limit(per_page).offset(page * per_page)
+        )
+
+        with Session(engine) as session:
+            rows = session.exec(statement).all()
+            total = session.exec(select(func.count()).select_from(db_models.MonumentReportSummary)).one()
+
+            return NetworkResponse(
+                status=NetworkingStatus.SUCCESS.value,
+                message="Successfully fetched Report Summary",
+                data={
+                    "summary": [{**summary.to_json(), "monument_name": monument_name}
+                                for summary, monument_name in rows],
+                    "total": total,
+                    "is_empty": len(rows) == 0,
+                    "page": page,
+                    "per_page": per_page,
+                    "sort": sort,
+                    "order": order
+                },
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.OK.value,
+
+    except Exception as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Failed to fetch report summary",
+            data=None,
+            is_exception=True,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.EXCEPTION.value,
+
+
+def _resolve_monuments(session, monument_ids, condition):
+    """Set the monuments' condition and close their open reports.
+
+    Two set-based UPDATEs in the caller's transaction; returns how many
+    reports were resolved.
+    """
+    session.exec(update(db_models.Monuments).where(col(db_models.Monuments.id).in_(monument_ids)).values(
+        condition=condition).execution_options(synchronize_session=False))
+    result = session.exec(update(db_models.Reports).where(
+        col(db_models.Reports.monument_id).in_(monument_ids),
+        col(db_models.Reports.is_resolved).is_(False)).values(
+        is_resolved=True).execution_options(synchronize_session=False))
+    return result.rowcount
+
+
 @bp.route('/resolve', methods=["PUT"])
 def resolve_report():
     try:
@@ -92,26 +256,25 @@ def resolve_report():
         monument_id = data["monument_id"]
 
         with Session(engine) as session:
-            statement = select(db_models.Monuments).where(db_models.Monuments.id == monument_id)
-            monument = session.exec(statement).one()
+            monument = session.get(db_models.Monuments, monument_id)
+            if monument is None:
+                return NetworkResponse(
+                    status=NetworkingStatus.FAILED.value,
+                    message=f"Monument {monument_id} not found",
+                    data=None,
+                    is_exception=False,
+                    error_message=None
+                ).to_json(), HttpStatusCode.NOT_FOUND.value,
 
-            monument.condition = condition
-            session.add(monument)
+            resolved = _resolve_monuments(session, [monument_id], condition)
             session.commit()
-            session.refresh(monument)
-
-            statement = select(db_models.Reports).join(db_models.Monuments).where(
-                db_models.Reports.monument_id == monument_id)
-            reports = session.exec(statement).all()
-            for report in reports:
-                report.is_resolved = True
-                session.add(report)
-                session.commit()
-                session.refresh(report)
+            open_reports.index.discard_monuments([monument_id])
+            cache.invalidate("monuments")
+            bundle.builder.schedule()
 
             return NetworkResponse(
                 status=NetworkingStatus.SUCCESS.value,
-                message=f"Resolved {len(reports)} reports for monument {monument_id}",
+                message=f"Resolved {resolved} reports for monument {monument_id}",
                 data={},
                 is_exception=False,
                 error_message=None
@@ -127,43 +290,91 @@ def resolve_report():
         ).to_json(), HttpStatusCode.EXCEPTION.value,
 
 
-@bp.route('', methods=["POST"])
-def create_report():
+@bp.route('/resolve/bulk', methods=["PUT"])
+def resolve_reports_bulk():
     try:
         data = request.get_json()
-        monument_id = data["monument_id"]
         condition = data["condition"]
+        monument_ids = list(dict.fromkeys(data["monument_ids"]))
 
         with Session(engine) as session:
-            # statement = select(db_models.Reports).where(db_models.Reports.monument_id == monument_id).where(
-            #     db_models.Reports.condition == condition)
-            # result = session.exec(statement).all()
-            #
-            # if len(result)> 0:
-            #     return NetworkResponse(
-            #         status=NetworkingStatus.FAILED.value,
-            #         message=f"This monument has already been reported as {condition}, contact the Administrator to confirm it's status",
-            #         data=None,
-            #         is_exception=False,
-            #         error_message=None
-            #     ).to_json(), HttpStatusCode.OK.value,
-            # else:
-            new_report = db_models.Reports(
-                monument_id=monument_id,
-                condition=condition
-            )
-            session.add(new_report)
+            statement = select(db_models.Monuments.id).where(col(db_models.Monuments.id).in_(monument_ids))
+            found = set(session.exec(statement).all())
+            missing = [monument_id for monument_id in monument_ids if monument_id not in found]
+
+            resolved = _resolve_monuments(session, list(found), condition) if found else 0
             session.commit()
-            session.refresh(new_report)
+            open_reports.index.discard_monuments(found)
+            cache.invalidate("monuments")
+            bundle.builder.schedule()
 
             return NetworkResponse(
                 status=NetworkingStatus.SUCCESS.value,
-                message=f"Monument Reported as {condition}",
-                data=new_report.to_json(),
+                message=f"Resolved {resolved} reports for {len(found)} monuments",
+                data={
+                    "resolved": resolved,
+                    "monument_ids": [monument_id for monument_id in monument_ids if monument_id in found],
+                    "missing_monument_ids": missing
+                },
                 is_exception=False,
                 error_message=None
             ).to_json(), HttpStatusCode.OK.value,
 
+    except Exception as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Failed to resolve reports",
+            data=None,
+            is_exception=True,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.EXCEPTION.value,
+
+
+@bp.route('', methods=["POST"])
+def create_report():
+    try:
+        data = request.get_json()
+        monument_id = data["monument_id"]
+        condition = data["condition"]
+
+        # Rejected here because a bad row would otherwise be dead-lettered
+        # after the client was told it was accepted
+        if not intake.is_valid_report(monument_id, condition):
+            return NetworkResponse(
+                status=NetworkingStatus.FAILED.value,
+                message="monument_id must be an integer and condition a non-empty string",
+                data=None,
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+
+        # Checked against this worker's in-memory ids: a read here would wait
+        # behind the intake writer's lock on the database
+        if not name_index.index.has_monument(monument_id):
+            return NetworkResponse(
+                status=NetworkingStatus.FAILED.value,
+                message=f"Monument {monument_id} not found",
+                data=None,
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.NOT_FOUND.value,
+
+        # Logged durably and queued; the report is written with the next batch
+        intake_id = intake.intake.submit(monument_id, condition)
+
+        return NetworkResponse(
+            status=NetworkingStatus.SUCCESS.value,
+            message=f"Monument Reported as {condition}",
+            data={
+                "intake_id": intake_id,
+                "monument_id": monument_id,
+                "condition": condition,
+                "is_resolved": False
+            },
+            is_exception=False,
+            error_message=None
+        ).to_json(), HttpStatusCode.ACCEPTED.value,
+
     except Exception as e:
         return NetworkResponse(
             status=NetworkingStatus.FAILED.value,
@@ -171,4 +382,47 @@ def create_report():
             data=None,
             is_exception=True,
             error_message=str(e)
-        ).to_json(), HttpStatusCode.EXCEPTION.value,
\ No newline at end of file
+        ).to_json(), HttpStatusCode.EXCEPTION.value,
+
+
+@bp.route('/intake/<intake_id>', methods=["GET"])
+def get_report_by_intake_id(intake_id):
+    try:
+        with Session(engine) as session:
+            written = session.get(db_models.ReportIntake, intake_id)
+            if written is not None:
+                report = session.get(db_models.Reports, written.report_id)
+                return NetworkResponse(
+                    status=NetworkingStatus.SUCCESS.value,
+                    message="Report Retrieved!",
+                    data=report.to_json(),
+                    is_exception=False,
+                    error_message=None
+                ).to_json(), HttpStatusCode.OK.value,
+
+        if intake.intake.is_pending(intake_id):
+            return NetworkResponse(
+                status=NetworkingStatus.SUCCESS.value,
+                message="Report is queued",
+                data={"intake_id": intake_id, "status": "pending"},
+                is_exception=False,
+                error_message=None
+            ).to_json(), HttpStatusCode.ACCEPTED.value,
+
+        # Other workers' queues are not visible from here, so an id we have
+        # not seen may still be on its way; the client should poll again
+        return NetworkResponse(
+            status=NetworkingStatus.SUCCESS.value,
+            message="Report is unknown or still queued in another worker",
+            data={"intake_id": intake_id, "status": "unknown_or_pending"},
+            is_exception=False,
+            error_message=None
+        ).to_json(), HttpStatusCode.ACCEPTED.value,
+    except Exception as e:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Failed to get report",
+            data=None,
+            is_exception=True,
+            error_message=str(e)
+        ).to_json(), HttpStatusCode.EXCEPTION.value,
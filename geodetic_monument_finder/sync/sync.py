@@ -0,0 +1,96 @@
+from flask import Blueprint, Response, request, stream_with_context
+from sqlmodel import Session, select
+
+import db_models
+from db import engine
+from db_queries import get_dataset_version, stream_instances
+from geodetic_monument_finder.models.network_response import NetworkResponse, NetworkingStatus, HttpStatusCode
+from geodetic_monument_finder.models.serializer import dumps
+
+bp = Blueprint('sync', __name__, url_prefix='/sync')
+
+BATCH_SIZE = 500
+
+
+def _changed_monuments(session, since, version):
+    statement = (
+        select(db_models.MonumentView, db_models.Monuments.version)
+        .join(db_models.Monuments, db_models.Monuments.id == db_models.MonumentView.id)
+        .where(db_models.Monuments.version > since, db_models.Monuments.version <= version)
+        .order_by(db_models.Monuments.version)
+        .execution_options(yield_per=BATCH_SIZE)
+    )
+    for monument, row_version in session.exec(statement):
+        yield {**monument.to_json(), "version": row_version}
+        # Rows pair the monument with its version, so stream_instances can't
+        # expunge them for us
+        session.expunge(monument)
+
+
+def _changed_reports(session, since, version):
+    # Bare report rows: the client already has (or is receiving) the monuments
+    statement = (
+        select(db_models.Reports)
+        .where(db_models.Reports.version > since, db_models.Reports.version <= version)
+        .order_by(db_models.Reports.version)
+    )
+    for report in stream_instances(session, statement, BATCH_SIZE):
+        yield {
+            "id": report.id,
+            "monument_id": report.monument_id,
+            "condition": report.condition,
+            "is_resolved": report.is_resolved,
+            "report_count": report.report_count,
+            "version": report.version,
+        }
+
+
+def _tombstones(session, since, version):
+    statement = (
+        select(db_models.Tombstones)
+        .where(db_models.Tombstones.version > since, db_models.Tombstones.version <= version)
+        .order_by(db_models.Tombstones.version)
+    )
+    for tombstone in stream_instances(session, statement, BATCH_SIZE):
+        yield {"table": tombstone.table_name, "id": tombstone.row_id, "version": tombstone.version}
+
+
+def _json_array(rows):
+    yield b"["
+    for i, row in enumerate(rows):
+        yield (b"," if i else b"") + dumps(row)
+    yield b"]"
+
+
+def _stream_changes(since):
+    with Session(engine) as session:
+        # Everything is bounded by the version read here. A row changed while
+        # we stream has moved past it and goes out in the client's next sync,
+        # so the response stays consistent without holding a read transaction.
+        version, _ = get_dataset_version(session)
+        yield (
+            b'{"status": ' + dumps(NetworkingStatus.SUCCESS.value) + b', "message": "Changes Retrieved!", '
+            b'"data": {"since": ' + dumps(since) + b', "version": ' + dumps(version) + b', "monuments": '
+        )
+        yield from _json_array(_changed_monuments(session, since, version))
+        yield b', "reports": '
+        yield from _json_array(_changed_reports(session, since, version))
+        yield b', "tombstones": '
+        yield from _json_array(_tombstones(session, since, version))
+        yield b'}, "is_exception": false, "error_message": null}'
+
+
+@bp.route('', methods=['GET'])
+def get_changes():
+    since = request.args.get('since', default=0, type=int)
+    if since < 0:
+        return NetworkResponse(
+            status=NetworkingStatus.FAILED.value,
+            message="Invalid since",
+            data=None,
+            is_exception=False,
+            error_message="since must be a dataset version (0 for everything)"
+        ).to_json(), HttpStatusCode.BAD_REQUEST.value,
+
+    # Streamed so a full sync from 0 never builds the whole payload in memory
+    return Response(stream_with_context(_stream_changes(since)), mimetype="application/json")
@@ -0,0 +1,81 @@
+"""Convert the point tables' coordinate columns from VARCHAR to REAL.
+
+Empty DELTA_* strings become NULL and the lat/lon and UTM northing/easting
+indexes are created. Each table is rebuilt inside a single transaction, and
+tables that are already numeric are skipped, so the step is safe to re-run.
+The triggers and R*Tree that depend on these tables are recreated by the
+db_schema.create_all call at the end of migrations.upgrade.
+"""
+import sqlite3
+
+from sqlalchemy import MetaData
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+import db_models
+from db import sqlite_file_name
+
+POINT_MODELS = (
+    db_models.GaussPoints,
+    db_models.WGS84Points,
+    db_models.UTMPoints,
+    db_models.DeltaPoints,
+)
+
+
+def _declared_types(connection, table_name):
+    return {row[1]: row[2] for row in connection.execute(f"PRAGMA table_info({table_name})")}
+
+
+def _converted(column):
+    if column.nullable:
+        return f"CAST(NULLIF(TRIM({column.name}), '') AS REAL)"
+    return f"CAST({column.name} AS REAL)"
+
+
+def migrate_table(connection, model):
+    table = model.__table__
+    declared = _declared_types(connection, table.name)
+    coordinates = [column for column in table.columns if column.name != "id"]
+    if not declared or all(declared[column.name] != "VARCHAR" for column in coordinates):
+        return False
+
+    dialect = sqlite.dialect()
+    new_table = table.to_metadata(MetaData(), name=f"{table.name}_numeric")
+    column_names = ", ".join(column.name for column in table.columns)
+    converted = ", ".join(["id"] + [_converted(column) for column in coordinates])
+
+    connection.execute(str(CreateTable(new_table).compile(dialect=dialect)))
+    connection.execute(
+        f"INSERT INTO {new_table.name} ({column_names}) SELECT {converted} FROM {table.name}"
+    )
+    connection.execute(f"DROP TABLE {table.name}")
+    connection.execute(f"ALTER TABLE {new_table.name} RENAME TO {table.name}")
+    for index in table.indexes:
+        connection.execute(str(CreateIndex(index, if_not_exists=True).compile(dialect=dialect)))
+    return True
+
+
+def migrate():
+    connection = sqlite3.connect(sqlite_file_name, isolation_level=None)
+    try:
+        connection.execute("PRAGMA foreign_keys = OFF")
+        # Triggers on monuments (monument_view, sync) join the point tables
+        # by name. Between the DROP and the RENAME they point at nothing, and
+        # the modern RENAME re-checks every trigger and fails. The legacy
+        # RENAME leaves them alone, and they bind to the new table by name.
+        connection.execute("PRAGMA legacy_alter_table = ON")
+        connection.execute("BEGIN IMMEDIATE")
+        migrated = [model.__tablename__ for model in POINT_MODELS if migrate_table(connection, model)]
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    else:
+        if migrated:
+            # Reclaim the pages left behind by the dropped VARCHAR tables
+            connection.execute("VACUUM")
+    finally:
+        connection.close()
+
+    return migrated
@@ -0,0 +1,73 @@
+"""Add reports.report_count and merge duplicate open reports.
+
+Each set of unresolved reports sharing a monument and condition is folded
+into its oldest row. That row's report_count becomes the size of the set,
+the others are deleted, and their intake ids are pointed at the kept row.
+The unique partial index created by db_schema.create_all at the end of
+migrations.upgrade then keeps the set at one row. The sync update trigger
+is dropped so create_all recreates it with report_count. Reports that
+already have the column are left alone, so the step is safe to re-run.
+"""
+import sqlite3
+
+import db_schema
+from db import sqlite_file_name
+
+SUPERSEDED_TRIGGERS = ("sync_reports_update",)
+
+
+def _column_names(connection, table_name):
+    return {row[1] for row in connection.execute(f"PRAGMA table_info({table_name})")}
+
+
+def _table_exists(connection, name):
+    statement = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+    return connection.execute(statement, (name,)).fetchone() is not None
+
+
+def merge_open_duplicates(connection):
+    duplicates = connection.execute(
+        "SELECT min(id), group_concat(id), sum(report_count) FROM reports WHERE is_resolved = 0 "
+        "GROUP BY monument_id, condition HAVING count(*) > 1"
+    ).fetchall()
+    if not duplicates:
+        return 0
+
+    has_intake = _table_exists(connection, "reportintake")
+    # Before the sync tables exist the kept rows stay at version 0, and
+    # create_all stamps them along with every other row
+    stamped = _table_exists(connection, "datasetversion")
+    if stamped:
+        connection.execute(db_schema.BUMP_VERSION)
+    stamp = f", version = {db_schema.CURRENT_VERSION}, updated_at = CURRENT_TIMESTAMP" if stamped else ""
+    merged = 0
+    for kept_id, ids, total in duplicates:
+        others = [int(report_id) for report_id in ids.split(",") if int(report_id) != kept_id]
+        placeholders = ", ".join("?" * len(others))
+        connection.execute(f"UPDATE reports SET report_count = ?{stamp} WHERE id = ?", (total, kept_id))
+        if has_intake:
+            connection.execute(f"UPDATE reportintake SET report_id = ? WHERE report_id IN ({placeholders})",
+                               (kept_id, *others))
+        # The delete triggers tombstone these for /sync and update rowcounts
+        connection.execute(f"DELETE FROM reports WHERE id IN ({placeholders})", others)
+        merged += len(others)
+    return merged
+
+
+def migrate():
+    connection = sqlite3.connect(sqlite_file_name, isolation_level=None)
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        merged = None
+        if "report_count" not in _column_names(connection, "reports"):
+            connection.execute("ALTER TABLE reports ADD COLUMN report_count INTEGER NOT NULL DEFAULT 1")
+            for name in SUPERSEDED_TRIGGERS:
+                connection.execute(f"DROP TRIGGER IF EXISTS {name}")
+            merged = merge_open_duplicates(connection)
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    finally:
+        connection.close()
+    return merged
@@ -0,0 +1,52 @@
+"""Add the version/updated_at columns that /sync reads to monuments and reports.
+
+Existing rows are stamped with a fresh dataset version by the
+db_schema.create_all call at the end of migrations.upgrade.
+The script also drops the older triggers that bumped the dataset version
+without stamping rows, and the monument_view trigger that fired on every
+UPDATE. create_all recreates them in their current form. Tables that already
+have the columns are left alone, so the step is safe to re-run.
+"""
+import sqlite3
+
+import db_schema
+from db import sqlite_file_name
+
+SUPERSEDED_TRIGGERS = ("monument_view_monuments_update",)
+
+
+def _column_names(connection, table_name):
+    return {row[1] for row in connection.execute(f"PRAGMA table_info({table_name})")}
+
+
+def migrate_table(connection, table_name):
+    columns = _column_names(connection, table_name)
+    if not columns or "version" in columns:
+        return False
+    connection.execute(f"ALTER TABLE {table_name} ADD COLUMN version INTEGER NOT NULL DEFAULT 0")
+    connection.execute(f"ALTER TABLE {table_name} ADD COLUMN updated_at DATETIME")
+    return True
+
+
+def _drop_superseded_triggers(connection):
+    names = [row[0] for row in connection.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'datasetversion\\_%' ESCAPE '\\'"
+    )]
+    for name in names + list(SUPERSEDED_TRIGGERS):
+        connection.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def migrate():
+    connection = sqlite3.connect(sqlite_file_name, isolation_level=None)
+    try:
+        connection.execute("BEGIN IMMEDIATE")
+        migrated = [table_name for table_name in db_schema.SYNCED_TABLES if migrate_table(connection, table_name)]
+        if migrated:
+            _drop_superseded_triggers(connection)
+        connection.execute("COMMIT")
+    except Exception:
+        connection.execute("ROLLBACK")
+        raise
+    finally:
+        connection.close()
+    return migrated
@@ -0,0 +1,30 @@
+"""Bring a database.db from any earlier revision up to the current schema.
+
+The steps run in order, each changing only the tables it owns. Then one
+db_schema.create_all builds everything derived from them: indexes, the
+R*Tree, FTS, rowcounts, monument_view, the report summary and the sync
+triggers. Every step skips work that is already done, so the upgrade is
+safe to re-run.
+
+    python -m migrations.upgrade
+"""
+import db_schema
+from db import engine
+from migrations import numeric_coordinates, report_counts, sync_versions
+
+STEPS = (
+    ("numeric_coordinates", numeric_coordinates.migrate),
+    ("sync_versions", sync_versions.migrate),
+    ("report_counts", report_counts.migrate),
+)
+
+
+def upgrade():
+    results = [(name, migrate()) for name, migrate in STEPS]
+    db_schema.create_all(engine)
+    return results
+
+
+if __name__ == "__main__":
+    for name, result in upgrade():
+        print(f"{name}: {'nothing to do' if result in (None, []) else result}")
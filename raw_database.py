@@ -1,42140 +0,0 @@
-DATABASE = [
-  {
-    "MONUNUM": "Tsm850",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10697.2,
-    "GAUSS_X": 1971888,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8027882.098,
-    "UTM_E": 298729.552,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm853",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11456.4,
-    "GAUSS_X": 1972564,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8027213.89,
-    "UTM_E": 299496.064,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm852",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11119.7,
-    "GAUSS_X": 1972511,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8027263.25,
-    "UTM_E": 299158.775,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm851",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10965.3,
-    "GAUSS_X": 1972443,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8027329.941,
-    "UTM_E": 299003.588,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "P10",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10645.6,
-    "GAUSS_X": 1981810,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8017958.959,
-    "UTM_E": 298784.344,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "P4",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10728.1,
-    "GAUSS_X": 1981718,
-    "LAT_WGS84": -17.919,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8018051.589,
-    "UTM_E": 298865.832,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "P5",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10755.5,
-    "GAUSS_X": 1981746,
-    "LAT_WGS84": -17.919,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8018024.752,
-    "UTM_E": 298893.495,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "P6",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10785,
-    "GAUSS_X": 1981775,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8017995.349,
-    "UTM_E": 298923.405,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "P7",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10725.2,
-    "GAUSS_X": 1981855,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8017914.883,
-    "UTM_E": 298864.43,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "P8",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10673.2,
-    "GAUSS_X": 1981804,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8017965.506,
-    "UTM_E": 298811.838,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "P9",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10685,
-    "GAUSS_X": 1981761,
-    "LAT_WGS84": -17.919,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8018008.274,
-    "UTM_E": 298823.201,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm284A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13764.7,
-    "GAUSS_X": 1973245,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8026557.71,
-    "UTM_E": 301811.752,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1290A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14058.9,
-    "GAUSS_X": 1973388,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8026418.134,
-    "UTM_E": 302107.466,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1293A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12216.6,
-    "GAUSS_X": 1972788,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.115,
-    "UTM_CM": 27,
-    "UTM_N": 8026998.012,
-    "UTM_E": 300258.648,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1291A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13436.6,
-    "GAUSS_X": 1973145,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.127,
-    "UTM_CM": 27,
-    "UTM_N": 8026654.772,
-    "UTM_E": 301482.527,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1292A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12544.9,
-    "GAUSS_X": 1972802,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8026988.174,
-    "UTM_E": 300587.151,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "11/P",
-    "TOPO": "Mbebe",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3985.6,
-    "GAUSS_X": 1941325,
-    "LAT_WGS84": -17.554,
-    "LON_WGS84": 30.962,
-    "UTM_CM": 27,
-    "UTM_N": 8058291.848,
-    "UTM_E": 283721.228,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "101/P",
-    "TOPO": "Harare",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4065.67,
-    "GAUSS_X": 1973032,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8026666.804,
-    "UTM_E": 292109.905,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "21/P",
-    "TOPO": "Mpitazebi",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -46828.8,
-    "GAUSS_X": 1961274,
-    "LAT_WGS84": -17.734,
-    "LON_WGS84": 31.441,
-    "UTM_CM": 27,
-    "UTM_N": 8038880.719,
-    "UTM_E": 334746.112,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "20/P",
-    "TOPO": "Domboshawa",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -18429.8,
-    "GAUSS_X": 1947704,
-    "LAT_WGS84": -17.612,
-    "LON_WGS84": 31.174,
-    "UTM_CM": 27,
-    "UTM_N": 8052149.326,
-    "UTM_E": 306205.368,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "65/Q",
-    "TOPO": "BEAN VANE",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8971.6,
-    "GAUSS_X": 1971888,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8027863.508,
-    "UTM_E": 297003.912,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "32/Q",
-    "TOPO": "STATION",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5516.38,
-    "GAUSS_X": 1972404,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8027310.628,
-    "UTM_E": 293554,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "76/Q",
-    "TOPO": "COMPENSATION",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5639.91,
-    "GAUSS_X": 1971271,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8028444.817,
-    "UTM_E": 293665.427,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "2/Q",
-    "TOPO": "MEIKLES HOTEL",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5494.13,
-    "GAUSS_X": 1971947,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8027767.812,
-    "UTM_E": 293526.858,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "8/Q",
-    "TOPO": "M.T.C",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9696.39,
-    "GAUSS_X": 1975246,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 31.091,
-    "UTM_CM": 27,
-    "UTM_N": 8024512.998,
-    "UTM_E": 297764.672,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "82/Q",
-    "TOPO": "V.H.F. HARARE",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5375.49,
-    "GAUSS_X": 1971379,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8028334.153,
-    "UTM_E": 293402.141,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "7/Q",
-    "TOPO": "C.M.B.W",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5214.79,
-    "GAUSS_X": 1971846,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8027865.252,
-    "UTM_E": 293246.424,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "12/Q",
-    "TOPO": "HOSPITAL",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4649.69,
-    "GAUSS_X": 1970227,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8029478.68,
-    "UTM_E": 292663.975,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "64/Q",
-    "TOPO": "NAZARETH SOUTH",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11071.3,
-    "GAUSS_X": 1967656,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8032118.53,
-    "UTM_E": 299058.543,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "31/Q",
-    "TOPO": "AERADIO N",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2497.43,
-    "GAUSS_X": 1971751,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8027931.815,
-    "UTM_E": 290527.829,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "11/Q",
-    "TOPO": "BISHOPS LEA",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2233.67,
-    "GAUSS_X": 1970819,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8028860.266,
-    "UTM_E": 290254.093,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "1/Q",
-    "TOPO": "D.R.Church",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4832.85,
-    "GAUSS_X": 1971620,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8028087.095,
-    "UTM_E": 292862.041,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "72/Q",
-    "TOPO": "R.T.V",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9551.64,
-    "GAUSS_X": 1967438,
-    "LAT_WGS84": -17.79,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8032320.026,
-    "UTM_E": 297536.452,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "177/S",
-    "TOPO": "Greendale",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14440,
-    "GAUSS_X": 1970066,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.136,
-    "UTM_CM": 27,
-    "UTM_N": 8029744.216,
-    "UTM_E": 302453.031,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "176/S",
-    "TOPO": "Epworth",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15082.9,
-    "GAUSS_X": 1975801,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.142,
-    "UTM_CM": 27,
-    "UTM_N": 8024016.294,
-    "UTM_E": 303157.288,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "175/S",
-    "TOPO": "Retreat",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7340.44,
-    "GAUSS_X": 1979517,
-    "LAT_WGS84": -17.899,
-    "LON_WGS84": 31.069,
-    "UTM_CM": 27,
-    "UTM_N": 8020216.363,
-    "UTM_E": 295454.388,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "174/S",
-    "TOPO": "Spreckley",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4607.59,
-    "GAUSS_X": 1985902,
-    "LAT_WGS84": -17.957,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8013802.357,
-    "UTM_E": 292789.983,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "173/S",
-    "TOPO": "Lochinvar",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4939.24,
-    "GAUSS_X": 1975446,
-    "LAT_WGS84": -17.862,
-    "LON_WGS84": 30.953,
-    "UTM_CM": 27,
-    "UTM_N": 8024156.91,
-    "UTM_E": 283129.925,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "170/s",
-    "TOPO": "Hindon",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6529.55,
-    "GAUSS_X": 1967697,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 30.938,
-    "UTM_CM": 27,
-    "UTM_N": 8031889.872,
-    "UTM_E": 281456.558,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "235/S",
-    "TOPO": "Sherwood",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 22818.75,
-    "GAUSS_X": 1989765,
-    "LAT_WGS84": -17.992,
-    "LON_WGS84": 30.785,
-    "UTM_CM": 27,
-    "UTM_N": 8009643.197,
-    "UTM_E": 265401.32,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "172/S",
-    "TOPO": "Kilworth",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 20672.81,
-    "GAUSS_X": 1973639,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 30.805,
-    "UTM_CM": 27,
-    "UTM_N": 8025794.836,
-    "UTM_E": 267374.415,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "359/S",
-    "TOPO": "Duiker",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 20909.79,
-    "GAUSS_X": 1990660,
-    "LAT_WGS84": -18,
-    "LON_WGS84": 30.803,
-    "UTM_CM": 27,
-    "UTM_N": 8008768.679,
-    "UTM_E": 267320.34,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "274/S",
-    "TOPO": "Glenlussa",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 16878.57,
-    "GAUSS_X": 1958324,
-    "LAT_WGS84": -17.708,
-    "LON_WGS84": 30.841,
-    "UTM_CM": 27,
-    "UTM_N": 8041153.654,
-    "UTM_E": 271006.077,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "270/S",
-    "TOPO": "Estes",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 13877.65,
-    "GAUSS_X": 1946731,
-    "LAT_WGS84": -17.603,
-    "LON_WGS84": 30.869,
-    "UTM_CM": 27,
-    "UTM_N": 8052780.465,
-    "UTM_E": 273884.734,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "27/S",
-    "TOPO": "Ruwanji",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -37590.3,
-    "GAUSS_X": 1936626,
-    "LAT_WGS84": -17.511,
-    "LON_WGS84": 31.354,
-    "UTM_CM": 27,
-    "UTM_N": 8063428.594,
-    "UTM_E": 325248.303,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "269/S",
-    "TOPO": "Ewell",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 24722.3,
-    "GAUSS_X": 1967104,
-    "LAT_WGS84": -17.787,
-    "LON_WGS84": 30.767,
-    "UTM_CM": 27,
-    "UTM_N": 8032288.758,
-    "UTM_E": 263254.191,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "46/S",
-    "TOPO": "Alpes",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6374.39,
-    "GAUSS_X": 1947074,
-    "LAT_WGS84": -17.606,
-    "LON_WGS84": 31.06,
-    "UTM_CM": 27,
-    "UTM_N": 8052651.255,
-    "UTM_E": 294142.846,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "228/S",
-    "TOPO": "Manresa",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21168.1,
-    "GAUSS_X": 1970665,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.2,
-    "UTM_CM": 27,
-    "UTM_N": 8029216.56,
-    "UTM_E": 309187.552,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "169/S",
-    "TOPO": "Hatcliffe",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9262.18,
-    "GAUSS_X": 1957679,
-    "LAT_WGS84": -17.702,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8042076.904,
-    "UTM_E": 297143.107,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "49/S",
-    "TOPO": "Ngomakurira",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -25451.8,
-    "GAUSS_X": 1942168,
-    "LAT_WGS84": -17.562,
-    "LON_WGS84": 31.24,
-    "UTM_CM": 27,
-    "UTM_N": 8057759.077,
-    "UTM_E": 313168.793,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "168/S",
-    "TOPO": "Gletwyn",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -17876.1,
-    "GAUSS_X": 1963287,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.169,
-    "UTM_CM": 27,
-    "UTM_N": 8036559.716,
-    "UTM_E": 305816.932,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "48/S",
-    "TOPO": "Sidambwe",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19014,
-    "GAUSS_X": 1937384,
-    "LAT_WGS84": -17.518,
-    "LON_WGS84": 31.179,
-    "UTM_CM": 27,
-    "UTM_N": 8062475.297,
-    "UTM_E": 306680.809,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "244/S",
-    "TOPO": "Mt. Hampden",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6272.22,
-    "GAUSS_X": 1956289,
-    "LAT_WGS84": -17.689,
-    "LON_WGS84": 30.941,
-    "UTM_CM": 27,
-    "UTM_N": 8043301.768,
-    "UTM_E": 281592.523,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "227/S",
-    "TOPO": "Donnybrook",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19742.3,
-    "GAUSS_X": 1971768,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.186,
-    "UTM_CM": 27,
-    "UTM_N": 8028099.012,
-    "UTM_E": 307773.565,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "221/S",
-    "TOPO": "Elladale",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11737.31,
-    "GAUSS_X": 1986682,
-    "LAT_WGS84": -17.964,
-    "LON_WGS84": 30.889,
-    "UTM_CM": 27,
-    "UTM_N": 8012846.179,
-    "UTM_E": 276451.596,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "220/S",
-    "TOPO": "Marimba",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 16989.4,
-    "GAUSS_X": 1966686,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 30.84,
-    "UTM_CM": 27,
-    "UTM_N": 8032788.859,
-    "UTM_E": 270984.247,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "246/S",
-    "TOPO": "Gwibi Central",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 22813.46,
-    "GAUSS_X": 1942106,
-    "LAT_WGS84": -17.561,
-    "LON_WGS84": 30.785,
-    "UTM_CM": 27,
-    "UTM_N": 8057312.467,
-    "UTM_E": 264898.354,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "165/S",
-    "TOPO": "Chitenga",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -44726.8,
-    "GAUSS_X": 1947651,
-    "LAT_WGS84": -17.611,
-    "LON_WGS84": 31.421,
-    "UTM_CM": 27,
-    "UTM_N": 8052479.281,
-    "UTM_E": 332500.128,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "166/S",
-    "TOPO": "Swiswa",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -32800.7,
-    "GAUSS_X": 1950969,
-    "LAT_WGS84": -17.641,
-    "LON_WGS84": 31.309,
-    "UTM_CM": 27,
-    "UTM_N": 8049036.285,
-    "UTM_E": 320610.285,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "1001/S",
-    "TOPO": "Greendale Tank",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14429.7,
-    "GAUSS_X": 1970065,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.136,
-    "UTM_CM": 27,
-    "UTM_N": 8029745.246,
-    "UTM_E": 302442.689,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "1002/S",
-    "TOPO": "Portland",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21016.6,
-    "GAUSS_X": 1970881,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.198,
-    "UTM_CM": 27,
-    "UTM_N": 8028999.275,
-    "UTM_E": 309038.408,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "800/S",
-    "TOPO": "Donnybrook East",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19951.6,
-    "GAUSS_X": 1971892,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.188,
-    "UTM_CM": 27,
-    "UTM_N": 8027976.771,
-    "UTM_E": 307984.204,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "171/S",
-    "TOPO": "Stapleford",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11419.77,
-    "GAUSS_X": 1960433,
-    "LAT_WGS84": -17.727,
-    "LON_WGS84": 30.892,
-    "UTM_CM": 27,
-    "UTM_N": 8039102.869,
-    "UTM_E": 276488.238,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "86/T",
-    "TOPO": "Stuhm",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -25156.2,
-    "GAUSS_X": 1959515,
-    "LAT_WGS84": -17.718,
-    "LON_WGS84": 31.237,
-    "UTM_CM": 27,
-    "UTM_N": 8040409.635,
-    "UTM_E": 313056.812,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "94/T",
-    "TOPO": "Gandimi",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -25453.6,
-    "GAUSS_X": 1950443,
-    "LAT_WGS84": -17.636,
-    "LON_WGS84": 31.24,
-    "UTM_CM": 27,
-    "UTM_N": 8049483.884,
-    "UTM_E": 313258.01,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "93/T",
-    "TOPO": "Denda",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -28824.4,
-    "GAUSS_X": 1952004,
-    "LAT_WGS84": -17.65,
-    "LON_WGS84": 31.272,
-    "UTM_CM": 27,
-    "UTM_N": 8047959.078,
-    "UTM_E": 316645.213,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "92/T",
-    "TOPO": "Ewanrigg",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -35042.1,
-    "GAUSS_X": 1957582,
-    "LAT_WGS84": -17.701,
-    "LON_WGS84": 31.33,
-    "UTM_CM": 27,
-    "UTM_N": 8042447.02,
-    "UTM_E": 322921.575,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "90/T",
-    "TOPO": "Crag",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -26424.6,
-    "GAUSS_X": 1962530,
-    "LAT_WGS84": -17.745,
-    "LON_WGS84": 31.249,
-    "UTM_CM": 27,
-    "UTM_N": 8037407.82,
-    "UTM_E": 314357.2,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "9/T",
-    "TOPO": "Mutiny",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4094.26,
-    "GAUSS_X": 1973250,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 30.961,
-    "UTM_CM": 27,
-    "UTM_N": 8026361.824,
-    "UTM_E": 283951.501,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "89/T",
-    "TOPO": "Stamford E",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6833.1,
-    "GAUSS_X": 1965580,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8034003.738,
-    "UTM_E": 281130.389,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "87/T",
-    "TOPO": "Chishawasha",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -26056.1,
-    "GAUSS_X": 1967780,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 31.246,
-    "UTM_CM": 27,
-    "UTM_N": 8032153.715,
-    "UTM_E": 314044.627,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "387/t",
-    "TOPO": "Coventry",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3029.5,
-    "GAUSS_X": 1973480,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8026208.121,
-    "UTM_E": 291078.441,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "85/T",
-    "TOPO": "Sternblick S",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20815.1,
-    "GAUSS_X": 1967489,
-    "LAT_WGS84": -17.79,
-    "LON_WGS84": 31.196,
-    "UTM_CM": 27,
-    "UTM_N": 8032388.756,
-    "UTM_E": 308800.688,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "84/T",
-    "TOPO": "Sternblick N",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21430.6,
-    "GAUSS_X": 1966212,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.202,
-    "UTM_CM": 27,
-    "UTM_N": 8033672.925,
-    "UTM_E": 309402.526,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "83/T",
-    "TOPO": "Pangula",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19248.8,
-    "GAUSS_X": 1965504,
-    "LAT_WGS84": -17.772,
-    "LON_WGS84": 31.181,
-    "UTM_CM": 27,
-    "UTM_N": 8034357.223,
-    "UTM_E": 307213.221,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "88/T",
-    "TOPO": "Kilmuir",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -30138.3,
-    "GAUSS_X": 1961261,
-    "LAT_WGS84": -17.734,
-    "LON_WGS84": 31.284,
-    "UTM_CM": 27,
-    "UTM_N": 8038716.212,
-    "UTM_E": 318057.17,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "388/T",
-    "TOPO": "Epsilon",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -176.16,
-    "GAUSS_X": 1965294,
-    "LAT_WGS84": -17.771,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8034363.887,
-    "UTM_E": 288137.424,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "5/T",
-    "TOPO": "St. Georges",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6285.62,
-    "GAUSS_X": 1968616,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.059,
-    "UTM_CM": 27,
-    "UTM_N": 8031107.374,
-    "UTM_E": 294282.814,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "385/T",
-    "TOPO": "Circuit",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2921.7,
-    "GAUSS_X": 1961611,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8038014.59,
-    "UTM_E": 285000.01,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "95/T",
-    "TOPO": "Rumani",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20786,
-    "GAUSS_X": 1953241,
-    "LAT_WGS84": -17.662,
-    "LON_WGS84": 31.196,
-    "UTM_CM": 27,
-    "UTM_N": 8046636.543,
-    "UTM_E": 308620.094,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "96/T",
-    "TOPO": "Springs",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20645,
-    "GAUSS_X": 1960315,
-    "LAT_WGS84": -17.726,
-    "LON_WGS84": 31.195,
-    "UTM_CM": 27,
-    "UTM_N": 8039561.097,
-    "UTM_E": 308554.192,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "97/T",
-    "TOPO": "Luna",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -18119.5,
-    "GAUSS_X": 1957616,
-    "LAT_WGS84": -17.701,
-    "LON_WGS84": 31.171,
-    "UTM_CM": 27,
-    "UTM_N": 8042233.624,
-    "UTM_E": 306000.041,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "98/T",
-    "TOPO": "Brooke",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14868.6,
-    "GAUSS_X": 1960418,
-    "LAT_WGS84": -17.727,
-    "LON_WGS84": 31.14,
-    "UTM_CM": 27,
-    "UTM_N": 8039397.019,
-    "UTM_E": 302778.796,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "382/T",
-    "TOPO": "R.S.T",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4829.26,
-    "GAUSS_X": 1971535,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8028172.243,
-    "UTM_E": 292857.54,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "99/T",
-    "TOPO": "Windyridge",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15386.3,
-    "GAUSS_X": 1954698,
-    "LAT_WGS84": -17.675,
-    "LON_WGS84": 31.145,
-    "UTM_CM": 27,
-    "UTM_N": 8045123.003,
-    "UTM_E": 303235.817,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "381/T",
-    "TOPO": "Flash",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5302.88,
-    "GAUSS_X": 1972349,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8027363.578,
-    "UTM_E": 293339.895,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "342/T",
-    "TOPO": "Smithfield",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -74.78,
-    "GAUSS_X": 1936314,
-    "LAT_WGS84": -17.509,
-    "LON_WGS84": 31.001,
-    "UTM_CM": 27,
-    "UTM_N": 8063346.416,
-    "UTM_E": 287729.346,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "341/T",
-    "TOPO": "Masumbi",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9768.58,
-    "GAUSS_X": 1943694,
-    "LAT_WGS84": -17.575,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8056067.954,
-    "UTM_E": 297501.56,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "340/T",
-    "TOPO": "Pote",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9546.23,
-    "GAUSS_X": 1936621,
-    "LAT_WGS84": -17.512,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8063138.426,
-    "UTM_E": 297204.757,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "339/T",
-    "TOPO": "Nande",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3033.45,
-    "GAUSS_X": 1941111,
-    "LAT_WGS84": -17.552,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8058579.787,
-    "UTM_E": 290738.756,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "4/T",
-    "TOPO": "Gun Hill",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7848.81,
-    "GAUSS_X": 1967952,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 31.074,
-    "UTM_CM": 27,
-    "UTM_N": 8031788.039,
-    "UTM_E": 295839.014,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "607/T",
-    "TOPO": "Tafara",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22150.3,
-    "GAUSS_X": 1973419,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.209,
-    "UTM_CM": 27,
-    "UTM_N": 8026473.584,
-    "UTM_E": 310199.246,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "7/T",
-    "TOPO": "Asp",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 520.56,
-    "GAUSS_X": 1970772,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8028877.805,
-    "UTM_E": 287499.102,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "70/T",
-    "TOPO": "Boswell",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12839.4,
-    "GAUSS_X": 1978061,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.121,
-    "UTM_CM": 27,
-    "UTM_N": 8021731.432,
-    "UTM_E": 300937.984,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "323/T",
-    "TOPO": "Nels Hope",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -17110.9,
-    "GAUSS_X": 1986461,
-    "LAT_WGS84": -17.962,
-    "LON_WGS84": 31.162,
-    "UTM_CM": 27,
-    "UTM_N": 8013377.705,
-    "UTM_E": 305299.813,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "71/T",
-    "TOPO": "Hatfield",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7498.13,
-    "GAUSS_X": 1976393,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 31.071,
-    "UTM_CM": 27,
-    "UTM_N": 8023342.838,
-    "UTM_E": 295578.579,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "73/T",
-    "TOPO": "Trafalgar North",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5157.63,
-    "GAUSS_X": 1971382,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8028328.474,
-    "UTM_E": 293184.302,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "74/T",
-    "TOPO": "Trafalgar South",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5163,
-    "GAUSS_X": 1971404,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8028306.98,
-    "UTM_E": 293189.902,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "76/T",
-    "TOPO": "Meyrick North",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -359.45,
-    "GAUSS_X": 1969001,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.003,
-    "UTM_CM": 27,
-    "UTM_N": 8030659.261,
-    "UTM_E": 288360.27,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "77/T",
-    "TOPO": "Water Tower",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9727.65,
-    "GAUSS_X": 1975099,
-    "LAT_WGS84": -17.859,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8024660.76,
-    "UTM_E": 297794.355,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "78/T",
-    "TOPO": "Kentucky",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10799.1,
-    "GAUSS_X": 1982642,
-    "LAT_WGS84": -17.927,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8017129.054,
-    "UTM_E": 298946.746,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "63/T",
-    "TOPO": "Milton",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5404.65,
-    "GAUSS_X": 1971464,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8028249.379,
-    "UTM_E": 293432.213,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "62/T",
-    "TOPO": "Livingstone",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6539.93,
-    "GAUSS_X": 1970738,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.062,
-    "UTM_CM": 27,
-    "UTM_N": 8028987.692,
-    "UTM_E": 294559.808,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "79/T",
-    "TOPO": "Pomona",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8678.33,
-    "GAUSS_X": 1960842,
-    "LAT_WGS84": -17.73,
-    "LON_WGS84": 31.082,
-    "UTM_CM": 27,
-    "UTM_N": 8038907.233,
-    "UTM_E": 296592.839,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "82/T",
-    "TOPO": "Auds Hill",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15241.3,
-    "GAUSS_X": 1964516,
-    "LAT_WGS84": -17.764,
-    "LON_WGS84": 31.144,
-    "UTM_CM": 27,
-    "UTM_N": 8035302.661,
-    "UTM_E": 303195.167,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "80/T",
-    "TOPO": "Greystones",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12950.1,
-    "GAUSS_X": 1964024,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.122,
-    "UTM_CM": 27,
-    "UTM_N": 8035770.498,
-    "UTM_E": 300898.606,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "81/T",
-    "TOPO": "Helensvale",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13545.9,
-    "GAUSS_X": 1961983,
-    "LAT_WGS84": -17.741,
-    "LON_WGS84": 31.128,
-    "UTM_CM": 27,
-    "UTM_N": 8037817.852,
-    "UTM_E": 301472.708,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "604/T",
-    "TOPO": "Range",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16429,
-    "GAUSS_X": 1969620,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.155,
-    "UTM_CM": 27,
-    "UTM_N": 8030211.528,
-    "UTM_E": 304437.292,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "603/T",
-    "TOPO": "Starres",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4616.33,
-    "GAUSS_X": 1982580,
-    "LAT_WGS84": -17.927,
-    "LON_WGS84": 30.956,
-    "UTM_CM": 27,
-    "UTM_N": 8017024.7,
-    "UTM_E": 283529.438,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "602/T",
-    "TOPO": "Glenview",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5232.96,
-    "GAUSS_X": 1979061,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.951,
-    "UTM_CM": 27,
-    "UTM_N": 8020538.271,
-    "UTM_E": 282874.928,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "6/T",
-    "TOPO": "Traga Ho",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11238.4,
-    "GAUSS_X": 1975508,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8024268.122,
-    "UTM_E": 299309.528,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "587/T",
-    "TOPO": "Bus stop",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6065.61,
-    "GAUSS_X": 1990572,
-    "LAT_WGS84": -17.999,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8009147.181,
-    "UTM_E": 294298.443,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "586/T",
-    "TOPO": "St.Marys police",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6073.98,
-    "GAUSS_X": 1988951,
-    "LAT_WGS84": -17.984,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8010768.666,
-    "UTM_E": 294289.326,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "584/T",
-    "TOPO": "Katanga",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3594.28,
-    "GAUSS_X": 1989527,
-    "LAT_WGS84": -17.99,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8010165.626,
-    "UTM_E": 291815.664,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "583/T",
-    "TOPO": "Bricks",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3311.55,
-    "GAUSS_X": 1990258,
-    "LAT_WGS84": -17.996,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8009431.309,
-    "UTM_E": 291540.799,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "57/T",
-    "TOPO": "Bluff hill",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2438.2,
-    "GAUSS_X": 1965999,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 30.977,
-    "UTM_CM": 27,
-    "UTM_N": 8033630.853,
-    "UTM_E": 285530.306,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "560/T",
-    "TOPO": "Kamfinsa",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12685.2,
-    "GAUSS_X": 1968914,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8030877.869,
-    "UTM_E": 300685.897,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "556/T",
-    "TOPO": "Adylinn",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1879.42,
-    "GAUSS_X": 1964278,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8035358.638,
-    "UTM_E": 286070.798,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "526/T",
-    "TOPO": "Mabvuku",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19926.1,
-    "GAUSS_X": 1971921,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.188,
-    "UTM_CM": 27,
-    "UTM_N": 8027947.288,
-    "UTM_E": 307959.017,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "511/T",
-    "TOPO": "Cranborne",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7236.31,
-    "GAUSS_X": 1974282,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.068,
-    "UTM_CM": 27,
-    "UTM_N": 8025450.489,
-    "UTM_E": 295294.141,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "608/T",
-    "TOPO": "Tafara tank",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22769.1,
-    "GAUSS_X": 1971052,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.215,
-    "UTM_CM": 27,
-    "UTM_N": 8028846.764,
-    "UTM_E": 310792.699,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "135/T",
-    "TOPO": "Marlborough",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2728.86,
-    "GAUSS_X": 1961644,
-    "LAT_WGS84": -17.738,
-    "LON_WGS84": 30.974,
-    "UTM_CM": 27,
-    "UTM_N": 8037984.129,
-    "UTM_E": 285193.218,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "144/T",
-    "TOPO": "Passaford",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9715.01,
-    "GAUSS_X": 1945814,
-    "LAT_WGS84": -17.595,
-    "LON_WGS84": 30.908,
-    "UTM_CM": 27,
-    "UTM_N": 8053741.402,
-    "UTM_E": 278038.372,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "121/T",
-    "TOPO": "Thornpark",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2015.61,
-    "GAUSS_X": 1957594,
-    "LAT_WGS84": -17.701,
-    "LON_WGS84": 31.019,
-    "UTM_CM": 27,
-    "UTM_N": 8042084.828,
-    "UTM_E": 289895.125,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "122/T",
-    "TOPO": "Sussexdale",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9018.37,
-    "GAUSS_X": 1950757,
-    "LAT_WGS84": -17.639,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8048996.163,
-    "UTM_E": 296825.92,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "123/T",
-    "TOPO": "Mtonda",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15607.7,
-    "GAUSS_X": 1943222,
-    "LAT_WGS84": -17.571,
-    "LON_WGS84": 31.147,
-    "UTM_CM": 27,
-    "UTM_N": 8056601.279,
-    "UTM_E": 303335.911,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "124/T",
-    "TOPO": "Pentire",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12451.6,
-    "GAUSS_X": 1952492,
-    "LAT_WGS84": -17.655,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8047297.449,
-    "UTM_E": 300277.688,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "125/T",
-    "TOPO": "Ridge Tank",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12680.8,
-    "GAUSS_X": 1968873,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8030918.273,
-    "UTM_E": 300681.025,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "126/T",
-    "TOPO": "Bannockburn",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4341.15,
-    "GAUSS_X": 1961198,
-    "LAT_WGS84": -17.734,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8038504.603,
-    "UTM_E": 292259.166,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "128/T",
-    "TOPO": "Vinot",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1343.92,
-    "GAUSS_X": 1973017,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 30.987,
-    "UTM_CM": 27,
-    "UTM_N": 8026624.409,
-    "UTM_E": 286699.656,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "12/T",
-    "TOPO": "Blakiston",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4002.81,
-    "GAUSS_X": 1969558,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8030140.951,
-    "UTM_E": 292009.898,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "131/T",
-    "TOPO": "Orange",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9471.54,
-    "GAUSS_X": 1967406,
-    "LAT_WGS84": -17.79,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8032350.763,
-    "UTM_E": 297456.012,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "119/T",
-    "TOPO": "Glenara W",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2349.99,
-    "GAUSS_X": 1955110,
-    "LAT_WGS84": -17.679,
-    "LON_WGS84": 30.978,
-    "UTM_CM": 27,
-    "UTM_N": 8044522.803,
-    "UTM_E": 285502.724,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "137/T",
-    "TOPO": "Highfield",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1326.15,
-    "GAUSS_X": 1975162,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 31.012,
-    "UTM_CM": 27,
-    "UTM_N": 8024507.61,
-    "UTM_E": 289392.951,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "138/T",
-    "TOPO": "Henderson",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5420.84,
-    "GAUSS_X": 1943297,
-    "LAT_WGS84": -17.572,
-    "LON_WGS84": 30.949,
-    "UTM_CM": 27,
-    "UTM_N": 8056304.474,
-    "UTM_E": 282306.588,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "139/T",
-    "TOPO": "Dassau",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4488.88,
-    "GAUSS_X": 1945726,
-    "LAT_WGS84": -17.594,
-    "LON_WGS84": 30.958,
-    "UTM_CM": 27,
-    "UTM_N": 8053885.116,
-    "UTM_E": 283264.291,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "14/T",
-    "TOPO": "Met, Station",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1949.75,
-    "GAUSS_X": 1972107,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8027569.888,
-    "UTM_E": 289983.909,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "140/T",
-    "TOPO": "Iron Cap",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6646.34,
-    "GAUSS_X": 1945093,
-    "LAT_WGS84": -17.588,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8054495.347,
-    "UTM_E": 281099.869,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "141/T",
-    "TOPO": "Pearson",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6640.54,
-    "GAUSS_X": 1948518,
-    "LAT_WGS84": -17.619,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8051070.282,
-    "UTM_E": 281141.842,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "142/T",
-    "TOPO": "Makalanga",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10103.35,
-    "GAUSS_X": 1943544,
-    "LAT_WGS84": -17.574,
-    "LON_WGS84": 30.905,
-    "UTM_CM": 27,
-    "UTM_N": 8056007.593,
-    "UTM_E": 277626.021,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "143/T",
-    "TOPO": "Umsasa",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9128.81,
-    "GAUSS_X": 1939228,
-    "LAT_WGS84": -17.535,
-    "LON_WGS84": 30.914,
-    "UTM_CM": 27,
-    "UTM_N": 8060335.296,
-    "UTM_E": 278555.236,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "13/T",
-    "TOPO": "Harari",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2927.9,
-    "GAUSS_X": 1975768,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8023918.845,
-    "UTM_E": 291001.33,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "108/T",
-    "TOPO": "Den",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2593.33,
-    "GAUSS_X": 1951076,
-    "LAT_WGS84": -17.642,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8048608.998,
-    "UTM_E": 290403.806,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "100/T",
-    "TOPO": "Stamford W",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9733.48,
-    "GAUSS_X": 1964756,
-    "LAT_WGS84": -17.766,
-    "LON_WGS84": 30.908,
-    "UTM_CM": 27,
-    "UTM_N": 8034796.751,
-    "UTM_E": 278220.815,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "101/T",
-    "TOPO": "Tank",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6407.32,
-    "GAUSS_X": 1962858,
-    "LAT_WGS84": -17.749,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8036730.809,
-    "UTM_E": 281527.225,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "102/T",
-    "TOPO": "Hogarty",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12238.9,
-    "GAUSS_X": 1957065,
-    "LAT_WGS84": -17.696,
-    "LON_WGS84": 31.115,
-    "UTM_CM": 27,
-    "UTM_N": 8042722.191,
-    "UTM_E": 300113.412,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "103/T",
-    "TOPO": "Ballamona",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15565,
-    "GAUSS_X": 1952983,
-    "LAT_WGS84": -17.659,
-    "LON_WGS84": 31.147,
-    "UTM_CM": 27,
-    "UTM_N": 8046839.45,
-    "UTM_E": 303396.352,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "72/T",
-    "TOPO": "Forces",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6929.77,
-    "GAUSS_X": 1977214,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.065,
-    "UTM_CM": 27,
-    "UTM_N": 8022515.407,
-    "UTM_E": 295018.987,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "322/T",
-    "TOPO": "Vent",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19041.5,
-    "GAUSS_X": 1975117,
-    "LAT_WGS84": -17.859,
-    "LON_WGS84": 31.18,
-    "UTM_CM": 27,
-    "UTM_N": 8024742.746,
-    "UTM_E": 307108.586,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "104/T",
-    "TOPO": "Chirika",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19185.2,
-    "GAUSS_X": 1956036,
-    "LAT_WGS84": -17.687,
-    "LON_WGS84": 31.181,
-    "UTM_CM": 27,
-    "UTM_N": 8043824.436,
-    "UTM_E": 307048.912,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "105/T",
-    "TOPO": "Mashere",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -26719.7,
-    "GAUSS_X": 1956976,
-    "LAT_WGS84": -17.695,
-    "LON_WGS84": 31.252,
-    "UTM_CM": 27,
-    "UTM_N": 8042964.676,
-    "UTM_E": 314593.269,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "120/T",
-    "TOPO": "Bradford",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 462.42,
-    "GAUSS_X": 1944878,
-    "LAT_WGS84": -17.586,
-    "LON_WGS84": 30.996,
-    "UTM_CM": 27,
-    "UTM_N": 8054775.348,
-    "UTM_E": 287282.266,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "107/T",
-    "TOPO": "Zimbiru",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -17269.9,
-    "GAUSS_X": 1949186,
-    "LAT_WGS84": -17.625,
-    "LON_WGS84": 31.163,
-    "UTM_CM": 27,
-    "UTM_N": 8050654.557,
-    "UTM_E": 305061.127,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "114/T",
-    "TOPO": "Theroza",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4849.46,
-    "GAUSS_X": 1951114,
-    "LAT_WGS84": -17.642,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8048595.353,
-    "UTM_E": 292660.516,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "109/T",
-    "TOPO": "Kevin",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6884.15,
-    "GAUSS_X": 1956994,
-    "LAT_WGS84": -17.696,
-    "LON_WGS84": 31.065,
-    "UTM_CM": 27,
-    "UTM_N": 8042736.639,
-    "UTM_E": 294757.668,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "11/T",
-    "TOPO": "Tynwald West",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4599.68,
-    "GAUSS_X": 1968969,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 30.957,
-    "UTM_CM": 27,
-    "UTM_N": 8030637.79,
-    "UTM_E": 283400.26,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "111/T",
-    "TOPO": "Chrissie",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13102,
-    "GAUSS_X": 1947619,
-    "LAT_WGS84": -17.611,
-    "LON_WGS84": 31.123,
-    "UTM_CM": 27,
-    "UTM_N": 8052177.073,
-    "UTM_E": 300876.572,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "113/T",
-    "TOPO": "Trevor",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11007.7,
-    "GAUSS_X": 1951955,
-    "LAT_WGS84": -17.65,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8047818.941,
-    "UTM_E": 298828.038,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "115/T",
-    "TOPO": "Sharunzi",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2343.72,
-    "GAUSS_X": 1948280,
-    "LAT_WGS84": -17.617,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8051402.364,
-    "UTM_E": 290124.605,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "116/T",
-    "TOPO": "Pare",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1084.87,
-    "GAUSS_X": 1950942,
-    "LAT_WGS84": -17.641,
-    "LON_WGS84": 31.01,
-    "UTM_CM": 27,
-    "UTM_N": 8048726.785,
-    "UTM_E": 288893.793,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "117/T",
-    "TOPO": "Glenara E",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 682.59,
-    "GAUSS_X": 1955282,
-    "LAT_WGS84": -17.68,
-    "LON_WGS84": 30.994,
-    "UTM_CM": 27,
-    "UTM_N": 8044367.848,
-    "UTM_E": 287172.136,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "118/T",
-    "TOPO": "Hopefield",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3744.72,
-    "GAUSS_X": 1953140,
-    "LAT_WGS84": -17.661,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8046478.228,
-    "UTM_E": 284086.95,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "106/T",
-    "TOPO": "Quinnington",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12977.3,
-    "GAUSS_X": 1959172,
-    "LAT_WGS84": -17.715,
-    "LON_WGS84": 31.122,
-    "UTM_CM": 27,
-    "UTM_N": 8040623.171,
-    "UTM_E": 300874.19,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "263/T",
-    "TOPO": "Welston",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9000.67,
-    "GAUSS_X": 1954363,
-    "LAT_WGS84": -17.672,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8045390.283,
-    "UTM_E": 296846.404,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "214/T",
-    "TOPO": "Rainham",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 12592.77,
-    "GAUSS_X": 1967894,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 30.881,
-    "UTM_CM": 27,
-    "UTM_N": 8031627.491,
-    "UTM_E": 275394.544,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "215/T",
-    "TOPO": "United",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 17256.65,
-    "GAUSS_X": 1974984,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 30.837,
-    "UTM_CM": 27,
-    "UTM_N": 8024486.87,
-    "UTM_E": 270805.644,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "216/T",
-    "TOPO": "Strathmore",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 13444.32,
-    "GAUSS_X": 1979095,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.873,
-    "UTM_CM": 27,
-    "UTM_N": 8020415.283,
-    "UTM_E": 274662.739,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "217/T",
-    "TOPO": "McIlwane",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 17445.13,
-    "GAUSS_X": 1981828,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 30.835,
-    "UTM_CM": 27,
-    "UTM_N": 8017639.667,
-    "UTM_E": 270690.559,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "218/T",
-    "TOPO": "Gleneagles",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8893.87,
-    "GAUSS_X": 1977499,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 30.916,
-    "UTM_CM": 27,
-    "UTM_N": 8022061.109,
-    "UTM_E": 279196.77,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "219/T",
-    "TOPO": "Fontainbleau",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5898.88,
-    "GAUSS_X": 1972662,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.944,
-    "UTM_CM": 27,
-    "UTM_N": 8026930.739,
-    "UTM_E": 282140.364,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "23/T",
-    "TOPO": "Beryl",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3298.01,
-    "GAUSS_X": 1966084,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8033607.906,
-    "UTM_E": 291267.968,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "259/T",
-    "TOPO": "Interim",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12742.9,
-    "GAUSS_X": 1964164,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8035628.327,
-    "UTM_E": 300692.9,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "213/T",
-    "TOPO": "Mutenji",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 17298.22,
-    "GAUSS_X": 1969834,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 30.837,
-    "UTM_CM": 27,
-    "UTM_N": 8029637.058,
-    "UTM_E": 270708.976,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "319/T",
-    "TOPO": "Glenwood",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19457.9,
-    "GAUSS_X": 1980652,
-    "LAT_WGS84": -17.909,
-    "LON_WGS84": 31.184,
-    "UTM_CM": 27,
-    "UTM_N": 8019211.727,
-    "UTM_E": 307584.309,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "260/T",
-    "TOPO": "Thornpark South",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -860.79,
-    "GAUSS_X": 1960732,
-    "LAT_WGS84": -17.729,
-    "LON_WGS84": 31.008,
-    "UTM_CM": 27,
-    "UTM_N": 8038934.157,
-    "UTM_E": 288773.545,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "145/T",
-    "TOPO": "Murgwe",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 17197.1,
-    "GAUSS_X": 1940466,
-    "LAT_WGS84": -17.546,
-    "LON_WGS84": 30.838,
-    "UTM_CM": 27,
-    "UTM_N": 8059011.344,
-    "UTM_E": 270498.605,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "112/T",
-    "TOPO": "Karen",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2084.36,
-    "GAUSS_X": 1949410,
-    "LAT_WGS84": -17.627,
-    "LON_WGS84": 30.98,
-    "UTM_CM": 27,
-    "UTM_N": 8050226.396,
-    "UTM_E": 285708.018,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "3/T",
-    "TOPO": "Amby",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11098.5,
-    "GAUSS_X": 1972607,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8027166.969,
-    "UTM_E": 299138.571,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "316/T",
-    "TOPO": "Caledonia",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -24322.1,
-    "GAUSS_X": 1972963,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.229,
-    "UTM_CM": 27,
-    "UTM_N": 8026952.576,
-    "UTM_E": 312366.109,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "317/T",
-    "TOPO": "Craig",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -23164.4,
-    "GAUSS_X": 1974381,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.219,
-    "UTM_CM": 27,
-    "UTM_N": 8025522.055,
-    "UTM_E": 311223.534,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "321/T",
-    "TOPO": "Sebastopol",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -25573,
-    "GAUSS_X": 1974606,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.241,
-    "UTM_CM": 27,
-    "UTM_N": 8025322.764,
-    "UTM_E": 313634.532,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "320/T",
-    "TOPO": "Boulders",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -23425.1,
-    "GAUSS_X": 1979637,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 31.221,
-    "UTM_CM": 27,
-    "UTM_N": 8020269.397,
-    "UTM_E": 311540.584,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "318/T",
-    "TOPO": "Domboramwari",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15250.6,
-    "GAUSS_X": 1980058,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 31.144,
-    "UTM_CM": 27,
-    "UTM_N": 8019760.905,
-    "UTM_E": 303370.691,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "261/T",
-    "TOPO": "Bendauch",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2789.95,
-    "GAUSS_X": 1957657,
-    "LAT_WGS84": -17.702,
-    "LON_WGS84": 30.974,
-    "UTM_CM": 27,
-    "UTM_N": 8041970.605,
-    "UTM_E": 285089.746,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "16/T",
-    "TOPO": "Winston",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4829.7,
-    "GAUSS_X": 1971945,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8027762.807,
-    "UTM_E": 292862.358,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "15/T",
-    "TOPO": "Graniteside",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6026.27,
-    "GAUSS_X": 1974788,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8024931.922,
-    "UTM_E": 294089.437,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "150/T",
-    "TOPO": "Berea",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 20735.4,
-    "GAUSS_X": 1943138,
-    "LAT_WGS84": -17.57,
-    "LON_WGS84": 30.805,
-    "UTM_CM": 27,
-    "UTM_N": 8056301.471,
-    "UTM_E": 266987.749,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "151/T",
-    "TOPO": "Nalire",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 16622.5,
-    "GAUSS_X": 1952284,
-    "LAT_WGS84": -17.653,
-    "LON_WGS84": 30.843,
-    "UTM_CM": 27,
-    "UTM_N": 8047197.336,
-    "UTM_E": 271198.125,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "262/T",
-    "TOPO": "Calgary",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4739.54,
-    "GAUSS_X": 1954531,
-    "LAT_WGS84": -17.673,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8045176.851,
-    "UTM_E": 292586.784,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "149/T",
-    "TOPO": "Selby",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10973.88,
-    "GAUSS_X": 1951749,
-    "LAT_WGS84": -17.648,
-    "LON_WGS84": 30.897,
-    "UTM_CM": 27,
-    "UTM_N": 8047792.19,
-    "UTM_E": 276842.057,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "212/T",
-    "TOPO": "White Cliff",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 13261.29,
-    "GAUSS_X": 1972003,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.875,
-    "UTM_CM": 27,
-    "UTM_N": 8027510.645,
-    "UTM_E": 274769.815,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "147/T",
-    "TOPO": "Mgutu",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4434.87,
-    "GAUSS_X": 1950409,
-    "LAT_WGS84": -17.636,
-    "LON_WGS84": 30.958,
-    "UTM_CM": 27,
-    "UTM_N": 8049201.714,
-    "UTM_E": 283367.805,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "194/T",
-    "TOPO": "Ord Lodge",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12629,
-    "GAUSS_X": 1968850,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8030940.651,
-    "UTM_E": 300629.019,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "197/T",
-    "TOPO": "Parktown",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3301.56,
-    "GAUSS_X": 1978987,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8020703.509,
-    "UTM_E": 291409.534,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "2/T",
-    "TOPO": "Emerald",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3321.49,
-    "GAUSS_X": 1966113,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8033578.984,
-    "UTM_E": 291291.761,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "211/T",
-    "TOPO": "Ingwe",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7931.69,
-    "GAUSS_X": 1980819,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8018750.485,
-    "UTM_E": 280194.722,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "204/T",
-    "TOPO": "Cave",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6334.19,
-    "GAUSS_X": 1988191,
-    "LAT_WGS84": -17.977,
-    "LON_WGS84": 31.06,
-    "UTM_CM": 27,
-    "UTM_N": 8011531.38,
-    "UTM_E": 294541.361,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "146/T",
-    "TOPO": "Marasoti",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 15112.47,
-    "GAUSS_X": 1935884,
-    "LAT_WGS84": -17.505,
-    "LON_WGS84": 30.858,
-    "UTM_CM": 27,
-    "UTM_N": 8063617.057,
-    "UTM_E": 272535.422,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "210/T",
-    "TOPO": "Pension",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10425.82,
-    "GAUSS_X": 1983291,
-    "LAT_WGS84": -17.933,
-    "LON_WGS84": 30.902,
-    "UTM_CM": 27,
-    "UTM_N": 8016251.59,
-    "UTM_E": 277726.795,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "205/T",
-    "TOPO": "Stoneridge",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1846.39,
-    "GAUSS_X": 1986500,
-    "LAT_WGS84": -17.962,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8013174.497,
-    "UTM_E": 290035.002,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "209/T",
-    "TOPO": "Ambleside",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6205.04,
-    "GAUSS_X": 1976700,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 30.941,
-    "UTM_CM": 27,
-    "UTM_N": 8022888.776,
-    "UTM_E": 281877.406,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "201/T",
-    "TOPO": "St Marys",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6764.11,
-    "GAUSS_X": 1990085,
-    "LAT_WGS84": -17.995,
-    "LON_WGS84": 31.064,
-    "UTM_CM": 27,
-    "UTM_N": 8009641.688,
-    "UTM_E": 294991.733,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "208/T",
-    "TOPO": "Saturday",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5569.21,
-    "GAUSS_X": 1985310,
-    "LAT_WGS84": -17.951,
-    "LON_WGS84": 30.947,
-    "UTM_CM": 27,
-    "UTM_N": 8014284.582,
-    "UTM_E": 282605.802,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "207/T",
-    "TOPO": "Glen Norah",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3746.33,
-    "GAUSS_X": 1980724,
-    "LAT_WGS84": -17.91,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8018890.999,
-    "UTM_E": 284379.592,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1819",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11487.1,
-    "GAUSS_X": 1966122,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8033656.836,
-    "UTM_E": 299457.961,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1822",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10881.5,
-    "GAUSS_X": 1966235,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8033537.224,
-    "UTM_E": 298853.533,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1821",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11144.9,
-    "GAUSS_X": 1966155,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8033620.336,
-    "UTM_E": 299116.137,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1815",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11836.1,
-    "GAUSS_X": 1967042,
-    "LAT_WGS84": -17.786,
-    "LON_WGS84": 31.112,
-    "UTM_CM": 27,
-    "UTM_N": 8032740.323,
-    "UTM_E": 299816.797,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1816",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13373.4,
-    "GAUSS_X": 1966344,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.126,
-    "UTM_CM": 27,
-    "UTM_N": 8033454.9,
-    "UTM_E": 301346.712,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM184",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5568.26,
-    "GAUSS_X": 1970172,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8029542.907,
-    "UTM_E": 293582.03,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1818",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11739.9,
-    "GAUSS_X": 1966170,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8033611.269,
-    "UTM_E": 299711.245,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1817",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12916.2,
-    "GAUSS_X": 1966510,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.122,
-    "UTM_CM": 27,
-    "UTM_N": 8033283.82,
-    "UTM_E": 300891.25,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1823",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10688.2,
-    "GAUSS_X": 1966265,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8033505.052,
-    "UTM_E": 298660.566,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1830",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11164.5,
-    "GAUSS_X": 1965358,
-    "LAT_WGS84": -17.771,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8034417.397,
-    "UTM_E": 299127.174,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1840",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12589.5,
-    "GAUSS_X": 1965029,
-    "LAT_WGS84": -17.768,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8034761.495,
-    "UTM_E": 300548.712,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1820",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11337.6,
-    "GAUSS_X": 1966128,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8033649.121,
-    "UTM_E": 299308.48,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1833",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11380.5,
-    "GAUSS_X": 1965019,
-    "LAT_WGS84": -17.768,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8034759.042,
-    "UTM_E": 299339.587,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1839",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12590.8,
-    "GAUSS_X": 1964848,
-    "LAT_WGS84": -17.767,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8034942.585,
-    "UTM_E": 300548.103,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1838",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12522,
-    "GAUSS_X": 1964608,
-    "LAT_WGS84": -17.764,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8035181.639,
-    "UTM_E": 300476.716,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM180",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4500.17,
-    "GAUSS_X": 1973358,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8026345.318,
-    "UTM_E": 292547.927,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1837",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12379.2,
-    "GAUSS_X": 1964639,
-    "LAT_WGS84": -17.765,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8035149.007,
-    "UTM_E": 300334.282,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1836",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12139.1,
-    "GAUSS_X": 1964779,
-    "LAT_WGS84": -17.766,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8035007.095,
-    "UTM_E": 300095.699,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1829",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11011.7,
-    "GAUSS_X": 1965654,
-    "LAT_WGS84": -17.774,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8034119.927,
-    "UTM_E": 298977.571,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1834",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11655.6,
-    "GAUSS_X": 1964925,
-    "LAT_WGS84": -17.767,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8034855.377,
-    "UTM_E": 299613.682,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1824",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10247.4,
-    "GAUSS_X": 1966563,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8033202.878,
-    "UTM_E": 298222.888,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1832",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11274.3,
-    "GAUSS_X": 1965127,
-    "LAT_WGS84": -17.769,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8034649.366,
-    "UTM_E": 299234.499,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1831",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11150.4,
-    "GAUSS_X": 1965238,
-    "LAT_WGS84": -17.77,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8034537.481,
-    "UTM_E": 299111.772,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM183",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5041.35,
-    "GAUSS_X": 1970962,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 31.048,
-    "UTM_CM": 27,
-    "UTM_N": 8028747.221,
-    "UTM_E": 293063.524,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1828",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11020.2,
-    "GAUSS_X": 1965771,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8034002.492,
-    "UTM_E": 298987.254,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1826",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10552.2,
-    "GAUSS_X": 1966403,
-    "LAT_WGS84": -17.781,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8033365.495,
-    "UTM_E": 298525.982,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1825",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10044.4,
-    "GAUSS_X": 1966237,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8033526.039,
-    "UTM_E": 298016.44,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1835",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11946.1,
-    "GAUSS_X": 1964839,
-    "LAT_WGS84": -17.766,
-    "LON_WGS84": 31.113,
-    "UTM_CM": 27,
-    "UTM_N": 8034944.266,
-    "UTM_E": 299903.339,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM18",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5357.82,
-    "GAUSS_X": 1971431,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8028282.491,
-    "UTM_E": 293385.02,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1762",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1475.08,
-    "GAUSS_X": 1979610,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 31.014,
-    "UTM_CM": 27,
-    "UTM_N": 8020061.025,
-    "UTM_E": 289589.583,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1761",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1538.16,
-    "GAUSS_X": 1979874,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 31.014,
-    "UTM_CM": 27,
-    "UTM_N": 8019797.018,
-    "UTM_E": 289655.509,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1877",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10469.3,
-    "GAUSS_X": 1963796,
-    "LAT_WGS84": -17.757,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8035972.217,
-    "UTM_E": 298415.322,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1841",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12676.4,
-    "GAUSS_X": 1965184,
-    "LAT_WGS84": -17.77,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8034607.306,
-    "UTM_E": 300637.308,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1763",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1151.9,
-    "GAUSS_X": 1979980,
-    "LAT_WGS84": -17.903,
-    "LON_WGS84": 31.011,
-    "UTM_CM": 27,
-    "UTM_N": 8019687.262,
-    "UTM_E": 289270.348,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1764",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1033.56,
-    "GAUSS_X": 1979725,
-    "LAT_WGS84": -17.901,
-    "LON_WGS84": 31.01,
-    "UTM_CM": 27,
-    "UTM_N": 8019940.745,
-    "UTM_E": 289149.263,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1765",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1423.89,
-    "GAUSS_X": 1979397,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 31.013,
-    "UTM_CM": 27,
-    "UTM_N": 8020272.794,
-    "UTM_E": 289536.11,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1766",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1334.47,
-    "GAUSS_X": 1979254,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 31.013,
-    "UTM_CM": 27,
-    "UTM_N": 8020415.548,
-    "UTM_E": 289445.139,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1767",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1090.53,
-    "GAUSS_X": 1979182,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 31.01,
-    "UTM_CM": 27,
-    "UTM_N": 8020484.866,
-    "UTM_E": 289200.405,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1768",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -906.72,
-    "GAUSS_X": 1979224,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8020440.58,
-    "UTM_E": 289017.032,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1769",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1868.3,
-    "GAUSS_X": 1979392,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8020283.064,
-    "UTM_E": 289980.5,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM177",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5053.1,
-    "GAUSS_X": 1970301,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.048,
-    "UTM_CM": 27,
-    "UTM_N": 8029409.084,
-    "UTM_E": 293068.204,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1802",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13351.5,
-    "GAUSS_X": 1965762,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 31.126,
-    "UTM_CM": 27,
-    "UTM_N": 8034036.993,
-    "UTM_E": 301318.583,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1771",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2390.1,
-    "GAUSS_X": 1980851,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8018829.88,
-    "UTM_E": 290518.005,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1814",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11728.2,
-    "GAUSS_X": 1966837,
-    "LAT_WGS84": -17.785,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8032943.979,
-    "UTM_E": 299706.659,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1801",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13499.5,
-    "GAUSS_X": 1966154,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.127,
-    "UTM_CM": 27,
-    "UTM_N": 8033646.29,
-    "UTM_E": 301470.789,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1803",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13242.7,
-    "GAUSS_X": 1965549,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.125,
-    "UTM_CM": 27,
-    "UTM_N": 8034248.12,
-    "UTM_E": 301207.498,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1804",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13104,
-    "GAUSS_X": 1965457,
-    "LAT_WGS84": -17.772,
-    "LON_WGS84": 31.124,
-    "UTM_CM": 27,
-    "UTM_N": 8034338.904,
-    "UTM_E": 301067.84,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1805",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12903.9,
-    "GAUSS_X": 1965735,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 31.122,
-    "UTM_CM": 27,
-    "UTM_N": 8034058.663,
-    "UTM_E": 300870.648,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1806",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12724.7,
-    "GAUSS_X": 1966019,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8033772.984,
-    "UTM_E": 300694.537,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1807",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12548.5,
-    "GAUSS_X": 1966279,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8033510.797,
-    "UTM_E": 300521.097,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1808",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12322.4,
-    "GAUSS_X": 1966299,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.116,
-    "UTM_CM": 27,
-    "UTM_N": 8033488.575,
-    "UTM_E": 300295.18,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1809",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11986.5,
-    "GAUSS_X": 1966237,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.113,
-    "UTM_CM": 27,
-    "UTM_N": 8033546.806,
-    "UTM_E": 299958.639,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM181",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4577.51,
-    "GAUSS_X": 1973214,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8026490.476,
-    "UTM_E": 292623.728,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1810",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11857.5,
-    "GAUSS_X": 1966229,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.112,
-    "UTM_CM": 27,
-    "UTM_N": 8033553.961,
-    "UTM_E": 299829.514,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1811",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11789.6,
-    "GAUSS_X": 1966423,
-    "LAT_WGS84": -17.781,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8033358.899,
-    "UTM_E": 299763.633,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1812",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11573.6,
-    "GAUSS_X": 1966553,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8033226.262,
-    "UTM_E": 299549.105,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1813",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11649.4,
-    "GAUSS_X": 1966710,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8033070.414,
-    "UTM_E": 299626.558,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1770",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1946.53,
-    "GAUSS_X": 1979107,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8020569.389,
-    "UTM_E": 290055.674,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1885",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10666.1,
-    "GAUSS_X": 1962521,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8037249.179,
-    "UTM_E": 298598.599,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1870",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9478.65,
-    "GAUSS_X": 1964506,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8035251.522,
-    "UTM_E": 297432.199,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1871",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9245.88,
-    "GAUSS_X": 1964575,
-    "LAT_WGS84": -17.764,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8035179.699,
-    "UTM_E": 297200.156,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1872",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9323.02,
-    "GAUSS_X": 1965301,
-    "LAT_WGS84": -17.771,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8034454.884,
-    "UTM_E": 297285.032,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1873",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11618.5,
-    "GAUSS_X": 1963449,
-    "LAT_WGS84": -17.754,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8036331.729,
-    "UTM_E": 299560.922,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1874",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11332.8,
-    "GAUSS_X": 1963569,
-    "LAT_WGS84": -17.755,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8036208.682,
-    "UTM_E": 299276.469,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1876",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10783,
-    "GAUSS_X": 1963708,
-    "LAT_WGS84": -17.756,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8036063.172,
-    "UTM_E": 298728.143,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1878",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10303.9,
-    "GAUSS_X": 1963829,
-    "LAT_WGS84": -17.757,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8035936.944,
-    "UTM_E": 298250.262,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1879",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9805.54,
-    "GAUSS_X": 1963964,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8035796.438,
-    "UTM_E": 297753.338,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM188",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4958.29,
-    "GAUSS_X": 1972140,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027569.178,
-    "UTM_E": 292993.042,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1880",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9591.09,
-    "GAUSS_X": 1963973,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8035785.356,
-    "UTM_E": 297538.972,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1881",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9403.2,
-    "GAUSS_X": 1963856,
-    "LAT_WGS84": -17.758,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8035900.201,
-    "UTM_E": 297349.828,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1882",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11621,
-    "GAUSS_X": 1962983,
-    "LAT_WGS84": -17.75,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8036796.893,
-    "UTM_E": 299558.39,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1875",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11057.8,
-    "GAUSS_X": 1963653,
-    "LAT_WGS84": -17.756,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8036121.4,
-    "UTM_E": 299002.326,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1884",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11210.3,
-    "GAUSS_X": 1962589,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8037186.468,
-    "UTM_E": 299143.561,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1868",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9963.79,
-    "GAUSS_X": 1964410,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8035352.385,
-    "UTM_E": 297916.343,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1886",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10503.1,
-    "GAUSS_X": 1962438,
-    "LAT_WGS84": -17.745,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8037330.207,
-    "UTM_E": 298434.691,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1887",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13781.9,
-    "GAUSS_X": 1966205,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8033598.379,
-    "UTM_E": 301753.7,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1888",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13961.6,
-    "GAUSS_X": 1966141,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.132,
-    "UTM_CM": 27,
-    "UTM_N": 8033663.706,
-    "UTM_E": 301932.699,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1889",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14140.1,
-    "GAUSS_X": 1965971,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8033836.474,
-    "UTM_E": 302109.382,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM189",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4801.62,
-    "GAUSS_X": 1972254,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027453.284,
-    "UTM_E": 292837.582,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1890",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14272.6,
-    "GAUSS_X": 1965688,
-    "LAT_WGS84": -17.774,
-    "LON_WGS84": 31.135,
-    "UTM_CM": 27,
-    "UTM_N": 8034120.483,
-    "UTM_E": 302238.883,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1891",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14449.6,
-    "GAUSS_X": 1965370,
-    "LAT_WGS84": -17.771,
-    "LON_WGS84": 31.136,
-    "UTM_CM": 27,
-    "UTM_N": 8034440.428,
-    "UTM_E": 302412.577,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1892",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14597.7,
-    "GAUSS_X": 1965090,
-    "LAT_WGS84": -17.769,
-    "LON_WGS84": 31.138,
-    "UTM_CM": 27,
-    "UTM_N": 8034721.792,
-    "UTM_E": 302557.629,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1893",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14780.6,
-    "GAUSS_X": 1964652,
-    "LAT_WGS84": -17.765,
-    "LON_WGS84": 31.139,
-    "UTM_CM": 27,
-    "UTM_N": 8035161.601,
-    "UTM_E": 302735.918,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1894",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14644.4,
-    "GAUSS_X": 1964528,
-    "LAT_WGS84": -17.764,
-    "LON_WGS84": 31.138,
-    "UTM_CM": 27,
-    "UTM_N": 8035284.222,
-    "UTM_E": 302598.343,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1760",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1592.3,
-    "GAUSS_X": 1980130,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8019542.476,
-    "UTM_E": 289712.393,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1530",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8349.1,
-    "GAUSS_X": 1984708,
-    "LAT_WGS84": -17.946,
-    "LON_WGS84": 31.079,
-    "UTM_CM": 27,
-    "UTM_N": 8015036.071,
-    "UTM_E": 296518.884,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1883",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11448.9,
-    "GAUSS_X": 1962755,
-    "LAT_WGS84": -17.748,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8037023.08,
-    "UTM_E": 299383.897,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1856",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11217.7,
-    "GAUSS_X": 1964011,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8035765.158,
-    "UTM_E": 299166.004,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1843",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11069.8,
-    "GAUSS_X": 1965261,
-    "LAT_WGS84": -17.77,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8034513.442,
-    "UTM_E": 299031.456,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1844",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11028.2,
-    "GAUSS_X": 1965250,
-    "LAT_WGS84": -17.77,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8034524.029,
-    "UTM_E": 298989.717,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1845",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10636.4,
-    "GAUSS_X": 1965166,
-    "LAT_WGS84": -17.769,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8034603.487,
-    "UTM_E": 298597.049,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1846",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10318.4,
-    "GAUSS_X": 1965460,
-    "LAT_WGS84": -17.772,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8034306.125,
-    "UTM_E": 298282.108,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1847",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9686.35,
-    "GAUSS_X": 1965661,
-    "LAT_WGS84": -17.774,
-    "LON_WGS84": 31.091,
-    "UTM_CM": 27,
-    "UTM_N": 8034098.749,
-    "UTM_E": 297652.217,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1848",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9939.28,
-    "GAUSS_X": 1965579,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8034183.329,
-    "UTM_E": 297904.286,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1849",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10127.4,
-    "GAUSS_X": 1965542,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8034222.696,
-    "UTM_E": 298092.027,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM185",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6473.62,
-    "GAUSS_X": 1971463,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8028262.246,
-    "UTM_E": 294501.239,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1850",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9444.73,
-    "GAUSS_X": 1965759,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8033998.258,
-    "UTM_E": 297411.629,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1851",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10940.8,
-    "GAUSS_X": 1964901,
-    "LAT_WGS84": -17.767,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8034871.572,
-    "UTM_E": 298898.59,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1852",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10882.3,
-    "GAUSS_X": 1964644,
-    "LAT_WGS84": -17.765,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8035128.1,
-    "UTM_E": 298837.388,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1853",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10823.2,
-    "GAUSS_X": 1964469,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8035302.527,
-    "UTM_E": 298776.37,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM187",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4961.83,
-    "GAUSS_X": 1972011,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027697.495,
-    "UTM_E": 292995.211,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1855",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10982.7,
-    "GAUSS_X": 1964148,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8035625.11,
-    "UTM_E": 298932.499,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1869",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9700.65,
-    "GAUSS_X": 1964467,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.091,
-    "UTM_CM": 27,
-    "UTM_N": 8035292.609,
-    "UTM_E": 297653.798,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1857",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11437.7,
-    "GAUSS_X": 1963898,
-    "LAT_WGS84": -17.758,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8035880.486,
-    "UTM_E": 299384.809,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1858",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11545.1,
-    "GAUSS_X": 1963824,
-    "LAT_WGS84": -17.757,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8035955.163,
-    "UTM_E": 299491.471,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1859",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11578.7,
-    "GAUSS_X": 1963693,
-    "LAT_WGS84": -17.756,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8036086.435,
-    "UTM_E": 299523.648,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM186",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4656.12,
-    "GAUSS_X": 1971058,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8028647.087,
-    "UTM_E": 292679.292,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1860",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11636.8,
-    "GAUSS_X": 1963530,
-    "LAT_WGS84": -17.755,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8036250.301,
-    "UTM_E": 299580.072,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1861",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11730,
-    "GAUSS_X": 1963489,
-    "LAT_WGS84": -17.754,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8036292.775,
-    "UTM_E": 299672.854,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1862",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11715.3,
-    "GAUSS_X": 1963409,
-    "LAT_WGS84": -17.754,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8036372.601,
-    "UTM_E": 299657.302,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1863",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11875.7,
-    "GAUSS_X": 1963311,
-    "LAT_WGS84": -17.753,
-    "LON_WGS84": 31.112,
-    "UTM_CM": 27,
-    "UTM_N": 8036471.992,
-    "UTM_E": 299816.628,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1864",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12143.8,
-    "GAUSS_X": 1963641,
-    "LAT_WGS84": -17.756,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8036145.105,
-    "UTM_E": 300088.198,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1865",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12437.1,
-    "GAUSS_X": 1964161,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8035627.781,
-    "UTM_E": 300387.131,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1866",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10572.9,
-    "GAUSS_X": 1964256,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8035513.491,
-    "UTM_E": 298523.874,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1867",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10248.9,
-    "GAUSS_X": 1964330,
-    "LAT_WGS84": -17.762,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8035435.736,
-    "UTM_E": 298200.601,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1842",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12945.8,
-    "GAUSS_X": 1965376,
-    "LAT_WGS84": -17.771,
-    "LON_WGS84": 31.122,
-    "UTM_CM": 27,
-    "UTM_N": 8034418.17,
-    "UTM_E": 300908.722,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1854",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10746,
-    "GAUSS_X": 1964204,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8035567.007,
-    "UTM_E": 298696.431,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1613A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12180.6,
-    "GAUSS_X": 1956353,
-    "LAT_WGS84": -17.69,
-    "LON_WGS84": 31.115,
-    "UTM_CM": 27,
-    "UTM_N": 8043433.138,
-    "UTM_E": 300047.539,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1604A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11453.9,
-    "GAUSS_X": 1957330,
-    "LAT_WGS84": -17.699,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8042449.018,
-    "UTM_E": 299331.193,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1605",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11465.2,
-    "GAUSS_X": 1956991,
-    "LAT_WGS84": -17.696,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8042787.632,
-    "UTM_E": 299338.881,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1605A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11454.3,
-    "GAUSS_X": 1956993,
-    "LAT_WGS84": -17.696,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8042786.246,
-    "UTM_E": 299328.044,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1606",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11379.6,
-    "GAUSS_X": 1956845,
-    "LAT_WGS84": -17.694,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8042932.639,
-    "UTM_E": 299251.729,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1606A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11385.2,
-    "GAUSS_X": 1956850,
-    "LAT_WGS84": -17.694,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8042927.639,
-    "UTM_E": 299257.433,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1607",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11398.2,
-    "GAUSS_X": 1956730,
-    "LAT_WGS84": -17.693,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8043047.832,
-    "UTM_E": 299269.179,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1608",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11399.9,
-    "GAUSS_X": 1956545,
-    "LAT_WGS84": -17.692,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8043233.097,
-    "UTM_E": 299268.924,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1609",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11422.2,
-    "GAUSS_X": 1956514,
-    "LAT_WGS84": -17.691,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8043264.875,
-    "UTM_E": 299290.86,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1610",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11496,
-    "GAUSS_X": 1956365,
-    "LAT_WGS84": -17.69,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8043414.644,
-    "UTM_E": 299363.112,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1611",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11628,
-    "GAUSS_X": 1956316,
-    "LAT_WGS84": -17.689,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8043464.526,
-    "UTM_E": 299494.543,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1611A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11640.4,
-    "GAUSS_X": 1956299,
-    "LAT_WGS84": -17.689,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8043481.588,
-    "UTM_E": 299506.754,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1612",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11697.4,
-    "GAUSS_X": 1956313,
-    "LAT_WGS84": -17.689,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8043468.353,
-    "UTM_E": 299563.983,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1703",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -762.71,
-    "GAUSS_X": 1978628,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8021035.25,
-    "UTM_E": 288866.612,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1613",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11573,
-    "GAUSS_X": 1956727,
-    "LAT_WGS84": -17.693,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8043052.607,
-    "UTM_E": 299443.955,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1602",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11786.7,
-    "GAUSS_X": 1957319,
-    "LAT_WGS84": -17.699,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8042463.261,
-    "UTM_E": 299663.883,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1614",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11603.1,
-    "GAUSS_X": 1956727,
-    "LAT_WGS84": -17.693,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8043053.336,
-    "UTM_E": 299474.002,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1614A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12064.4,
-    "GAUSS_X": 1956731,
-    "LAT_WGS84": -17.693,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8043054.041,
-    "UTM_E": 299935.384,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1615",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11858.6,
-    "GAUSS_X": 1956881,
-    "LAT_WGS84": -17.695,
-    "LON_WGS84": 31.112,
-    "UTM_CM": 27,
-    "UTM_N": 8042901.741,
-    "UTM_E": 299731.13,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1615A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11875.2,
-    "GAUSS_X": 1957324,
-    "LAT_WGS84": -17.699,
-    "LON_WGS84": 31.112,
-    "UTM_CM": 27,
-    "UTM_N": 8042459.531,
-    "UTM_E": 299752.426,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM165",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3105.63,
-    "GAUSS_X": 1974002,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8025686.853,
-    "UTM_E": 291160.164,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM167",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3598.87,
-    "GAUSS_X": 1971793,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8027901.518,
-    "UTM_E": 291629.81,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM168",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3190.07,
-    "GAUSS_X": 1972339,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8027350.683,
-    "UTM_E": 291226.82,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM169",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3620.77,
-    "GAUSS_X": 1972558,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8027136.652,
-    "UTM_E": 291659.893,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM17",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5186.64,
-    "GAUSS_X": 1971472,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8028239.028,
-    "UTM_E": 293214.273,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM170",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3953.07,
-    "GAUSS_X": 1972579,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8027119.124,
-    "UTM_E": 291992.445,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1700",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2008,
-    "GAUSS_X": 1978813,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.019,
-    "UTM_CM": 27,
-    "UTM_N": 8020863.894,
-    "UTM_E": 290113.996,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1701",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1653.96,
-    "GAUSS_X": 1978713,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.016,
-    "UTM_CM": 27,
-    "UTM_N": 8020960.124,
-    "UTM_E": 289758.852,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM155",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3856.21,
-    "GAUSS_X": 1970109,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8029588.182,
-    "UTM_E": 291869.174,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1612A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11970.1,
-    "GAUSS_X": 1956291,
-    "LAT_WGS84": -17.689,
-    "LON_WGS84": 31.113,
-    "UTM_CM": 27,
-    "UTM_N": 8043493.677,
-    "UTM_E": 299836.445,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1526",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10452.8,
-    "GAUSS_X": 1982174,
-    "LAT_WGS84": -17.923,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8017592.572,
-    "UTM_E": 298595.44,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1512",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3701.12,
-    "GAUSS_X": 1976703,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8022991.945,
-    "UTM_E": 291784.633,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1513",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10522,
-    "GAUSS_X": 1981259,
-    "LAT_WGS84": -17.915,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8018509.165,
-    "UTM_E": 298654.814,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1514",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10756.5,
-    "GAUSS_X": 1981285,
-    "LAT_WGS84": -17.915,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8018484.923,
-    "UTM_E": 298889.642,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1515",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10998.2,
-    "GAUSS_X": 1981492,
-    "LAT_WGS84": -17.917,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8018280.68,
-    "UTM_E": 299133.543,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1516",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11275.3,
-    "GAUSS_X": 1981902,
-    "LAT_WGS84": -17.921,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8017873.611,
-    "UTM_E": 299415.039,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1517",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10977.8,
-    "GAUSS_X": 1982203,
-    "LAT_WGS84": -17.923,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8017569.822,
-    "UTM_E": 299120.737,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1518",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10708,
-    "GAUSS_X": 1982492,
-    "LAT_WGS84": -17.926,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8017277.761,
-    "UTM_E": 298854.024,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1519",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10239.7,
-    "GAUSS_X": 1982933,
-    "LAT_WGS84": -17.93,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8016831.269,
-    "UTM_E": 298390.469,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM152",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3574.08,
-    "GAUSS_X": 1970411,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8029283.513,
-    "UTM_E": 291590.245,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1520",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9640.23,
-    "GAUSS_X": 1983504,
-    "LAT_WGS84": -17.935,
-    "LON_WGS84": 31.091,
-    "UTM_CM": 27,
-    "UTM_N": 8016254.488,
-    "UTM_E": 297797.123,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1521",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9268.43,
-    "GAUSS_X": 1983826,
-    "LAT_WGS84": -17.938,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8015928.255,
-    "UTM_E": 297428.771,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1522",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8799.34,
-    "GAUSS_X": 1984269,
-    "LAT_WGS84": -17.942,
-    "LON_WGS84": 31.083,
-    "UTM_CM": 27,
-    "UTM_N": 8015479.987,
-    "UTM_E": 296964.424,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1523",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8268.18,
-    "GAUSS_X": 1984390,
-    "LAT_WGS84": -17.943,
-    "LON_WGS84": 31.078,
-    "UTM_CM": 27,
-    "UTM_N": 8015353.377,
-    "UTM_E": 296434.537,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1604",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11457,
-    "GAUSS_X": 1957324,
-    "LAT_WGS84": -17.699,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8042454.552,
-    "UTM_E": 299334.285,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1895",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14521.1,
-    "GAUSS_X": 1964636,
-    "LAT_WGS84": -17.765,
-    "LON_WGS84": 31.137,
-    "UTM_CM": 27,
-    "UTM_N": 8035175.046,
-    "UTM_E": 302476.209,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1704",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -645.64,
-    "GAUSS_X": 1978901,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.006,
-    "UTM_CM": 27,
-    "UTM_N": 8020761.369,
-    "UTM_E": 288752.456,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1601",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12112.1,
-    "GAUSS_X": 1957403,
-    "LAT_WGS84": -17.699,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8042382.643,
-    "UTM_E": 299990.177,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM16",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5025.52,
-    "GAUSS_X": 1971512,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8028197.482,
-    "UTM_E": 293053.567,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM159",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5869.23,
-    "GAUSS_X": 1969804,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8029914.548,
-    "UTM_E": 293879.085,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM158",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4210.81,
-    "GAUSS_X": 1970348,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8029352.442,
-    "UTM_E": 292226.361,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1524",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9175.35,
-    "GAUSS_X": 1983483,
-    "LAT_WGS84": -17.935,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8016270.281,
-    "UTM_E": 297331.998,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM156",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4134.42,
-    "GAUSS_X": 1970040,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8029660.049,
-    "UTM_E": 292146.67,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1525",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9502.65,
-    "GAUSS_X": 1983153,
-    "LAT_WGS84": -17.932,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8016603.886,
-    "UTM_E": 297655.764,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM154",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3519.42,
-    "GAUSS_X": 1970192,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8029501.387,
-    "UTM_E": 291533.247,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1986",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14463.5,
-    "GAUSS_X": 1961134,
-    "LAT_WGS84": -17.733,
-    "LON_WGS84": 31.136,
-    "UTM_CM": 27,
-    "UTM_N": 8038676.495,
-    "UTM_E": 302381.342,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1529",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10439.9,
-    "GAUSS_X": 1981430,
-    "LAT_WGS84": -17.916,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8018337.316,
-    "UTM_E": 298574.567,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1528",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10176.2,
-    "GAUSS_X": 1981419,
-    "LAT_WGS84": -17.916,
-    "LON_WGS84": 31.096,
-    "UTM_CM": 27,
-    "UTM_N": 8018344.903,
-    "UTM_E": 298310.714,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1527",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10099.2,
-    "GAUSS_X": 1981784,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8017979.38,
-    "UTM_E": 298237.628,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1603",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11593.3,
-    "GAUSS_X": 1957319,
-    "LAT_WGS84": -17.699,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8042461.038,
-    "UTM_E": 299470.477,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM157",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4178.59,
-    "GAUSS_X": 1970218,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8029482.207,
-    "UTM_E": 292192.748,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1747",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -263.69,
-    "GAUSS_X": 1980953,
-    "LAT_WGS84": -17.912,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8018704.253,
-    "UTM_E": 288392.507,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1734",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -909.13,
-    "GAUSS_X": 1980794,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8018870.58,
-    "UTM_E": 289036.296,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1735",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1182.08,
-    "GAUSS_X": 1980874,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 31.011,
-    "UTM_CM": 27,
-    "UTM_N": 8018793.744,
-    "UTM_E": 289310.128,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1736",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -750.84,
-    "GAUSS_X": 1981021,
-    "LAT_WGS84": -17.913,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8018641.549,
-    "UTM_E": 288880.433,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1737",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -688.26,
-    "GAUSS_X": 1981138,
-    "LAT_WGS84": -17.914,
-    "LON_WGS84": 31.006,
-    "UTM_CM": 27,
-    "UTM_N": 8018524.346,
-    "UTM_E": 288819.098,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1738",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -757.41,
-    "GAUSS_X": 1981324,
-    "LAT_WGS84": -17.915,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8018338.641,
-    "UTM_E": 288890.258,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1739",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1142.2,
-    "GAUSS_X": 1981170,
-    "LAT_WGS84": -17.914,
-    "LON_WGS84": 31.011,
-    "UTM_CM": 27,
-    "UTM_N": 8018497.469,
-    "UTM_E": 289273.421,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM174",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3924.53,
-    "GAUSS_X": 1971266,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8028431.531,
-    "UTM_E": 291949.867,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1740",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -899.1,
-    "GAUSS_X": 1981661,
-    "LAT_WGS84": -17.918,
-    "LON_WGS84": 31.008,
-    "UTM_CM": 27,
-    "UTM_N": 8018003.812,
-    "UTM_E": 289035.574,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1741",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1148.71,
-    "GAUSS_X": 1982300,
-    "LAT_WGS84": -17.924,
-    "LON_WGS84": 31.011,
-    "UTM_CM": 27,
-    "UTM_N": 8017366.776,
-    "UTM_E": 289292.081,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1742",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -845.96,
-    "GAUSS_X": 1982425,
-    "LAT_WGS84": -17.925,
-    "LON_WGS84": 31.008,
-    "UTM_CM": 27,
-    "UTM_N": 8017238.77,
-    "UTM_E": 288990.643,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1743",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -998.81,
-    "GAUSS_X": 1982806,
-    "LAT_WGS84": -17.929,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8016859.118,
-    "UTM_E": 289147.606,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1744",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -605.63,
-    "GAUSS_X": 1981779,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 31.006,
-    "UTM_CM": 27,
-    "UTM_N": 8017882.488,
-    "UTM_E": 288743.346,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1702",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -999.58,
-    "GAUSS_X": 1978755,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8020910.63,
-    "UTM_E": 289104.868,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1746",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -437.84,
-    "GAUSS_X": 1981372,
-    "LAT_WGS84": -17.916,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8018287.324,
-    "UTM_E": 288571.172,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1731",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -626.22,
-    "GAUSS_X": 1979846,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 31.006,
-    "UTM_CM": 27,
-    "UTM_N": 8019815.811,
-    "UTM_E": 288743.179,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1748",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -407.82,
-    "GAUSS_X": 1980907,
-    "LAT_WGS84": -17.912,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8018752.516,
-    "UTM_E": 288536.149,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1749",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -229.38,
-    "GAUSS_X": 1980793,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8018863.82,
-    "UTM_E": 288356.476,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM175",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3693.56,
-    "GAUSS_X": 1971326,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8028369.678,
-    "UTM_E": 291719.514,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1750",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -421.86,
-    "GAUSS_X": 1980052,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8019607.848,
-    "UTM_E": 288541.008,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1751",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1378.58,
-    "GAUSS_X": 1981097,
-    "LAT_WGS84": -17.913,
-    "LON_WGS84": 31.013,
-    "UTM_CM": 27,
-    "UTM_N": 8018572.295,
-    "UTM_E": 289509.047,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1752",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1469.54,
-    "GAUSS_X": 1981484,
-    "LAT_WGS84": -17.917,
-    "LON_WGS84": 31.014,
-    "UTM_CM": 27,
-    "UTM_N": 8018186.777,
-    "UTM_E": 289604.166,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1753",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1546.94,
-    "GAUSS_X": 1981813,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8017858.409,
-    "UTM_E": 289685.11,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1754",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1595.61,
-    "GAUSS_X": 1982084,
-    "LAT_WGS84": -17.922,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8017587.918,
-    "UTM_E": 289736.696,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1755",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1676.81,
-    "GAUSS_X": 1982382,
-    "LAT_WGS84": -17.925,
-    "LON_WGS84": 31.016,
-    "UTM_CM": 27,
-    "UTM_N": 8017290.314,
-    "UTM_E": 289821.111,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1756",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1851.33,
-    "GAUSS_X": 1981982,
-    "LAT_WGS84": -17.921,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8017692.575,
-    "UTM_E": 289991.344,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1757",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2655.02,
-    "GAUSS_X": 1981767,
-    "LAT_WGS84": -17.919,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8017916.749,
-    "UTM_E": 290792.786,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1758",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2492.34,
-    "GAUSS_X": 1981212,
-    "LAT_WGS84": -17.914,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8018469.448,
-    "UTM_E": 290624.137,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1759",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1210.22,
-    "GAUSS_X": 1980231,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 31.011,
-    "UTM_CM": 27,
-    "UTM_N": 8019437.085,
-    "UTM_E": 289331.366,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1745",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -401.62,
-    "GAUSS_X": 1981880,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8017779.376,
-    "UTM_E": 288540.401,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM172",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4178.47,
-    "GAUSS_X": 1971832,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8027868.322,
-    "UTM_E": 292209.876,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1705",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -426.48,
-    "GAUSS_X": 1979280,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8020379.341,
-    "UTM_E": 288537.349,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1706",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -270.12,
-    "GAUSS_X": 1979582,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 31.003,
-    "UTM_CM": 27,
-    "UTM_N": 8020075.694,
-    "UTM_E": 288384.215,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1707",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -113.62,
-    "GAUSS_X": 1979857,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 31.001,
-    "UTM_CM": 27,
-    "UTM_N": 8019799.447,
-    "UTM_E": 288230.646,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1708",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 278.42,
-    "GAUSS_X": 1980531,
-    "LAT_WGS84": -17.908,
-    "LON_WGS84": 30.997,
-    "UTM_CM": 27,
-    "UTM_N": 8019120.612,
-    "UTM_E": 287845.811,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1709",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 456.46,
-    "GAUSS_X": 1980818,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 30.996,
-    "UTM_CM": 27,
-    "UTM_N": 8018832.272,
-    "UTM_E": 287670.829,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1710",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 170.23,
-    "GAUSS_X": 1981126,
-    "LAT_WGS84": -17.914,
-    "LON_WGS84": 30.998,
-    "UTM_CM": 27,
-    "UTM_N": 8018527.196,
-    "UTM_E": 287960.396,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1711",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -17.77,
-    "GAUSS_X": 1981494,
-    "LAT_WGS84": -17.917,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8018161.239,
-    "UTM_E": 288152.367,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1712",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -238.9,
-    "GAUSS_X": 1981956,
-    "LAT_WGS84": -17.921,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8017701.331,
-    "UTM_E": 288378.485,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1713",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -551.7,
-    "GAUSS_X": 1982636,
-    "LAT_WGS84": -17.927,
-    "LON_WGS84": 31.005,
-    "UTM_CM": 27,
-    "UTM_N": 8017024.848,
-    "UTM_E": 288698.621,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1714",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -766.57,
-    "GAUSS_X": 1983020,
-    "LAT_WGS84": -17.931,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8016642.532,
-    "UTM_E": 288917.646,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1715",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -854.46,
-    "GAUSS_X": 1983194,
-    "LAT_WGS84": -17.932,
-    "LON_WGS84": 31.008,
-    "UTM_CM": 27,
-    "UTM_N": 8016470.11,
-    "UTM_E": 289007.408,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1716",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1100.86,
-    "GAUSS_X": 1983066,
-    "LAT_WGS84": -17.931,
-    "LON_WGS84": 31.01,
-    "UTM_CM": 27,
-    "UTM_N": 8016600.331,
-    "UTM_E": 289252.459,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1717",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1783.86,
-    "GAUSS_X": 1982794,
-    "LAT_WGS84": -17.929,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8016879.969,
-    "UTM_E": 289932.593,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1733",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -774.56,
-    "GAUSS_X": 1980358,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8019304.896,
-    "UTM_E": 288897.035,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1725",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3055.78,
-    "GAUSS_X": 1980204,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8019483.742,
-    "UTM_E": 291176.797,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM176",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3527.99,
-    "GAUSS_X": 1971649,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8028044.452,
-    "UTM_E": 291557.388,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1730",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -548.28,
-    "GAUSS_X": 1979534,
-    "LAT_WGS84": -17.899,
-    "LON_WGS84": 31.005,
-    "UTM_CM": 27,
-    "UTM_N": 8020126.784,
-    "UTM_E": 288661.885,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM173",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4011.13,
-    "GAUSS_X": 1971533,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8028166.016,
-    "UTM_E": 292039.322,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1729",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -541.02,
-    "GAUSS_X": 1979378,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 31.005,
-    "UTM_CM": 27,
-    "UTM_N": 8020282.361,
-    "UTM_E": 288652.954,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1728",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1297.2,
-    "GAUSS_X": 1980996,
-    "LAT_WGS84": -17.912,
-    "LON_WGS84": 31.012,
-    "UTM_CM": 27,
-    "UTM_N": 8018672.93,
-    "UTM_E": 289426.569,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1718",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2438.62,
-    "GAUSS_X": 1982516,
-    "LAT_WGS84": -17.926,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8017165.181,
-    "UTM_E": 290584.419,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1726",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2657.21,
-    "GAUSS_X": 1980500,
-    "LAT_WGS84": -17.908,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8019183.838,
-    "UTM_E": 290781.368,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1719",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2943.98,
-    "GAUSS_X": 1982298,
-    "LAT_WGS84": -17.924,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8017388.37,
-    "UTM_E": 291087.481,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1724",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2960.12,
-    "GAUSS_X": 1980377,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8019309.461,
-    "UTM_E": 291082.989,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1723",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3042.28,
-    "GAUSS_X": 1980446,
-    "LAT_WGS84": -17.908,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8019241.888,
-    "UTM_E": 291165.891,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1722",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3033.41,
-    "GAUSS_X": 1980694,
-    "LAT_WGS84": -17.91,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8018993.082,
-    "UTM_E": 291159.691,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1721",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3234.04,
-    "GAUSS_X": 1981450,
-    "LAT_WGS84": -17.917,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8018239.856,
-    "UTM_E": 291368.45,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1720",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3413.78,
-    "GAUSS_X": 1982095,
-    "LAT_WGS84": -17.922,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8017596.786,
-    "UTM_E": 291555.134,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1732",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -711.61,
-    "GAUSS_X": 1980098,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8019565.024,
-    "UTM_E": 288831.279,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1727",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1496.76,
-    "GAUSS_X": 1980810,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 31.014,
-    "UTM_CM": 27,
-    "UTM_N": 8018860.65,
-    "UTM_E": 289624.154,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2048",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3878.66,
-    "GAUSS_X": 1980791,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 30.963,
-    "UTM_CM": 27,
-    "UTM_N": 8018822.39,
-    "UTM_E": 284247.968,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2035",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2473.91,
-    "GAUSS_X": 1980286,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 30.977,
-    "UTM_CM": 27,
-    "UTM_N": 8019341.983,
-    "UTM_E": 285647.461,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2036",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2408.76,
-    "GAUSS_X": 1979860,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 30.977,
-    "UTM_CM": 27,
-    "UTM_N": 8019769.359,
-    "UTM_E": 285708.038,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2037",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2107.56,
-    "GAUSS_X": 1979978,
-    "LAT_WGS84": -17.903,
-    "LON_WGS84": 30.98,
-    "UTM_CM": 27,
-    "UTM_N": 8019654.18,
-    "UTM_E": 286010.542,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2038",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2144.58,
-    "GAUSS_X": 1980327,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 30.98,
-    "UTM_CM": 27,
-    "UTM_N": 8019305.075,
-    "UTM_E": 285977.261,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2039",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2183.28,
-    "GAUSS_X": 1980680,
-    "LAT_WGS84": -17.91,
-    "LON_WGS84": 30.979,
-    "UTM_CM": 27,
-    "UTM_N": 8018951.231,
-    "UTM_E": 285942.352,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM204",
-    "TOPO": "Taormina",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 499.78,
-    "GAUSS_X": 1962469,
-    "LAT_WGS84": -17.745,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8037182.091,
-    "UTM_E": 287431.325,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2040",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2500.81,
-    "GAUSS_X": 1980649,
-    "LAT_WGS84": -17.909,
-    "LON_WGS84": 30.976,
-    "UTM_CM": 27,
-    "UTM_N": 8018978.814,
-    "UTM_E": 285624.454,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2041",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2528.26,
-    "GAUSS_X": 1980913,
-    "LAT_WGS84": -17.912,
-    "LON_WGS84": 30.976,
-    "UTM_CM": 27,
-    "UTM_N": 8018714.21,
-    "UTM_E": 285599.84,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2042",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2845.34,
-    "GAUSS_X": 1980913,
-    "LAT_WGS84": -17.912,
-    "LON_WGS84": 30.973,
-    "UTM_CM": 27,
-    "UTM_N": 8018711.184,
-    "UTM_E": 285282.72,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2043",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3095.22,
-    "GAUSS_X": 1981030,
-    "LAT_WGS84": -17.913,
-    "LON_WGS84": 30.971,
-    "UTM_CM": 27,
-    "UTM_N": 8018591.877,
-    "UTM_E": 285034.064,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2044",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3091.28,
-    "GAUSS_X": 1981195,
-    "LAT_WGS84": -17.914,
-    "LON_WGS84": 30.971,
-    "UTM_CM": 27,
-    "UTM_N": 8018426.551,
-    "UTM_E": 285039.781,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2045",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3722.2,
-    "GAUSS_X": 1981280,
-    "LAT_WGS84": -17.915,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8018335.223,
-    "UTM_E": 284409.697,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2093",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7892.15,
-    "GAUSS_X": 1976503,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8023067.79,
-    "UTM_E": 280187.956,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2047",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3754.04,
-    "GAUSS_X": 1980946,
-    "LAT_WGS84": -17.912,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8018668.86,
-    "UTM_E": 284374.266,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2032",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2922.67,
-    "GAUSS_X": 1980019,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8019604.605,
-    "UTM_E": 285195.78,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2049",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3818.43,
-    "GAUSS_X": 1980389,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 30.964,
-    "UTM_CM": 27,
-    "UTM_N": 8019225.044,
-    "UTM_E": 284303.888,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2050",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3494.49,
-    "GAUSS_X": 1980310,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 30.967,
-    "UTM_CM": 27,
-    "UTM_N": 8019307.862,
-    "UTM_E": 284627.014,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2051",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3768.3,
-    "GAUSS_X": 1980144,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 30.964,
-    "UTM_CM": 27,
-    "UTM_N": 8019470.261,
-    "UTM_E": 284351.397,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2052",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3750.89,
-    "GAUSS_X": 1979854,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8019760.442,
-    "UTM_E": 284365.696,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM208",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 330.96,
-    "GAUSS_X": 1964836,
-    "LAT_WGS84": -17.766,
-    "LON_WGS84": 30.997,
-    "UTM_CM": 27,
-    "UTM_N": 8034816.528,
-    "UTM_E": 287625.372,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2085",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7939.94,
-    "GAUSS_X": 1975519,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8024051.765,
-    "UTM_E": 280129.612,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2086",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7820.62,
-    "GAUSS_X": 1975511,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 30.926,
-    "UTM_CM": 27,
-    "UTM_N": 8024060.344,
-    "UTM_E": 280248.87,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2087",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7840.71,
-    "GAUSS_X": 1975690,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 30.926,
-    "UTM_CM": 27,
-    "UTM_N": 8023880.964,
-    "UTM_E": 280230.697,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2088",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7845.97,
-    "GAUSS_X": 1976029,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 30.926,
-    "UTM_CM": 27,
-    "UTM_N": 8023542.37,
-    "UTM_E": 280229.063,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2089",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7632.51,
-    "GAUSS_X": 1976045,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8023528.286,
-    "UTM_E": 280442.728,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2090",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7489.12,
-    "GAUSS_X": 1976164,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8023410.616,
-    "UTM_E": 280587.415,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2091",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7253.73,
-    "GAUSS_X": 1976199,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8023378.193,
-    "UTM_E": 280823.211,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2004",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3315.22,
-    "GAUSS_X": 1979084,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.969,
-    "UTM_CM": 27,
-    "UTM_N": 8020535.518,
-    "UTM_E": 284793.149,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2046",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3903.95,
-    "GAUSS_X": 1981223,
-    "LAT_WGS84": -17.915,
-    "LON_WGS84": 30.963,
-    "UTM_CM": 27,
-    "UTM_N": 8018390.098,
-    "UTM_E": 284227.315,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2020",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4063.91,
-    "GAUSS_X": 1980600,
-    "LAT_WGS84": -17.909,
-    "LON_WGS84": 30.962,
-    "UTM_CM": 27,
-    "UTM_N": 8019011.363,
-    "UTM_E": 284060.645,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1984",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14027.7,
-    "GAUSS_X": 1961095,
-    "LAT_WGS84": -17.733,
-    "LON_WGS84": 31.132,
-    "UTM_CM": 27,
-    "UTM_N": 8038710.602,
-    "UTM_E": 301945.159,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2006",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2773.43,
-    "GAUSS_X": 1979409,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 30.974,
-    "UTM_CM": 27,
-    "UTM_N": 8020215.815,
-    "UTM_E": 285338.493,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2007",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2307.07,
-    "GAUSS_X": 1979661,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 30.978,
-    "UTM_CM": 27,
-    "UTM_N": 8019969.563,
-    "UTM_E": 285807.602,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2008",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1999.82,
-    "GAUSS_X": 1979939,
-    "LAT_WGS84": -17.903,
-    "LON_WGS84": 30.981,
-    "UTM_CM": 27,
-    "UTM_N": 8019694.831,
-    "UTM_E": 286117.869,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2009",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1870.87,
-    "GAUSS_X": 1980255,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8019380.291,
-    "UTM_E": 286250.225,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2010",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1810.69,
-    "GAUSS_X": 1980756,
-    "LAT_WGS84": -17.91,
-    "LON_WGS84": 30.983,
-    "UTM_CM": 27,
-    "UTM_N": 8018878.914,
-    "UTM_E": 286315.802,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2011",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2667.45,
-    "GAUSS_X": 1981086,
-    "LAT_WGS84": -17.913,
-    "LON_WGS84": 30.975,
-    "UTM_CM": 27,
-    "UTM_N": 8018540.586,
-    "UTM_E": 285462.483,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2012",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2616.21,
-    "GAUSS_X": 1981261,
-    "LAT_WGS84": -17.915,
-    "LON_WGS84": 30.975,
-    "UTM_CM": 27,
-    "UTM_N": 8018365.657,
-    "UTM_E": 285515.613,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2013",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2704.71,
-    "GAUSS_X": 1981394,
-    "LAT_WGS84": -17.916,
-    "LON_WGS84": 30.974,
-    "UTM_CM": 27,
-    "UTM_N": 8018231.861,
-    "UTM_E": 285428.53,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2014",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3017.26,
-    "GAUSS_X": 1981474,
-    "LAT_WGS84": -17.917,
-    "LON_WGS84": 30.971,
-    "UTM_CM": 27,
-    "UTM_N": 8018148.234,
-    "UTM_E": 285116.808,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2015",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3720.3,
-    "GAUSS_X": 1981596,
-    "LAT_WGS84": -17.918,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8018018.437,
-    "UTM_E": 284415,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2016",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4137.07,
-    "GAUSS_X": 1981630,
-    "LAT_WGS84": -17.918,
-    "LON_WGS84": 30.961,
-    "UTM_CM": 27,
-    "UTM_N": 8017980.335,
-    "UTM_E": 283998.542,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2017",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4167.11,
-    "GAUSS_X": 1981127,
-    "LAT_WGS84": -17.914,
-    "LON_WGS84": 30.961,
-    "UTM_CM": 27,
-    "UTM_N": 8018483.022,
-    "UTM_E": 283963.095,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2034",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2471.83,
-    "GAUSS_X": 1980349,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 30.977,
-    "UTM_CM": 27,
-    "UTM_N": 8019279.518,
-    "UTM_E": 285650.212,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2026",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3639.65,
-    "GAUSS_X": 1979651,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 30.966,
-    "UTM_CM": 27,
-    "UTM_N": 8019965.28,
-    "UTM_E": 284474.763,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2094",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8304.8,
-    "GAUSS_X": 1976492,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8023074.388,
-    "UTM_E": 279775.13,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2031",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2916.58,
-    "GAUSS_X": 1979770,
-    "LAT_WGS84": -17.901,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8019853.518,
-    "UTM_E": 285199.199,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2030",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2916.06,
-    "GAUSS_X": 1979669,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8019955.135,
-    "UTM_E": 285198.629,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM203",
-    "TOPO": "Golden Stairs",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3163.91,
-    "GAUSS_X": 1963561,
-    "LAT_WGS84": -17.755,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8036129.705,
-    "UTM_E": 291106.972,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2029",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3147.99,
-    "GAUSS_X": 1979767,
-    "LAT_WGS84": -17.901,
-    "LON_WGS84": 30.97,
-    "UTM_CM": 27,
-    "UTM_N": 8019854.574,
-    "UTM_E": 284967.725,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2018",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4084.87,
-    "GAUSS_X": 1981057,
-    "LAT_WGS84": -17.913,
-    "LON_WGS84": 30.961,
-    "UTM_CM": 27,
-    "UTM_N": 8018553.784,
-    "UTM_E": 284044.594,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2027",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3616.45,
-    "GAUSS_X": 1979610,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 30.966,
-    "UTM_CM": 27,
-    "UTM_N": 8020006.584,
-    "UTM_E": 284497.525,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2019",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4298.8,
-    "GAUSS_X": 1980817,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 30.959,
-    "UTM_CM": 27,
-    "UTM_N": 8018792.025,
-    "UTM_E": 283828.056,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2025",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3942.64,
-    "GAUSS_X": 1979492,
-    "LAT_WGS84": -17.899,
-    "LON_WGS84": 30.963,
-    "UTM_CM": 27,
-    "UTM_N": 8020120.736,
-    "UTM_E": 284170.035,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2024",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4219.14,
-    "GAUSS_X": 1980004,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 30.96,
-    "UTM_CM": 27,
-    "UTM_N": 8019605.567,
-    "UTM_E": 283898.999,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2023",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4219.95,
-    "GAUSS_X": 1980131,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 30.96,
-    "UTM_CM": 27,
-    "UTM_N": 8019478.533,
-    "UTM_E": 283899.553,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2022",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4221.94,
-    "GAUSS_X": 1980347,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 30.96,
-    "UTM_CM": 27,
-    "UTM_N": 8019262.586,
-    "UTM_E": 283899.881,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2021",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4023,
-    "GAUSS_X": 1980575,
-    "LAT_WGS84": -17.909,
-    "LON_WGS84": 30.962,
-    "UTM_CM": 27,
-    "UTM_N": 8019036.775,
-    "UTM_E": 284101.292,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2033",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3020.98,
-    "GAUSS_X": 1980299,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 30.971,
-    "UTM_CM": 27,
-    "UTM_N": 8019323.887,
-    "UTM_E": 285100.461,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2028",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3313.6,
-    "GAUSS_X": 1979772,
-    "LAT_WGS84": -17.901,
-    "LON_WGS84": 30.969,
-    "UTM_CM": 27,
-    "UTM_N": 8019847.246,
-    "UTM_E": 284802.156,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2138",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7347.3,
-    "GAUSS_X": 1975864,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8023712.246,
-    "UTM_E": 280726.039,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2124",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6698.34,
-    "GAUSS_X": 1976001,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8023582.662,
-    "UTM_E": 281376.549,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2125",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6513.74,
-    "GAUSS_X": 1976390,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 30.939,
-    "UTM_CM": 27,
-    "UTM_N": 8023195.558,
-    "UTM_E": 281565.342,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2126",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6694.94,
-    "GAUSS_X": 1976476,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8023107.095,
-    "UTM_E": 281385.046,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2127",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6547.3,
-    "GAUSS_X": 1976744,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 30.938,
-    "UTM_CM": 27,
-    "UTM_N": 8022840.692,
-    "UTM_E": 281535.577,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2128",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6677.75,
-    "GAUSS_X": 1976837,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8022747.041,
-    "UTM_E": 281406.099,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2129",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6641.1,
-    "GAUSS_X": 1976957,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8022626.898,
-    "UTM_E": 281444.046,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2130",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6769.23,
-    "GAUSS_X": 1976909,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8022673.171,
-    "UTM_E": 281315.388,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2131",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6969.29,
-    "GAUSS_X": 1976761,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 30.934,
-    "UTM_CM": 27,
-    "UTM_N": 8022819.106,
-    "UTM_E": 281113.714,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2132",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6962.2,
-    "GAUSS_X": 1976574,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 30.934,
-    "UTM_CM": 27,
-    "UTM_N": 8023006.317,
-    "UTM_E": 281118.799,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2133",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7124.47,
-    "GAUSS_X": 1976569,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8023009.629,
-    "UTM_E": 280956.453,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2134",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7097.78,
-    "GAUSS_X": 1976184,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8023395.487,
-    "UTM_E": 280979.015,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2135",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6986.22,
-    "GAUSS_X": 1976142,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 30.934,
-    "UTM_CM": 27,
-    "UTM_N": 8023438.468,
-    "UTM_E": 281090.142,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2092",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7260.11,
-    "GAUSS_X": 1976555,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8023022.487,
-    "UTM_E": 280820.641,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2137",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7241.86,
-    "GAUSS_X": 1976055,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8023522.33,
-    "UTM_E": 280833.54,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2121",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7088.65,
-    "GAUSS_X": 1975727,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8023851.926,
-    "UTM_E": 280983.257,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM214",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12730.5,
-    "GAUSS_X": 1964131,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8035661.527,
-    "UTM_E": 300680.215,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2142",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1913.02,
-    "GAUSS_X": 1971732,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8027903.029,
-    "UTM_E": 286116.756,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2143",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1955.98,
-    "GAUSS_X": 1972021,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8027613.848,
-    "UTM_E": 286076.878,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2144",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1995.63,
-    "GAUSS_X": 1972567,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 30.981,
-    "UTM_CM": 27,
-    "UTM_N": 8027067.075,
-    "UTM_E": 286043.066,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2145",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2028.85,
-    "GAUSS_X": 1972797,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 30.981,
-    "UTM_CM": 27,
-    "UTM_N": 8026836.624,
-    "UTM_E": 286012.304,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2146",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2374.31,
-    "GAUSS_X": 1972742,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 30.978,
-    "UTM_CM": 27,
-    "UTM_N": 8026888.425,
-    "UTM_E": 285666.212,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2147",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2589.91,
-    "GAUSS_X": 1972826,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 30.976,
-    "UTM_CM": 27,
-    "UTM_N": 8026802.369,
-    "UTM_E": 285451.484,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2148",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2917.91,
-    "GAUSS_X": 1973060,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8026564.553,
-    "UTM_E": 285125.954,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2149",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3224.11,
-    "GAUSS_X": 1973317,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 30.97,
-    "UTM_CM": 27,
-    "UTM_N": 8026304.187,
-    "UTM_E": 284822.469,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM215",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12922.5,
-    "GAUSS_X": 1964018,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.122,
-    "UTM_CM": 27,
-    "UTM_N": 8035775.835,
-    "UTM_E": 300870.945,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2150",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1838.14,
-    "GAUSS_X": 1973232,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 30.983,
-    "UTM_CM": 27,
-    "UTM_N": 8026404.028,
-    "UTM_E": 286207.684,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2151",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1728.33,
-    "GAUSS_X": 1972714,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 30.984,
-    "UTM_CM": 27,
-    "UTM_N": 8026922.648,
-    "UTM_E": 286311.971,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2152",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1751.6,
-    "GAUSS_X": 1972396,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 30.983,
-    "UTM_CM": 27,
-    "UTM_N": 8027240.463,
-    "UTM_E": 286285.296,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2136",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7012.11,
-    "GAUSS_X": 1976075,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 30.934,
-    "UTM_CM": 27,
-    "UTM_N": 8023504.899,
-    "UTM_E": 281063.534,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2109",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7901.58,
-    "GAUSS_X": 1975159,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8024411.326,
-    "UTM_E": 280164.131,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2095",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8563.36,
-    "GAUSS_X": 1976476,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 30.919,
-    "UTM_CM": 27,
-    "UTM_N": 8023087.339,
-    "UTM_E": 279516.365,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2096",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8670.1,
-    "GAUSS_X": 1976356,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 30.918,
-    "UTM_CM": 27,
-    "UTM_N": 8023205.952,
-    "UTM_E": 279408.327,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2097",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8855.4,
-    "GAUSS_X": 1976352,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 30.916,
-    "UTM_CM": 27,
-    "UTM_N": 8023208.147,
-    "UTM_E": 279222.955,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2098",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8937.32,
-    "GAUSS_X": 1976274,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 30.916,
-    "UTM_CM": 27,
-    "UTM_N": 8023285.78,
-    "UTM_E": 279140.182,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2099",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8846.13,
-    "GAUSS_X": 1976189,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 30.916,
-    "UTM_CM": 27,
-    "UTM_N": 8023371.57,
-    "UTM_E": 279230.476,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM21",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5849.41,
-    "GAUSS_X": 1971308,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8028410.424,
-    "UTM_E": 293875.333,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2100",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8921.83,
-    "GAUSS_X": 1976104,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 30.916,
-    "UTM_CM": 27,
-    "UTM_N": 8023456.171,
-    "UTM_E": 279153.85,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2101",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8758.07,
-    "GAUSS_X": 1975944,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 30.917,
-    "UTM_CM": 27,
-    "UTM_N": 8023617.759,
-    "UTM_E": 279315.921,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2102",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8570.95,
-    "GAUSS_X": 1975891,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 30.919,
-    "UTM_CM": 27,
-    "UTM_N": 8023672.051,
-    "UTM_E": 279502.508,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2103",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8281.56,
-    "GAUSS_X": 1975917,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8023649.739,
-    "UTM_E": 279792.211,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2104",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8275.58,
-    "GAUSS_X": 1976072,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8023494.521,
-    "UTM_E": 279799.856,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2105",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8243.98,
-    "GAUSS_X": 1975709,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8023857.731,
-    "UTM_E": 279827.573,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2106",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8095.24,
-    "GAUSS_X": 1975598,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 30.924,
-    "UTM_CM": 27,
-    "UTM_N": 8023970.39,
-    "UTM_E": 279975.144,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2123",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6756.23,
-    "GAUSS_X": 1975961,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8023621.547,
-    "UTM_E": 281318.228,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2114",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7125.03,
-    "GAUSS_X": 1975153,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8024425.724,
-    "UTM_E": 280940.722,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2003",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3406.73,
-    "GAUSS_X": 1979237,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 30.968,
-    "UTM_CM": 27,
-    "UTM_N": 8020381.388,
-    "UTM_E": 284703.272,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2120",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7093.23,
-    "GAUSS_X": 1975647,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8023932.398,
-    "UTM_E": 280977.814,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2119",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7212.79,
-    "GAUSS_X": 1975646,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8023932.277,
-    "UTM_E": 280858.225,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2118",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7337.9,
-    "GAUSS_X": 1975714,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8023862.638,
-    "UTM_E": 280733.83,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2117",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7345.71,
-    "GAUSS_X": 1975351,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8024225.974,
-    "UTM_E": 280722.126,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2107",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8166.62,
-    "GAUSS_X": 1975497,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 30.923,
-    "UTM_CM": 27,
-    "UTM_N": 8024070.579,
-    "UTM_E": 279902.673,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2115",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7058.65,
-    "GAUSS_X": 1975300,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8024279.655,
-    "UTM_E": 281008.683,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2108",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8125.42,
-    "GAUSS_X": 1975291,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 30.923,
-    "UTM_CM": 27,
-    "UTM_N": 8024277.52,
-    "UTM_E": 279941.667,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2113",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7261.18,
-    "GAUSS_X": 1975217,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8024360.697,
-    "UTM_E": 280805.234,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2112",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7387.09,
-    "GAUSS_X": 1974944,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 30.93,
-    "UTM_CM": 27,
-    "UTM_N": 8024632.446,
-    "UTM_E": 280676.383,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2111",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7493.01,
-    "GAUSS_X": 1975004,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8024571.153,
-    "UTM_E": 280571.092,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2110",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7705.33,
-    "GAUSS_X": 1975054,
-    "LAT_WGS84": -17.859,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8024518.632,
-    "UTM_E": 280359.281,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM211",
-    "TOPO": "Stour Road",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8249.94,
-    "GAUSS_X": 1962695,
-    "LAT_WGS84": -17.747,
-    "LON_WGS84": 31.078,
-    "UTM_CM": 27,
-    "UTM_N": 8037049.724,
-    "UTM_E": 296184.138,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2122",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6883.64,
-    "GAUSS_X": 1975680,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 30.935,
-    "UTM_CM": 27,
-    "UTM_N": 8023901.259,
-    "UTM_E": 281187.79,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2116",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7207.56,
-    "GAUSS_X": 1975339,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8024239.425,
-    "UTM_E": 280860.167,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1937",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15404.3,
-    "GAUSS_X": 1963221,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.145,
-    "UTM_CM": 27,
-    "UTM_N": 8036600.032,
-    "UTM_E": 303344.403,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1924",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13407.4,
-    "GAUSS_X": 1962413,
-    "LAT_WGS84": -17.745,
-    "LON_WGS84": 31.126,
-    "UTM_CM": 27,
-    "UTM_N": 8037386.256,
-    "UTM_E": 301338.78,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1925",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13694,
-    "GAUSS_X": 1962352,
-    "LAT_WGS84": -17.744,
-    "LON_WGS84": 31.129,
-    "UTM_CM": 27,
-    "UTM_N": 8037450.628,
-    "UTM_E": 301624.766,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1926",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13758.8,
-    "GAUSS_X": 1962478,
-    "LAT_WGS84": -17.745,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8037325.064,
-    "UTM_E": 301690.911,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1927",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13837.8,
-    "GAUSS_X": 1962556,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8037247.903,
-    "UTM_E": 301770.744,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1928",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13879.9,
-    "GAUSS_X": 1962734,
-    "LAT_WGS84": -17.747,
-    "LON_WGS84": 31.131,
-    "UTM_CM": 27,
-    "UTM_N": 8037070.416,
-    "UTM_E": 301814.708,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1929",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13905.6,
-    "GAUSS_X": 1962986,
-    "LAT_WGS84": -17.75,
-    "LON_WGS84": 31.131,
-    "UTM_CM": 27,
-    "UTM_N": 8036818.732,
-    "UTM_E": 301843.101,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM193",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3743.76,
-    "GAUSS_X": 1969654,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8030041.616,
-    "UTM_E": 291751.859,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1930",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14283.3,
-    "GAUSS_X": 1963014,
-    "LAT_WGS84": -17.75,
-    "LON_WGS84": 31.135,
-    "UTM_CM": 27,
-    "UTM_N": 8036794.442,
-    "UTM_E": 302221.122,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1931",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14694.1,
-    "GAUSS_X": 1963058,
-    "LAT_WGS84": -17.75,
-    "LON_WGS84": 31.139,
-    "UTM_CM": 27,
-    "UTM_N": 8036755.504,
-    "UTM_E": 302632.393,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1932",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14799.4,
-    "GAUSS_X": 1963016,
-    "LAT_WGS84": -17.75,
-    "LON_WGS84": 31.14,
-    "UTM_CM": 27,
-    "UTM_N": 8036798.477,
-    "UTM_E": 302737.309,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1933",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14891.5,
-    "GAUSS_X": 1963245,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.14,
-    "UTM_CM": 27,
-    "UTM_N": 8036570.112,
-    "UTM_E": 302831.833,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1934",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14918.4,
-    "GAUSS_X": 1963376,
-    "LAT_WGS84": -17.753,
-    "LON_WGS84": 31.141,
-    "UTM_CM": 27,
-    "UTM_N": 8036439.776,
-    "UTM_E": 302860.144,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM195",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4799.86,
-    "GAUSS_X": 1969988,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8029718.722,
-    "UTM_E": 292811.609,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1936",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15174.5,
-    "GAUSS_X": 1963258,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.143,
-    "UTM_CM": 27,
-    "UTM_N": 8036560.025,
-    "UTM_E": 303114.978,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1921",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12925.8,
-    "GAUSS_X": 1962673,
-    "LAT_WGS84": -17.747,
-    "LON_WGS84": 31.122,
-    "UTM_CM": 27,
-    "UTM_N": 8037121.042,
-    "UTM_E": 300859.924,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1938",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15485.1,
-    "GAUSS_X": 1963267,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.146,
-    "UTM_CM": 27,
-    "UTM_N": 8036554.621,
-    "UTM_E": 303425.667,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1939",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15384.2,
-    "GAUSS_X": 1963359,
-    "LAT_WGS84": -17.753,
-    "LON_WGS84": 31.145,
-    "UTM_CM": 27,
-    "UTM_N": 8036460.995,
-    "UTM_E": 303325.74,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM194",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4711.67,
-    "GAUSS_X": 1969632,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8030074.186,
-    "UTM_E": 292719.606,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1940",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15321.3,
-    "GAUSS_X": 1963489,
-    "LAT_WGS84": -17.754,
-    "LON_WGS84": 31.144,
-    "UTM_CM": 27,
-    "UTM_N": 8036330.233,
-    "UTM_E": 303264.264,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1941",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15342.2,
-    "GAUSS_X": 1963545,
-    "LAT_WGS84": -17.755,
-    "LON_WGS84": 31.145,
-    "UTM_CM": 27,
-    "UTM_N": 8036275.364,
-    "UTM_E": 303285.701,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1942",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15418.5,
-    "GAUSS_X": 1963634,
-    "LAT_WGS84": -17.756,
-    "LON_WGS84": 31.145,
-    "UTM_CM": 27,
-    "UTM_N": 8036186.975,
-    "UTM_E": 303362.972,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1943",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15717.7,
-    "GAUSS_X": 1963805,
-    "LAT_WGS84": -17.757,
-    "LON_WGS84": 31.148,
-    "UTM_CM": 27,
-    "UTM_N": 8036018.888,
-    "UTM_E": 303663.961,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1944",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15641.2,
-    "GAUSS_X": 1963979,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.147,
-    "UTM_CM": 27,
-    "UTM_N": 8035843.611,
-    "UTM_E": 303589.368,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1945",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15372.2,
-    "GAUSS_X": 1964146,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.145,
-    "UTM_CM": 27,
-    "UTM_N": 8035674.613,
-    "UTM_E": 303322.102,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1946",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15155.7,
-    "GAUSS_X": 1964314,
-    "LAT_WGS84": -17.762,
-    "LON_WGS84": 31.143,
-    "UTM_CM": 27,
-    "UTM_N": 8035504.364,
-    "UTM_E": 303107.437,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1947",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14990.1,
-    "GAUSS_X": 1964406,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.141,
-    "UTM_CM": 27,
-    "UTM_N": 8035409.928,
-    "UTM_E": 302942.781,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1948",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15771.5,
-    "GAUSS_X": 1963590,
-    "LAT_WGS84": -17.755,
-    "LON_WGS84": 31.149,
-    "UTM_CM": 27,
-    "UTM_N": 8036234.765,
-    "UTM_E": 303715.48,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2005",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2940.78,
-    "GAUSS_X": 1979310,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8020313.38,
-    "UTM_E": 285170.058,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1935",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15047.3,
-    "GAUSS_X": 1963410,
-    "LAT_WGS84": -17.754,
-    "LON_WGS84": 31.142,
-    "UTM_CM": 27,
-    "UTM_N": 8036406.388,
-    "UTM_E": 302989.417,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM191",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3910.07,
-    "GAUSS_X": 1970327,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8029370.19,
-    "UTM_E": 291925.374,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1897",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14070,
-    "GAUSS_X": 1964882,
-    "LAT_WGS84": -17.767,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8034924.345,
-    "UTM_E": 302027.738,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1898",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13810.2,
-    "GAUSS_X": 1964999,
-    "LAT_WGS84": -17.768,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8034804.673,
-    "UTM_E": 301769.127,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1899",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13561.8,
-    "GAUSS_X": 1965152,
-    "LAT_WGS84": -17.769,
-    "LON_WGS84": 31.128,
-    "UTM_CM": 27,
-    "UTM_N": 8034648.872,
-    "UTM_E": 301522.342,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM19",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5529.14,
-    "GAUSS_X": 1971387,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8028327.915,
-    "UTM_E": 293555.886,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM190",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3150.77,
-    "GAUSS_X": 1970123,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8029566.324,
-    "UTM_E": 291163.831,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1900",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14806.2,
-    "GAUSS_X": 1964433,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.14,
-    "UTM_CM": 27,
-    "UTM_N": 8035380.998,
-    "UTM_E": 302759.144,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1901",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13199.9,
-    "GAUSS_X": 1965343,
-    "LAT_WGS84": -17.771,
-    "LON_WGS84": 31.124,
-    "UTM_CM": 27,
-    "UTM_N": 8034454.409,
-    "UTM_E": 301162.463,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1902",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14719.4,
-    "GAUSS_X": 1964176,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.139,
-    "UTM_CM": 27,
-    "UTM_N": 8035637.609,
-    "UTM_E": 302669.609,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1903",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14644.9,
-    "GAUSS_X": 1963992,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.138,
-    "UTM_CM": 27,
-    "UTM_N": 8035820.41,
-    "UTM_E": 302593.132,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1904",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14538.9,
-    "GAUSS_X": 1964043,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.137,
-    "UTM_CM": 27,
-    "UTM_N": 8035768.58,
-    "UTM_E": 302487.68,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1905",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14224.9,
-    "GAUSS_X": 1964177,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.134,
-    "UTM_CM": 27,
-    "UTM_N": 8035631.462,
-    "UTM_E": 302175.107,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1906",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14166.1,
-    "GAUSS_X": 1964236,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 31.134,
-    "UTM_CM": 27,
-    "UTM_N": 8035571.634,
-    "UTM_E": 302116.916,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1907",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14068.9,
-    "GAUSS_X": 1964189,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8035616.901,
-    "UTM_E": 302019.27,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1923",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13222.4,
-    "GAUSS_X": 1962439,
-    "LAT_WGS84": -17.745,
-    "LON_WGS84": 31.125,
-    "UTM_CM": 27,
-    "UTM_N": 8037357.907,
-    "UTM_E": 301154.136,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1915",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13226.9,
-    "GAUSS_X": 1964201,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 31.125,
-    "UTM_CM": 27,
-    "UTM_N": 8035596.181,
-    "UTM_E": 301177.302,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1950",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16224.4,
-    "GAUSS_X": 1963126,
-    "LAT_WGS84": -17.751,
-    "LON_WGS84": 31.153,
-    "UTM_CM": 27,
-    "UTM_N": 8036702.924,
-    "UTM_E": 304163.444,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1920",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12861.3,
-    "GAUSS_X": 1962810,
-    "LAT_WGS84": -17.748,
-    "LON_WGS84": 31.121,
-    "UTM_CM": 27,
-    "UTM_N": 8036983.352,
-    "UTM_E": 300796.96,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM192",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4294.67,
-    "GAUSS_X": 1972917,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8026784.073,
-    "UTM_E": 292337.694,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1919",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12881.3,
-    "GAUSS_X": 1963040,
-    "LAT_WGS84": -17.75,
-    "LON_WGS84": 31.121,
-    "UTM_CM": 27,
-    "UTM_N": 8036753.338,
-    "UTM_E": 300819.391,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1918",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13067.5,
-    "GAUSS_X": 1963250,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.123,
-    "UTM_CM": 27,
-    "UTM_N": 8036545.833,
-    "UTM_E": 301007.847,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1908",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14003,
-    "GAUSS_X": 1964308,
-    "LAT_WGS84": -17.762,
-    "LON_WGS84": 31.132,
-    "UTM_CM": 27,
-    "UTM_N": 8035497.435,
-    "UTM_E": 301954.604,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1916",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13319.4,
-    "GAUSS_X": 1963925,
-    "LAT_WGS84": -17.758,
-    "LON_WGS84": 31.126,
-    "UTM_CM": 27,
-    "UTM_N": 8035873.845,
-    "UTM_E": 301266.928,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1909",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13599,
-    "GAUSS_X": 1964523,
-    "LAT_WGS84": -17.764,
-    "LON_WGS84": 31.128,
-    "UTM_CM": 27,
-    "UTM_N": 8035278.686,
-    "UTM_E": 301552.917,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1914",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13136.9,
-    "GAUSS_X": 1964306,
-    "LAT_WGS84": -17.762,
-    "LON_WGS84": 31.124,
-    "UTM_CM": 27,
-    "UTM_N": 8035490,
-    "UTM_E": 301088.46,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1913",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12875.7,
-    "GAUSS_X": 1964578,
-    "LAT_WGS84": -17.764,
-    "LON_WGS84": 31.121,
-    "UTM_CM": 27,
-    "UTM_N": 8035215.289,
-    "UTM_E": 300830.139,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1912",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13062.8,
-    "GAUSS_X": 1964425,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.123,
-    "UTM_CM": 27,
-    "UTM_N": 8035370.887,
-    "UTM_E": 301015.608,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1911",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13386.2,
-    "GAUSS_X": 1964660,
-    "LAT_WGS84": -17.765,
-    "LON_WGS84": 31.126,
-    "UTM_CM": 27,
-    "UTM_N": 8035139.065,
-    "UTM_E": 301341.574,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1910",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13560.9,
-    "GAUSS_X": 1964648,
-    "LAT_WGS84": -17.765,
-    "LON_WGS84": 31.128,
-    "UTM_CM": 27,
-    "UTM_N": 8035152.567,
-    "UTM_E": 301516.115,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1922",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13017,
-    "GAUSS_X": 1962546,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.123,
-    "UTM_CM": 27,
-    "UTM_N": 8037249.637,
-    "UTM_E": 300949.808,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1917",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13336.6,
-    "GAUSS_X": 1963516,
-    "LAT_WGS84": -17.755,
-    "LON_WGS84": 31.126,
-    "UTM_CM": 27,
-    "UTM_N": 8036282.8,
-    "UTM_E": 301279.766,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1992",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12593.8,
-    "GAUSS_X": 1961183,
-    "LAT_WGS84": -17.733,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8038607.639,
-    "UTM_E": 300512.099,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM198",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4485.99,
-    "GAUSS_X": 1972572,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8027131.275,
-    "UTM_E": 292525.336,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1980",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13897,
-    "GAUSS_X": 1962268,
-    "LAT_WGS84": -17.743,
-    "LON_WGS84": 31.131,
-    "UTM_CM": 27,
-    "UTM_N": 8037536.76,
-    "UTM_E": 301826.848,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1981",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13619.1,
-    "GAUSS_X": 1961715,
-    "LAT_WGS84": -17.738,
-    "LON_WGS84": 31.128,
-    "UTM_CM": 27,
-    "UTM_N": 8038086.848,
-    "UTM_E": 301543.066,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1982",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13783.5,
-    "GAUSS_X": 1961509,
-    "LAT_WGS84": -17.736,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8038294.544,
-    "UTM_E": 301705.34,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1983",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13768.9,
-    "GAUSS_X": 1961209,
-    "LAT_WGS84": -17.734,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8038594.526,
-    "UTM_E": 301687.527,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1511",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2594.17,
-    "GAUSS_X": 1976638,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8023045.056,
-    "UTM_E": 290676.896,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1985",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14201.6,
-    "GAUSS_X": 1961167,
-    "LAT_WGS84": -17.733,
-    "LON_WGS84": 31.134,
-    "UTM_CM": 27,
-    "UTM_N": 8038640.539,
-    "UTM_E": 302119.758,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM140",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4429.74,
-    "GAUSS_X": 1970155,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8029548.225,
-    "UTM_E": 292443.241,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1987",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14633.8,
-    "GAUSS_X": 1961263,
-    "LAT_WGS84": -17.734,
-    "LON_WGS84": 31.138,
-    "UTM_CM": 27,
-    "UTM_N": 8038549.524,
-    "UTM_E": 302553.016,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1988",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14899,
-    "GAUSS_X": 1961327,
-    "LAT_WGS84": -17.735,
-    "LON_WGS84": 31.14,
-    "UTM_CM": 27,
-    "UTM_N": 8038487.973,
-    "UTM_E": 302818.926,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1989",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13482.6,
-    "GAUSS_X": 1961313,
-    "LAT_WGS84": -17.735,
-    "LON_WGS84": 31.127,
-    "UTM_CM": 27,
-    "UTM_N": 8038487.588,
-    "UTM_E": 301402.294,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM199",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5357.97,
-    "GAUSS_X": 1971432,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8028280.812,
-    "UTM_E": 293385.188,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1949",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15961.3,
-    "GAUSS_X": 1963371,
-    "LAT_WGS84": -17.753,
-    "LON_WGS84": 31.15,
-    "UTM_CM": 27,
-    "UTM_N": 8036455.789,
-    "UTM_E": 303902.931,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1991",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12704.6,
-    "GAUSS_X": 1961256,
-    "LAT_WGS84": -17.734,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8038535.765,
-    "UTM_E": 300623.64,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1977",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13619.6,
-    "GAUSS_X": 1961885,
-    "LAT_WGS84": -17.74,
-    "LON_WGS84": 31.128,
-    "UTM_CM": 27,
-    "UTM_N": 8037916.119,
-    "UTM_E": 301545.373,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1993",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12436.5,
-    "GAUSS_X": 1961468,
-    "LAT_WGS84": -17.736,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8038320.947,
-    "UTM_E": 300357.875,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1994",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12387.2,
-    "GAUSS_X": 1961725,
-    "LAT_WGS84": -17.738,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8038063.622,
-    "UTM_E": 300311.215,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1995",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12451.8,
-    "GAUSS_X": 1961838,
-    "LAT_WGS84": -17.739,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8037950.706,
-    "UTM_E": 300377.056,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1996",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12685.4,
-    "GAUSS_X": 1962054,
-    "LAT_WGS84": -17.741,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8037737.454,
-    "UTM_E": 300612.959,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1997",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12761.3,
-    "GAUSS_X": 1962147,
-    "LAT_WGS84": -17.742,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8037645.539,
-    "UTM_E": 300689.828,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1998",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12794.4,
-    "GAUSS_X": 1962238,
-    "LAT_WGS84": -17.743,
-    "LON_WGS84": 31.121,
-    "UTM_CM": 27,
-    "UTM_N": 8037554.778,
-    "UTM_E": 300723.949,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1999",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12898.1,
-    "GAUSS_X": 1962408,
-    "LAT_WGS84": -17.745,
-    "LON_WGS84": 31.122,
-    "UTM_CM": 27,
-    "UTM_N": 8037385.876,
-    "UTM_E": 300829.451,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4344.61,
-    "GAUSS_X": 1972115,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8027587.627,
-    "UTM_E": 292379.049,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM20",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5678.64,
-    "GAUSS_X": 1971350,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8028366.246,
-    "UTM_E": 293705.004,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM200",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5024.9,
-    "GAUSS_X": 1971514,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8028195.576,
-    "UTM_E": 293052.967,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm2000",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12388.6,
-    "GAUSS_X": 1961093,
-    "LAT_WGS84": -17.733,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8038695.97,
-    "UTM_E": 300305.92,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2001",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3741.37,
-    "GAUSS_X": 1979130,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8020484.699,
-    "UTM_E": 284367.446,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2002",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3675.46,
-    "GAUSS_X": 1979102,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8020513.62,
-    "UTM_E": 284433.061,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1990",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13103.3,
-    "GAUSS_X": 1961353,
-    "LAT_WGS84": -17.735,
-    "LON_WGS84": 31.124,
-    "UTM_CM": 27,
-    "UTM_N": 8038443.223,
-    "UTM_E": 301023.442,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1965",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15696.7,
-    "GAUSS_X": 1961678,
-    "LAT_WGS84": -17.738,
-    "LON_WGS84": 31.148,
-    "UTM_CM": 27,
-    "UTM_N": 8038146.211,
-    "UTM_E": 303620.337,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1951",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16427.3,
-    "GAUSS_X": 1963032,
-    "LAT_WGS84": -17.75,
-    "LON_WGS84": 31.155,
-    "UTM_CM": 27,
-    "UTM_N": 8036799.075,
-    "UTM_E": 304365.386,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1952",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16710.6,
-    "GAUSS_X": 1962978,
-    "LAT_WGS84": -17.75,
-    "LON_WGS84": 31.158,
-    "UTM_CM": 27,
-    "UTM_N": 8036856.112,
-    "UTM_E": 304648.144,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1953",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16622.4,
-    "GAUSS_X": 1962626,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.157,
-    "UTM_CM": 27,
-    "UTM_N": 8037207.627,
-    "UTM_E": 304556.172,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1954",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16580,
-    "GAUSS_X": 1962390,
-    "LAT_WGS84": -17.744,
-    "LON_WGS84": 31.156,
-    "UTM_CM": 27,
-    "UTM_N": 8037443.088,
-    "UTM_E": 304511.211,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1955",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16536,
-    "GAUSS_X": 1962254,
-    "LAT_WGS84": -17.743,
-    "LON_WGS84": 31.156,
-    "UTM_CM": 27,
-    "UTM_N": 8037578.692,
-    "UTM_E": 304465.812,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1956",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16271.5,
-    "GAUSS_X": 1962033,
-    "LAT_WGS84": -17.741,
-    "LON_WGS84": 31.153,
-    "UTM_CM": 27,
-    "UTM_N": 8037796.35,
-    "UTM_E": 304198.893,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1957",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -16051.2,
-    "GAUSS_X": 1961864,
-    "LAT_WGS84": -17.74,
-    "LON_WGS84": 31.151,
-    "UTM_CM": 27,
-    "UTM_N": 8037963.929,
-    "UTM_E": 303976.792,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1958",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15867.4,
-    "GAUSS_X": 1962067,
-    "LAT_WGS84": -17.741,
-    "LON_WGS84": 31.15,
-    "UTM_CM": 27,
-    "UTM_N": 8037758.39,
-    "UTM_E": 303795.165,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1959",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15597.6,
-    "GAUSS_X": 1962272,
-    "LAT_WGS84": -17.743,
-    "LON_WGS84": 31.147,
-    "UTM_CM": 27,
-    "UTM_N": 8037551.036,
-    "UTM_E": 303527.516,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM196",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4968.9,
-    "GAUSS_X": 1969946,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8029762.961,
-    "UTM_E": 292980.208,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1960",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15443.8,
-    "GAUSS_X": 1962472,
-    "LAT_WGS84": -17.745,
-    "LON_WGS84": 31.146,
-    "UTM_CM": 27,
-    "UTM_N": 8037348.746,
-    "UTM_E": 303375.879,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1961",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15346.5,
-    "GAUSS_X": 1962608,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.145,
-    "UTM_CM": 27,
-    "UTM_N": 8037212.168,
-    "UTM_E": 303279.999,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1962",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15169.6,
-    "GAUSS_X": 1962669,
-    "LAT_WGS84": -17.747,
-    "LON_WGS84": 31.143,
-    "UTM_CM": 27,
-    "UTM_N": 8037148.834,
-    "UTM_E": 303103.75,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1979",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13856.9,
-    "GAUSS_X": 1962051,
-    "LAT_WGS84": -17.741,
-    "LON_WGS84": 31.131,
-    "UTM_CM": 27,
-    "UTM_N": 8037753.499,
-    "UTM_E": 301784.426,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1970",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14809.1,
-    "GAUSS_X": 1961566,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.14,
-    "UTM_CM": 27,
-    "UTM_N": 8038247.871,
-    "UTM_E": 302731.508,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1896",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14248,
-    "GAUSS_X": 1964770,
-    "LAT_WGS84": -17.766,
-    "LON_WGS84": 31.134,
-    "UTM_CM": 27,
-    "UTM_N": 8035037.744,
-    "UTM_E": 302204.545,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1976",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14033.9,
-    "GAUSS_X": 1961802,
-    "LAT_WGS84": -17.739,
-    "LON_WGS84": 31.132,
-    "UTM_CM": 27,
-    "UTM_N": 8038004.269,
-    "UTM_E": 301958.863,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1975",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14212.4,
-    "GAUSS_X": 1961696,
-    "LAT_WGS84": -17.738,
-    "LON_WGS84": 31.134,
-    "UTM_CM": 27,
-    "UTM_N": 8038111.821,
-    "UTM_E": 302136.244,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1974",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14373.1,
-    "GAUSS_X": 1961566,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.135,
-    "UTM_CM": 27,
-    "UTM_N": 8038243.914,
-    "UTM_E": 302295.551,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1973",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14574.1,
-    "GAUSS_X": 1961615,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.137,
-    "UTM_CM": 27,
-    "UTM_N": 8038196.84,
-    "UTM_E": 302497.029,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1963",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15046.7,
-    "GAUSS_X": 1962782,
-    "LAT_WGS84": -17.748,
-    "LON_WGS84": 31.142,
-    "UTM_CM": 27,
-    "UTM_N": 8037034.334,
-    "UTM_E": 302982.092,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1971",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14762.9,
-    "GAUSS_X": 1961493,
-    "LAT_WGS84": -17.736,
-    "LON_WGS84": 31.139,
-    "UTM_CM": 27,
-    "UTM_N": 8038320.812,
-    "UTM_E": 302684.586,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1964",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14907,
-    "GAUSS_X": 1962951,
-    "LAT_WGS84": -17.749,
-    "LON_WGS84": 31.141,
-    "UTM_CM": 27,
-    "UTM_N": 8036863.873,
-    "UTM_E": 302844.158,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM197",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4881.01,
-    "GAUSS_X": 1969590,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8030118.558,
-    "UTM_E": 292888.504,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1969",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14946,
-    "GAUSS_X": 1961614,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.141,
-    "UTM_CM": 27,
-    "UTM_N": 8038201.447,
-    "UTM_E": 302869,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1968",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15144.2,
-    "GAUSS_X": 1961662,
-    "LAT_WGS84": -17.738,
-    "LON_WGS84": 31.143,
-    "UTM_CM": 27,
-    "UTM_N": 8038156.264,
-    "UTM_E": 303067.687,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1967",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15268,
-    "GAUSS_X": 1961604,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.144,
-    "UTM_CM": 27,
-    "UTM_N": 8038215.572,
-    "UTM_E": 303190.813,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1966",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15567.9,
-    "GAUSS_X": 1961614,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.147,
-    "UTM_CM": 27,
-    "UTM_N": 8038208.442,
-    "UTM_E": 303490.858,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1978",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13724.7,
-    "GAUSS_X": 1962001,
-    "LAT_WGS84": -17.741,
-    "LON_WGS84": 31.129,
-    "UTM_CM": 27,
-    "UTM_N": 8037801.864,
-    "UTM_E": 301651.723,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1972",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14662.2,
-    "GAUSS_X": 1961577,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.138,
-    "UTM_CM": 27,
-    "UTM_N": 8038235.588,
-    "UTM_E": 302584.739,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1199",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4726.13,
-    "GAUSS_X": 1967768,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8031938.828,
-    "UTM_E": 292714.164,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1263",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10970.2,
-    "GAUSS_X": 1967854,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8031919.263,
-    "UTM_E": 298959.524,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1181",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3478.82,
-    "GAUSS_X": 1968863,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8030830.12,
-    "UTM_E": 291478.448,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1182",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3506.04,
-    "GAUSS_X": 1968476,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031217.832,
-    "UTM_E": 291501.535,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1183",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3521.9,
-    "GAUSS_X": 1968284,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031409.496,
-    "UTM_E": 291515.352,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1184",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3534.22,
-    "GAUSS_X": 1968120,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031573.721,
-    "UTM_E": 291525.922,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1185",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3542.83,
-    "GAUSS_X": 1967966,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031727.695,
-    "UTM_E": 291532.891,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1186",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3552.76,
-    "GAUSS_X": 1967841,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031852.981,
-    "UTM_E": 291541.486,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1187",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3573.02,
-    "GAUSS_X": 1967576,
-    "LAT_WGS84": -17.791,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8032118.139,
-    "UTM_E": 291558.92,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1188",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3598.4,
-    "GAUSS_X": 1967224,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8032470.738,
-    "UTM_E": 291580.544,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1189",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3608.54,
-    "GAUSS_X": 1967054,
-    "LAT_WGS84": -17.787,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8032641.03,
-    "UTM_E": 291588.869,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM119",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5161.63,
-    "GAUSS_X": 1970638,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8029072.64,
-    "UTM_E": 293180.349,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1190",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3450.4,
-    "GAUSS_X": 1969252,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8030441.125,
-    "UTM_E": 291454.176,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM118",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4972.6,
-    "GAUSS_X": 1970685,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8029024.297,
-    "UTM_E": 292991.801,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1198",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4338.22,
-    "GAUSS_X": 1967178,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8032524.394,
-    "UTM_E": 292319.933,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1179",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2634.8,
-    "GAUSS_X": 1969997,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8029687.372,
-    "UTM_E": 290646.466,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM12",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4940.31,
-    "GAUSS_X": 1972562,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027146.475,
-    "UTM_E": 292979.579,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM120",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5332.84,
-    "GAUSS_X": 1970596,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8029116.812,
-    "UTM_E": 293351.119,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1200",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4826.47,
-    "GAUSS_X": 1967939,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8031768.956,
-    "UTM_E": 292816.335,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1201",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4607.19,
-    "GAUSS_X": 1967194,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8032510.922,
-    "UTM_E": 292589.098,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1202",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4637.76,
-    "GAUSS_X": 1966900,
-    "LAT_WGS84": -17.785,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8032805.96,
-    "UTM_E": 292616.527,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1203",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4119.12,
-    "GAUSS_X": 1966546,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8033154.345,
-    "UTM_E": 292094.073,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1204",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4469.12,
-    "GAUSS_X": 1966526,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8033177.53,
-    "UTM_E": 292443.892,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1205",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4666.62,
-    "GAUSS_X": 1966498,
-    "LAT_WGS84": -17.781,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8033207.828,
-    "UTM_E": 292641.106,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1206",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4046.87,
-    "GAUSS_X": 1966295,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8033404.814,
-    "UTM_E": 292019.138,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1207",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4689.14,
-    "GAUSS_X": 1966200,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8033506.55,
-    "UTM_E": 292660.445,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1208",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5310.28,
-    "GAUSS_X": 1966269,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8033444.058,
-    "UTM_E": 293282.367,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1209",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3881.36,
-    "GAUSS_X": 1965757,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8033940.722,
-    "UTM_E": 291847.883,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM121",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5482.9,
-    "GAUSS_X": 1970558,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8029156.079,
-    "UTM_E": 293500.787,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1197",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4361.29,
-    "GAUSS_X": 1966878,
-    "LAT_WGS84": -17.785,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8032825.183,
-    "UTM_E": 292339.799,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1166",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2483.08,
-    "GAUSS_X": 1966234,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8033449.044,
-    "UTM_E": 290454.571,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1153",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2646.77,
-    "GAUSS_X": 1966678,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8033006.772,
-    "UTM_E": 290623.009,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1154",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2635.15,
-    "GAUSS_X": 1966969,
-    "LAT_WGS84": -17.786,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8032715.453,
-    "UTM_E": 290614.494,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1155",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2613.7,
-    "GAUSS_X": 1967255,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8032429.5,
-    "UTM_E": 290596.09,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1156",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2444.57,
-    "GAUSS_X": 1967239,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8032443.387,
-    "UTM_E": 290426.778,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1157",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2147.76,
-    "GAUSS_X": 1967356,
-    "LAT_WGS84": -17.789,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8032323.37,
-    "UTM_E": 290131.189,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1158",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2470.16,
-    "GAUSS_X": 1966957,
-    "LAT_WGS84": -17.786,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8032725.594,
-    "UTM_E": 290449.363,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1159",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2215.4,
-    "GAUSS_X": 1966938,
-    "LAT_WGS84": -17.785,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8032741.618,
-    "UTM_E": 290194.381,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM116",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4587.31,
-    "GAUSS_X": 1970781,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8028924.242,
-    "UTM_E": 292607.507,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1160",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2480.1,
-    "GAUSS_X": 1966675,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8033007.535,
-    "UTM_E": 290456.298,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1161",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2442.08,
-    "GAUSS_X": 1966671,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8033011.049,
-    "UTM_E": 290418.233,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1162",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2236.53,
-    "GAUSS_X": 1966655,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8033024.639,
-    "UTM_E": 290212.497,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1163",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2282.29,
-    "GAUSS_X": 1966053,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8033627.869,
-    "UTM_E": 290251.834,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1180",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2049.78,
-    "GAUSS_X": 1967628,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 31.019,
-    "UTM_CM": 27,
-    "UTM_N": 8032049.631,
-    "UTM_E": 290036.11,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1165",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2484.91,
-    "GAUSS_X": 1966096,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8033586.476,
-    "UTM_E": 290454.936,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1212",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3170.27,
-    "GAUSS_X": 1965520,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8034169.891,
-    "UTM_E": 291134.212,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1167",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2451.07,
-    "GAUSS_X": 1966527,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8033155.868,
-    "UTM_E": 290425.68,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1168",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2075.34,
-    "GAUSS_X": 1967776,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8031902.341,
-    "UTM_E": 290063.246,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1169",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2170.99,
-    "GAUSS_X": 1967944,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8031734.947,
-    "UTM_E": 290160.702,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM117",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4780.01,
-    "GAUSS_X": 1970732,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8028974.715,
-    "UTM_E": 292799.704,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1170",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2346.93,
-    "GAUSS_X": 1967843,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8031837.683,
-    "UTM_E": 290335.581,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1171",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2545.07,
-    "GAUSS_X": 1967846,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8031837.727,
-    "UTM_E": 290533.76,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1172",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2402.74,
-    "GAUSS_X": 1968489,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8031192.593,
-    "UTM_E": 290398.287,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1173",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2008.78,
-    "GAUSS_X": 1968457,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.019,
-    "UTM_CM": 27,
-    "UTM_N": 8031220.53,
-    "UTM_E": 290003.949,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1174",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1959.59,
-    "GAUSS_X": 1968376,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8031300.792,
-    "UTM_E": 289953.893,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1175",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2304.13,
-    "GAUSS_X": 1968156,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8031524.829,
-    "UTM_E": 290296.111,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1176",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2389.64,
-    "GAUSS_X": 1968264,
-    "LAT_WGS84": -17.797,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8031417.273,
-    "UTM_E": 290382.786,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1177",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2492.86,
-    "GAUSS_X": 1968154,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8031528.984,
-    "UTM_E": 290484.834,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1178",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3060.77,
-    "GAUSS_X": 1969827,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8029861.577,
-    "UTM_E": 291070.659,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1164",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2252.97,
-    "GAUSS_X": 1966509,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8033170.907,
-    "UTM_E": 290227.38,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1253",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9585.59,
-    "GAUSS_X": 1963519,
-    "LAT_WGS84": -17.755,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8036239.59,
-    "UTM_E": 297528.634,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1240",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7845.57,
-    "GAUSS_X": 1968560,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 31.074,
-    "UTM_CM": 27,
-    "UTM_N": 8031180.07,
-    "UTM_E": 295842.262,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1241",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8093.1,
-    "GAUSS_X": 1968924,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.076,
-    "UTM_CM": 27,
-    "UTM_N": 8030818.641,
-    "UTM_E": 296093.693,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1242",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5781.3,
-    "GAUSS_X": 1964302,
-    "LAT_WGS84": -17.762,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8035415.576,
-    "UTM_E": 293732.463,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1243",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6051.31,
-    "GAUSS_X": 1964757,
-    "LAT_WGS84": -17.766,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8034964.172,
-    "UTM_E": 294007.331,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1244",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6158.63,
-    "GAUSS_X": 1964771,
-    "LAT_WGS84": -17.766,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8034951.254,
-    "UTM_E": 294114.808,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1245",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6457.43,
-    "GAUSS_X": 1964583,
-    "LAT_WGS84": -17.764,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8035141.83,
-    "UTM_E": 294411.632,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1246",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7407.33,
-    "GAUSS_X": 1964491,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8035243.906,
-    "UTM_E": 295360.612,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1247",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7404.56,
-    "GAUSS_X": 1964037,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8035698.494,
-    "UTM_E": 295352.999,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1248",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7475.84,
-    "GAUSS_X": 1963365,
-    "LAT_WGS84": -17.753,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8036370.854,
-    "UTM_E": 295417.132,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1249",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7593.29,
-    "GAUSS_X": 1962707,
-    "LAT_WGS84": -17.747,
-    "LON_WGS84": 31.072,
-    "UTM_CM": 27,
-    "UTM_N": 8037029.953,
-    "UTM_E": 295527.586,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM125",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5984.41,
-    "GAUSS_X": 1970268,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8029452.187,
-    "UTM_E": 293999.225,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1250",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8493.92,
-    "GAUSS_X": 1964325,
-    "LAT_WGS84": -17.762,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8035421.851,
-    "UTM_E": 296445.492,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1210",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4274.35,
-    "GAUSS_X": 1965787,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8033914.549,
-    "UTM_E": 292241.227,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1252",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9187.7,
-    "GAUSS_X": 1964221,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8035533.437,
-    "UTM_E": 297138.199,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1238",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7021.38,
-    "GAUSS_X": 1967617,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 31.066,
-    "UTM_CM": 27,
-    "UTM_N": 8032114.08,
-    "UTM_E": 295007.961,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1254",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10177.3,
-    "GAUSS_X": 1962623,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.096,
-    "UTM_CM": 27,
-    "UTM_N": 8037142.052,
-    "UTM_E": 298110.872,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1255",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10339.1,
-    "GAUSS_X": 1962373,
-    "LAT_WGS84": -17.744,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8037393.545,
-    "UTM_E": 298269.961,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "Tsm1255A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10346.5,
-    "GAUSS_X": 1962356,
-    "LAT_WGS84": -17.744,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8037411.035,
-    "UTM_E": 298277.216,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1256",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9290.56,
-    "GAUSS_X": 1965048,
-    "LAT_WGS84": -17.768,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8034707.661,
-    "UTM_E": 297249.873,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1257",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9343.56,
-    "GAUSS_X": 1966006,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8033749.878,
-    "UTM_E": 297313.09,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1258",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9958.6,
-    "GAUSS_X": 1966072,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8033690.372,
-    "UTM_E": 297928.864,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1258A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9916.11,
-    "GAUSS_X": 1966019,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 31.093,
-    "UTM_CM": 27,
-    "UTM_N": 8033742.512,
-    "UTM_E": 297885.811,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1259",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8529.6,
-    "GAUSS_X": 1966582,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8033165.038,
-    "UTM_E": 296505.231,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM126",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3302.83,
-    "GAUSS_X": 1970730,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8028960.759,
-    "UTM_E": 291322.391,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1260",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7625.01,
-    "GAUSS_X": 1967109,
-    "LAT_WGS84": -17.787,
-    "LON_WGS84": 31.072,
-    "UTM_CM": 27,
-    "UTM_N": 8032628.43,
-    "UTM_E": 295606.21,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1261",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7286.18,
-    "GAUSS_X": 1967354,
-    "LAT_WGS84": -17.789,
-    "LON_WGS84": 31.069,
-    "UTM_CM": 27,
-    "UTM_N": 8032380.391,
-    "UTM_E": 295269.967,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1262",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10340.3,
-    "GAUSS_X": 1966728,
-    "LAT_WGS84": -17.784,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8033038.962,
-    "UTM_E": 298317.571,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1401",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 528.05,
-    "GAUSS_X": 1965656,
-    "LAT_WGS84": -17.774,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8033995.015,
-    "UTM_E": 287436.995,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1251",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7459.23,
-    "GAUSS_X": 1964990,
-    "LAT_WGS84": -17.768,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8034745.459,
-    "UTM_E": 295417.831,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1226",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2282.3,
-    "GAUSS_X": 1965941,
-    "LAT_WGS84": -17.776,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8033739.579,
-    "UTM_E": 290250.653,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1150",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2688.41,
-    "GAUSS_X": 1966140,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8033544.562,
-    "UTM_E": 290658.923,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1213",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3197.09,
-    "GAUSS_X": 1965122,
-    "LAT_WGS84": -17.769,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8034568.539,
-    "UTM_E": 291156.789,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1214",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3713.76,
-    "GAUSS_X": 1965218,
-    "LAT_WGS84": -17.77,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8034477.768,
-    "UTM_E": 291674.527,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1215",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4016.6,
-    "GAUSS_X": 1965272,
-    "LAT_WGS84": -17.77,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8034427.161,
-    "UTM_E": 291977.964,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1216",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4735.96,
-    "GAUSS_X": 1965378,
-    "LAT_WGS84": -17.771,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8034328.4,
-    "UTM_E": 292698.513,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1217",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4852.97,
-    "GAUSS_X": 1965433,
-    "LAT_WGS84": -17.772,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8034274.584,
-    "UTM_E": 292816.119,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1218",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5384.04,
-    "GAUSS_X": 1965489,
-    "LAT_WGS84": -17.772,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8034224.73,
-    "UTM_E": 293347.819,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1219",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3560.15,
-    "GAUSS_X": 1964843,
-    "LAT_WGS84": -17.767,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8034851.241,
-    "UTM_E": 291516.907,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM122",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5653.91,
-    "GAUSS_X": 1970516,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8029200.119,
-    "UTM_E": 293671.358,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1220",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5445.1,
-    "GAUSS_X": 1965024,
-    "LAT_WGS84": -17.768,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8034690.694,
-    "UTM_E": 293403.924,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1221",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3304.5,
-    "GAUSS_X": 1964021,
-    "LAT_WGS84": -17.759,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8035670.914,
-    "UTM_E": 291252.476,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1222",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4095.4,
-    "GAUSS_X": 1964115,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8035584.931,
-    "UTM_E": 292044.444,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1223",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4571.54,
-    "GAUSS_X": 1964156,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8035549.58,
-    "UTM_E": 292521.051,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM124",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6023.38,
-    "GAUSS_X": 1970425,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8029295.123,
-    "UTM_E": 294039.88,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1231",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6871.7,
-    "GAUSS_X": 1966437,
-    "LAT_WGS84": -17.781,
-    "LON_WGS84": 31.065,
-    "UTM_CM": 27,
-    "UTM_N": 8033292.987,
-    "UTM_E": 294845.681,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1211",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4704.12,
-    "GAUSS_X": 1965817,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8033889.338,
-    "UTM_E": 292671.347,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1237",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6603.06,
-    "GAUSS_X": 1967352,
-    "LAT_WGS84": -17.789,
-    "LON_WGS84": 31.062,
-    "UTM_CM": 27,
-    "UTM_N": 8032374.193,
-    "UTM_E": 294586.792,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1236",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6675.5,
-    "GAUSS_X": 1966877,
-    "LAT_WGS84": -17.785,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8032850.437,
-    "UTM_E": 294654.165,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1235",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5693.43,
-    "GAUSS_X": 1965510,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8034207.136,
-    "UTM_E": 293657.453,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1234",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5987.54,
-    "GAUSS_X": 1965534,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8034186.44,
-    "UTM_E": 293951.837,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1224",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5523.42,
-    "GAUSS_X": 1964264,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8035451.212,
-    "UTM_E": 293474.156,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1232",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7050.81,
-    "GAUSS_X": 1965970,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 31.066,
-    "UTM_CM": 27,
-    "UTM_N": 8033760.976,
-    "UTM_E": 295019.832,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1225",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3619.12,
-    "GAUSS_X": 1966703,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8032991.43,
-    "UTM_E": 291595.714,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1230",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6406.59,
-    "GAUSS_X": 1966389,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.06,
-    "UTM_CM": 27,
-    "UTM_N": 8033335.85,
-    "UTM_E": 294380.031,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM123",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5846.19,
-    "GAUSS_X": 1970469,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8029249.457,
-    "UTM_E": 293863.146,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1229",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2913.93,
-    "GAUSS_X": 1965680,
-    "LAT_WGS84": -17.774,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8034007.215,
-    "UTM_E": 290879.556,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1228",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2884.96,
-    "GAUSS_X": 1966081,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8033605.562,
-    "UTM_E": 290854.862,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1227",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2533.83,
-    "GAUSS_X": 1965995,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8033688.446,
-    "UTM_E": 290502.778,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1239",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7149.09,
-    "GAUSS_X": 1967799,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 31.067,
-    "UTM_CM": 27,
-    "UTM_N": 8031933.361,
-    "UTM_E": 295137.622,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1233",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6457.35,
-    "GAUSS_X": 1965606,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8034119.563,
-    "UTM_E": 294422.445,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1088",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4568,
-    "GAUSS_X": 1967845,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8031860.005,
-    "UTM_E": 292556.845,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1062",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3614.37,
-    "GAUSS_X": 1965562,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8034133.001,
-    "UTM_E": 291578.792,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM107",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5402.03,
-    "GAUSS_X": 1970874,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8028839.502,
-    "UTM_E": 293423.285,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1073",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4042.8,
-    "GAUSS_X": 1966160,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8033539.172,
-    "UTM_E": 292013.635,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1074",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4026.39,
-    "GAUSS_X": 1966148,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8033551.678,
-    "UTM_E": 291997.088,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1076",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3843.14,
-    "GAUSS_X": 1965578,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8034119.199,
-    "UTM_E": 291807.753,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1077",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3791.42,
-    "GAUSS_X": 1966143,
-    "LAT_WGS84": -17.778,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8033553.342,
-    "UTM_E": 291762.055,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1078",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3778.39,
-    "GAUSS_X": 1966327,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8033369.769,
-    "UTM_E": 291750.98,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM108",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5552.34,
-    "GAUSS_X": 1970837,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8028878.131,
-    "UTM_E": 293573.21,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1080",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3754.94,
-    "GAUSS_X": 1966639,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8033057.764,
-    "UTM_E": 291730.853,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1082",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3525.42,
-    "GAUSS_X": 1968078,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031616.071,
-    "UTM_E": 291516.668,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1083",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3560.03,
-    "GAUSS_X": 1967589,
-    "LAT_WGS84": -17.791,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8032104.929,
-    "UTM_E": 291546.069,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1084",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3625.1,
-    "GAUSS_X": 1966708,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8032987.184,
-    "UTM_E": 291601.74,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM110",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5915.26,
-    "GAUSS_X": 1970747,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8028972.236,
-    "UTM_E": 293935.191,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1087",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4542.46,
-    "GAUSS_X": 1968211,
-    "LAT_WGS84": -17.797,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8031493.075,
-    "UTM_E": 292535.216,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM106",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5230.67,
-    "GAUSS_X": 1970917,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8028795.038,
-    "UTM_E": 293252.368,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1089",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4305.63,
-    "GAUSS_X": 1967643,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8032059.151,
-    "UTM_E": 292292.3,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM109",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5723.09,
-    "GAUSS_X": 1970795,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8028922.249,
-    "UTM_E": 293743.52,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1090",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4008.37,
-    "GAUSS_X": 1967621,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8032078.001,
-    "UTM_E": 291994.782,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1091",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3735.43,
-    "GAUSS_X": 1967602,
-    "LAT_WGS84": -17.791,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8032093.98,
-    "UTM_E": 291721.619,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1092",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3160.49,
-    "GAUSS_X": 1965528,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8034161.546,
-    "UTM_E": 291124.519,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1093",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3674.27,
-    "GAUSS_X": 1969472,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8030222.848,
-    "UTM_E": 291680.421,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1094",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3649.41,
-    "GAUSS_X": 1969378,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8030317.38,
-    "UTM_E": 291654.546,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1095",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3564.41,
-    "GAUSS_X": 1969192,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8030502.498,
-    "UTM_E": 291567.553,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1096",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3465.63,
-    "GAUSS_X": 1968963,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8030730.191,
-    "UTM_E": 291466.323,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1097",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3531.78,
-    "GAUSS_X": 1967966,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031727.807,
-    "UTM_E": 291521.837,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1098",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3541.52,
-    "GAUSS_X": 1967830,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031864.092,
-    "UTM_E": 291530.125,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1099",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3606.47,
-    "GAUSS_X": 1968253,
-    "LAT_WGS84": -17.797,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8031441.882,
-    "UTM_E": 291599.593,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1152",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2661.29,
-    "GAUSS_X": 1966529,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8033155.98,
-    "UTM_E": 290635.941,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1085",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3747.5,
-    "GAUSS_X": 1966738,
-    "LAT_WGS84": -17.784,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8032958.317,
-    "UTM_E": 291724.472,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1024",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4500.33,
-    "GAUSS_X": 1968985,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8030718.907,
-    "UTM_E": 292501.342,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "RM5",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3553.96,
-    "GAUSS_X": 1969194,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8030499.816,
-    "UTM_E": 291557.13,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "tsm",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4129.23,
-    "GAUSS_X": 1969108,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8030592.325,
-    "UTM_E": 292131.523,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4354.08,
-    "GAUSS_X": 1971969,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8027733.23,
-    "UTM_E": 292386.964,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM10",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4949.48,
-    "GAUSS_X": 1972332,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027376.2,
-    "UTM_E": 292986.294,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM100",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3760.12,
-    "GAUSS_X": 1971280,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8028416.183,
-    "UTM_E": 291785.589,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1001",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4467.48,
-    "GAUSS_X": 1969315,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8030388.302,
-    "UTM_E": 292472.016,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1002",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4248.85,
-    "GAUSS_X": 1969356,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8030345.284,
-    "UTM_E": 292253.803,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1003",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3862.45,
-    "GAUSS_X": 1969428,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8030269.642,
-    "UTM_E": 291868.137,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM101",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4124.31,
-    "GAUSS_X": 1971190,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8028510.323,
-    "UTM_E": 292148.843,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1013",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2979.76,
-    "GAUSS_X": 1966295,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8033392.815,
-    "UTM_E": 290951.949,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1017",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2004.41,
-    "GAUSS_X": 1965995,
-    "LAT_WGS84": -17.777,
-    "LON_WGS84": 31.019,
-    "UTM_CM": 27,
-    "UTM_N": 8033682.231,
-    "UTM_E": 289973.318,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM102",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4402.22,
-    "GAUSS_X": 1971121,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8028581.478,
-    "UTM_E": 292426.046,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1020",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4613.28,
-    "GAUSS_X": 1967669,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8032036.421,
-    "UTM_E": 292600.251,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1061",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3418.16,
-    "GAUSS_X": 1965547,
-    "LAT_WGS84": -17.773,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8034145.411,
-    "UTM_E": 291382.411,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1031",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3468.65,
-    "GAUSS_X": 1968864,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8030829.331,
-    "UTM_E": 291468.285,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1100",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3664.73,
-    "GAUSS_X": 1968401,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8031294.052,
-    "UTM_E": 291659.442,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM105",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5041.47,
-    "GAUSS_X": 1970963,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 31.048,
-    "UTM_CM": 27,
-    "UTM_N": 8028746.522,
-    "UTM_E": 293063.652,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1042",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2204.6,
-    "GAUSS_X": 1967211,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8032468.349,
-    "UTM_E": 290186.494,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM104",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4848.87,
-    "GAUSS_X": 1971011,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8028696.34,
-    "UTM_E": 292871.552,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1039",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2276.31,
-    "GAUSS_X": 1966207,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8033473.742,
-    "UTM_E": 290247.496,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1022",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4548.94,
-    "GAUSS_X": 1968316,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8031388.426,
-    "UTM_E": 292542.814,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1032",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3439.6,
-    "GAUSS_X": 1969242,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8030450.251,
-    "UTM_E": 291443.277,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1023",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4525.48,
-    "GAUSS_X": 1968625,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8031079.213,
-    "UTM_E": 292522.65,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1030",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3494.33,
-    "GAUSS_X": 1968487,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031205.956,
-    "UTM_E": 291489.949,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM103",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4666.28,
-    "GAUSS_X": 1971088,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8028617.843,
-    "UTM_E": 292689.767,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1029",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3510.07,
-    "GAUSS_X": 1968280,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8031413.971,
-    "UTM_E": 291503.472,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1026",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3585.75,
-    "GAUSS_X": 1967233,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8032461.262,
-    "UTM_E": 291567.992,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1025",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3597.23,
-    "GAUSS_X": 1967075,
-    "LAT_WGS84": -17.787,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8032620.007,
-    "UTM_E": 291577.781,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1060",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3147.48,
-    "GAUSS_X": 1965709,
-    "LAT_WGS84": -17.774,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8033980.942,
-    "UTM_E": 291113.432,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1036",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2887.79,
-    "GAUSS_X": 1967544,
-    "LAT_WGS84": -17.791,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8032143.36,
-    "UTM_E": 290873.287,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1139",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2860.16,
-    "GAUSS_X": 1968090,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8031596.569,
-    "UTM_E": 290851.486,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1126",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3208.07,
-    "GAUSS_X": 1967933,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8031756.965,
-    "UTM_E": 291197.753,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1127",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3184.41,
-    "GAUSS_X": 1968147,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8031543.265,
-    "UTM_E": 291176.369,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1128",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3161.87,
-    "GAUSS_X": 1968454,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8031236.14,
-    "UTM_E": 291157.102,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1129",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3132.22,
-    "GAUSS_X": 1968837,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8030852.702,
-    "UTM_E": 291131.54,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM113",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3392.65,
-    "GAUSS_X": 1971094,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8028597.91,
-    "UTM_E": 291416.106,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1130",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3107.02,
-    "GAUSS_X": 1969229,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8030459.78,
-    "UTM_E": 291110.53,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1131",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2779.39,
-    "GAUSS_X": 1969207,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8030478.813,
-    "UTM_E": 290782.632,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1132",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3309.92,
-    "GAUSS_X": 1968850,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8030841.278,
-    "UTM_E": 291309.396,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1133",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2745.16,
-    "GAUSS_X": 1969600,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8030085.105,
-    "UTM_E": 290752.6,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1134",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2806.02,
-    "GAUSS_X": 1968817,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8030869.25,
-    "UTM_E": 290805.099,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1135",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2830.84,
-    "GAUSS_X": 1968446,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8031239.917,
-    "UTM_E": 290825.967,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1136",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2619.12,
-    "GAUSS_X": 1968409,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8031275.43,
-    "UTM_E": 290613.826,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM11",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4145.98,
-    "GAUSS_X": 1971730,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8027970.233,
-    "UTM_E": 292176.291,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1138",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2538.25,
-    "GAUSS_X": 1968775,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8030908.205,
-    "UTM_E": 290536.86,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1123",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3864.94,
-    "GAUSS_X": 1968130,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8031567.02,
-    "UTM_E": 291856.777,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM114",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4054.61,
-    "GAUSS_X": 1970912,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8028786.749,
-    "UTM_E": 292076.176,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1140",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2525.77,
-    "GAUSS_X": 1968066,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8031617.393,
-    "UTM_E": 290516.807,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1141",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2891.05,
-    "GAUSS_X": 1967662,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8032025.295,
-    "UTM_E": 290877.807,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1142",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2566.23,
-    "GAUSS_X": 1967640,
-    "LAT_WGS84": -17.792,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8032044.011,
-    "UTM_E": 290552.723,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1143",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2908.6,
-    "GAUSS_X": 1967265,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8032422.355,
-    "UTM_E": 290891.125,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1144",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2929.84,
-    "GAUSS_X": 1966982,
-    "LAT_WGS84": -17.786,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8032705.796,
-    "UTM_E": 290909.345,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1145",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2948.45,
-    "GAUSS_X": 1966707,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8032980.317,
-    "UTM_E": 290925.031,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1146",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2960.06,
-    "GAUSS_X": 1966548,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8033140.004,
-    "UTM_E": 290934.941,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1147",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3523.83,
-    "GAUSS_X": 1966682,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8033012.136,
-    "UTM_E": 291500.185,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1148",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3140.09,
-    "GAUSS_X": 1966452,
-    "LAT_WGS84": -17.781,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8033237.602,
-    "UTM_E": 291113.965,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1149",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2837.8,
-    "GAUSS_X": 1966185,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8033501.791,
-    "UTM_E": 290808.799,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM115",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4333.44,
-    "GAUSS_X": 1970843,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8028859.024,
-    "UTM_E": 292354.286,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1263A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10657.1,
-    "GAUSS_X": 1967286,
-    "LAT_WGS84": -17.789,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8032484.296,
-    "UTM_E": 298640.327,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1137",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2591.85,
-    "GAUSS_X": 1968544,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8031140.167,
-    "UTM_E": 290587.994,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1111",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4794.61,
-    "GAUSS_X": 1969241,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8030465.771,
-    "UTM_E": 292798.38,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1101",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3720.06,
-    "GAUSS_X": 1968499,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8031197.165,
-    "UTM_E": 291715.817,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1102",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3916.62,
-    "GAUSS_X": 1968847,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8030850.736,
-    "UTM_E": 291916.113,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1103",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4006.52,
-    "GAUSS_X": 1968960,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8030738.927,
-    "UTM_E": 292007.224,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM11042",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3114.98,
-    "GAUSS_X": 1973453,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8026236.128,
-    "UTM_E": 291163.638,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM11043",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3000.86,
-    "GAUSS_X": 1973487,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8026200.804,
-    "UTM_E": 291049.874,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM11044",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3070.67,
-    "GAUSS_X": 1973525,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8026163.008,
-    "UTM_E": 291120.102,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM11045",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3082.42,
-    "GAUSS_X": 1973504,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8026184.116,
-    "UTM_E": 291131.628,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM11046",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3115.92,
-    "GAUSS_X": 1973515,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8026174.293,
-    "UTM_E": 291165.24,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1105",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4235.2,
-    "GAUSS_X": 1969200,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8030501.45,
-    "UTM_E": 292238.483,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1106",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3839.9,
-    "GAUSS_X": 1968884,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8030813.424,
-    "UTM_E": 291839.777,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1107",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3846.19,
-    "GAUSS_X": 1968414,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8031283.308,
-    "UTM_E": 291841.052,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1108",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4095.42,
-    "GAUSS_X": 1968432,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8031268.177,
-    "UTM_E": 292090.491,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1109",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4228.41,
-    "GAUSS_X": 1968441,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8031259.816,
-    "UTM_E": 292223.596,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1125",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3715.19,
-    "GAUSS_X": 1967933,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8031762.637,
-    "UTM_E": 291704.911,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1117",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4822.12,
-    "GAUSS_X": 1968158,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8031549.154,
-    "UTM_E": 292814.33,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1151",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2679.58,
-    "GAUSS_X": 1966238,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8033446.819,
-    "UTM_E": 290651.133,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1122",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4252.57,
-    "GAUSS_X": 1968122,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8031579.438,
-    "UTM_E": 292244.349,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1121",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4274.19,
-    "GAUSS_X": 1967824,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8031877.741,
-    "UTM_E": 292262.79,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1120",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4695.98,
-    "GAUSS_X": 1967770,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8031936.046,
-    "UTM_E": 292684.038,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM112",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6062.32,
-    "GAUSS_X": 1970583,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8029137.368,
-    "UTM_E": 294080.513,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM111",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6092.48,
-    "GAUSS_X": 1970704,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8029017.232,
-    "UTM_E": 294111.962,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1118",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4824.61,
-    "GAUSS_X": 1968076,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8031631.207,
-    "UTM_E": 292815.945,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1110",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4625.24,
-    "GAUSS_X": 1969283,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8030422.369,
-    "UTM_E": 292629.442,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1116",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4780.53,
-    "GAUSS_X": 1968329,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8031377.807,
-    "UTM_E": 292774.561,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1115",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4744.74,
-    "GAUSS_X": 1968472,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8031234.495,
-    "UTM_E": 292740.294,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1114",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4708.93,
-    "GAUSS_X": 1968637,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8031069.37,
-    "UTM_E": 292706.24,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1113",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4686.39,
-    "GAUSS_X": 1968753,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8030952.971,
-    "UTM_E": 292684.938,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1112",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4718.61,
-    "GAUSS_X": 1968931,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8030775.672,
-    "UTM_E": 292719.057,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1124",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3700.62,
-    "GAUSS_X": 1968119,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8031576.497,
-    "UTM_E": 291692.325,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1119",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4801.09,
-    "GAUSS_X": 1967961,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8031745.934,
-    "UTM_E": 292791.196,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1424",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 259.88,
-    "GAUSS_X": 1970318,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 30.998,
-    "UTM_CM": 27,
-    "UTM_N": 8029335.206,
-    "UTM_E": 287754.95,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1262A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10411.6,
-    "GAUSS_X": 1966866,
-    "LAT_WGS84": -17.785,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8032901.101,
-    "UTM_E": 298390.322,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1412",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2190.14,
-    "GAUSS_X": 1964803,
-    "LAT_WGS84": -17.766,
-    "LON_WGS84": 30.979,
-    "UTM_CM": 27,
-    "UTM_N": 8034829.58,
-    "UTM_E": 285765.645,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1413",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2098.05,
-    "GAUSS_X": 1965226,
-    "LAT_WGS84": -17.77,
-    "LON_WGS84": 30.98,
-    "UTM_CM": 27,
-    "UTM_N": 8034408.085,
-    "UTM_E": 285862.248,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1414",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1983.41,
-    "GAUSS_X": 1965482,
-    "LAT_WGS84": -17.772,
-    "LON_WGS84": 30.981,
-    "UTM_CM": 27,
-    "UTM_N": 8034152.979,
-    "UTM_E": 285979.632,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1415",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1815.47,
-    "GAUSS_X": 1965800,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 30.983,
-    "UTM_CM": 27,
-    "UTM_N": 8033836.634,
-    "UTM_E": 286150.981,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1416",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1531.16,
-    "GAUSS_X": 1966229,
-    "LAT_WGS84": -17.779,
-    "LON_WGS84": 30.986,
-    "UTM_CM": 27,
-    "UTM_N": 8033411.329,
-    "UTM_E": 286439.889,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1417",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1351.69,
-    "GAUSS_X": 1967025,
-    "LAT_WGS84": -17.786,
-    "LON_WGS84": 30.987,
-    "UTM_CM": 27,
-    "UTM_N": 8032616.759,
-    "UTM_E": 286627.872,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1418",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1069.87,
-    "GAUSS_X": 1967216,
-    "LAT_WGS84": -17.788,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8032428.615,
-    "UTM_E": 286911.761,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1419",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1539.02,
-    "GAUSS_X": 1967836,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 30.985,
-    "UTM_CM": 27,
-    "UTM_N": 8031804.024,
-    "UTM_E": 286449.172,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM142",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4362.27,
-    "GAUSS_X": 1969823,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8029879.59,
-    "UTM_E": 292372.218,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1420",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1711.29,
-    "GAUSS_X": 1968188,
-    "LAT_WGS84": -17.797,
-    "LON_WGS84": 30.984,
-    "UTM_CM": 27,
-    "UTM_N": 8031449.677,
-    "UTM_E": 286280.645,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1421",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1460.71,
-    "GAUSS_X": 1969140,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 30.986,
-    "UTM_CM": 27,
-    "UTM_N": 8030500.291,
-    "UTM_E": 286541.415,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1410",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1724.17,
-    "GAUSS_X": 1964408,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 30.984,
-    "UTM_CM": 27,
-    "UTM_N": 8035230.108,
-    "UTM_E": 286227.452,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1423",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 745.46,
-    "GAUSS_X": 1970154,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 30.993,
-    "UTM_CM": 27,
-    "UTM_N": 8029493.425,
-    "UTM_E": 287267.575,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM141",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4393.54,
-    "GAUSS_X": 1969977,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8029725.992,
-    "UTM_E": 292405.135,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1425",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 29.37,
-    "GAUSS_X": 1970384,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8029271.473,
-    "UTM_E": 287986.19,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1426",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1430.02,
-    "GAUSS_X": 1970363,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.013,
-    "UTM_CM": 27,
-    "UTM_N": 8029308.148,
-    "UTM_E": 289445.494,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1427",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2382.75,
-    "GAUSS_X": 1970654,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8029026.933,
-    "UTM_E": 290401.421,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1428",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3015.39,
-    "GAUSS_X": 1970813,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8028874.59,
-    "UTM_E": 291035.815,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM143",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4335.42,
-    "GAUSS_X": 1969692,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8030010.723,
-    "UTM_E": 292343.963,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM144",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4303.81,
-    "GAUSS_X": 1969539,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8030163.367,
-    "UTM_E": 292310.717,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1449",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6036.29,
-    "GAUSS_X": 1974159,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8025560.612,
-    "UTM_E": 294092.729,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM145",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4064.72,
-    "GAUSS_X": 1969758,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8029940.876,
-    "UTM_E": 292073.957,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1450",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6538.14,
-    "GAUSS_X": 1973960,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.062,
-    "UTM_CM": 27,
-    "UTM_N": 8025765.516,
-    "UTM_E": 294592.476,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1451",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6832.99,
-    "GAUSS_X": 1973896,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.064,
-    "UTM_CM": 27,
-    "UTM_N": 8025832.856,
-    "UTM_E": 294886.657,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1452",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7635.33,
-    "GAUSS_X": 1973703,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 31.072,
-    "UTM_CM": 27,
-    "UTM_N": 8026034.535,
-    "UTM_E": 295686.979,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1453",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7924.82,
-    "GAUSS_X": 1973506,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.075,
-    "UTM_CM": 27,
-    "UTM_N": 8026234.794,
-    "UTM_E": 295974.376,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1454",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8054.75,
-    "GAUSS_X": 1973391,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.076,
-    "UTM_CM": 27,
-    "UTM_N": 8026350.311,
-    "UTM_E": 296103.093,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1422",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1479.47,
-    "GAUSS_X": 1969880,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 30.986,
-    "UTM_CM": 27,
-    "UTM_N": 8029760.502,
-    "UTM_E": 286530.552,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1398",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 134.57,
-    "GAUSS_X": 1964234,
-    "LAT_WGS84": -17.761,
-    "LON_WGS84": 30.999,
-    "UTM_CM": 27,
-    "UTM_N": 8035421.081,
-    "UTM_E": 287815.364,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1384",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8715.72,
-    "GAUSS_X": 1978143,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 30.918,
-    "UTM_CM": 27,
-    "UTM_N": 8021418.447,
-    "UTM_E": 279381.858,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1385",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8875.13,
-    "GAUSS_X": 1978562,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.916,
-    "UTM_CM": 27,
-    "UTM_N": 8020997.377,
-    "UTM_E": 279226.923,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1386",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9020.95,
-    "GAUSS_X": 1978879,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 30.915,
-    "UTM_CM": 27,
-    "UTM_N": 8020679.706,
-    "UTM_E": 279084.474,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1387",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9191.58,
-    "GAUSS_X": 1979115,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.913,
-    "UTM_CM": 27,
-    "UTM_N": 8020441.691,
-    "UTM_E": 278916.353,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1388",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9385.6,
-    "GAUSS_X": 1979403,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 30.911,
-    "UTM_CM": 27,
-    "UTM_N": 8020150.906,
-    "UTM_E": 278725.403,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1389",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7818.94,
-    "GAUSS_X": 1979039,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.926,
-    "UTM_CM": 27,
-    "UTM_N": 8020531.832,
-    "UTM_E": 280288.379,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1390",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7851.18,
-    "GAUSS_X": 1979292,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 30.926,
-    "UTM_CM": 27,
-    "UTM_N": 8020278.791,
-    "UTM_E": 280258.846,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1391",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7811.39,
-    "GAUSS_X": 1979602,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 30.926,
-    "UTM_CM": 27,
-    "UTM_N": 8019969.165,
-    "UTM_E": 280301.969,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1392",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7612.83,
-    "GAUSS_X": 1980020,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8019552.789,
-    "UTM_E": 280505.049,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1393",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3018.16,
-    "GAUSS_X": 1963212,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8036477.182,
-    "UTM_E": 290957.494,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1394",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1612.22,
-    "GAUSS_X": 1963142,
-    "LAT_WGS84": -17.751,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8036531.639,
-    "UTM_E": 289550.692,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1395",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -774.94,
-    "GAUSS_X": 1963182,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8036483.06,
-    "UTM_E": 288713.757,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1411",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2080.92,
-    "GAUSS_X": 1964321,
-    "LAT_WGS84": -17.762,
-    "LON_WGS84": 30.98,
-    "UTM_CM": 27,
-    "UTM_N": 8035312.937,
-    "UTM_E": 285869.74,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1397",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 42.24,
-    "GAUSS_X": 1963856,
-    "LAT_WGS84": -17.758,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8035799.732,
-    "UTM_E": 287903.68,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1457",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9223.88,
-    "GAUSS_X": 1972869,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8026885.166,
-    "UTM_E": 297266.696,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1399",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 284.74,
-    "GAUSS_X": 1964674,
-    "LAT_WGS84": -17.765,
-    "LON_WGS84": 30.997,
-    "UTM_CM": 27,
-    "UTM_N": 8034979.367,
-    "UTM_E": 287669.867,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM14",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4524.92,
-    "GAUSS_X": 1971636,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8028067.941,
-    "UTM_E": 292554.258,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2158",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2214.09,
-    "GAUSS_X": 1971295,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 30.979,
-    "UTM_CM": 27,
-    "UTM_N": 8028336.748,
-    "UTM_E": 285810.982,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1400",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 438.36,
-    "GAUSS_X": 1965095,
-    "LAT_WGS84": -17.769,
-    "LON_WGS84": 30.996,
-    "UTM_CM": 27,
-    "UTM_N": 8034556.468,
-    "UTM_E": 287520.72,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2153",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1461.94,
-    "GAUSS_X": 1971785,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 30.986,
-    "UTM_CM": 27,
-    "UTM_N": 8027855.106,
-    "UTM_E": 286568.448,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1402",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 630.04,
-    "GAUSS_X": 1966584,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 30.994,
-    "UTM_CM": 27,
-    "UTM_N": 8033065.892,
-    "UTM_E": 287344.889,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1403",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 870.14,
-    "GAUSS_X": 1966959,
-    "LAT_WGS84": -17.786,
-    "LON_WGS84": 30.992,
-    "UTM_CM": 27,
-    "UTM_N": 8032688.383,
-    "UTM_E": 287108.763,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1404",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1147.08,
-    "GAUSS_X": 1965837,
-    "LAT_WGS84": -17.776,
-    "LON_WGS84": 31.011,
-    "UTM_CM": 27,
-    "UTM_N": 8033831.665,
-    "UTM_E": 289114.22,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1405",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -752.72,
-    "GAUSS_X": 1965754,
-    "LAT_WGS84": -17.775,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8033909.959,
-    "UTM_E": 288718.943,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1406",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -673.03,
-    "GAUSS_X": 1965685,
-    "LAT_WGS84": -17.774,
-    "LON_WGS84": 31.006,
-    "UTM_CM": 27,
-    "UTM_N": 8033978.906,
-    "UTM_E": 288638.502,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1407",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -255.79,
-    "GAUSS_X": 1965226,
-    "LAT_WGS84": -17.77,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8034432.683,
-    "UTM_E": 288216.338,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1408",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -29.49,
-    "GAUSS_X": 1964940,
-    "LAT_WGS84": -17.767,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8034716.599,
-    "UTM_E": 287986.964,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1409",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 896.75,
-    "GAUSS_X": 1964561,
-    "LAT_WGS84": -17.764,
-    "LON_WGS84": 30.992,
-    "UTM_CM": 27,
-    "UTM_N": 8035086.168,
-    "UTM_E": 287056.587,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1396",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -320,
-    "GAUSS_X": 1963365,
-    "LAT_WGS84": -17.753,
-    "LON_WGS84": 31.003,
-    "UTM_CM": 27,
-    "UTM_N": 8036294.889,
-    "UTM_E": 288260.724,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1499",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2872.27,
-    "GAUSS_X": 1976090,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8023596.442,
-    "UTM_E": 290949.143,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1485",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3725.66,
-    "GAUSS_X": 1975755,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8023940.222,
-    "UTM_E": 291799.017,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1486",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3985.22,
-    "GAUSS_X": 1975801,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8023897.019,
-    "UTM_E": 292059.09,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1487",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3218.54,
-    "GAUSS_X": 1976079,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8023611.283,
-    "UTM_E": 291295.322,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1488",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4228.27,
-    "GAUSS_X": 1973864,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8025836.31,
-    "UTM_E": 292281.422,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1489",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4334.29,
-    "GAUSS_X": 1975883,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8023819.243,
-    "UTM_E": 292409.06,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1490",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3038.25,
-    "GAUSS_X": 1975800,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8023887.674,
-    "UTM_E": 291112.036,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1491",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3299.5,
-    "GAUSS_X": 1975957,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8023734.131,
-    "UTM_E": 291374.982,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1492",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3484.97,
-    "GAUSS_X": 1976081,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8023611.288,
-    "UTM_E": 291561.804,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1493",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3648.23,
-    "GAUSS_X": 1976122,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8023572.434,
-    "UTM_E": 291725.512,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1494",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3909.9,
-    "GAUSS_X": 1976171,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8023525.884,
-    "UTM_E": 291987.732,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1495",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4183.66,
-    "GAUSS_X": 1976218,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8023482.084,
-    "UTM_E": 292262.013,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1496",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2964.92,
-    "GAUSS_X": 1975907,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8023780.54,
-    "UTM_E": 291039.839,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1455",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8742,
-    "GAUSS_X": 1973291,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.082,
-    "UTM_CM": 27,
-    "UTM_N": 8026457.749,
-    "UTM_E": 296789.309,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1498",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3870.44,
-    "GAUSS_X": 1976294,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8023403.251,
-    "UTM_E": 291949.578,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1482",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3778.67,
-    "GAUSS_X": 1975529,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8024167.178,
-    "UTM_E": 291849.606,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM15",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4784.31,
-    "GAUSS_X": 1971572,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8028135.199,
-    "UTM_E": 292812.978,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM150",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3190.49,
-    "GAUSS_X": 1970273,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8029416.656,
-    "UTM_E": 291205.158,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1500",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3151.08,
-    "GAUSS_X": 1976184,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8023504.942,
-    "UTM_E": 291228.989,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1501",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2692.59,
-    "GAUSS_X": 1976170,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8023514.52,
-    "UTM_E": 290770.305,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1502",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3466.26,
-    "GAUSS_X": 1976411,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8023281.901,
-    "UTM_E": 291546.62,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1503",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3589.15,
-    "GAUSS_X": 1976367,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8023327.181,
-    "UTM_E": 291669.049,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1504",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2707.62,
-    "GAUSS_X": 1976354,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8023330.506,
-    "UTM_E": 290787.31,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1505",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2924.97,
-    "GAUSS_X": 1976555,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8023131.578,
-    "UTM_E": 291006.835,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1506",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3458.45,
-    "GAUSS_X": 1976697,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8022995.444,
-    "UTM_E": 291541.878,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1507",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3985.2,
-    "GAUSS_X": 1976703,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8022994.58,
-    "UTM_E": 292068.739,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1508",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2470.58,
-    "GAUSS_X": 1976671,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8023010.269,
-    "UTM_E": 290553.655,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1509",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2841.22,
-    "GAUSS_X": 1976681,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8023004.2,
-    "UTM_E": 290924.433,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM151",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3242.67,
-    "GAUSS_X": 1970489,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8029201.346,
-    "UTM_E": 291259.648,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1497",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3399.09,
-    "GAUSS_X": 1976181,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8023510.44,
-    "UTM_E": 291476.988,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1470",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4564.58,
-    "GAUSS_X": 1974467,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8025236.895,
-    "UTM_E": 292624.212,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1381",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4964.38,
-    "GAUSS_X": 1978351,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 30.953,
-    "UTM_CM": 27,
-    "UTM_N": 8021250.911,
-    "UTM_E": 283135.927,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1458",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9263.66,
-    "GAUSS_X": 1972480,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8027274.401,
-    "UTM_E": 297302.32,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1459",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9267.16,
-    "GAUSS_X": 1972277,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8027477.909,
-    "UTM_E": 297303.644,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM146",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3787,
-    "GAUSS_X": 1969827,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8029869.064,
-    "UTM_E": 291796.951,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1460",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9336.05,
-    "GAUSS_X": 1972083,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8027672.075,
-    "UTM_E": 297370.469,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1461",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7423.39,
-    "GAUSS_X": 1972218,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8027517.315,
-    "UTM_E": 295459.141,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1462",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7453.69,
-    "GAUSS_X": 1971900,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8027835.888,
-    "UTM_E": 295486.04,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1463",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7079.06,
-    "GAUSS_X": 1971852,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.067,
-    "UTM_CM": 27,
-    "UTM_N": 8027879.435,
-    "UTM_E": 295110.879,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1464",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6793.15,
-    "GAUSS_X": 1971876,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.064,
-    "UTM_CM": 27,
-    "UTM_N": 8027852.216,
-    "UTM_E": 294825.21,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1465",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6489.04,
-    "GAUSS_X": 1971846,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8027879.517,
-    "UTM_E": 294520.754,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1466",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8510.32,
-    "GAUSS_X": 1973929,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8025817.266,
-    "UTM_E": 296564.444,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1467",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4334.71,
-    "GAUSS_X": 1974044,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8025657.626,
-    "UTM_E": 292389.795,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1468",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4128.8,
-    "GAUSS_X": 1974185,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8025514.571,
-    "UTM_E": 292185.377,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1484",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3657.29,
-    "GAUSS_X": 1975742,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8023952.101,
-    "UTM_E": 291730.507,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1476",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3964.02,
-    "GAUSS_X": 1975174,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8024523.471,
-    "UTM_E": 292031.176,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1456",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8984.91,
-    "GAUSS_X": 1973155,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8026597.025,
-    "UTM_E": 297030.769,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1481",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3255.07,
-    "GAUSS_X": 1975478,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8024212.103,
-    "UTM_E": 291325.423,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1480",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2980.66,
-    "GAUSS_X": 1975310,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8024376.808,
-    "UTM_E": 291049.196,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM148",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3119.84,
-    "GAUSS_X": 1969993,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8029696.464,
-    "UTM_E": 291131.505,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1479",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4039.43,
-    "GAUSS_X": 1975479,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8024219.725,
-    "UTM_E": 292109.854,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1469",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4109.17,
-    "GAUSS_X": 1974404,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8025295.724,
-    "UTM_E": 292168.085,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1477",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4461.49,
-    "GAUSS_X": 1975314,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8024388.878,
-    "UTM_E": 292530.182,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM147",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3450.65,
-    "GAUSS_X": 1969911,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8029782.215,
-    "UTM_E": 291461.463,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1475",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3846.52,
-    "GAUSS_X": 1974920,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8024776.442,
-    "UTM_E": 291910.945,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1474",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3435.53,
-    "GAUSS_X": 1974858,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8024834.056,
-    "UTM_E": 291499.258,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1473",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4504.68,
-    "GAUSS_X": 1974889,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8024814.382,
-    "UTM_E": 292568.824,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1472",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4038.8,
-    "GAUSS_X": 1974814,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8024884.569,
-    "UTM_E": 292102.104,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1471",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3710.7,
-    "GAUSS_X": 1974548,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8025147.237,
-    "UTM_E": 291771.128,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1483",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3463.68,
-    "GAUSS_X": 1975612,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8024080.757,
-    "UTM_E": 291535.481,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1478",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3350.71,
-    "GAUSS_X": 1975318,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8024373.651,
-    "UTM_E": 291419.352,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1305",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1497.79,
-    "GAUSS_X": 1976260,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 30.986,
-    "UTM_CM": 27,
-    "UTM_N": 8023378.769,
-    "UTM_E": 286580.502,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1292",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12625.9,
-    "GAUSS_X": 1972860,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8026930.398,
-    "UTM_E": 300668.761,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1293",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12216.8,
-    "GAUSS_X": 1972789,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.115,
-    "UTM_CM": 27,
-    "UTM_N": 8026997.394,
-    "UTM_E": 300258.884,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1294",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11764.3,
-    "GAUSS_X": 1972698,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8027083.348,
-    "UTM_E": 299805.417,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1295",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11152.7,
-    "GAUSS_X": 1972350,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8027425.069,
-    "UTM_E": 299190.009,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1296",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11860.3,
-    "GAUSS_X": 1971814,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.112,
-    "UTM_CM": 27,
-    "UTM_N": 8027968.866,
-    "UTM_E": 299891.933,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1297",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12447.5,
-    "GAUSS_X": 1971184,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8028605.266,
-    "UTM_E": 300472.467,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1298",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12841.9,
-    "GAUSS_X": 1970748,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.121,
-    "UTM_CM": 27,
-    "UTM_N": 8029045.264,
-    "UTM_E": 300862.163,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1299",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13661.4,
-    "GAUSS_X": 1969569,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.129,
-    "UTM_CM": 27,
-    "UTM_N": 8030232.423,
-    "UTM_E": 301669.129,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM13",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4321.76,
-    "GAUSS_X": 1971686,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8028016.086,
-    "UTM_E": 292351.614,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM130",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4500.58,
-    "GAUSS_X": 1970435,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8029269.041,
-    "UTM_E": 292517.077,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1301",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 138.17,
-    "GAUSS_X": 1975090,
-    "LAT_WGS84": -17.859,
-    "LON_WGS84": 30.999,
-    "UTM_CM": 27,
-    "UTM_N": 8024563.994,
-    "UTM_E": 287927.721,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1302",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 211.21,
-    "GAUSS_X": 1975229,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 30.998,
-    "UTM_CM": 27,
-    "UTM_N": 8024424.028,
-    "UTM_E": 287856.164,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1318",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -28.52,
-    "GAUSS_X": 1976400,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8023256.071,
-    "UTM_E": 288108.457,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1304",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1872.63,
-    "GAUSS_X": 1976402,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8023233.187,
-    "UTM_E": 286207.139,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM129",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4247.92,
-    "GAUSS_X": 1970498,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8029203.247,
-    "UTM_E": 292265.072,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1306",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1350,
-    "GAUSS_X": 1976206,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 30.987,
-    "UTM_CM": 27,
-    "UTM_N": 8023435.068,
-    "UTM_E": 286727.721,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1307",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1042.45,
-    "GAUSS_X": 1976108,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8023536.224,
-    "UTM_E": 287034.254,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1308",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 645.43,
-    "GAUSS_X": 1976002,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 30.994,
-    "UTM_CM": 27,
-    "UTM_N": 8023645.959,
-    "UTM_E": 287430.185,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1309",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1846.04,
-    "GAUSS_X": 1976510,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 30.983,
-    "UTM_CM": 27,
-    "UTM_N": 8023125.86,
-    "UTM_E": 286234.885,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM131",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4694.52,
-    "GAUSS_X": 1970388,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8029318.447,
-    "UTM_E": 292710.526,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1310",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1008.92,
-    "GAUSS_X": 1976250,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8023394.249,
-    "UTM_E": 287069.313,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1311",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 598.7,
-    "GAUSS_X": 1976141,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 30.994,
-    "UTM_CM": 27,
-    "UTM_N": 8023507.696,
-    "UTM_E": 287478.406,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1312",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 406.81,
-    "GAUSS_X": 1976213,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 30.996,
-    "UTM_CM": 27,
-    "UTM_N": 8023437.715,
-    "UTM_E": 287671.088,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1313",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 231.81,
-    "GAUSS_X": 1976115,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 30.998,
-    "UTM_CM": 27,
-    "UTM_N": 8023538.15,
-    "UTM_E": 287845.049,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1314",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 15.73,
-    "GAUSS_X": 1975993,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8023662.617,
-    "UTM_E": 288059.842,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1315",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -160.03,
-    "GAUSS_X": 1975894,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 31.001,
-    "UTM_CM": 27,
-    "UTM_N": 8023762.99,
-    "UTM_E": 288234.564,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1316",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 974.7,
-    "GAUSS_X": 1976396,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 30.991,
-    "UTM_CM": 27,
-    "UTM_N": 8023248.71,
-    "UTM_E": 287105.1,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1383",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8724.67,
-    "GAUSS_X": 1977811,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 30.918,
-    "UTM_CM": 27,
-    "UTM_N": 8021750.699,
-    "UTM_E": 279369.342,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1303",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 24.64,
-    "GAUSS_X": 1975559,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8024095.954,
-    "UTM_E": 288046.288,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1278",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13375.9,
-    "GAUSS_X": 1969097,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.126,
-    "UTM_CM": 27,
-    "UTM_N": 8030701.348,
-    "UTM_E": 301378.581,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1264",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11731,
-    "GAUSS_X": 1967135,
-    "LAT_WGS84": -17.787,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8032646.268,
-    "UTM_E": 299712.654,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1265",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12119,
-    "GAUSS_X": 1966880,
-    "LAT_WGS84": -17.785,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8032905.586,
-    "UTM_E": 300097.957,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1266",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12337.7,
-    "GAUSS_X": 1966716,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.116,
-    "UTM_CM": 27,
-    "UTM_N": 8033071.874,
-    "UTM_E": 300314.966,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1267",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12566.8,
-    "GAUSS_X": 1966620,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8033170.301,
-    "UTM_E": 300543.05,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1268",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13540,
-    "GAUSS_X": 1966304,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.128,
-    "UTM_CM": 27,
-    "UTM_N": 8033496.527,
-    "UTM_E": 301512.832,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1269",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13687.5,
-    "GAUSS_X": 1966643,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.129,
-    "UTM_CM": 27,
-    "UTM_N": 8033159.381,
-    "UTM_E": 301663.968,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM127",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3633.03,
-    "GAUSS_X": 1970649,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8029046.024,
-    "UTM_E": 291651.744,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1270",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13869.2,
-    "GAUSS_X": 1967101,
-    "LAT_WGS84": -17.787,
-    "LON_WGS84": 31.131,
-    "UTM_CM": 27,
-    "UTM_N": 8032703.106,
-    "UTM_E": 301850.549,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1271",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14013.8,
-    "GAUSS_X": 1967460,
-    "LAT_WGS84": -17.79,
-    "LON_WGS84": 31.132,
-    "UTM_CM": 27,
-    "UTM_N": 8032345.86,
-    "UTM_E": 301999,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1272",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14843.3,
-    "GAUSS_X": 1968687,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.14,
-    "UTM_CM": 27,
-    "UTM_N": 8031127.633,
-    "UTM_E": 302841.594,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1273",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15170.7,
-    "GAUSS_X": 1969192,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.143,
-    "UTM_CM": 27,
-    "UTM_N": 8030626.319,
-    "UTM_E": 303174.44,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1274",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15373.8,
-    "GAUSS_X": 1969605,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.145,
-    "UTM_CM": 27,
-    "UTM_N": 8030214.949,
-    "UTM_E": 303381.889,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1275",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15111.3,
-    "GAUSS_X": 1969587,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.143,
-    "UTM_CM": 27,
-    "UTM_N": 8030230.456,
-    "UTM_E": 303119.219,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1291",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13604.9,
-    "GAUSS_X": 1973181,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.128,
-    "UTM_CM": 27,
-    "UTM_N": 8026620.431,
-    "UTM_E": 301651.188,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1283",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11566.9,
-    "GAUSS_X": 1968890,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8030889.771,
-    "UTM_E": 299567.333,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1319",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -176.22,
-    "GAUSS_X": 1976315,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8023342.032,
-    "UTM_E": 288255.267,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1289",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14281.8,
-    "GAUSS_X": 1972890,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.135,
-    "UTM_CM": 27,
-    "UTM_N": 8026918.34,
-    "UTM_E": 302325.016,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1288",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14695.8,
-    "GAUSS_X": 1972361,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.139,
-    "UTM_CM": 27,
-    "UTM_N": 8027452.169,
-    "UTM_E": 302733.323,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1287",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15006.2,
-    "GAUSS_X": 1970878,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.142,
-    "UTM_CM": 27,
-    "UTM_N": 8028937.968,
-    "UTM_E": 303027.932,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1286",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15239.8,
-    "GAUSS_X": 1970297,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.144,
-    "UTM_CM": 27,
-    "UTM_N": 8029522.085,
-    "UTM_E": 303255.272,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1276",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14537.5,
-    "GAUSS_X": 1969176,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.137,
-    "UTM_CM": 27,
-    "UTM_N": 8030634.798,
-    "UTM_E": 302541.084,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1284",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11369.6,
-    "GAUSS_X": 1968529,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8031248.179,
-    "UTM_E": 299366.167,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1277",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13661.3,
-    "GAUSS_X": 1969079,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.129,
-    "UTM_CM": 27,
-    "UTM_N": 8030722.415,
-    "UTM_E": 301663.747,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1282",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11735.4,
-    "GAUSS_X": 1969147,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8030634.57,
-    "UTM_E": 299738.543,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1281",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12040.9,
-    "GAUSS_X": 1969078,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8030706.155,
-    "UTM_E": 300043.355,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1280",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12515.6,
-    "GAUSS_X": 1969113,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8030676.731,
-    "UTM_E": 300518.39,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM128",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3968.82,
-    "GAUSS_X": 1970566,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8029131.959,
-    "UTM_E": 291986.68,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1279",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13157.5,
-    "GAUSS_X": 1969145,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.124,
-    "UTM_CM": 27,
-    "UTM_N": 8030651.364,
-    "UTM_E": 301160.654,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1290",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14071.3,
-    "GAUSS_X": 1973348,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8026458.147,
-    "UTM_E": 302119.45,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1285",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -15301,
-    "GAUSS_X": 1969996,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.144,
-    "UTM_CM": 27,
-    "UTM_N": 8029823.144,
-    "UTM_E": 303313.264,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1362",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6720.65,
-    "GAUSS_X": 1979531,
-    "LAT_WGS84": -17.899,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8020052.123,
-    "UTM_E": 281392.092,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1349",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5381.02,
-    "GAUSS_X": 1980059,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 30.949,
-    "UTM_CM": 27,
-    "UTM_N": 8019538.036,
-    "UTM_E": 282737.568,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM135",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5397.47,
-    "GAUSS_X": 1970216,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8029497.86,
-    "UTM_E": 293411.69,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1350",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5641.29,
-    "GAUSS_X": 1980108,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 30.947,
-    "UTM_CM": 27,
-    "UTM_N": 8019486.076,
-    "UTM_E": 282477.793,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1351",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6031.82,
-    "GAUSS_X": 1980173,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 30.943,
-    "UTM_CM": 27,
-    "UTM_N": 8019417.514,
-    "UTM_E": 282087.904,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1352",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6305.59,
-    "GAUSS_X": 1980223,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8019364.088,
-    "UTM_E": 281814.64,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1353",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6610.1,
-    "GAUSS_X": 1980275,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 30.938,
-    "UTM_CM": 27,
-    "UTM_N": 8019308.962,
-    "UTM_E": 281510.647,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1354",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6880.71,
-    "GAUSS_X": 1980339,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 30.935,
-    "UTM_CM": 27,
-    "UTM_N": 8019242.267,
-    "UTM_E": 281240.686,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1355",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7206.08,
-    "GAUSS_X": 1980388,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8019189.167,
-    "UTM_E": 280915.805,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1356",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7506.96,
-    "GAUSS_X": 1980445,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8019129.408,
-    "UTM_E": 280615.491,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1357",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7756.94,
-    "GAUSS_X": 1980497,
-    "LAT_WGS84": -17.908,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8019075.046,
-    "UTM_E": 280366.031,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1358",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7596.45,
-    "GAUSS_X": 1980292,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8019281.348,
-    "UTM_E": 280524.347,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1359",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7466.27,
-    "GAUSS_X": 1980176,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 30.93,
-    "UTM_CM": 27,
-    "UTM_N": 8019398.922,
-    "UTM_E": 280653.298,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1317",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 533.66,
-    "GAUSS_X": 1976373,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8023276.649,
-    "UTM_E": 287545.936,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1361",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6935.41,
-    "GAUSS_X": 1979704,
-    "LAT_WGS84": -17.901,
-    "LON_WGS84": 30.935,
-    "UTM_CM": 27,
-    "UTM_N": 8019876.635,
-    "UTM_E": 281179.162,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1346",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4592.62,
-    "GAUSS_X": 1980214,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 30.957,
-    "UTM_CM": 27,
-    "UTM_N": 8019391.882,
-    "UTM_E": 283527.725,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1363",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6454.05,
-    "GAUSS_X": 1979412,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 30.939,
-    "UTM_CM": 27,
-    "UTM_N": 8020173.22,
-    "UTM_E": 281657.459,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1364",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6001.5,
-    "GAUSS_X": 1979250,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 30.943,
-    "UTM_CM": 27,
-    "UTM_N": 8020340.789,
-    "UTM_E": 282108.321,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1365",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5619.03,
-    "GAUSS_X": 1979113,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.947,
-    "UTM_CM": 27,
-    "UTM_N": 8020481.721,
-    "UTM_E": 282489.372,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1367",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5325.46,
-    "GAUSS_X": 1978818,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 30.95,
-    "UTM_CM": 27,
-    "UTM_N": 8020779.538,
-    "UTM_E": 282779.818,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM137",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5761.49,
-    "GAUSS_X": 1970124,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8029593.785,
-    "UTM_E": 293774.752,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1375",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5599.4,
-    "GAUSS_X": 1978440,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 30.947,
-    "UTM_CM": 27,
-    "UTM_N": 8021154.617,
-    "UTM_E": 282501.788,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1376",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5358.28,
-    "GAUSS_X": 1978287,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 30.949,
-    "UTM_CM": 27,
-    "UTM_N": 8021310.903,
-    "UTM_E": 282741.29,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1377",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5128.64,
-    "GAUSS_X": 1978225,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 30.952,
-    "UTM_CM": 27,
-    "UTM_N": 8021374.604,
-    "UTM_E": 282970.301,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1378",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4816.21,
-    "GAUSS_X": 1978053,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 30.955,
-    "UTM_CM": 27,
-    "UTM_N": 8021550.757,
-    "UTM_E": 283280.917,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1379",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4529.05,
-    "GAUSS_X": 1978061,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 30.957,
-    "UTM_CM": 27,
-    "UTM_N": 8021545.486,
-    "UTM_E": 283568.201,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM138",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5937.85,
-    "GAUSS_X": 1970079,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8029640.102,
-    "UTM_E": 293950.649,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1380",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4744.81,
-    "GAUSS_X": 1978203,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 30.955,
-    "UTM_CM": 27,
-    "UTM_N": 8021400.734,
-    "UTM_E": 283353.943,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1510",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4210.6,
-    "GAUSS_X": 1976093,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8023607.072,
-    "UTM_E": 292287.619,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1360",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7256.25,
-    "GAUSS_X": 1979989,
-    "LAT_WGS84": -17.903,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8019588.072,
-    "UTM_E": 280861.34,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1334",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5319.82,
-    "GAUSS_X": 1982013,
-    "LAT_WGS84": -17.922,
-    "LON_WGS84": 30.95,
-    "UTM_CM": 27,
-    "UTM_N": 8017584.879,
-    "UTM_E": 282819.76,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM132",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4886.71,
-    "GAUSS_X": 1970340,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8029368.294,
-    "UTM_E": 292902.219,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1320",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1643.16,
-    "GAUSS_X": 1976702,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 30.984,
-    "UTM_CM": 27,
-    "UTM_N": 8022935.944,
-    "UTM_E": 286439.845,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1321",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1383.95,
-    "GAUSS_X": 1976691,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 30.987,
-    "UTM_CM": 27,
-    "UTM_N": 8022949.073,
-    "UTM_E": 286698.971,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1322",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1211.49,
-    "GAUSS_X": 1976683,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 30.989,
-    "UTM_CM": 27,
-    "UTM_N": 8022959.413,
-    "UTM_E": 286871.358,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1323",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 891,
-    "GAUSS_X": 1976670,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 30.992,
-    "UTM_CM": 27,
-    "UTM_N": 8022975.469,
-    "UTM_E": 287191.746,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1324",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 659.06,
-    "GAUSS_X": 1976606,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 30.994,
-    "UTM_CM": 27,
-    "UTM_N": 8023042.362,
-    "UTM_E": 287423.02,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1325",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 479.82,
-    "GAUSS_X": 1976598,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8023051.933,
-    "UTM_E": 287602.196,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1326",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 340.43,
-    "GAUSS_X": 1976528,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 30.997,
-    "UTM_CM": 27,
-    "UTM_N": 8023123.594,
-    "UTM_E": 287740.848,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1327",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -217.89,
-    "GAUSS_X": 1976605,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8023052.341,
-    "UTM_E": 288300.05,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1328",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 500.79,
-    "GAUSS_X": 1976770,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8022879.931,
-    "UTM_E": 287583.065,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1329",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -409.83,
-    "GAUSS_X": 1976732,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8022927.566,
-    "UTM_E": 288493.368,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1330",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -820.84,
-    "GAUSS_X": 1976712,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.008,
-    "UTM_CM": 27,
-    "UTM_N": 8022952.223,
-    "UTM_E": 288904.2,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1331",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1063.35,
-    "GAUSS_X": 1976834,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.01,
-    "UTM_CM": 27,
-    "UTM_N": 8022832.611,
-    "UTM_E": 289148.042,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1348",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4353.59,
-    "GAUSS_X": 1979867,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 30.959,
-    "UTM_CM": 27,
-    "UTM_N": 8019741.09,
-    "UTM_E": 283763.063,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM134",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5247.34,
-    "GAUSS_X": 1970253,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8029459.133,
-    "UTM_E": 293261.946,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1382",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5125.86,
-    "GAUSS_X": 1978499,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.952,
-    "UTM_CM": 27,
-    "UTM_N": 8021100.61,
-    "UTM_E": 282976.021,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1345",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4630.81,
-    "GAUSS_X": 1980483,
-    "LAT_WGS84": -17.908,
-    "LON_WGS84": 30.956,
-    "UTM_CM": 27,
-    "UTM_N": 8019122.339,
-    "UTM_E": 283492.42,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1344",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4769.35,
-    "GAUSS_X": 1980814,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 30.955,
-    "UTM_CM": 27,
-    "UTM_N": 8018789.551,
-    "UTM_E": 283357.421,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1343",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4920.4,
-    "GAUSS_X": 1981033,
-    "LAT_WGS84": -17.913,
-    "LON_WGS84": 30.954,
-    "UTM_CM": 27,
-    "UTM_N": 8018569.082,
-    "UTM_E": 283208.703,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1342",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5145.64,
-    "GAUSS_X": 1981318,
-    "LAT_WGS84": -17.915,
-    "LON_WGS84": 30.951,
-    "UTM_CM": 27,
-    "UTM_N": 8018281.127,
-    "UTM_E": 282986.502,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1332",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4266.63,
-    "GAUSS_X": 1981618,
-    "LAT_WGS84": -17.918,
-    "LON_WGS84": 30.96,
-    "UTM_CM": 27,
-    "UTM_N": 8017990.454,
-    "UTM_E": 283868.843,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1340",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5550.3,
-    "GAUSS_X": 1981814,
-    "LAT_WGS84": -17.92,
-    "LON_WGS84": 30.948,
-    "UTM_CM": 27,
-    "UTM_N": 8017781.437,
-    "UTM_E": 282587.113,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1333",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4900.41,
-    "GAUSS_X": 1982291,
-    "LAT_WGS84": -17.924,
-    "LON_WGS84": 30.954,
-    "UTM_CM": 27,
-    "UTM_N": 8017311.122,
-    "UTM_E": 283242.212,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1339",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7094.97,
-    "GAUSS_X": 1980881,
-    "LAT_WGS84": -17.911,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8018697.924,
-    "UTM_E": 281032.218,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1338",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6747.37,
-    "GAUSS_X": 1981102,
-    "LAT_WGS84": -17.913,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8018479.898,
-    "UTM_E": 281382.246,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1337",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6382.62,
-    "GAUSS_X": 1981334,
-    "LAT_WGS84": -17.916,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8018251.926,
-    "UTM_E": 281749.535,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1336",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6050.86,
-    "GAUSS_X": 1981543,
-    "LAT_WGS84": -17.917,
-    "LON_WGS84": 30.943,
-    "UTM_CM": 27,
-    "UTM_N": 8018047.213,
-    "UTM_E": 282083.575,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1335",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5741.99,
-    "GAUSS_X": 1981742,
-    "LAT_WGS84": -17.919,
-    "LON_WGS84": 30.946,
-    "UTM_CM": 27,
-    "UTM_N": 8017850.996,
-    "UTM_E": 282394.629,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1347",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5028.8,
-    "GAUSS_X": 1979965,
-    "LAT_WGS84": -17.903,
-    "LON_WGS84": 30.953,
-    "UTM_CM": 27,
-    "UTM_N": 8019636.34,
-    "UTM_E": 283088.817,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM1341",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5374.36,
-    "GAUSS_X": 1981603,
-    "LAT_WGS84": -17.918,
-    "LON_WGS84": 30.949,
-    "UTM_CM": 27,
-    "UTM_N": 8017993.614,
-    "UTM_E": 282760.815,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM588",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4064.16,
-    "GAUSS_X": 1978662,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8021036.166,
-    "UTM_E": 292168.713,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM611",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3982.66,
-    "GAUSS_X": 1979280,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8020417.934,
-    "UTM_E": 292093.83,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM594",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2462.29,
-    "GAUSS_X": 1978618,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8021063.935,
-    "UTM_E": 290566.232,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM593",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3475.06,
-    "GAUSS_X": 1978561,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8021131.774,
-    "UTM_E": 291578.474,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM592",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3270.03,
-    "GAUSS_X": 1978517,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8021173.618,
-    "UTM_E": 291372.955,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM591",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3092.22,
-    "GAUSS_X": 1978469,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8021219.305,
-    "UTM_E": 291194.62,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM590",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2903.9,
-    "GAUSS_X": 1978421,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8021265.619,
-    "UTM_E": 291005.766,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM596",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2837.46,
-    "GAUSS_X": 1978704,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8020981.392,
-    "UTM_E": 290942.362,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM589",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2530.16,
-    "GAUSS_X": 1978313,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8021369.689,
-    "UTM_E": 290630.836,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM597",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3019.23,
-    "GAUSS_X": 1978749,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8020938.289,
-    "UTM_E": 291124.63,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM587",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3919.97,
-    "GAUSS_X": 1978437,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8021260.097,
-    "UTM_E": 292022.093,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM586",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3523.89,
-    "GAUSS_X": 1978338,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8021354.866,
-    "UTM_E": 291624.92,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM585",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3331.47,
-    "GAUSS_X": 1978313,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8021377.854,
-    "UTM_E": 291432.216,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM584",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3142.85,
-    "GAUSS_X": 1978262,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8021426.545,
-    "UTM_E": 291243.037,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM583",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2579.76,
-    "GAUSS_X": 1978124,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8021559.176,
-    "UTM_E": 290678.413,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM582",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3827.4,
-    "GAUSS_X": 1978083,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8021613.231,
-    "UTM_E": 291925.718,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM581",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3612.33,
-    "GAUSS_X": 1978046,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8021647.627,
-    "UTM_E": 291710.238,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM59",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6291.69,
-    "GAUSS_X": 1971508,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.059,
-    "UTM_CM": 27,
-    "UTM_N": 8028215.189,
-    "UTM_E": 294319.78,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM603",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3952.26,
-    "GAUSS_X": 1979084,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8020613.043,
-    "UTM_E": 292061.331,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM547",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1488.97,
-    "GAUSS_X": 1977543,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.014,
-    "UTM_CM": 27,
-    "UTM_N": 8022128.609,
-    "UTM_E": 289581.297,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM609",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3319.21,
-    "GAUSS_X": 1979132,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8020558.146,
-    "UTM_E": 291428.747,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM608",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3137.25,
-    "GAUSS_X": 1979087,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8020601.838,
-    "UTM_E": 291246.283,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM607",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2951.12,
-    "GAUSS_X": 1979040,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8020646.764,
-    "UTM_E": 291059.634,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM606",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2763.01,
-    "GAUSS_X": 1979003,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8020681.859,
-    "UTM_E": 290871.11,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM605",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2579.84,
-    "GAUSS_X": 1978944,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8020738.378,
-    "UTM_E": 290687.298,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM595",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2647.29,
-    "GAUSS_X": 1978657,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8021026.676,
-    "UTM_E": 290751.668,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM604",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2395.67,
-    "GAUSS_X": 1978911,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8020769.505,
-    "UTM_E": 290502.757,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM579",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3876.69,
-    "GAUSS_X": 1977472,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8022224.457,
-    "UTM_E": 291968.463,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "tsm602",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4244.41,
-    "GAUSS_X": 1978941,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8020759.399,
-    "UTM_E": 292351.966,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM601",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4001.36,
-    "GAUSS_X": 1978882,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8020816.446,
-    "UTM_E": 292108.258,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM600",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3424.32,
-    "GAUSS_X": 1978731,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8020960.776,
-    "UTM_E": 291529.558,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM60",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4511.76,
-    "GAUSS_X": 1971993,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8027710.564,
-    "UTM_E": 292544.916,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM6",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4965.95,
-    "GAUSS_X": 1971932,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027776.695,
-    "UTM_E": 292998.485,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM599",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3392.89,
-    "GAUSS_X": 1978856,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8020835.669,
-    "UTM_E": 291499.464,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM598",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3208.17,
-    "GAUSS_X": 1978796,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8020892.982,
-    "UTM_E": 291314.093,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM604A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2403.48,
-    "GAUSS_X": 1978900,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8020780.41,
-    "UTM_E": 290510.452,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM554",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3740.69,
-    "GAUSS_X": 1976781,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8022914.343,
-    "UTM_E": 291825.042,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM561",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2960,
-    "GAUSS_X": 1977142,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8022544.445,
-    "UTM_E": 291048.165,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM560",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2631.52,
-    "GAUSS_X": 1977247,
-    "LAT_WGS84": -17.879,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8022435.985,
-    "UTM_E": 290720.782,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM56",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5750.86,
-    "GAUSS_X": 1971643,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8028074.448,
-    "UTM_E": 293780.356,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM559",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3108.11,
-    "GAUSS_X": 1976885,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8022803.854,
-    "UTM_E": 291193.523,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM558",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2756.91,
-    "GAUSS_X": 1976999,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8022686.13,
-    "UTM_E": 290843.516,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM557",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2575.47,
-    "GAUSS_X": 1977052,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8022630.951,
-    "UTM_E": 290662.631,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM580",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3640.28,
-    "GAUSS_X": 1977763,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8021931.459,
-    "UTM_E": 291735.149,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM555",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3899.66,
-    "GAUSS_X": 1976783,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8022914.417,
-    "UTM_E": 291984.042,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM564",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3688.3,
-    "GAUSS_X": 1976910,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8022784.561,
-    "UTM_E": 291774.033,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM553",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3490.9,
-    "GAUSS_X": 1976770,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8022922.656,
-    "UTM_E": 291575.115,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM552",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3057.62,
-    "GAUSS_X": 1976753,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8022935.384,
-    "UTM_E": 291141.614,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM551",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2738.92,
-    "GAUSS_X": 1976753,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8022931.508,
-    "UTM_E": 290822.892,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM550",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2498.09,
-    "GAUSS_X": 1976753,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8022928.637,
-    "UTM_E": 290582.045,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM55",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5601.46,
-    "GAUSS_X": 1971680,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8028035.878,
-    "UTM_E": 293631.341,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM549",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1868.64,
-    "GAUSS_X": 1977525,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8022149.992,
-    "UTM_E": 289960.815,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM677",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7354.75,
-    "GAUSS_X": 1979308,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 31.069,
-    "UTM_CM": 27,
-    "UTM_N": 8020426.389,
-    "UTM_E": 295466.447,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM556",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3981.72,
-    "GAUSS_X": 1976811,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8022886.944,
-    "UTM_E": 292066.412,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM570",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3793.49,
-    "GAUSS_X": 1977085,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8022610.985,
-    "UTM_E": 291881.104,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM612",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4375.06,
-    "GAUSS_X": 1979232,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8020469.709,
-    "UTM_E": 292485.75,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM578",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3739.66,
-    "GAUSS_X": 1977509,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8022185.825,
-    "UTM_E": 291831.821,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM577",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3517.3,
-    "GAUSS_X": 1977585,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8022108.355,
-    "UTM_E": 291610.249,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM576",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4062.13,
-    "GAUSS_X": 1977205,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8022494.156,
-    "UTM_E": 292151.048,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM575",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3980.67,
-    "GAUSS_X": 1977229,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8022469.001,
-    "UTM_E": 292069.842,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM574",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3817.09,
-    "GAUSS_X": 1977280,
-    "LAT_WGS84": -17.879,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8022415.683,
-    "UTM_E": 291906.802,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM573",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3636.45,
-    "GAUSS_X": 1977337,
-    "LAT_WGS84": -17.879,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8022356.802,
-    "UTM_E": 291726.758,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM562",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3344.68,
-    "GAUSS_X": 1977014,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8022676.9,
-    "UTM_E": 291431.5,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM571",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3931.1,
-    "GAUSS_X": 1976998,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8022698.887,
-    "UTM_E": 292017.798,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM563",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3504.34,
-    "GAUSS_X": 1976971,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8022722.195,
-    "UTM_E": 291590.706,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM57",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5922.45,
-    "GAUSS_X": 1971600,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8028119.415,
-    "UTM_E": 293951.497,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM569",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3694.36,
-    "GAUSS_X": 1977117,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8022577.69,
-    "UTM_E": 291782.312,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM568",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3410.27,
-    "GAUSS_X": 1977194,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8022497.868,
-    "UTM_E": 291499.022,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM567",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2960.54,
-    "GAUSS_X": 1977341,
-    "LAT_WGS84": -17.879,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8022345.995,
-    "UTM_E": 291050.832,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM566",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2733.33,
-    "GAUSS_X": 1977543,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8022141.502,
-    "UTM_E": 290825.769,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM565",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3867.6,
-    "GAUSS_X": 1976854,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8022842.327,
-    "UTM_E": 291952.748,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM58",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6114.73,
-    "GAUSS_X": 1971552,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8028168.974,
-    "UTM_E": 294143.282,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM572",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3459.66,
-    "GAUSS_X": 1977396,
-    "LAT_WGS84": -17.88,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8022296.022,
-    "UTM_E": 291550.586,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM652",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5066.78,
-    "GAUSS_X": 1978457,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 31.048,
-    "UTM_CM": 27,
-    "UTM_N": 8021252.527,
-    "UTM_E": 293169.201,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM610",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3927.44,
-    "GAUSS_X": 1979285,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8020411.851,
-    "UTM_E": 292038.665,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM659",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6106.3,
-    "GAUSS_X": 1978133,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8021587.839,
-    "UTM_E": 294205.316,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM658",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6024.05,
-    "GAUSS_X": 1978384,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8021335.81,
-    "UTM_E": 294125.754,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM657",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5950.09,
-    "GAUSS_X": 1978320,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8021399.281,
-    "UTM_E": 294051.1,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM656",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5919.14,
-    "GAUSS_X": 1978287,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8021431.931,
-    "UTM_E": 294019.794,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM655",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5418.24,
-    "GAUSS_X": 1978355,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8021358.204,
-    "UTM_E": 293519.593,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM660",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7068.03,
-    "GAUSS_X": 1978075,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.067,
-    "UTM_CM": 27,
-    "UTM_N": 8021656.287,
-    "UTM_E": 295166.483,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM653",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5169.64,
-    "GAUSS_X": 1978645,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8021065.927,
-    "UTM_E": 293274.082,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM661",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6676.81,
-    "GAUSS_X": 1978444,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8021283.008,
-    "UTM_E": 294779.197,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM651",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4707.06,
-    "GAUSS_X": 1978474,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8021231.607,
-    "UTM_E": 292809.638,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM650",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6646.33,
-    "GAUSS_X": 1977925,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8021801.884,
-    "UTM_E": 294743.147,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM65",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5470.85,
-    "GAUSS_X": 1971886,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8027828.507,
-    "UTM_E": 293502.924,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM649",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6093.81,
-    "GAUSS_X": 1977972,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8021748.916,
-    "UTM_E": 294191.096,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM648",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5822.79,
-    "GAUSS_X": 1977997,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8021720.907,
-    "UTM_E": 293920.327,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM647",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5365.87,
-    "GAUSS_X": 1978070,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8021642.332,
-    "UTM_E": 293464.166,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM646",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5018.01,
-    "GAUSS_X": 1978107,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8021601.499,
-    "UTM_E": 293116.679,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM654",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5224.36,
-    "GAUSS_X": 1978588,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8021122.738,
-    "UTM_E": 293328.203,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM669",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5354.69,
-    "GAUSS_X": 1979116,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8020596.689,
-    "UTM_E": 293464.2,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM408",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2518.43,
-    "GAUSS_X": 1970333,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8029349.69,
-    "UTM_E": 290533.68,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM675",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6729.38,
-    "GAUSS_X": 1979431,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8020296.641,
-    "UTM_E": 294842.359,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM674",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7045.38,
-    "GAUSS_X": 1978681,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.066,
-    "UTM_CM": 27,
-    "UTM_N": 8021050.097,
-    "UTM_E": 295150.331,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM673",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6690.58,
-    "GAUSS_X": 1978845,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8020881.551,
-    "UTM_E": 294797.276,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM672",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6417.44,
-    "GAUSS_X": 1978985,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8020739.231,
-    "UTM_E": 294525.614,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM671",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6097.17,
-    "GAUSS_X": 1979026,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8020694.462,
-    "UTM_E": 294205.767,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM66",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5642.6,
-    "GAUSS_X": 1971844,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8027872.096,
-    "UTM_E": 293674.24,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM67",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5791.9,
-    "GAUSS_X": 1971807,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8027910.335,
-    "UTM_E": 293823.158,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM643",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7097.83,
-    "GAUSS_X": 1977566,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.067,
-    "UTM_CM": 27,
-    "UTM_N": 8022164.948,
-    "UTM_E": 295190.834,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM668",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4940.3,
-    "GAUSS_X": 1979165,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8020542.889,
-    "UTM_E": 293050.311,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM667",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6063.6,
-    "GAUSS_X": 1978717,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8021003.343,
-    "UTM_E": 294168.877,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM666",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5809.55,
-    "GAUSS_X": 1978747,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8020970.615,
-    "UTM_E": 293915.132,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM665",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5517.06,
-    "GAUSS_X": 1978791,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8020923.134,
-    "UTM_E": 293623.098,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM664",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5193.11,
-    "GAUSS_X": 1978830,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8020880.746,
-    "UTM_E": 293299.543,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM663",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4912.1,
-    "GAUSS_X": 1978855,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.046,
-    "UTM_CM": 27,
-    "UTM_N": 8020852.499,
-    "UTM_E": 293018.784,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM662",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4536.78,
-    "GAUSS_X": 1978899,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8020804.359,
-    "UTM_E": 292643.91,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM670",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5846.38,
-    "GAUSS_X": 1979057,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8020661.049,
-    "UTM_E": 293955.29,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM619",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2984.37,
-    "GAUSS_X": 1979673,
-    "LAT_WGS84": -17.901,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8020013.869,
-    "UTM_E": 291099.682,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM626",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4238.14,
-    "GAUSS_X": 1977760,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8021940.261,
-    "UTM_E": 292333.03,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM625",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4216.64,
-    "GAUSS_X": 1977911,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8021789.049,
-    "UTM_E": 292313.147,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM624",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2810.11,
-    "GAUSS_X": 1980440,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8019245.525,
-    "UTM_E": 290933.636,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM623",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2301.8,
-    "GAUSS_X": 1980598,
-    "LAT_WGS84": -17.909,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8019081.514,
-    "UTM_E": 290426.986,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM622",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2112.48,
-    "GAUSS_X": 1979981,
-    "LAT_WGS84": -17.903,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8019696.494,
-    "UTM_E": 290231.025,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM621",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2175.14,
-    "GAUSS_X": 1979769,
-    "LAT_WGS84": -17.901,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8019908.945,
-    "UTM_E": 290291.417,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM645",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4734.32,
-    "GAUSS_X": 1978143,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8021562.563,
-    "UTM_E": 292833.354,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM62",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4812.78,
-    "GAUSS_X": 1972005,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027701.712,
-    "UTM_E": 292846.088,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM629",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5526.9,
-    "GAUSS_X": 1977471,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8022243.13,
-    "UTM_E": 293618.784,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM618",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2610.98,
-    "GAUSS_X": 1979580,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8020103.019,
-    "UTM_E": 290725.262,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM617A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2252.05,
-    "GAUSS_X": 1979478,
-    "LAT_WGS84": -17.899,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8020201.165,
-    "UTM_E": 290365.207,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM617",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2251.37,
-    "GAUSS_X": 1979478,
-    "LAT_WGS84": -17.899,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8020200.838,
-    "UTM_E": 290364.53,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM616",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3254.3,
-    "GAUSS_X": 1979433,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8020257.196,
-    "UTM_E": 291367.054,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM615",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3054.85,
-    "GAUSS_X": 1979383,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8020304.379,
-    "UTM_E": 291167.059,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM614",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2684.16,
-    "GAUSS_X": 1979292,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8020392.239,
-    "UTM_E": 290795.352,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM613",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2324.33,
-    "GAUSS_X": 1979192,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8020487.606,
-    "UTM_E": 290434.427,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM620",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3180.64,
-    "GAUSS_X": 1979722,
-    "LAT_WGS84": -17.901,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8019967.092,
-    "UTM_E": 291296.493,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM635",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4281.53,
-    "GAUSS_X": 1978051,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8021650.174,
-    "UTM_E": 292379.539,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM546",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1699.99,
-    "GAUSS_X": 1977199,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.016,
-    "UTM_CM": 27,
-    "UTM_N": 8022474.413,
-    "UTM_E": 289788.653,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM642",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6843.74,
-    "GAUSS_X": 1977604,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.065,
-    "UTM_CM": 27,
-    "UTM_N": 8022124.471,
-    "UTM_E": 294937.133,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM641",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6637,
-    "GAUSS_X": 1977643,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8022082.922,
-    "UTM_E": 294730.802,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM640",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6209.01,
-    "GAUSS_X": 1977680,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.059,
-    "UTM_CM": 27,
-    "UTM_N": 8022041.98,
-    "UTM_E": 294303.174,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM64",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5300,
-    "GAUSS_X": 1971929,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8027783.817,
-    "UTM_E": 293332.521,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM639",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5806.68,
-    "GAUSS_X": 1977714,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8022003.224,
-    "UTM_E": 293901.187,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM638",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5339.07,
-    "GAUSS_X": 1977767,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8021945.446,
-    "UTM_E": 293434.111,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM627",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4538.72,
-    "GAUSS_X": 1977611,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8022092.955,
-    "UTM_E": 292632.03,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM636",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4390.61,
-    "GAUSS_X": 1977989,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8021713.589,
-    "UTM_E": 292487.959,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM628",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5295.21,
-    "GAUSS_X": 1977498,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8022214.044,
-    "UTM_E": 293387.363,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM634",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4136.49,
-    "GAUSS_X": 1978111,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8021587.994,
-    "UTM_E": 292235.138,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM633",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6536.71,
-    "GAUSS_X": 1977422,
-    "LAT_WGS84": -17.88,
-    "LON_WGS84": 31.062,
-    "UTM_CM": 27,
-    "UTM_N": 8022303.73,
-    "UTM_E": 294628.127,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM632",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6467.38,
-    "GAUSS_X": 1977297,
-    "LAT_WGS84": -17.879,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8022427.285,
-    "UTM_E": 294557.46,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM631",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5990.49,
-    "GAUSS_X": 1977338,
-    "LAT_WGS84": -17.879,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8022381.48,
-    "UTM_E": 294080.975,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM630",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5742.71,
-    "GAUSS_X": 1977365,
-    "LAT_WGS84": -17.88,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8022351.871,
-    "UTM_E": 293833.467,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM63",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5147.1,
-    "GAUSS_X": 1971967,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8027743.83,
-    "UTM_E": 293180.02,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM644",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4552.06,
-    "GAUSS_X": 1978239,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8021464.752,
-    "UTM_E": 292652.109,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM637",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4643.58,
-    "GAUSS_X": 1977869,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8021836.35,
-    "UTM_E": 292739.661,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM455",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1930.22,
-    "GAUSS_X": 1974712,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8024964.129,
-    "UTM_E": 289992.256,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM480",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -628.91,
-    "GAUSS_X": 1974815,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31.006,
-    "UTM_CM": 27,
-    "UTM_N": 8024846.835,
-    "UTM_E": 288691.934,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM461",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2655.37,
-    "GAUSS_X": 1974175,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8025509.059,
-    "UTM_E": 290711.718,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM460",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2541.49,
-    "GAUSS_X": 1974184,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8025499.029,
-    "UTM_E": 290597.923,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM46",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4519.42,
-    "GAUSS_X": 1971811,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8027892.629,
-    "UTM_E": 292550.631,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM459",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2088.49,
-    "GAUSS_X": 1974340,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8025337.746,
-    "UTM_E": 290146.559,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM458",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1842.04,
-    "GAUSS_X": 1974472,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8025203.066,
-    "UTM_E": 289901.5,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM463",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3117.65,
-    "GAUSS_X": 1973989,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8025699.753,
-    "UTM_E": 291172.049,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM456",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1690.68,
-    "GAUSS_X": 1974781,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.016,
-    "UTM_CM": 27,
-    "UTM_N": 8024892.108,
-    "UTM_E": 289753.439,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM464",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3291.39,
-    "GAUSS_X": 1973924,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8025766.248,
-    "UTM_E": 291345.111,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM454",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1890.51,
-    "GAUSS_X": 1974964,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8024711.872,
-    "UTM_E": 289955.239,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM453",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1804.94,
-    "GAUSS_X": 1974985,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8024689.844,
-    "UTM_E": 289869.888,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM452",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1902.33,
-    "GAUSS_X": 1975158,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8024517.711,
-    "UTM_E": 289969.141,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM451",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2100.59,
-    "GAUSS_X": 1975136,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8024541.707,
-    "UTM_E": 290167.184,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM450",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2117.12,
-    "GAUSS_X": 1974880,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8024798.346,
-    "UTM_E": 290180.969,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM45",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4364.3,
-    "GAUSS_X": 1971850,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8027852.668,
-    "UTM_E": 292395.909,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM449",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2352.15,
-    "GAUSS_X": 1974791,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8024889.15,
-    "UTM_E": 290415.074,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM457",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1579.69,
-    "GAUSS_X": 1974569,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8025103.269,
-    "UTM_E": 289640.165,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM472",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2891.69,
-    "GAUSS_X": 1973965,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8025720.996,
-    "UTM_E": 290945.817,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM548",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1699.56,
-    "GAUSS_X": 1977431,
-    "LAT_WGS84": -17.88,
-    "LON_WGS84": 31.016,
-    "UTM_CM": 27,
-    "UTM_N": 8022242.187,
-    "UTM_E": 289790.712,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM479",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1003.58,
-    "GAUSS_X": 1974676,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8024989.77,
-    "UTM_E": 289065.152,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM478",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1376.9,
-    "GAUSS_X": 1974515,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.013,
-    "UTM_CM": 27,
-    "UTM_N": 8025154.742,
-    "UTM_E": 289436.783,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM477",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1648.39,
-    "GAUSS_X": 1974417,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.016,
-    "UTM_CM": 27,
-    "UTM_N": 8025256.598,
-    "UTM_E": 289707.238,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM476",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1910.37,
-    "GAUSS_X": 1974318,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8025358.191,
-    "UTM_E": 289968.184,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM475",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2147.68,
-    "GAUSS_X": 1974240,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8025438.899,
-    "UTM_E": 290204.678,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM462",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2923.88,
-    "GAUSS_X": 1974086,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8025600.891,
-    "UTM_E": 290979.299,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM473",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2610.82,
-    "GAUSS_X": 1974065,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8025618.482,
-    "UTM_E": 290665.988,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM446",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2475.41,
-    "GAUSS_X": 1974492,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8025190.296,
-    "UTM_E": 290535.135,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM471",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3094.57,
-    "GAUSS_X": 1973890,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8025799.044,
-    "UTM_E": 291147.901,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM470",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3422.1,
-    "GAUSS_X": 1973771,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8025920.979,
-    "UTM_E": 291474.191,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM47",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4570.41,
-    "GAUSS_X": 1971799,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8027905.576,
-    "UTM_E": 292601.492,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM469",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3714.64,
-    "GAUSS_X": 1973665,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8026030.588,
-    "UTM_E": 291765.614,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM468",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4156.43,
-    "GAUSS_X": 1973414,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8026286.046,
-    "UTM_E": 292204.756,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM467",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4006.61,
-    "GAUSS_X": 1973560,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8026138.101,
-    "UTM_E": 292056.49,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM466",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4062.32,
-    "GAUSS_X": 1973687,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 31.038,
-    "UTM_CM": 27,
-    "UTM_N": 8026011.968,
-    "UTM_E": 292113.56,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM474",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2366.68,
-    "GAUSS_X": 1974154,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8025526.501,
-    "UTM_E": 290422.784,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM421",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2699.72,
-    "GAUSS_X": 1974988,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8024696.146,
-    "UTM_E": 290764.78,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM429",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2097.99,
-    "GAUSS_X": 1976069,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8023608.298,
-    "UTM_E": 290174.582,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM428",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2265.75,
-    "GAUSS_X": 1975833,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8023847.055,
-    "UTM_E": 290339.818,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM427",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2320.92,
-    "GAUSS_X": 1975714,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8023965.987,
-    "UTM_E": 290393.725,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM426",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2386.56,
-    "GAUSS_X": 1975412,
-    "LAT_WGS84": -17.862,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8024269.196,
-    "UTM_E": 290456.13,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM425",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2495.32,
-    "GAUSS_X": 1975311,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8024370.999,
-    "UTM_E": 290563.821,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM424",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2629.78,
-    "GAUSS_X": 1975530,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8024153.601,
-    "UTM_E": 290700.637,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM448",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2221.3,
-    "GAUSS_X": 1974695,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8024984.288,
-    "UTM_E": 290283.179,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM422",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2545.52,
-    "GAUSS_X": 1975208,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8024474.616,
-    "UTM_E": 290612.922,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM431",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1421.51,
-    "GAUSS_X": 1976094,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.013,
-    "UTM_CM": 27,
-    "UTM_N": 8023576.177,
-    "UTM_E": 289498.308,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM420",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2787.87,
-    "GAUSS_X": 1974828,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8024857.513,
-    "UTM_E": 290851.22,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM42",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4309.82,
-    "GAUSS_X": 1972563,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8027138.571,
-    "UTM_E": 292349.055,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM419",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2937.68,
-    "GAUSS_X": 1974589,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8025098.047,
-    "UTM_E": 290998.484,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM418",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3077.94,
-    "GAUSS_X": 1974701,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8024987.12,
-    "UTM_E": 291139.959,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM417",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3347.66,
-    "GAUSS_X": 1974286,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8025405.431,
-    "UTM_E": 291405.254,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM416",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3320,
-    "GAUSS_X": 1974180,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.031,
-    "UTM_CM": 27,
-    "UTM_N": 8025510.663,
-    "UTM_E": 291376.462,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2156",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1452.18,
-    "GAUSS_X": 1971371,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.986,
-    "UTM_CM": 27,
-    "UTM_N": 8028269.155,
-    "UTM_E": 286573.784,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM423",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2639.7,
-    "GAUSS_X": 1975270,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8024413.379,
-    "UTM_E": 290707.776,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM438",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2395.47,
-    "GAUSS_X": 1975071,
-    "LAT_WGS84": -17.859,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8024609.71,
-    "UTM_E": 290461.395,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM481",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -477.17,
-    "GAUSS_X": 1974870,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8024790.915,
-    "UTM_E": 288540.761,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM445",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2760.52,
-    "GAUSS_X": 1974387,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8025298.027,
-    "UTM_E": 290819.148,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM444",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2991.84,
-    "GAUSS_X": 1974303,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8025384.52,
-    "UTM_E": 291049.588,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM443",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3202.18,
-    "GAUSS_X": 1974224,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8025465.579,
-    "UTM_E": 291259.102,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM442",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3046.49,
-    "GAUSS_X": 1974448,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8025240.114,
-    "UTM_E": 291105.795,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM441",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2800.91,
-    "GAUSS_X": 1974526,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8025159.048,
-    "UTM_E": 290861.034,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM440",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2703.39,
-    "GAUSS_X": 1974694,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8024990.35,
-    "UTM_E": 290765.301,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM43",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4317.29,
-    "GAUSS_X": 1972379,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8027322.525,
-    "UTM_E": 292354.559,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM439",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2579.59,
-    "GAUSS_X": 1974914,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8024769.475,
-    "UTM_E": 290643.841,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM430",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1945.39,
-    "GAUSS_X": 1975976,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8023700.011,
-    "UTM_E": 290020.968,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM437",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2251.6,
-    "GAUSS_X": 1975264,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8024415.313,
-    "UTM_E": 290319.578,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM436",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2082.84,
-    "GAUSS_X": 1975447,
-    "LAT_WGS84": -17.862,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8024230.839,
-    "UTM_E": 290152.76,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM435",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2202.1,
-    "GAUSS_X": 1975596,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8024082.454,
-    "UTM_E": 290273.633,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM434",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2116.12,
-    "GAUSS_X": 1975739,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8023939.131,
-    "UTM_E": 290189.171,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM433",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1808.4,
-    "GAUSS_X": 1975682,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8023992.349,
-    "UTM_E": 289880.819,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM432",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1715.89,
-    "GAUSS_X": 1975801,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 31.016,
-    "UTM_CM": 27,
-    "UTM_N": 8023872.237,
-    "UTM_E": 289789.577,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM447",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2206.4,
-    "GAUSS_X": 1974616,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.021,
-    "UTM_CM": 27,
-    "UTM_N": 8025063.135,
-    "UTM_E": 290267.432,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM44",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4367.25,
-    "GAUSS_X": 1971987,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8027715.349,
-    "UTM_E": 292400.328,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM521",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1601.57,
-    "GAUSS_X": 1973804,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8025868.842,
-    "UTM_E": 289653.855,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM48",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4803.56,
-    "GAUSS_X": 1971740,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027967.483,
-    "UTM_E": 292834.024,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM528",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -768.64,
-    "GAUSS_X": 1974039,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8025624.375,
-    "UTM_E": 288823.37,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM527",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -925.11,
-    "GAUSS_X": 1974002,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8025663.563,
-    "UTM_E": 288979.453,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM526",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1110.62,
-    "GAUSS_X": 1973925,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.01,
-    "UTM_CM": 27,
-    "UTM_N": 8025742.516,
-    "UTM_E": 289164.156,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM525",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -974.6,
-    "GAUSS_X": 1974072,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8025593.516,
-    "UTM_E": 289029.703,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM524",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1191.6,
-    "GAUSS_X": 1974063,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.011,
-    "UTM_CM": 27,
-    "UTM_N": 8025604.89,
-    "UTM_E": 289246.626,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM53",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5259.44,
-    "GAUSS_X": 1971764,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8027947.515,
-    "UTM_E": 293290.203,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM522",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1626.43,
-    "GAUSS_X": 1973867,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8025806.132,
-    "UTM_E": 289679.391,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM530",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -258.42,
-    "GAUSS_X": 1974229,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8025429.265,
-    "UTM_E": 288315.131,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM520",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1794.88,
-    "GAUSS_X": 1973764,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8025910.614,
-    "UTM_E": 289846.758,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM52",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5106.47,
-    "GAUSS_X": 1971802,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.048,
-    "UTM_CM": 27,
-    "UTM_N": 8027908.387,
-    "UTM_E": 293137.623,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM519",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1803.82,
-    "GAUSS_X": 1973848,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8025827.152,
-    "UTM_E": 289856.593,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM518",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2031.1,
-    "GAUSS_X": 1973952,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.019,
-    "UTM_CM": 27,
-    "UTM_N": 8025724.916,
-    "UTM_E": 290085.013,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM517",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2035.43,
-    "GAUSS_X": 1973703,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 31.019,
-    "UTM_CM": 27,
-    "UTM_N": 8025974.794,
-    "UTM_E": 290086.669,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM516",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2132.51,
-    "GAUSS_X": 1973728,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8025950.261,
-    "UTM_E": 290184.032,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM515",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2353.26,
-    "GAUSS_X": 1973834,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8025846.904,
-    "UTM_E": 290405.932,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM523",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1312.72,
-    "GAUSS_X": 1973874,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.012,
-    "UTM_CM": 27,
-    "UTM_N": 8025795.844,
-    "UTM_E": 289365.727,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM538",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3950.32,
-    "GAUSS_X": 1972691,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8027007.046,
-    "UTM_E": 291990.893,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM545",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1901.03,
-    "GAUSS_X": 1976851,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8022824.488,
-    "UTM_E": 289985.981,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM544",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1551.01,
-    "GAUSS_X": 1976827,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8022845.119,
-    "UTM_E": 289635.669,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM543",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1407.55,
-    "GAUSS_X": 1976798,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.013,
-    "UTM_CM": 27,
-    "UTM_N": 8022871.924,
-    "UTM_E": 289491.892,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM542",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1339.17,
-    "GAUSS_X": 1976843,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.013,
-    "UTM_CM": 27,
-    "UTM_N": 8022826.497,
-    "UTM_E": 289423.985,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM541",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1253.97,
-    "GAUSS_X": 1977215,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.012,
-    "UTM_CM": 27,
-    "UTM_N": 8022454.1,
-    "UTM_E": 289342.759,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM540",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1238.43,
-    "GAUSS_X": 1977709,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.012,
-    "UTM_CM": 27,
-    "UTM_N": 8021959.778,
-    "UTM_E": 289332.515,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM529",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -394.49,
-    "GAUSS_X": 1974178,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8025481.256,
-    "UTM_E": 288450.673,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM539",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1315.72,
-    "GAUSS_X": 1977765,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.012,
-    "UTM_CM": 27,
-    "UTM_N": 8021904.522,
-    "UTM_E": 289410.414,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM512",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2690.45,
-    "GAUSS_X": 1973308,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8026376.128,
-    "UTM_E": 290737.526,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM537",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3902.28,
-    "GAUSS_X": 1972888,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8026809.267,
-    "UTM_E": 291944.959,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM536",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3871.18,
-    "GAUSS_X": 1973018,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8026678.684,
-    "UTM_E": 291915.25,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM535",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3853.13,
-    "GAUSS_X": 1973253,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.036,
-    "UTM_CM": 27,
-    "UTM_N": 8026443.713,
-    "UTM_E": 291899.711,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM534",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 303.91,
-    "GAUSS_X": 1974665,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 30.997,
-    "UTM_CM": 27,
-    "UTM_N": 8024987.401,
-    "UTM_E": 287757.411,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM533",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 98.36,
-    "GAUSS_X": 1974367,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 30.999,
-    "UTM_CM": 27,
-    "UTM_N": 8025287.252,
-    "UTM_E": 287959.795,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM532",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 44.83,
-    "GAUSS_X": 1974520,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8025134.64,
-    "UTM_E": 288014.97,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM531",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -307.07,
-    "GAUSS_X": 1974345,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.003,
-    "UTM_CM": 27,
-    "UTM_N": 8025313.564,
-    "UTM_E": 288365.03,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM54",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5430.28,
-    "GAUSS_X": 1971722,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8027991.665,
-    "UTM_E": 293460.602,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM489",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -42.87,
-    "GAUSS_X": 1974657,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8024999.315,
-    "UTM_E": 288104.138,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM496",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -873.87,
-    "GAUSS_X": 1974296,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.008,
-    "UTM_CM": 27,
-    "UTM_N": 8025369.287,
-    "UTM_E": 288931.352,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM495",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -948.77,
-    "GAUSS_X": 1974512,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8025153.919,
-    "UTM_E": 289008.573,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM494",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -743.33,
-    "GAUSS_X": 1974579,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.007,
-    "UTM_CM": 27,
-    "UTM_N": 8025084.323,
-    "UTM_E": 288803.835,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM493",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -565.13,
-    "GAUSS_X": 1974659,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.005,
-    "UTM_CM": 27,
-    "UTM_N": 8025002.207,
-    "UTM_E": 288626.477,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM492",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -483.6,
-    "GAUSS_X": 1974401,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.005,
-    "UTM_CM": 27,
-    "UTM_N": 8025259.629,
-    "UTM_E": 288542.174,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM491",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -360.71,
-    "GAUSS_X": 1974479,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.003,
-    "UTM_CM": 27,
-    "UTM_N": 8025180.566,
-    "UTM_E": 288420.105,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM514",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2405.75,
-    "GAUSS_X": 1973679,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8026002.179,
-    "UTM_E": 290456.771,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM49",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4977.95,
-    "GAUSS_X": 1971698,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8028010.59,
-    "UTM_E": 293007.986,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM499",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1822.24,
-    "GAUSS_X": 1974038,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8025636.713,
-    "UTM_E": 289877.055,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM488",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -205.86,
-    "GAUSS_X": 1974775,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8024882.809,
-    "UTM_E": 288268.41,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM487",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2.83,
-    "GAUSS_X": 1974852,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8024803.387,
-    "UTM_E": 288060.526,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM486",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 55.33,
-    "GAUSS_X": 1974698,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 30.999,
-    "UTM_CM": 27,
-    "UTM_N": 8024956.79,
-    "UTM_E": 288006.372,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM485",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 226.99,
-    "GAUSS_X": 1974802,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 30.998,
-    "UTM_CM": 27,
-    "UTM_N": 8024851.231,
-    "UTM_E": 287835.806,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM484",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 66.39,
-    "GAUSS_X": 1975069,
-    "LAT_WGS84": -17.859,
-    "LON_WGS84": 30.999,
-    "UTM_CM": 27,
-    "UTM_N": 8024585.675,
-    "UTM_E": 287999.284,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM483",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -64.58,
-    "GAUSS_X": 1975023,
-    "LAT_WGS84": -17.859,
-    "LON_WGS84": 31.001,
-    "UTM_CM": 27,
-    "UTM_N": 8024633.332,
-    "UTM_E": 288129.771,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM482",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -265.16,
-    "GAUSS_X": 1974948,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8024710.417,
-    "UTM_E": 288329.568,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM490",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -137.04,
-    "GAUSS_X": 1974590,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.001,
-    "UTM_CM": 27,
-    "UTM_N": 8025067.1,
-    "UTM_E": 288197.602,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM504",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2596.41,
-    "GAUSS_X": 1973947,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8025736.137,
-    "UTM_E": 290650.316,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM678",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4528.37,
-    "GAUSS_X": 1974272,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8025431.962,
-    "UTM_E": 292585.907,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM511",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2716.56,
-    "GAUSS_X": 1973520,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8026164.609,
-    "UTM_E": 290765.905,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM510",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3148.52,
-    "GAUSS_X": 1973434,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8026254.989,
-    "UTM_E": 291196.983,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM51",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4970.23,
-    "GAUSS_X": 1971836,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027873.168,
-    "UTM_E": 293001.734,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM509",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3502.49,
-    "GAUSS_X": 1973333,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8026360.375,
-    "UTM_E": 291549.894,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM508",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3064.91,
-    "GAUSS_X": 1973755,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8025933.468,
-    "UTM_E": 291116.797,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM507",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2792.13,
-    "GAUSS_X": 1973622,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8026063.719,
-    "UTM_E": 290842.569,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM497",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1236.15,
-    "GAUSS_X": 1974264,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.012,
-    "UTM_CM": 27,
-    "UTM_N": 8025404.648,
-    "UTM_E": 289293.329,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM505",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2666.06,
-    "GAUSS_X": 1973796,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8025887.605,
-    "UTM_E": 290718.359,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM498",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1553.27,
-    "GAUSS_X": 1974138,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8025534.405,
-    "UTM_E": 289609.125,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM503",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2328.6,
-    "GAUSS_X": 1974075,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8025605.43,
-    "UTM_E": 290383.852,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM502",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2087.54,
-    "GAUSS_X": 1974153,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8025525.253,
-    "UTM_E": 290143.601,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM501",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1877.21,
-    "GAUSS_X": 1974236,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8025439.464,
-    "UTM_E": 289934.147,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM500",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1957.41,
-    "GAUSS_X": 1974108,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8025568.423,
-    "UTM_E": 290012.983,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM50",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4809.79,
-    "GAUSS_X": 1971875,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027832.28,
-    "UTM_E": 292841.701,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM5",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4323.86,
-    "GAUSS_X": 1972107,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8027595.346,
-    "UTM_E": 292358.213,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM513",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2393.29,
-    "GAUSS_X": 1973603,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8026078.303,
-    "UTM_E": 290443.494,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM506",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2745.17,
-    "GAUSS_X": 1973623,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8026061.447,
-    "UTM_E": 290795.624,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM845",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9462.57,
-    "GAUSS_X": 1971308,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8028448.436,
-    "UTM_E": 297488.71,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM92",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5291.6,
-    "GAUSS_X": 1971165,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8028547.801,
-    "UTM_E": 293315.952,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM89",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4480.88,
-    "GAUSS_X": 1972731,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8026972.099,
-    "UTM_E": 292521.928,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM88",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4789.69,
-    "GAUSS_X": 1972580,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027126.573,
-    "UTM_E": 292829.144,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM87",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4602.54,
-    "GAUSS_X": 1972575,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8027129.872,
-    "UTM_E": 292641.923,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM85",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4795.69,
-    "GAUSS_X": 1972406,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027301.24,
-    "UTM_E": 292833.277,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM848",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9367.84,
-    "GAUSS_X": 1968657,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8031099.004,
-    "UTM_E": 297365.652,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM9",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4954.74,
-    "GAUSS_X": 1972213,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027495.795,
-    "UTM_E": 292990.276,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM846",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9533.83,
-    "GAUSS_X": 1971600,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8028157.703,
-    "UTM_E": 297563.089,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM90",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4595.7,
-    "GAUSS_X": 1972735,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8026970.247,
-    "UTM_E": 292636.789,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM844",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9553.38,
-    "GAUSS_X": 1971475,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8028282.658,
-    "UTM_E": 297581.307,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM843",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10522.1,
-    "GAUSS_X": 1971668,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8028100.486,
-    "UTM_E": 298552.169,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM842",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10419.7,
-    "GAUSS_X": 1971556,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8028210.755,
-    "UTM_E": 298448.504,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM841",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9994.81,
-    "GAUSS_X": 1971261,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8028501.547,
-    "UTM_E": 298020.468,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM840",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10771.7,
-    "GAUSS_X": 1968072,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8031698.955,
-    "UTM_E": 298763.314,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM84",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5567.54,
-    "GAUSS_X": 1972275,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8027439.994,
-    "UTM_E": 293603.786,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM839A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9196.31,
-    "GAUSS_X": 1969402,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8030352.076,
-    "UTM_E": 297202.069,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM847",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9204.29,
-    "GAUSS_X": 1968817,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8030937.67,
-    "UTM_E": 297203.798,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM91",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6185.04,
-    "GAUSS_X": 1971078,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8028644.307,
-    "UTM_E": 294208.524,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM809",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10800.1,
-    "GAUSS_X": 1969434,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8030337.321,
-    "UTM_E": 298806.274,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM917",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7420.68,
-    "GAUSS_X": 1978093,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8021641.988,
-    "UTM_E": 295519.348,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM916",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7474.8,
-    "GAUSS_X": 1977201,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8022534.611,
-    "UTM_E": 295563.907,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM915",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10170.1,
-    "GAUSS_X": 1976705,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.096,
-    "UTM_CM": 27,
-    "UTM_N": 8023059.516,
-    "UTM_E": 298254.01,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM913",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8962.34,
-    "GAUSS_X": 1977140,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8022610.81,
-    "UTM_E": 297050.882,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM912",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9167.51,
-    "GAUSS_X": 1977215,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.086,
-    "UTM_CM": 27,
-    "UTM_N": 8022538.506,
-    "UTM_E": 297256.861,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM894/V",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6564.95,
-    "GAUSS_X": 1972646,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.938,
-    "UTM_CM": 27,
-    "UTM_N": 8026939.306,
-    "UTM_E": 281474.039,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM910",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8466,
-    "GAUSS_X": 1977587,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8022158.776,
-    "UTM_E": 296559.305,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM837A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10015.6,
-    "GAUSS_X": 1968398,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8031364.962,
-    "UTM_E": 298010.719,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM909",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8133.48,
-    "GAUSS_X": 1976881,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.077,
-    "UTM_CM": 27,
-    "UTM_N": 8022861.87,
-    "UTM_E": 296219.192,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM908",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8010.29,
-    "GAUSS_X": 1976626,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 31.076,
-    "UTM_CM": 27,
-    "UTM_N": 8023115.373,
-    "UTM_E": 296093.264,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM906",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8933.13,
-    "GAUSS_X": 1976152,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8023599.408,
-    "UTM_E": 297011.073,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM905",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9662.22,
-    "GAUSS_X": 1975756,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.091,
-    "UTM_CM": 27,
-    "UTM_N": 8024003.008,
-    "UTM_E": 297735.959,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM904",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9464.04,
-    "GAUSS_X": 1975373,
-    "LAT_WGS84": -17.862,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8024383.354,
-    "UTM_E": 297533.673,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM902",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8347.9,
-    "GAUSS_X": 1975958,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31.079,
-    "UTM_CM": 27,
-    "UTM_N": 8023786.628,
-    "UTM_E": 296423.74,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM901",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7812.64,
-    "GAUSS_X": 1976241,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.074,
-    "UTM_CM": 27,
-    "UTM_N": 8023497.757,
-    "UTM_E": 295891.483,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM911",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8762.52,
-    "GAUSS_X": 1977411,
-    "LAT_WGS84": -17.88,
-    "LON_WGS84": 31.083,
-    "UTM_CM": 27,
-    "UTM_N": 8022337.964,
-    "UTM_E": 296853.954,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM815",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8856.25,
-    "GAUSS_X": 1969251,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8030499.872,
-    "UTM_E": 296860.375,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM822",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9246.38,
-    "GAUSS_X": 1968904,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8030850.575,
-    "UTM_E": 297246.825,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM821",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9247.35,
-    "GAUSS_X": 1969022,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8030732.92,
-    "UTM_E": 297249.051,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM820",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8123.14,
-    "GAUSS_X": 1970149,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.077,
-    "UTM_CM": 27,
-    "UTM_N": 8029593.423,
-    "UTM_E": 296136.822,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM82",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5243.55,
-    "GAUSS_X": 1972355,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8027356.453,
-    "UTM_E": 293280.63,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM819",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9085.4,
-    "GAUSS_X": 1969057,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.086,
-    "UTM_CM": 27,
-    "UTM_N": 8030695.699,
-    "UTM_E": 297087.472,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM818",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9055.34,
-    "GAUSS_X": 1969119,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8030633.635,
-    "UTM_E": 297058.069,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM839",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9232.76,
-    "GAUSS_X": 1969370,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8030384.677,
-    "UTM_E": 297238.177,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM816",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8925.43,
-    "GAUSS_X": 1969244,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8030506.901,
-    "UTM_E": 296929.491,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM824A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9320.58,
-    "GAUSS_X": 1969279,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8030476.639,
-    "UTM_E": 297325.029,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM814",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10540.4,
-    "GAUSS_X": 1968833,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8030935.764,
-    "UTM_E": 298540.163,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM813",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10660.1,
-    "GAUSS_X": 1968698,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8031072.218,
-    "UTM_E": 298658.415,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM812",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10815.9,
-    "GAUSS_X": 1968554,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8031217.927,
-    "UTM_E": 298812.674,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM811",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11025.7,
-    "GAUSS_X": 1968763,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8031010.388,
-    "UTM_E": 299024.752,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM810",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10563.3,
-    "GAUSS_X": 1969717,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8030051.71,
-    "UTM_E": 298572.447,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM81",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6196.99,
-    "GAUSS_X": 1971867,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8027855.253,
-    "UTM_E": 294228.911,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM676",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7147.75,
-    "GAUSS_X": 1979384,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 31.067,
-    "UTM_CM": 27,
-    "UTM_N": 8020348.133,
-    "UTM_E": 295260.25,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM817",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8949.94,
-    "GAUSS_X": 1969186,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8030565.206,
-    "UTM_E": 296953.382,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM830",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10280.6,
-    "GAUSS_X": 1970731,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8029035.186,
-    "UTM_E": 298300.641,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM920",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8000.39,
-    "GAUSS_X": 1978693,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.075,
-    "UTM_CM": 27,
-    "UTM_N": 8021047.992,
-    "UTM_E": 296105.529,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM837",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10014.8,
-    "GAUSS_X": 1968399,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8031364.193,
-    "UTM_E": 298009.897,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM836A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10377.9,
-    "GAUSS_X": 1968243,
-    "LAT_WGS84": -17.797,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8031524.065,
-    "UTM_E": 298371.338,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM836",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10377.6,
-    "GAUSS_X": 1968243,
-    "LAT_WGS84": -17.797,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8031523.822,
-    "UTM_E": 298371.081,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM835",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10430.9,
-    "GAUSS_X": 1968207,
-    "LAT_WGS84": -17.797,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8031560.743,
-    "UTM_E": 298423.995,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM834",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10621.4,
-    "GAUSS_X": 1968348,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8031421.599,
-    "UTM_E": 298615.95,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM833",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9881.03,
-    "GAUSS_X": 1968667,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.093,
-    "UTM_CM": 27,
-    "UTM_N": 8031094.952,
-    "UTM_E": 297878.969,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM823",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9213.17,
-    "GAUSS_X": 1968856,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8030898.873,
-    "UTM_E": 297213.094,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM831",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10317.7,
-    "GAUSS_X": 1970547,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8029219.58,
-    "UTM_E": 298335.707,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM824",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9316.22,
-    "GAUSS_X": 1969282,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8030473.192,
-    "UTM_E": 297320.705,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM83",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5433.39,
-    "GAUSS_X": 1972309,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8027405.177,
-    "UTM_E": 293469.984,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM829",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10068.1,
-    "GAUSS_X": 1970692,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8029071.336,
-    "UTM_E": 298087.681,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM828",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10565.7,
-    "GAUSS_X": 1969255,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8030513.506,
-    "UTM_E": 298569.956,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM827",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10480.9,
-    "GAUSS_X": 1969254,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8030514.21,
-    "UTM_E": 298485.125,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM826",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9421.74,
-    "GAUSS_X": 1969026,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8030730.252,
-    "UTM_E": 297423.498,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM825",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9364.25,
-    "GAUSS_X": 1969194,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8030561.729,
-    "UTM_E": 297367.798,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM838",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9813.07,
-    "GAUSS_X": 1968484,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.093,
-    "UTM_CM": 27,
-    "UTM_N": 8031276.575,
-    "UTM_E": 297809.059,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM832",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10410.8,
-    "GAUSS_X": 1968440,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8031327.218,
-    "UTM_E": 298406.354,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM968",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10061.6,
-    "GAUSS_X": 1977869,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8021893.861,
-    "UTM_E": 298157.968,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM918",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7370.28,
-    "GAUSS_X": 1979002,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8020732.074,
-    "UTM_E": 295478.699,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM974",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10413.8,
-    "GAUSS_X": 1978290,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8021477.23,
-    "UTM_E": 298514.752,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM973",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10868.4,
-    "GAUSS_X": 1978423,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8021348.41,
-    "UTM_E": 298970.745,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM972",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10911,
-    "GAUSS_X": 1978594,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8021177.96,
-    "UTM_E": 299015.21,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM971",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10508,
-    "GAUSS_X": 1978040,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8021727.561,
-    "UTM_E": 298606.262,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM970",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9740.69,
-    "GAUSS_X": 1978456,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8021303.543,
-    "UTM_E": 297843.377,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM976",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7663.86,
-    "GAUSS_X": 1977975,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 31.072,
-    "UTM_CM": 27,
-    "UTM_N": 8021762.663,
-    "UTM_E": 295761.276,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM969",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9963.07,
-    "GAUSS_X": 1978118,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8021643.733,
-    "UTM_E": 298062.144,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM977",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8647.71,
-    "GAUSS_X": 1977937,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 31.082,
-    "UTM_CM": 27,
-    "UTM_N": 8021811.206,
-    "UTM_E": 296744.773,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM967",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9717.35,
-    "GAUSS_X": 1977886,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8021872.989,
-    "UTM_E": 297813.926,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM966",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9173.72,
-    "GAUSS_X": 1977855,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8021898.111,
-    "UTM_E": 297269.938,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM965",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12492.2,
-    "GAUSS_X": 1976786,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8023003.369,
-    "UTM_E": 300577.037,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM964",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10056,
-    "GAUSS_X": 1976512,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8023250.783,
-    "UTM_E": 298137.892,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM963",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10053.8,
-    "GAUSS_X": 1975553,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8024209.922,
-    "UTM_E": 298125.406,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM962",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10390.9,
-    "GAUSS_X": 1975854,
-    "LAT_WGS84": -17.866,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8023912.34,
-    "UTM_E": 298465.717,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM960",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9492.36,
-    "GAUSS_X": 1976329,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8023428.221,
-    "UTM_E": 297572.229,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM97",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6153.1,
-    "GAUSS_X": 1970950,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8028771.154,
-    "UTM_E": 294175.222,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM984",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8061.01,
-    "GAUSS_X": 1977775,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.076,
-    "UTM_CM": 27,
-    "UTM_N": 8021966.513,
-    "UTM_E": 296156.308,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM991",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7442.46,
-    "GAUSS_X": 1977612,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8022122.59,
-    "UTM_E": 295535.978,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM990",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11492.5,
-    "GAUSS_X": 1977451,
-    "LAT_WGS84": -17.88,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8022327.531,
-    "UTM_E": 299584.492,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM99",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3457.52,
-    "GAUSS_X": 1971356,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8028337.022,
-    "UTM_E": 291483.777,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM989",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11234.1,
-    "GAUSS_X": 1977105,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8022670.214,
-    "UTM_E": 299322.389,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM988",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10384.8,
-    "GAUSS_X": 1976342,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8023424.533,
-    "UTM_E": 298464.812,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM987",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9995.7,
-    "GAUSS_X": 1977741,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8022021.66,
-    "UTM_E": 298090.727,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM975",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10557.6,
-    "GAUSS_X": 1977457,
-    "LAT_WGS84": -17.88,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8022311.247,
-    "UTM_E": 298649.591,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM985",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8725.44,
-    "GAUSS_X": 1975785,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.082,
-    "UTM_CM": 27,
-    "UTM_N": 8023963.922,
-    "UTM_E": 296799.444,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM958",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8833.41,
-    "GAUSS_X": 1976883,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.083,
-    "UTM_CM": 27,
-    "UTM_N": 8022866.622,
-    "UTM_E": 296919.189,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM983",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8061.01,
-    "GAUSS_X": 1977775,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.076,
-    "UTM_CM": 27,
-    "UTM_N": 8021966.513,
-    "UTM_E": 296156.308,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM982",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10086.4,
-    "GAUSS_X": 1978810,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8020952.995,
-    "UTM_E": 298192.923,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM981",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8550.9,
-    "GAUSS_X": 1976342,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.081,
-    "UTM_CM": 27,
-    "UTM_N": 8023404.852,
-    "UTM_E": 296630.864,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM980",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10928.9,
-    "GAUSS_X": 1977267,
-    "LAT_WGS84": -17.879,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8022505.845,
-    "UTM_E": 299018.843,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM98",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6124.24,
-    "GAUSS_X": 1970831,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8028890.733,
-    "UTM_E": 294145.079,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM979",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9864.21,
-    "GAUSS_X": 1976137,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.093,
-    "UTM_CM": 27,
-    "UTM_N": 8023623.914,
-    "UTM_E": 297942.043,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM978",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9415.5,
-    "GAUSS_X": 1977097,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8022659.45,
-    "UTM_E": 297503.596,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM986",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7828.27,
-    "GAUSS_X": 1977017,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.074,
-    "UTM_CM": 27,
-    "UTM_N": 8022721.801,
-    "UTM_E": 295915.431,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM929",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11177.1,
-    "GAUSS_X": 1975690,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8024085.228,
-    "UTM_E": 299250.148,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM937",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10736.7,
-    "GAUSS_X": 1976886,
-    "LAT_WGS84": -17.875,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8022884.621,
-    "UTM_E": 298822.573,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM936",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11254.2,
-    "GAUSS_X": 1976615,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8023161.249,
-    "UTM_E": 299337.229,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM935",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11060.7,
-    "GAUSS_X": 1976024,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8023749.488,
-    "UTM_E": 299137.356,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM934",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10924.5,
-    "GAUSS_X": 1976324,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8023448.277,
-    "UTM_E": 299004.353,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM932",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11803.3,
-    "GAUSS_X": 1976291,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8023490.495,
-    "UTM_E": 299882.895,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM931",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12713.5,
-    "GAUSS_X": 1978368,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8021423.192,
-    "UTM_E": 300815.371,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM96",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5976.29,
-    "GAUSS_X": 1970994,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8028725.331,
-    "UTM_E": 293998.87,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM93",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5462.98,
-    "GAUSS_X": 1971122,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8028592.296,
-    "UTM_E": 293486.888,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM94",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5612.75,
-    "GAUSS_X": 1971084,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8028631.98,
-    "UTM_E": 293636.262,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM928",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11514.8,
-    "GAUSS_X": 1978445,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8021333.202,
-    "UTM_E": 299617.407,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM927",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11275.4,
-    "GAUSS_X": 1978036,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8021740.25,
-    "UTM_E": 299373.615,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM926",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10752.3,
-    "GAUSS_X": 1977829,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8021941.69,
-    "UTM_E": 298848.344,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM925",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10236.6,
-    "GAUSS_X": 1977631,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8022133.998,
-    "UTM_E": 298330.431,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM923",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9377.81,
-    "GAUSS_X": 1978065,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8021690.299,
-    "UTM_E": 297476.29,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM922",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9176.14,
-    "GAUSS_X": 1979053,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8020700.917,
-    "UTM_E": 297285.2,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM921",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8814.75,
-    "GAUSS_X": 1978299,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.083,
-    "UTM_CM": 27,
-    "UTM_N": 8021450.949,
-    "UTM_E": 296915.704,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM930",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12219.6,
-    "GAUSS_X": 1977988,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 31.115,
-    "UTM_CM": 27,
-    "UTM_N": 8021798.118,
-    "UTM_E": 300317.378,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM948",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9706.42,
-    "GAUSS_X": 1977425,
-    "LAT_WGS84": -17.88,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8022334.173,
-    "UTM_E": 297798.05,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM808",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10783.5,
-    "GAUSS_X": 1969461,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8030309.873,
-    "UTM_E": 298789.954,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM956",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9991.44,
-    "GAUSS_X": 1977286,
-    "LAT_WGS84": -17.879,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8022476.095,
-    "UTM_E": 298081.594,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM955",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9788.75,
-    "GAUSS_X": 1976905,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8022855.13,
-    "UTM_E": 297874.809,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM953",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11601.4,
-    "GAUSS_X": 1976923,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8022856.988,
-    "UTM_E": 299687.753,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM952",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8416.61,
-    "GAUSS_X": 1978492,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 31.079,
-    "UTM_CM": 27,
-    "UTM_N": 8021253.138,
-    "UTM_E": 296519.619,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM951",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8237.27,
-    "GAUSS_X": 1978136,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 31.078,
-    "UTM_CM": 27,
-    "UTM_N": 8021607.034,
-    "UTM_E": 296336.453,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM950",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10736.5,
-    "GAUSS_X": 1976159,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8023611.609,
-    "UTM_E": 298814.583,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM938",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10539.5,
-    "GAUSS_X": 1976511,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8023257.223,
-    "UTM_E": 298621.319,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM949",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9300.23,
-    "GAUSS_X": 1975960,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8023794.53,
-    "UTM_E": 297376.143,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM939",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10358.4,
-    "GAUSS_X": 1977088,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8022678.728,
-    "UTM_E": 298446.471,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM947",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11936.8,
-    "GAUSS_X": 1977222,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.113,
-    "UTM_CM": 27,
-    "UTM_N": 8022561.462,
-    "UTM_E": 300026.321,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM946",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12258.5,
-    "GAUSS_X": 1977507,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.116,
-    "UTM_CM": 27,
-    "UTM_N": 8022279.411,
-    "UTM_E": 300351.073,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM945",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11855,
-    "GAUSS_X": 1977737,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 31.112,
-    "UTM_CM": 27,
-    "UTM_N": 8022045.077,
-    "UTM_E": 299950.085,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM943",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7836.18,
-    "GAUSS_X": 1978330,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 31.074,
-    "UTM_CM": 27,
-    "UTM_N": 8021409.061,
-    "UTM_E": 295937.418,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM942",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7393.95,
-    "GAUSS_X": 1978545,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 31.07,
-    "UTM_CM": 27,
-    "UTM_N": 8021189.865,
-    "UTM_E": 295497.463,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM941",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11121,
-    "GAUSS_X": 1977634,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8022140.74,
-    "UTM_E": 299214.877,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM959",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9121.2,
-    "GAUSS_X": 1976530,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.086,
-    "UTM_CM": 27,
-    "UTM_N": 8023223.364,
-    "UTM_E": 297203.204,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM95",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5784.51,
-    "GAUSS_X": 1971041,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8028676.648,
-    "UTM_E": 293807.576,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM72",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4614.34,
-    "GAUSS_X": 1972299,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8027405.828,
-    "UTM_E": 292650.774,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM743",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8078.51,
-    "GAUSS_X": 1969509,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.076,
-    "UTM_CM": 27,
-    "UTM_N": 8030233.023,
-    "UTM_E": 296085.353,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM726",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9707.5,
-    "GAUSS_X": 1970915,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8028844.843,
-    "UTM_E": 297729.443,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM725",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9797,
-    "GAUSS_X": 1971077,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8028683.561,
-    "UTM_E": 297820.681,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM724",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7989.36,
-    "GAUSS_X": 1973546,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.075,
-    "UTM_CM": 27,
-    "UTM_N": 8026194.692,
-    "UTM_E": 296039.356,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM723",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10252.9,
-    "GAUSS_X": 1971801,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8027964.711,
-    "UTM_E": 298284.308,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM722",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10040.1,
-    "GAUSS_X": 1972079,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8027684.444,
-    "UTM_E": 298074.531,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM728",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10297.6,
-    "GAUSS_X": 1969604,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8030162.307,
-    "UTM_E": 298305.543,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM720",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9708.13,
-    "GAUSS_X": 1972006,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8027753.847,
-    "UTM_E": 297741.735,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM729",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10226.8,
-    "GAUSS_X": 1969591,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.096,
-    "UTM_CM": 27,
-    "UTM_N": 8030174.152,
-    "UTM_E": 298234.626,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM719",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9795.98,
-    "GAUSS_X": 1971892,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8027868.862,
-    "UTM_E": 297828.37,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM718",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9997.38,
-    "GAUSS_X": 1971629,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8028133.238,
-    "UTM_E": 298026.976,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM717",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10176.7,
-    "GAUSS_X": 1971391,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.096,
-    "UTM_CM": 27,
-    "UTM_N": 8028373.345,
-    "UTM_E": 298203.768,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM716",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9939.95,
-    "GAUSS_X": 1971404,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8028358.454,
-    "UTM_E": 297967.129,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM715",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9879.57,
-    "GAUSS_X": 1971538,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.093,
-    "UTM_CM": 27,
-    "UTM_N": 8028223.422,
-    "UTM_E": 297908.183,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM714",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9784.87,
-    "GAUSS_X": 1971200,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8028560.016,
-    "UTM_E": 297809.87,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM713",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9735.36,
-    "GAUSS_X": 1971511,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8028248.462,
-    "UTM_E": 297763.682,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM721",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9945.58,
-    "GAUSS_X": 1972202,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8027560.157,
-    "UTM_E": 297981.295,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM737",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9710.44,
-    "GAUSS_X": 1968771,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8030989.086,
-    "UTM_E": 297709.482,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM8090",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7795.08,
-    "GAUSS_X": 1990422,
-    "LAT_WGS84": -17.998,
-    "LON_WGS84": 31.074,
-    "UTM_CM": 27,
-    "UTM_N": 8009316.091,
-    "UTM_E": 296026.395,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM741",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8578.13,
-    "GAUSS_X": 1969131,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.081,
-    "UTM_CM": 27,
-    "UTM_N": 8030617.069,
-    "UTM_E": 296580.957,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM740",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8863.76,
-    "GAUSS_X": 1969000,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8030750.995,
-    "UTM_E": 296865.204,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM74",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5193.36,
-    "GAUSS_X": 1972153,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8027557.861,
-    "UTM_E": 293228.277,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM7394",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6981.47,
-    "GAUSS_X": 1990737,
-    "LAT_WGS84": -18,
-    "LON_WGS84": 31.066,
-    "UTM_CM": 27,
-    "UTM_N": 8008992.654,
-    "UTM_E": 295216.134,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM7393",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7492.83,
-    "GAUSS_X": 1989983,
-    "LAT_WGS84": -17.994,
-    "LON_WGS84": 31.071,
-    "UTM_CM": 27,
-    "UTM_N": 8009751.745,
-    "UTM_E": 295719.394,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM727",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9887.79,
-    "GAUSS_X": 1970150,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.093,
-    "UTM_CM": 27,
-    "UTM_N": 8029611.345,
-    "UTM_E": 297901.573,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM738",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9568.38,
-    "GAUSS_X": 1969052,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8030706.056,
-    "UTM_E": 297570.42,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM710",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9532.98,
-    "GAUSS_X": 1971862,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8027895.932,
-    "UTM_E": 297565.038,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM736",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8275.38,
-    "GAUSS_X": 1970209,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.078,
-    "UTM_CM": 27,
-    "UTM_N": 8029535.146,
-    "UTM_E": 296289.711,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM735",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9422.18,
-    "GAUSS_X": 1968744,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8031012.32,
-    "UTM_E": 297420.927,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM734",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9550.17,
-    "GAUSS_X": 1968870,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8030887.57,
-    "UTM_E": 297550.269,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM733",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9743.02,
-    "GAUSS_X": 1969024,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8030736.222,
-    "UTM_E": 297744.766,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM732",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10069.9,
-    "GAUSS_X": 1969284,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8030479.91,
-    "UTM_E": 298074.396,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM731",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10113.5,
-    "GAUSS_X": 1969507,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8030256.505,
-    "UTM_E": 298120.398,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM730",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10106.8,
-    "GAUSS_X": 1969649,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.095,
-    "UTM_CM": 27,
-    "UTM_N": 8030115.247,
-    "UTM_E": 298115.186,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM739",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9077.5,
-    "GAUSS_X": 1968897,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.086,
-    "UTM_CM": 27,
-    "UTM_N": 8030855.813,
-    "UTM_E": 297077.861,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM685",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6488.41,
-    "GAUSS_X": 1975677,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8024047.644,
-    "UTM_E": 294561.13,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM694",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2652.36,
-    "GAUSS_X": 1974171,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8025512.727,
-    "UTM_E": 290708.668,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM691",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3009.87,
-    "GAUSS_X": 1980320,
-    "LAT_WGS84": -17.906,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8019367.23,
-    "UTM_E": 291132.129,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM690",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5984.79,
-    "GAUSS_X": 1975405,
-    "LAT_WGS84": -17.862,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8024314.597,
-    "UTM_E": 294054.56,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM69",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4622.12,
-    "GAUSS_X": 1972127,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8027577.724,
-    "UTM_E": 292656.718,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM689",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5460.04,
-    "GAUSS_X": 1975745,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8023968.353,
-    "UTM_E": 293533.423,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM688",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4642.38,
-    "GAUSS_X": 1976719,
-    "LAT_WGS84": -17.874,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8022985.962,
-    "UTM_E": 292726.137,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM712",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9711.31,
-    "GAUSS_X": 1971604,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8028155.26,
-    "UTM_E": 297740.624,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM686",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6645.03,
-    "GAUSS_X": 1976072,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8023654.407,
-    "UTM_E": 294721.991,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM697",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -476.83,
-    "GAUSS_X": 1974871,
-    "LAT_WGS84": -17.857,
-    "LON_WGS84": 31.004,
-    "UTM_CM": 27,
-    "UTM_N": 8024789.862,
-    "UTM_E": 288540.432,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM684",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6183.28,
-    "GAUSS_X": 1975252,
-    "LAT_WGS84": -17.861,
-    "LON_WGS84": 31.058,
-    "UTM_CM": 27,
-    "UTM_N": 8024469.233,
-    "UTM_E": 294251.43,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM683",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5700.08,
-    "GAUSS_X": 1974352,
-    "LAT_WGS84": -17.852,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8025364.759,
-    "UTM_E": 293758.554,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM682",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5581.63,
-    "GAUSS_X": 1974050,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8025664.782,
-    "UTM_E": 293636.871,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM681",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5502.2,
-    "GAUSS_X": 1973718,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8025996.205,
-    "UTM_E": 293553.879,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM680",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5334.43,
-    "GAUSS_X": 1974418,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8025294.24,
-    "UTM_E": 293393.592,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM68",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4506.58,
-    "GAUSS_X": 1972122,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8027581.419,
-    "UTM_E": 292541.116,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM679",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5135.5,
-    "GAUSS_X": 1974452,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.048,
-    "UTM_CM": 27,
-    "UTM_N": 8025258.018,
-    "UTM_E": 293195.013,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM687",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6782.96,
-    "GAUSS_X": 1976491,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.064,
-    "UTM_CM": 27,
-    "UTM_N": 8023236.938,
-    "UTM_E": 294864.418,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM702",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9185.97,
-    "GAUSS_X": 1971288,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8028466.28,
-    "UTM_E": 297211.874,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM744",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7849.22,
-    "GAUSS_X": 1969690,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.074,
-    "UTM_CM": 27,
-    "UTM_N": 8030049.433,
-    "UTM_E": 295857.985,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM71",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4498.85,
-    "GAUSS_X": 1972327,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8027376.371,
-    "UTM_E": 292535.578,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM709",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9295.24,
-    "GAUSS_X": 1971659,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8028095.85,
-    "UTM_E": 297325.122,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM708",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9387.31,
-    "GAUSS_X": 1971551,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8028205.299,
-    "UTM_E": 297416.037,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM707",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9496.99,
-    "GAUSS_X": 1971645,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8028112.027,
-    "UTM_E": 297526.732,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM706",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9594.65,
-    "GAUSS_X": 1971319,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8028438.927,
-    "UTM_E": 297620.913,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM705",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9474.17,
-    "GAUSS_X": 1971297,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8028460.22,
-    "UTM_E": 297500.186,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM695",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2893.77,
-    "GAUSS_X": 1973963,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8025723.799,
-    "UTM_E": 290947.867,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM703",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9301.22,
-    "GAUSS_X": 1971345,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8028410.489,
-    "UTM_E": 297327.739,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM696",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -632.65,
-    "GAUSS_X": 1974796,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.006,
-    "UTM_CM": 27,
-    "UTM_N": 8024866.517,
-    "UTM_E": 288695.464,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM701",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9234.87,
-    "GAUSS_X": 1971117,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8028637.401,
-    "UTM_E": 297258.953,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM70",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4807.59,
-    "GAUSS_X": 1972136,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027571.377,
-    "UTM_E": 292842.29,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM7(WCT)",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2983.96,
-    "GAUSS_X": 1972094,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8027529.297,
-    "UTM_E": 285049.57,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM7",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4962.6,
-    "GAUSS_X": 1972012,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027696.974,
-    "UTM_E": 292995.986,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM699",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -265.67,
-    "GAUSS_X": 1974948,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8024709.943,
-    "UTM_E": 288330.084,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM698",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1002.06,
-    "GAUSS_X": 1974679,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.009,
-    "UTM_CM": 27,
-    "UTM_N": 8024987.114,
-    "UTM_E": 289063.66,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM711",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9600.63,
-    "GAUSS_X": 1971782,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.091,
-    "UTM_CM": 27,
-    "UTM_N": 8027976.179,
-    "UTM_E": 297631.841,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM704",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9337.94,
-    "GAUSS_X": 1971272,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8028484.075,
-    "UTM_E": 297363.679,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM785",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9824.75,
-    "GAUSS_X": 1969332,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.093,
-    "UTM_CM": 27,
-    "UTM_N": 8030429.11,
-    "UTM_E": 297829.789,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM742",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8361.35,
-    "GAUSS_X": 1969302,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.079,
-    "UTM_CM": 27,
-    "UTM_N": 8030443.255,
-    "UTM_E": 296365.996,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM790A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8969.07,
-    "GAUSS_X": 1969558,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8030193.841,
-    "UTM_E": 296976.481,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM790",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8966.05,
-    "GAUSS_X": 1969558,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8030193.729,
-    "UTM_E": 296973.462,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM79",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5838.28,
-    "GAUSS_X": 1971994,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8027724.549,
-    "UTM_E": 293871.533,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM789",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8938.14,
-    "GAUSS_X": 1969566,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8030184.98,
-    "UTM_E": 296945.641,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM788",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8573.99,
-    "GAUSS_X": 1969458,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.081,
-    "UTM_CM": 27,
-    "UTM_N": 8030289.557,
-    "UTM_E": 296580.313,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM792",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9236.19,
-    "GAUSS_X": 1969203,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8030551.562,
-    "UTM_E": 297239.825,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM786",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8445.03,
-    "GAUSS_X": 1969430,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8030316.191,
-    "UTM_E": 296451.047,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM793",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9260.01,
-    "GAUSS_X": 1969124,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.087,
-    "UTM_CM": 27,
-    "UTM_N": 8030631.3,
-    "UTM_E": 297262.798,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM784",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10407.3,
-    "GAUSS_X": 1969510,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8030256.733,
-    "UTM_E": 298414.312,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM783",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10310.2,
-    "GAUSS_X": 1969381,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8030385.542,
-    "UTM_E": 298315.802,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM782",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10161.7,
-    "GAUSS_X": 1969172,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.096,
-    "UTM_CM": 27,
-    "UTM_N": 8030592.005,
-    "UTM_E": 298165.023,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM781",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9824.36,
-    "GAUSS_X": 1968871,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 31.093,
-    "UTM_CM": 27,
-    "UTM_N": 8030890.388,
-    "UTM_E": 297824.474,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM780",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9649.43,
-    "GAUSS_X": 1969242,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.091,
-    "UTM_CM": 27,
-    "UTM_N": 8030516.922,
-    "UTM_E": 297653.503,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM78",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5688.38,
-    "GAUSS_X": 1972031,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8027685.683,
-    "UTM_E": 293722.021,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM779",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9620.63,
-    "GAUSS_X": 1969291,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.091,
-    "UTM_CM": 27,
-    "UTM_N": 8030467.752,
-    "UTM_E": 297625.223,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM787",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8698.61,
-    "GAUSS_X": 1969366,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.082,
-    "UTM_CM": 27,
-    "UTM_N": 8030382.833,
-    "UTM_E": 296703.958,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM80",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6009.3,
-    "GAUSS_X": 1971951,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8027768.98,
-    "UTM_E": 294042.109,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM807",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10958.9,
-    "GAUSS_X": 1969252,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8030520.855,
-    "UTM_E": 298963.179,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM806",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11075.7,
-    "GAUSS_X": 1969113,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8030661.207,
-    "UTM_E": 299078.458,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM805",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11236.7,
-    "GAUSS_X": 1968940,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.106,
-    "UTM_CM": 27,
-    "UTM_N": 8030836.143,
-    "UTM_E": 299237.625,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM804",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11461.6,
-    "GAUSS_X": 1969027,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8030751.731,
-    "UTM_E": 299463.421,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM803",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10963.8,
-    "GAUSS_X": 1969608,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8030165.402,
-    "UTM_E": 298971.795,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM802",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11082.1,
-    "GAUSS_X": 1969468,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8030306.311,
-    "UTM_E": 299088.609,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM791",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9013.87,
-    "GAUSS_X": 1969551,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8030201.57,
-    "UTM_E": 297021.206,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM800",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10716.8,
-    "GAUSS_X": 1969912,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 31.101,
-    "UTM_CM": 27,
-    "UTM_N": 8029858.182,
-    "UTM_E": 298728.118,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM776",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9148.55,
-    "GAUSS_X": 1969789,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 31.086,
-    "UTM_CM": 27,
-    "UTM_N": 8029964.666,
-    "UTM_E": 297158.438,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM8",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4958.25,
-    "GAUSS_X": 1972116,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027593.19,
-    "UTM_E": 292992.745,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM799",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10360.9,
-    "GAUSS_X": 1970334,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8029432.751,
-    "UTM_E": 298376.696,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM798",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10134.5,
-    "GAUSS_X": 1970248,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.096,
-    "UTM_CM": 27,
-    "UTM_N": 8029516.626,
-    "UTM_E": 298149.334,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM797",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10375.2,
-    "GAUSS_X": 1969777,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8029989.518,
-    "UTM_E": 298385.001,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM796",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10514.2,
-    "GAUSS_X": 1969658,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8030110.598,
-    "UTM_E": 298522.72,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM795",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9052.23,
-    "GAUSS_X": 1969381,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8030371.888,
-    "UTM_E": 297057.754,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM794",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8865.17,
-    "GAUSS_X": 1969511,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8030240.084,
-    "UTM_E": 296872.07,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM801",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10470.4,
-    "GAUSS_X": 1970203,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8029564.486,
-    "UTM_E": 298484.756,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM751",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8907.83,
-    "GAUSS_X": 1969718,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8030033.129,
-    "UTM_E": 296916.947,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM759",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8608.02,
-    "GAUSS_X": 1970530,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.081,
-    "UTM_CM": 27,
-    "UTM_N": 8029218.123,
-    "UTM_E": 296625.794,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM758",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8486.55,
-    "GAUSS_X": 1970481,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8029265.228,
-    "UTM_E": 296503.8,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM757",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8255.56,
-    "GAUSS_X": 1970422,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.078,
-    "UTM_CM": 27,
-    "UTM_N": 8029322.113,
-    "UTM_E": 296272.163,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM756",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8369.28,
-    "GAUSS_X": 1970440,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.079,
-    "UTM_CM": 27,
-    "UTM_N": 8029304.957,
-    "UTM_E": 296386.086,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM755",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8498.33,
-    "GAUSS_X": 1970281,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8029466.124,
-    "UTM_E": 296513.436,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM754",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8715.1,
-    "GAUSS_X": 1969967,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.082,
-    "UTM_CM": 27,
-    "UTM_N": 8029781.667,
-    "UTM_E": 296726.871,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM778",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9508.37,
-    "GAUSS_X": 1969463,
-    "LAT_WGS84": -17.808,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8030294.145,
-    "UTM_E": 297514.799,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM752",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8981.92,
-    "GAUSS_X": 1969705,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8030046.821,
-    "UTM_E": 296990.903,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM761",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8472.26,
-    "GAUSS_X": 1969914,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8029831.926,
-    "UTM_E": 296483.454,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM750",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9069.28,
-    "GAUSS_X": 1969699,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.086,
-    "UTM_CM": 27,
-    "UTM_N": 8030053.854,
-    "UTM_E": 297078.203,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM75",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5346.27,
-    "GAUSS_X": 1972115,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8027597.979,
-    "UTM_E": 293380.786,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM749",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9504.44,
-    "GAUSS_X": 1969200,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8030557.876,
-    "UTM_E": 297508.052,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM748",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9420.91,
-    "GAUSS_X": 1969373,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 31.089,
-    "UTM_CM": 27,
-    "UTM_N": 8030383.196,
-    "UTM_E": 297426.373,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM747",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6849.61,
-    "GAUSS_X": 1970592,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.065,
-    "UTM_CM": 27,
-    "UTM_N": 8029137.46,
-    "UTM_E": 294867.943,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM746",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7003.24,
-    "GAUSS_X": 1970363,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.066,
-    "UTM_CM": 27,
-    "UTM_N": 8029367.776,
-    "UTM_E": 295019.139,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM745",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7365.31,
-    "GAUSS_X": 1970052,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.069,
-    "UTM_CM": 27,
-    "UTM_N": 8029682.533,
-    "UTM_E": 295377.91,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM753",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8403.1,
-    "GAUSS_X": 1969584,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.079,
-    "UTM_CM": 27,
-    "UTM_N": 8030161.775,
-    "UTM_E": 296410.759,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM768",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7861.71,
-    "GAUSS_X": 1970461,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.074,
-    "UTM_CM": 27,
-    "UTM_N": 8029278.813,
-    "UTM_E": 295878.709,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM407",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2888.55,
-    "GAUSS_X": 1970436,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8029251.086,
-    "UTM_E": 290904.927,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM775",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8810.84,
-    "GAUSS_X": 1970050,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.083,
-    "UTM_CM": 27,
-    "UTM_N": 8029700.495,
-    "UTM_E": 296823.494,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM774",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8922.56,
-    "GAUSS_X": 1970101,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8029650.706,
-    "UTM_E": 296935.765,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM773",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8689.87,
-    "GAUSS_X": 1970418,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.082,
-    "UTM_CM": 27,
-    "UTM_N": 8029330.233,
-    "UTM_E": 296706.459,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM772",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8588.29,
-    "GAUSS_X": 1970355,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.081,
-    "UTM_CM": 27,
-    "UTM_N": 8029392.762,
-    "UTM_E": 296604.194,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM771",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8130.51,
-    "GAUSS_X": 1970393,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.077,
-    "UTM_CM": 27,
-    "UTM_N": 8029349.718,
-    "UTM_E": 296146.797,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM770",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8062.37,
-    "GAUSS_X": 1970393,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.076,
-    "UTM_CM": 27,
-    "UTM_N": 8029348.68,
-    "UTM_E": 296078.656,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM76",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5382.69,
-    "GAUSS_X": 1972107,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8027606.539,
-    "UTM_E": 293417.121,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM769",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7968.94,
-    "GAUSS_X": 1970329,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.075,
-    "UTM_CM": 27,
-    "UTM_N": 8029412.506,
-    "UTM_E": 295984.529,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM760",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9292.33,
-    "GAUSS_X": 1970757,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8028998.504,
-    "UTM_E": 297312.564,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM767",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7707.24,
-    "GAUSS_X": 1970325,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.073,
-    "UTM_CM": 27,
-    "UTM_N": 8029412.72,
-    "UTM_E": 295722.781,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM766",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7768.01,
-    "GAUSS_X": 1970133,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 31.073,
-    "UTM_CM": 27,
-    "UTM_N": 8029605.38,
-    "UTM_E": 295781.504,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM765",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7784.06,
-    "GAUSS_X": 1969993,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.073,
-    "UTM_CM": 27,
-    "UTM_N": 8029746.36,
-    "UTM_E": 295796.05,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM764",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7968.54,
-    "GAUSS_X": 1970023,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 31.075,
-    "UTM_CM": 27,
-    "UTM_N": 8029717.639,
-    "UTM_E": 295980.869,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM763",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8031.73,
-    "GAUSS_X": 1969768,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 31.076,
-    "UTM_CM": 27,
-    "UTM_N": 8029973.338,
-    "UTM_E": 296041.339,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM762",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8354.28,
-    "GAUSS_X": 1969872,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 31.079,
-    "UTM_CM": 27,
-    "UTM_N": 8029873.258,
-    "UTM_E": 296365.012,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM777",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9347.82,
-    "GAUSS_X": 1969605,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8030150.384,
-    "UTM_E": 297355.758,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM77",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5517.32,
-    "GAUSS_X": 1972073,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8027642.161,
-    "UTM_E": 293551.395,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2332",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22017,
-    "GAUSS_X": 1972970,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.208,
-    "UTM_CM": 27,
-    "UTM_N": 8026921.14,
-    "UTM_E": 310061.115,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM236",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12726.3,
-    "GAUSS_X": 1968724,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8031068.253,
-    "UTM_E": 300724.951,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2340",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20866.2,
-    "GAUSS_X": 1972344,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.197,
-    "UTM_CM": 27,
-    "UTM_N": 8027534.664,
-    "UTM_E": 308903.658,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2339",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20766.1,
-    "GAUSS_X": 1972526,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.196,
-    "UTM_CM": 27,
-    "UTM_N": 8027352.115,
-    "UTM_E": 308805.47,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2338",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20688.2,
-    "GAUSS_X": 1972660,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.195,
-    "UTM_CM": 27,
-    "UTM_N": 8027217.353,
-    "UTM_E": 308729.033,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2336",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20782.5,
-    "GAUSS_X": 1972689,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.196,
-    "UTM_CM": 27,
-    "UTM_N": 8027189.172,
-    "UTM_E": 308823.604,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2335",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21459,
-    "GAUSS_X": 1972868,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.202,
-    "UTM_CM": 27,
-    "UTM_N": 8027016.999,
-    "UTM_E": 309501.985,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2343",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20680.3,
-    "GAUSS_X": 1971664,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.195,
-    "UTM_CM": 27,
-    "UTM_N": 8028212.959,
-    "UTM_E": 308710.487,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2333",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21866.1,
-    "GAUSS_X": 1973007,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.206,
-    "UTM_CM": 27,
-    "UTM_N": 8026882.476,
-    "UTM_E": 309910.564,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2344",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20336.6,
-    "GAUSS_X": 1971428,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.192,
-    "UTM_CM": 27,
-    "UTM_N": 8028445.632,
-    "UTM_E": 308364.204,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2331",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21967,
-    "GAUSS_X": 1972743,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.207,
-    "UTM_CM": 27,
-    "UTM_N": 8027147.891,
-    "UTM_E": 310008.685,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2330",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21801.4,
-    "GAUSS_X": 1972781,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.206,
-    "UTM_CM": 27,
-    "UTM_N": 8027107.9,
-    "UTM_E": 309843.477,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2329",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21731.1,
-    "GAUSS_X": 1972802,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.205,
-    "UTM_CM": 27,
-    "UTM_N": 8027086.189,
-    "UTM_E": 309773.412,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2328",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21712.5,
-    "GAUSS_X": 1972711,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.205,
-    "UTM_CM": 27,
-    "UTM_N": 8027176.578,
-    "UTM_E": 309753.823,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2327",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21669.1,
-    "GAUSS_X": 1972451,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.204,
-    "UTM_CM": 27,
-    "UTM_N": 8027436.771,
-    "UTM_E": 309707.686,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2326",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21697.3,
-    "GAUSS_X": 1972550,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.205,
-    "UTM_CM": 27,
-    "UTM_N": 8027338.033,
-    "UTM_E": 309736.875,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2325",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21879.7,
-    "GAUSS_X": 1972496,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.206,
-    "UTM_CM": 27,
-    "UTM_N": 8027393.893,
-    "UTM_E": 309918.736,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2334",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21427.5,
-    "GAUSS_X": 1972791,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.202,
-    "UTM_CM": 27,
-    "UTM_N": 8027094.091,
-    "UTM_E": 309469.647,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2351",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19834.9,
-    "GAUSS_X": 1972590,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.187,
-    "UTM_CM": 27,
-    "UTM_N": 8027277.897,
-    "UTM_E": 307874.945,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM229",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5185.1,
-    "GAUSS_X": 1971471,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8028240.341,
-    "UTM_E": 293212.719,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2358",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20543,
-    "GAUSS_X": 1972680,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.194,
-    "UTM_CM": 27,
-    "UTM_N": 8027195.39,
-    "UTM_E": 308584.003,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2357",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20596.6,
-    "GAUSS_X": 1972612,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.194,
-    "UTM_CM": 27,
-    "UTM_N": 8027264.032,
-    "UTM_E": 308636.844,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2356",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20366.3,
-    "GAUSS_X": 1972536,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.192,
-    "UTM_CM": 27,
-    "UTM_N": 8027337.36,
-    "UTM_E": 308405.826,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2355",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20221,
-    "GAUSS_X": 1972531,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.191,
-    "UTM_CM": 27,
-    "UTM_N": 8027341.255,
-    "UTM_E": 308260.419,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2354",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20069.7,
-    "GAUSS_X": 1972637,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.189,
-    "UTM_CM": 27,
-    "UTM_N": 8027232.998,
-    "UTM_E": 308110.24,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2341",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20881.1,
-    "GAUSS_X": 1972079,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.197,
-    "UTM_CM": 27,
-    "UTM_N": 8027799.929,
-    "UTM_E": 308915.663,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2352",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19815.9,
-    "GAUSS_X": 1972720,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.187,
-    "UTM_CM": 27,
-    "UTM_N": 8027147.624,
-    "UTM_E": 307857.336,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2322",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22134.2,
-    "GAUSS_X": 1972483,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.209,
-    "UTM_CM": 27,
-    "UTM_N": 8027409.194,
-    "UTM_E": 310173.047,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2350",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19851.7,
-    "GAUSS_X": 1972460,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.187,
-    "UTM_CM": 27,
-    "UTM_N": 8027408.285,
-    "UTM_E": 307890.322,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM235",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12455,
-    "GAUSS_X": 1968641,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8031148.45,
-    "UTM_E": 300452.745,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2349",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19774.9,
-    "GAUSS_X": 1972254,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.187,
-    "UTM_CM": 27,
-    "UTM_N": 8027612.833,
-    "UTM_E": 307811.386,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2348",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19875.9,
-    "GAUSS_X": 1971952,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.187,
-    "UTM_CM": 27,
-    "UTM_N": 8027915.921,
-    "UTM_E": 307909.117,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2347",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19959.4,
-    "GAUSS_X": 1971755,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.188,
-    "UTM_CM": 27,
-    "UTM_N": 8028114.023,
-    "UTM_E": 307990.498,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2346",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20039.2,
-    "GAUSS_X": 1971598,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.189,
-    "UTM_CM": 27,
-    "UTM_N": 8028271.565,
-    "UTM_E": 308068.693,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2345",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20174.1,
-    "GAUSS_X": 1971515,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.19,
-    "UTM_CM": 27,
-    "UTM_N": 8028356.907,
-    "UTM_E": 308202.685,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2353",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19886.8,
-    "GAUSS_X": 1972811,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.188,
-    "UTM_CM": 27,
-    "UTM_N": 8027057.194,
-    "UTM_E": 307929.271,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2297",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22221.9,
-    "GAUSS_X": 1972706,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.21,
-    "UTM_CM": 27,
-    "UTM_N": 8027187.267,
-    "UTM_E": 310263.179,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2303",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22014.5,
-    "GAUSS_X": 1973314,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.208,
-    "UTM_CM": 27,
-    "UTM_N": 8026577.449,
-    "UTM_E": 310062.292,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2302",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21339.8,
-    "GAUSS_X": 1972585,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.201,
-    "UTM_CM": 27,
-    "UTM_N": 8027299.341,
-    "UTM_E": 309379.813,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2301",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22292.5,
-    "GAUSS_X": 1973175,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.21,
-    "UTM_CM": 27,
-    "UTM_N": 8026719.01,
-    "UTM_E": 310338.804,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2300",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22455.9,
-    "GAUSS_X": 1972952,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.212,
-    "UTM_CM": 27,
-    "UTM_N": 8026943.794,
-    "UTM_E": 310499.775,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM230",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4247.98,
-    "GAUSS_X": 1970498,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8029203.307,
-    "UTM_E": 292265.131,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM23",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6219.84,
-    "GAUSS_X": 1971216,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 31.059,
-    "UTM_CM": 27,
-    "UTM_N": 8028506.17,
-    "UTM_E": 294244.806,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2324",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21938.3,
-    "GAUSS_X": 1972664,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.207,
-    "UTM_CM": 27,
-    "UTM_N": 8027226.062,
-    "UTM_E": 309979.086,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2298",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22189,
-    "GAUSS_X": 1972771,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.209,
-    "UTM_CM": 27,
-    "UTM_N": 8027121.826,
-    "UTM_E": 310230.985,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2306",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21558.8,
-    "GAUSS_X": 1973346,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.203,
-    "UTM_CM": 27,
-    "UTM_N": 8026539.984,
-    "UTM_E": 309606.948,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2296",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22408.4,
-    "GAUSS_X": 1972719,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.211,
-    "UTM_CM": 27,
-    "UTM_N": 8027175.951,
-    "UTM_E": 310449.778,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2295",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22360,
-    "GAUSS_X": 1972503,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.211,
-    "UTM_CM": 27,
-    "UTM_N": 8027391.84,
-    "UTM_E": 310399.114,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2294",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22184,
-    "GAUSS_X": 1972393,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.209,
-    "UTM_CM": 27,
-    "UTM_N": 8027499.546,
-    "UTM_E": 310221.955,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2293",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22926.6,
-    "GAUSS_X": 1972520,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.216,
-    "UTM_CM": 27,
-    "UTM_N": 8027381.049,
-    "UTM_E": 310965.873,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2292",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22855.7,
-    "GAUSS_X": 1972133,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.216,
-    "UTM_CM": 27,
-    "UTM_N": 8027767.023,
-    "UTM_E": 310890.829,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2291",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22631.7,
-    "GAUSS_X": 1971774,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.213,
-    "UTM_CM": 27,
-    "UTM_N": 8028123.37,
-    "UTM_E": 310662.978,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2440",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9209.07,
-    "GAUSS_X": 1971452,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.913,
-    "UTM_CM": 27,
-    "UTM_N": 8028104.904,
-    "UTM_E": 278816.783,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2299",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22240,
-    "GAUSS_X": 1972989,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.21,
-    "UTM_CM": 27,
-    "UTM_N": 8026904.645,
-    "UTM_E": 310284.283,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2313",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21372.1,
-    "GAUSS_X": 1972794,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.202,
-    "UTM_CM": 27,
-    "UTM_N": 8027090.329,
-    "UTM_E": 309414.362,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2360",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20322.4,
-    "GAUSS_X": 1972681,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.192,
-    "UTM_CM": 27,
-    "UTM_N": 8027191.871,
-    "UTM_E": 308363.447,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2321",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22004.7,
-    "GAUSS_X": 1972394,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.208,
-    "UTM_CM": 27,
-    "UTM_N": 8027497.298,
-    "UTM_E": 310042.632,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2320",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21682.6,
-    "GAUSS_X": 1972360,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.205,
-    "UTM_CM": 27,
-    "UTM_N": 8027527.233,
-    "UTM_E": 309720.19,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2319",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21458.7,
-    "GAUSS_X": 1972345,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.202,
-    "UTM_CM": 27,
-    "UTM_N": 8027539.929,
-    "UTM_E": 309496.112,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2318",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21413.1,
-    "GAUSS_X": 1972403,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.202,
-    "UTM_CM": 27,
-    "UTM_N": 8027481.413,
-    "UTM_E": 309451.183,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2317",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20992.5,
-    "GAUSS_X": 1972219,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.198,
-    "UTM_CM": 27,
-    "UTM_N": 8027660.733,
-    "UTM_E": 309028.613,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2316",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21209.4,
-    "GAUSS_X": 1972311,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.2,
-    "UTM_CM": 27,
-    "UTM_N": 8027571.493,
-    "UTM_E": 309246.48,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2304",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21960.6,
-    "GAUSS_X": 1973305,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.207,
-    "UTM_CM": 27,
-    "UTM_N": 8026585.132,
-    "UTM_E": 310008.284,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2314",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21324,
-    "GAUSS_X": 1972636,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.201,
-    "UTM_CM": 27,
-    "UTM_N": 8027247.493,
-    "UTM_E": 309364.556,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2305",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21855,
-    "GAUSS_X": 1973508,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.206,
-    "UTM_CM": 27,
-    "UTM_N": 8026381.455,
-    "UTM_E": 309904.843,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2312",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21084.1,
-    "GAUSS_X": 1972813,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.199,
-    "UTM_CM": 27,
-    "UTM_N": 8027067.919,
-    "UTM_E": 309126.562,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2311",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21077.4,
-    "GAUSS_X": 1972893,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.199,
-    "UTM_CM": 27,
-    "UTM_N": 8026988.379,
-    "UTM_E": 309120.702,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2310",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21359.5,
-    "GAUSS_X": 1973050,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.201,
-    "UTM_CM": 27,
-    "UTM_N": 8026833.748,
-    "UTM_E": 309404.445,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2309",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21770.1,
-    "GAUSS_X": 1972951,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.205,
-    "UTM_CM": 27,
-    "UTM_N": 8026937.699,
-    "UTM_E": 309814.034,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2308",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21662,
-    "GAUSS_X": 1973158,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.204,
-    "UTM_CM": 27,
-    "UTM_N": 8026729.285,
-    "UTM_E": 309708.083,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2307",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21639.8,
-    "GAUSS_X": 1973198,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.204,
-    "UTM_CM": 27,
-    "UTM_N": 8026689.288,
-    "UTM_E": 309686.328,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2323",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22065.2,
-    "GAUSS_X": 1972586,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.208,
-    "UTM_CM": 27,
-    "UTM_N": 8027305.718,
-    "UTM_E": 310105.187,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2315",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -21130.1,
-    "GAUSS_X": 1972500,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.199,
-    "UTM_CM": 27,
-    "UTM_N": 8027382.067,
-    "UTM_E": 309169.147,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2414",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7546.63,
-    "GAUSS_X": 1971602,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8027972.828,
-    "UTM_E": 280481.061,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2359",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20464.4,
-    "GAUSS_X": 1972682,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 31.193,
-    "UTM_CM": 27,
-    "UTM_N": 8027192.44,
-    "UTM_E": 308505.466,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2421",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8183,
-    "GAUSS_X": 1971569,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 30.923,
-    "UTM_CM": 27,
-    "UTM_N": 8027999.008,
-    "UTM_E": 279844.25,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2420",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8752.89,
-    "GAUSS_X": 1971233,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 30.917,
-    "UTM_CM": 27,
-    "UTM_N": 8028328.833,
-    "UTM_E": 279270.687,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2419",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9386.12,
-    "GAUSS_X": 1971084,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 30.911,
-    "UTM_CM": 27,
-    "UTM_N": 8028471.115,
-    "UTM_E": 278635.772,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2418",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8759.12,
-    "GAUSS_X": 1970733,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.917,
-    "UTM_CM": 27,
-    "UTM_N": 8028828.769,
-    "UTM_E": 279259.113,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2417",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6182.56,
-    "GAUSS_X": 1971170,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 30.942,
-    "UTM_CM": 27,
-    "UTM_N": 8028419.209,
-    "UTM_E": 281840.699,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2423",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7216.79,
-    "GAUSS_X": 1971042,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8028536.471,
-    "UTM_E": 280804.959,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2415",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6801.33,
-    "GAUSS_X": 1970940,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8028643.466,
-    "UTM_E": 281219.379,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2424",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6925.97,
-    "GAUSS_X": 1971318,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 30.935,
-    "UTM_CM": 27,
-    "UTM_N": 8028264.202,
-    "UTM_E": 281098.762,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2413",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8282,
-    "GAUSS_X": 1972260,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8027307.362,
-    "UTM_E": 279752.62,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2412",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8943.11,
-    "GAUSS_X": 1972165,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 30.916,
-    "UTM_CM": 27,
-    "UTM_N": 8027394.924,
-    "UTM_E": 279090.403,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2411",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8615.72,
-    "GAUSS_X": 1972600,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.919,
-    "UTM_CM": 27,
-    "UTM_N": 8026963.483,
-    "UTM_E": 279422.492,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2410",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8988.21,
-    "GAUSS_X": 1972589,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.915,
-    "UTM_CM": 27,
-    "UTM_N": 8026970.82,
-    "UTM_E": 279049.827,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM24",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6390.53,
-    "GAUSS_X": 1971173,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 31.06,
-    "UTM_CM": 27,
-    "UTM_N": 8028550.637,
-    "UTM_E": 294415.052,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2399",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19836.3,
-    "GAUSS_X": 1972841,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.187,
-    "UTM_CM": 27,
-    "UTM_N": 8027026.363,
-    "UTM_E": 307879.015,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2398",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20169.7,
-    "GAUSS_X": 1972184,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.19,
-    "UTM_CM": 27,
-    "UTM_N": 8027687.485,
-    "UTM_E": 308205.451,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2416",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6574.37,
-    "GAUSS_X": 1971073,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 30.938,
-    "UTM_CM": 27,
-    "UTM_N": 8028512.834,
-    "UTM_E": 281447.792,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2432",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6348.82,
-    "GAUSS_X": 1971993,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8027594.964,
-    "UTM_E": 281683.21,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM41",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4302.89,
-    "GAUSS_X": 1972724,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8026977.415,
-    "UTM_E": 292343.847,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2439",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6851.8,
-    "GAUSS_X": 1971974,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.935,
-    "UTM_CM": 27,
-    "UTM_N": 8027608.867,
-    "UTM_E": 281179.957,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2438",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6069.11,
-    "GAUSS_X": 1972009,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.943,
-    "UTM_CM": 27,
-    "UTM_N": 8027581.753,
-    "UTM_E": 281963.13,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2437",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7054.1,
-    "GAUSS_X": 1971777,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8027802.94,
-    "UTM_E": 280975.531,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2436",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7313.15,
-    "GAUSS_X": 1972074,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8027503.49,
-    "UTM_E": 280719.618,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2435",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7542.25,
-    "GAUSS_X": 1972066,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8027509.131,
-    "UTM_E": 280490.4,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2422",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7915.54,
-    "GAUSS_X": 1971525,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8028045.854,
-    "UTM_E": 280111.277,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2433",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7927.19,
-    "GAUSS_X": 1972009,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8027561.822,
-    "UTM_E": 280104.799,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2395",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20531.3,
-    "GAUSS_X": 1972341,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.194,
-    "UTM_CM": 27,
-    "UTM_N": 8027533.982,
-    "UTM_E": 308568.731,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2431",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8102.64,
-    "GAUSS_X": 1972010,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.924,
-    "UTM_CM": 27,
-    "UTM_N": 8027559.125,
-    "UTM_E": 279929.333,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2430",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7229.89,
-    "GAUSS_X": 1971615,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8027963.103,
-    "UTM_E": 280797.985,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2429",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9448.93,
-    "GAUSS_X": 1971460,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.911,
-    "UTM_CM": 27,
-    "UTM_N": 8028094.298,
-    "UTM_E": 278576.973,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2428",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8413.91,
-    "GAUSS_X": 1971237,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 30.921,
-    "UTM_CM": 27,
-    "UTM_N": 8028328.426,
-    "UTM_E": 279609.759,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2427",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6135.02,
-    "GAUSS_X": 1971527,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 30.942,
-    "UTM_CM": 27,
-    "UTM_N": 8028063.251,
-    "UTM_E": 281892.055,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2426",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6354.75,
-    "GAUSS_X": 1971563,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8028025.297,
-    "UTM_E": 281672.677,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2425",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6549.79,
-    "GAUSS_X": 1971614,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 30.938,
-    "UTM_CM": 27,
-    "UTM_N": 8027972.085,
-    "UTM_E": 281478.158,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2434",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7766.36,
-    "GAUSS_X": 1972007,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8027565.182,
-    "UTM_E": 280265.634,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2369",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20556.3,
-    "GAUSS_X": 1972793,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.194,
-    "UTM_CM": 27,
-    "UTM_N": 8027082.164,
-    "UTM_E": 308598.555,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2376",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19689.6,
-    "GAUSS_X": 1973424,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.186,
-    "UTM_CM": 27,
-    "UTM_N": 8026442.587,
-    "UTM_E": 307738.564,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2375",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19850.3,
-    "GAUSS_X": 1973292,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.187,
-    "UTM_CM": 27,
-    "UTM_N": 8026576.045,
-    "UTM_E": 307897.824,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2374",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19898.7,
-    "GAUSS_X": 1973171,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.188,
-    "UTM_CM": 27,
-    "UTM_N": 8026697.793,
-    "UTM_E": 307945.017,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2373",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20017.1,
-    "GAUSS_X": 1973046,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.189,
-    "UTM_CM": 27,
-    "UTM_N": 8026823.748,
-    "UTM_E": 308062.032,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2372",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20671.8,
-    "GAUSS_X": 1973287,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.195,
-    "UTM_CM": 27,
-    "UTM_N": 8026589.424,
-    "UTM_E": 308719.348,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2371",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20544.1,
-    "GAUSS_X": 1972964,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.194,
-    "UTM_CM": 27,
-    "UTM_N": 8026911.625,
-    "UTM_E": 308588.148,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2397",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20166.2,
-    "GAUSS_X": 1972294,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.19,
-    "UTM_CM": 27,
-    "UTM_N": 8027576.927,
-    "UTM_E": 308203.073,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM237",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12611.1,
-    "GAUSS_X": 1968687,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8031103.195,
-    "UTM_E": 300609.411,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2379",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19427.3,
-    "GAUSS_X": 1973282,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.183,
-    "UTM_CM": 27,
-    "UTM_N": 8026581.48,
-    "UTM_E": 307474.749,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2368",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20728.9,
-    "GAUSS_X": 1972807,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.196,
-    "UTM_CM": 27,
-    "UTM_N": 8027070.44,
-    "UTM_E": 308771.249,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2366",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20941.4,
-    "GAUSS_X": 1972922,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.198,
-    "UTM_CM": 27,
-    "UTM_N": 8026957.614,
-    "UTM_E": 308984.987,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2365",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20753.3,
-    "GAUSS_X": 1973121,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.196,
-    "UTM_CM": 27,
-    "UTM_N": 8026756.384,
-    "UTM_E": 308799.061,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2364",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20608.6,
-    "GAUSS_X": 1973327,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.194,
-    "UTM_CM": 27,
-    "UTM_N": 8026549.019,
-    "UTM_E": 308656.564,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2363",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20410.2,
-    "GAUSS_X": 1973248,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.193,
-    "UTM_CM": 27,
-    "UTM_N": 8026625.945,
-    "UTM_E": 308457.31,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2362",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20181.7,
-    "GAUSS_X": 1973141,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.19,
-    "UTM_CM": 27,
-    "UTM_N": 8026730.41,
-    "UTM_E": 308227.658,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2361",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20286.5,
-    "GAUSS_X": 1972893,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.191,
-    "UTM_CM": 27,
-    "UTM_N": 8026979.178,
-    "UTM_E": 308329.758,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2370",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20456.3,
-    "GAUSS_X": 1972787,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.193,
-    "UTM_CM": 27,
-    "UTM_N": 8027087.404,
-    "UTM_E": 308498.429,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2386",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19611.6,
-    "GAUSS_X": 1972083,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.185,
-    "UTM_CM": 27,
-    "UTM_N": 8027782.306,
-    "UTM_E": 307646.227,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2289",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22731.7,
-    "GAUSS_X": 1972154,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.214,
-    "UTM_CM": 27,
-    "UTM_N": 8027745.187,
-    "UTM_E": 310767.061,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2394",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20665.7,
-    "GAUSS_X": 1972178,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.195,
-    "UTM_CM": 27,
-    "UTM_N": 8027698.418,
-    "UTM_E": 308701.356,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2393",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20641.8,
-    "GAUSS_X": 1971725,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.195,
-    "UTM_CM": 27,
-    "UTM_N": 8028151.338,
-    "UTM_E": 308672.642,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2392",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20662.2,
-    "GAUSS_X": 1971978,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.195,
-    "UTM_CM": 27,
-    "UTM_N": 8027898.968,
-    "UTM_E": 308695.722,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2391",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20487.6,
-    "GAUSS_X": 1971967,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.193,
-    "UTM_CM": 27,
-    "UTM_N": 8027907.732,
-    "UTM_E": 308521.03,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2390",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20297.5,
-    "GAUSS_X": 1971891,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.191,
-    "UTM_CM": 27,
-    "UTM_N": 8027981.666,
-    "UTM_E": 308330.049,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2389",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20190.8,
-    "GAUSS_X": 1971847,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.19,
-    "UTM_CM": 27,
-    "UTM_N": 8028024.827,
-    "UTM_E": 308222.906,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2377",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19362.8,
-    "GAUSS_X": 1973466,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.183,
-    "UTM_CM": 27,
-    "UTM_N": 8026397.091,
-    "UTM_E": 307412.235,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2387",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19702.6,
-    "GAUSS_X": 1971873,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.186,
-    "UTM_CM": 27,
-    "UTM_N": 8027993.418,
-    "UTM_E": 307734.999,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2378",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19359.9,
-    "GAUSS_X": 1973335,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.183,
-    "UTM_CM": 27,
-    "UTM_N": 8026528.099,
-    "UTM_E": 307407.923,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2385",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19430.9,
-    "GAUSS_X": 1972517,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.183,
-    "UTM_CM": 27,
-    "UTM_N": 8027346.796,
-    "UTM_E": 307470.204,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2384",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19349.9,
-    "GAUSS_X": 1972713,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.183,
-    "UTM_CM": 27,
-    "UTM_N": 8027150.1,
-    "UTM_E": 307391.278,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2383",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19216.9,
-    "GAUSS_X": 1973037,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.181,
-    "UTM_CM": 27,
-    "UTM_N": 8026824.218,
-    "UTM_E": 307261.709,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2382",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19631.1,
-    "GAUSS_X": 1973037,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.185,
-    "UTM_CM": 27,
-    "UTM_N": 8026828.969,
-    "UTM_E": 307675.964,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2381",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19424.9,
-    "GAUSS_X": 1973216,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.183,
-    "UTM_CM": 27,
-    "UTM_N": 8026646.944,
-    "UTM_E": 307471.639,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2380",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19385.4,
-    "GAUSS_X": 1973239,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.183,
-    "UTM_CM": 27,
-    "UTM_N": 8026624.471,
-    "UTM_E": 307432.375,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2396",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -20353.4,
-    "GAUSS_X": 1972298,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.192,
-    "UTM_CM": 27,
-    "UTM_N": 8027575.08,
-    "UTM_E": 308390.382,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2388",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -19634.8,
-    "GAUSS_X": 1972553,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.185,
-    "UTM_CM": 27,
-    "UTM_N": 8027312.917,
-    "UTM_E": 307674.488,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2199",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2695.38,
-    "GAUSS_X": 1971196,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 30.975,
-    "UTM_CM": 27,
-    "UTM_N": 8028430.824,
-    "UTM_E": 285328.578,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2222",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4951.15,
-    "GAUSS_X": 1971915,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 30.953,
-    "UTM_CM": 27,
-    "UTM_N": 8027687.52,
-    "UTM_E": 283080.229,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2204",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4494.01,
-    "GAUSS_X": 1973039,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 30.958,
-    "UTM_CM": 27,
-    "UTM_N": 8026568.392,
-    "UTM_E": 283549.447,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2203",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4167.26,
-    "GAUSS_X": 1972658,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.961,
-    "UTM_CM": 27,
-    "UTM_N": 8026952.874,
-    "UTM_E": 283872.161,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2202",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3806.6,
-    "GAUSS_X": 1972156,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 30.964,
-    "UTM_CM": 27,
-    "UTM_N": 8027459.031,
-    "UTM_E": 284227.492,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2201",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3402.71,
-    "GAUSS_X": 1971583,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 30.968,
-    "UTM_CM": 27,
-    "UTM_N": 8028036.438,
-    "UTM_E": 284625.302,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2200",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3218.31,
-    "GAUSS_X": 1971448,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.97,
-    "UTM_CM": 27,
-    "UTM_N": 8028173.595,
-    "UTM_E": 284808.278,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2206",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6004.13,
-    "GAUSS_X": 1973364,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 30.943,
-    "UTM_CM": 27,
-    "UTM_N": 8026227.272,
-    "UTM_E": 282042.614,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM22",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6042.45,
-    "GAUSS_X": 1971260,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.057,
-    "UTM_CM": 27,
-    "UTM_N": 8028460.431,
-    "UTM_E": 294067.873,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2207",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6494.91,
-    "GAUSS_X": 1973455,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 30.939,
-    "UTM_CM": 27,
-    "UTM_N": 8026130.798,
-    "UTM_E": 281552.746,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2198",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3098.44,
-    "GAUSS_X": 1971105,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 30.971,
-    "UTM_CM": 27,
-    "UTM_N": 8028518.086,
-    "UTM_E": 284924.493,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2197",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3556.24,
-    "GAUSS_X": 1971019,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.966,
-    "UTM_CM": 27,
-    "UTM_N": 8028599.092,
-    "UTM_E": 284465.722,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2196",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3136.95,
-    "GAUSS_X": 1969564,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 30.97,
-    "UTM_CM": 27,
-    "UTM_N": 8030058.711,
-    "UTM_E": 284869.514,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2195",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3527.07,
-    "GAUSS_X": 1970024,
-    "LAT_WGS84": -17.813,
-    "LON_WGS84": 30.967,
-    "UTM_CM": 27,
-    "UTM_N": 8029594.59,
-    "UTM_E": 284484.262,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2194",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3952.46,
-    "GAUSS_X": 1970488,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 30.963,
-    "UTM_CM": 27,
-    "UTM_N": 8029125.41,
-    "UTM_E": 284063.785,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2193",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4125.41,
-    "GAUSS_X": 1970979,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.961,
-    "UTM_CM": 27,
-    "UTM_N": 8028632.803,
-    "UTM_E": 283896.059,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2192",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4757.05,
-    "GAUSS_X": 1970923,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 30.955,
-    "UTM_CM": 27,
-    "UTM_N": 8028682.329,
-    "UTM_E": 283263.741,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM220",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5917.73,
-    "GAUSS_X": 1966320,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8033399.172,
-    "UTM_E": 293890.407,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2214",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8109.16,
-    "GAUSS_X": 1971922,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 30.923,
-    "UTM_CM": 27,
-    "UTM_N": 8027647.408,
-    "UTM_E": 279921.868,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2290",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22706.4,
-    "GAUSS_X": 1972022,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.214,
-    "UTM_CM": 27,
-    "UTM_N": 8027876.074,
-    "UTM_E": 310740.329,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2220",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5490.18,
-    "GAUSS_X": 1972590,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.948,
-    "UTM_CM": 27,
-    "UTM_N": 8027006.47,
-    "UTM_E": 282548.353,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM222",
-    "TOPO": "U.C.R.N",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5738.7,
-    "GAUSS_X": 1966306,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.054,
-    "UTM_CM": 27,
-    "UTM_N": 8033411.844,
-    "UTM_E": 293711.21,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2219",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5521.9,
-    "GAUSS_X": 1972367,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 30.948,
-    "UTM_CM": 27,
-    "UTM_N": 8027229.149,
-    "UTM_E": 282514.243,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2218",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5591.43,
-    "GAUSS_X": 1971798,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 30.947,
-    "UTM_CM": 27,
-    "UTM_N": 8027797.588,
-    "UTM_E": 282438.618,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2217",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5655.76,
-    "GAUSS_X": 1971399,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.947,
-    "UTM_CM": 27,
-    "UTM_N": 8028196.412,
-    "UTM_E": 282370.009,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2205",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4635.5,
-    "GAUSS_X": 1973497,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 30.956,
-    "UTM_CM": 27,
-    "UTM_N": 8026109.062,
-    "UTM_E": 283412.838,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2215",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8233.51,
-    "GAUSS_X": 1971205,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8028363.22,
-    "UTM_E": 279789.833,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2189",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6293.11,
-    "GAUSS_X": 1970728,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.941,
-    "UTM_CM": 27,
-    "UTM_N": 8028860.616,
-    "UTM_E": 281725.404,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2213",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7999.5,
-    "GAUSS_X": 1972636,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8026934.17,
-    "UTM_E": 280039.184,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2212",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8316.78,
-    "GAUSS_X": 1973106,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8026460.169,
-    "UTM_E": 279726.893,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2211",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8666.13,
-    "GAUSS_X": 1973711,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 30.918,
-    "UTM_CM": 27,
-    "UTM_N": 8025851.874,
-    "UTM_E": 279383.962,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2210",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8174.29,
-    "GAUSS_X": 1973646,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 30.923,
-    "UTM_CM": 27,
-    "UTM_N": 8025921.718,
-    "UTM_E": 279875.181,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM221",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5604.21,
-    "GAUSS_X": 1966289,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8033426.681,
-    "UTM_E": 293576.537,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2209",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7658.99,
-    "GAUSS_X": 1973596,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8025977.41,
-    "UTM_E": 280390.016,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2208",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7096.64,
-    "GAUSS_X": 1973519,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8026060.659,
-    "UTM_E": 280951.617,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2216",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5597.82,
-    "GAUSS_X": 1971204,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 30.947,
-    "UTM_CM": 27,
-    "UTM_N": 8028391.616,
-    "UTM_E": 282425.876,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2162",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3890.26,
-    "GAUSS_X": 1973645,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 30.963,
-    "UTM_CM": 27,
-    "UTM_N": 8025968.41,
-    "UTM_E": 284159.758,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2170",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4168.67,
-    "GAUSS_X": 1968050,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 30.961,
-    "UTM_CM": 27,
-    "UTM_N": 8031561.204,
-    "UTM_E": 283821.514,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2169",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3481.34,
-    "GAUSS_X": 1968461,
-    "LAT_WGS84": -17.799,
-    "LON_WGS84": 30.967,
-    "UTM_CM": 27,
-    "UTM_N": 8031157.722,
-    "UTM_E": 284513.311,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2168",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3066.02,
-    "GAUSS_X": 1968888,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 30.971,
-    "UTM_CM": 27,
-    "UTM_N": 8030735.016,
-    "UTM_E": 284933.239,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2167",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2773.96,
-    "GAUSS_X": 1969162,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 30.974,
-    "UTM_CM": 27,
-    "UTM_N": 8030464.304,
-    "UTM_E": 285228.256,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2166",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2330.51,
-    "GAUSS_X": 1969544,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 30.978,
-    "UTM_CM": 27,
-    "UTM_N": 8030086.817,
-    "UTM_E": 285675.837,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2165",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1978.44,
-    "GAUSS_X": 1969766,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 30.981,
-    "UTM_CM": 27,
-    "UTM_N": 8029868.614,
-    "UTM_E": 286030.316,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2191",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5358.9,
-    "GAUSS_X": 1970873,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 30.949,
-    "UTM_CM": 27,
-    "UTM_N": 8028725.982,
-    "UTM_E": 282661.28,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2163",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4298.6,
-    "GAUSS_X": 1973770,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 30.959,
-    "UTM_CM": 27,
-    "UTM_N": 8025839.925,
-    "UTM_E": 283752.698,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2173",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4973.1,
-    "GAUSS_X": 1968103,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 30.953,
-    "UTM_CM": 27,
-    "UTM_N": 8031500.061,
-    "UTM_E": 283017.546,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2161",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3553.29,
-    "GAUSS_X": 1973529,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 30.966,
-    "UTM_CM": 27,
-    "UTM_N": 8026088.73,
-    "UTM_E": 284495.519,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2160",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2303.08,
-    "GAUSS_X": 1973106,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 30.978,
-    "UTM_CM": 27,
-    "UTM_N": 8026524.626,
-    "UTM_E": 285741.35,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM216",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12573.8,
-    "GAUSS_X": 1964104,
-    "LAT_WGS84": -17.76,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8035686.128,
-    "UTM_E": 300523.18,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2159",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2985.36,
-    "GAUSS_X": 1972089,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8027534.662,
-    "UTM_E": 285048.112,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM992",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12419,
-    "GAUSS_X": 1978148,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8021640.301,
-    "UTM_E": 300518.489,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2157",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1842.28,
-    "GAUSS_X": 1971366,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 30.983,
-    "UTM_CM": 27,
-    "UTM_N": 8028269.985,
-    "UTM_E": 286183.588,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2155",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1277.44,
-    "GAUSS_X": 1971314,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 30.988,
-    "UTM_CM": 27,
-    "UTM_N": 8028327.899,
-    "UTM_E": 286747.934,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2164",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4470.8,
-    "GAUSS_X": 1973919,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 30.958,
-    "UTM_CM": 27,
-    "UTM_N": 8025688.433,
-    "UTM_E": 283582.079,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2180",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7352.59,
-    "GAUSS_X": 1969503,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8030074.6,
-    "UTM_E": 280652.692,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2223",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4902.59,
-    "GAUSS_X": 1971428,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.954,
-    "UTM_CM": 27,
-    "UTM_N": 8028175.78,
-    "UTM_E": 283123.58,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2188",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6748.12,
-    "GAUSS_X": 1970489,
-    "LAT_WGS84": -17.818,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8029095.085,
-    "UTM_E": 281267.776,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2187",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7093.06,
-    "GAUSS_X": 1970484,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8029096.239,
-    "UTM_E": 280922.738,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2186",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7376.7,
-    "GAUSS_X": 1970625,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 30.93,
-    "UTM_CM": 27,
-    "UTM_N": 8028952.399,
-    "UTM_E": 280640.564,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2185",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7905.52,
-    "GAUSS_X": 1970752,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8028819.459,
-    "UTM_E": 280113.031,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2184",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8290.1,
-    "GAUSS_X": 1970757,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8028810.298,
-    "UTM_E": 279728.451,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2183",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8449.77,
-    "GAUSS_X": 1970341,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 30.92,
-    "UTM_CM": 27,
-    "UTM_N": 8029224.551,
-    "UTM_E": 279564.313,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2171",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4535.65,
-    "GAUSS_X": 1967854,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 30.957,
-    "UTM_CM": 27,
-    "UTM_N": 8031754.121,
-    "UTM_E": 283452.389,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2181",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7638.87,
-    "GAUSS_X": 1969738,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8029836.34,
-    "UTM_E": 280368.884,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2172",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4712.24,
-    "GAUSS_X": 1967758,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 30.956,
-    "UTM_CM": 27,
-    "UTM_N": 8031847.378,
-    "UTM_E": 283274.762,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2179",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7040.34,
-    "GAUSS_X": 1969266,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 30.934,
-    "UTM_CM": 27,
-    "UTM_N": 8030314.408,
-    "UTM_E": 280962.459,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2178",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6775.63,
-    "GAUSS_X": 1969054,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8030529.903,
-    "UTM_E": 281224.934,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2177",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6519.96,
-    "GAUSS_X": 1968869,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 30.938,
-    "UTM_CM": 27,
-    "UTM_N": 8030717.138,
-    "UTM_E": 281478.668,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2176",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6392.24,
-    "GAUSS_X": 1968896,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8030691.998,
-    "UTM_E": 281606.688,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2175",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5836.53,
-    "GAUSS_X": 1968833,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 30.945,
-    "UTM_CM": 27,
-    "UTM_N": 8030760.821,
-    "UTM_E": 282161.799,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2174",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5385.4,
-    "GAUSS_X": 1968622,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 30.949,
-    "UTM_CM": 27,
-    "UTM_N": 8030976.534,
-    "UTM_E": 282610.735,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2190",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6007.46,
-    "GAUSS_X": 1970816,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 30.943,
-    "UTM_CM": 27,
-    "UTM_N": 8028775.507,
-    "UTM_E": 282012.034,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2182",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8050.18,
-    "GAUSS_X": 1970049,
-    "LAT_WGS84": -17.814,
-    "LON_WGS84": 30.924,
-    "UTM_CM": 27,
-    "UTM_N": 8029520.692,
-    "UTM_E": 279960.842,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "tsm2262",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7674.86,
-    "GAUSS_X": 1969077,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8030496.637,
-    "UTM_E": 280325.834,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2221",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5080.83,
-    "GAUSS_X": 1972135,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 30.952,
-    "UTM_CM": 27,
-    "UTM_N": 8027466.566,
-    "UTM_E": 282952.881,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2269",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7746.35,
-    "GAUSS_X": 1969316,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8030257.28,
-    "UTM_E": 280256.881,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2268",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7669.96,
-    "GAUSS_X": 1969309,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8030265.027,
-    "UTM_E": 280333.208,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2267",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7557.7,
-    "GAUSS_X": 1969225,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8030350.678,
-    "UTM_E": 280444.582,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2266",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7448.78,
-    "GAUSS_X": 1969363,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 30.93,
-    "UTM_CM": 27,
-    "UTM_N": 8030213.882,
-    "UTM_E": 280554.99,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2265",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6955.6,
-    "GAUSS_X": 1968942,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 30.934,
-    "UTM_CM": 27,
-    "UTM_N": 8030639.577,
-    "UTM_E": 281043.748,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2271",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7910.84,
-    "GAUSS_X": 1969489,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8030082.409,
-    "UTM_E": 280094.217,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2263",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7364.29,
-    "GAUSS_X": 1968839,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8030738.487,
-    "UTM_E": 280633.9,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2272",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7744.95,
-    "GAUSS_X": 1969584,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8029988.748,
-    "UTM_E": 280261.15,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2261",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7773.44,
-    "GAUSS_X": 1968932,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8030640.635,
-    "UTM_E": 280225.691,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2260",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7733.35,
-    "GAUSS_X": 1968905,
-    "LAT_WGS84": -17.803,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8030668.667,
-    "UTM_E": 280265.492,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM226",
-    "TOPO": "Stortford Parad",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 155.4,
-    "GAUSS_X": 1967453,
-    "LAT_WGS84": -17.79,
-    "LON_WGS84": 30.999,
-    "UTM_CM": 27,
-    "UTM_N": 8032201.358,
-    "UTM_E": 287828.853,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2259",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7856.35,
-    "GAUSS_X": 1968742,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 30.926,
-    "UTM_CM": 27,
-    "UTM_N": 8030830.326,
-    "UTM_E": 280140.735,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2258",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7748.1,
-    "GAUSS_X": 1968526,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8031046.892,
-    "UTM_E": 280246.7,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2257",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7721.66,
-    "GAUSS_X": 1968628,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8030946.02,
-    "UTM_E": 280274.224,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2256",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7590.45,
-    "GAUSS_X": 1968811,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8030763.575,
-    "UTM_E": 280407.415,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2264",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7132.6,
-    "GAUSS_X": 1969130,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8030449.611,
-    "UTM_E": 280868.732,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2280",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8359.56,
-    "GAUSS_X": 1969136,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 30.921,
-    "UTM_CM": 27,
-    "UTM_N": 8030430.647,
-    "UTM_E": 279641.664,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2288",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22520.2,
-    "GAUSS_X": 1972199,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.212,
-    "UTM_CM": 27,
-    "UTM_N": 8027697.517,
-    "UTM_E": 310556.041,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2287",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22490.4,
-    "GAUSS_X": 1972071,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.212,
-    "UTM_CM": 27,
-    "UTM_N": 8027825.446,
-    "UTM_E": 310524.89,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2286",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22441.9,
-    "GAUSS_X": 1971920,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.212,
-    "UTM_CM": 27,
-    "UTM_N": 8027975.494,
-    "UTM_E": 310474.741,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2285",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22380.5,
-    "GAUSS_X": 1971709,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.211,
-    "UTM_CM": 27,
-    "UTM_N": 8028185.894,
-    "UTM_E": 310411.156,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2284",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22317.8,
-    "GAUSS_X": 1971624,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 31.21,
-    "UTM_CM": 27,
-    "UTM_N": 8028270.412,
-    "UTM_E": 310347.467,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2283",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22541.3,
-    "GAUSS_X": 1971436,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.213,
-    "UTM_CM": 27,
-    "UTM_N": 8028460.838,
-    "UTM_E": 310569.002,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2270",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7785.66,
-    "GAUSS_X": 1969291,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8030281.654,
-    "UTM_E": 280217.301,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2281",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22821.2,
-    "GAUSS_X": 1971307,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.215,
-    "UTM_CM": 27,
-    "UTM_N": 8028592.776,
-    "UTM_E": 310847.488,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2253",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7106.67,
-    "GAUSS_X": 1968586,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8030993.792,
-    "UTM_E": 280888.859,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2279",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8477.36,
-    "GAUSS_X": 1969318,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 30.92,
-    "UTM_CM": 27,
-    "UTM_N": 8030247.523,
-    "UTM_E": 279525.789,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2278",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8012.47,
-    "GAUSS_X": 1969153,
-    "LAT_WGS84": -17.805,
-    "LON_WGS84": 30.924,
-    "UTM_CM": 27,
-    "UTM_N": 8030417.061,
-    "UTM_E": 279988.988,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2277",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8106.19,
-    "GAUSS_X": 1969282,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 30.924,
-    "UTM_CM": 27,
-    "UTM_N": 8030287.612,
-    "UTM_E": 279896.626,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2276",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8142.66,
-    "GAUSS_X": 1969343,
-    "LAT_WGS84": -17.807,
-    "LON_WGS84": 30.923,
-    "UTM_CM": 27,
-    "UTM_N": 8030225.964,
-    "UTM_E": 279860.805,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2275",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8274.17,
-    "GAUSS_X": 1969571,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 30.922,
-    "UTM_CM": 27,
-    "UTM_N": 8029996.547,
-    "UTM_E": 279731.711,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2274",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7955.86,
-    "GAUSS_X": 1969776,
-    "LAT_WGS84": -17.811,
-    "LON_WGS84": 30.925,
-    "UTM_CM": 27,
-    "UTM_N": 8029795.038,
-    "UTM_E": 280052.255,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2273",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7867.09,
-    "GAUSS_X": 1969907,
-    "LAT_WGS84": -17.812,
-    "LON_WGS84": 30.926,
-    "UTM_CM": 27,
-    "UTM_N": 8029664.378,
-    "UTM_E": 280142.443,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2282",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -22664.6,
-    "GAUSS_X": 1971349,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.214,
-    "UTM_CM": 27,
-    "UTM_N": 8028549.084,
-    "UTM_E": 310691.391,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM223",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5402.09,
-    "GAUSS_X": 1963654,
-    "LAT_WGS84": -17.756,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8036060.523,
-    "UTM_E": 293346.315,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2236",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11036.54,
-    "GAUSS_X": 1973680,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 30.896,
-    "UTM_CM": 27,
-    "UTM_N": 8025857.477,
-    "UTM_E": 277012.866,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2235",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10214.26,
-    "GAUSS_X": 1973683,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 30.904,
-    "UTM_CM": 27,
-    "UTM_N": 8025863.628,
-    "UTM_E": 277835.301,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2234",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9456.57,
-    "GAUSS_X": 1973688,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 30.911,
-    "UTM_CM": 27,
-    "UTM_N": 8025866.337,
-    "UTM_E": 278593.162,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2233",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9239.19,
-    "GAUSS_X": 1972581,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 30.913,
-    "UTM_CM": 27,
-    "UTM_N": 8026976.086,
-    "UTM_E": 278798.725,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2232",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10259.9,
-    "GAUSS_X": 1972594,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.903,
-    "UTM_CM": 27,
-    "UTM_N": 8026951.405,
-    "UTM_E": 277778.01,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2231",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11566.17,
-    "GAUSS_X": 1972858,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 30.891,
-    "UTM_CM": 27,
-    "UTM_N": 8026673.818,
-    "UTM_E": 276474.357,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2255",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7465.46,
-    "GAUSS_X": 1968700,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 30.93,
-    "UTM_CM": 27,
-    "UTM_N": 8030875.995,
-    "UTM_E": 280531.236,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2230",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11852.31,
-    "GAUSS_X": 1970976,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.888,
-    "UTM_CM": 27,
-    "UTM_N": 8028553.339,
-    "UTM_E": 276168.041,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2239",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6740.97,
-    "GAUSS_X": 1968378,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8031205.674,
-    "UTM_E": 281252.388,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2229A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10625.36,
-    "GAUSS_X": 1970761,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.9,
-    "UTM_CM": 27,
-    "UTM_N": 8028780.958,
-    "UTM_E": 277392.892,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2229",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10718.59,
-    "GAUSS_X": 1970751,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.899,
-    "UTM_CM": 27,
-    "UTM_N": 8028790.213,
-    "UTM_E": 277299.538,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2228",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10060.63,
-    "GAUSS_X": 1970740,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.905,
-    "UTM_CM": 27,
-    "UTM_N": 8028808.367,
-    "UTM_E": 277957.479,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2227",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9174.56,
-    "GAUSS_X": 1970705,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 30.913,
-    "UTM_CM": 27,
-    "UTM_N": 8028853.193,
-    "UTM_E": 278843.304,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2226",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 4802.16,
-    "GAUSS_X": 1973726,
-    "LAT_WGS84": -17.847,
-    "LON_WGS84": 30.955,
-    "UTM_CM": 27,
-    "UTM_N": 8025878.37,
-    "UTM_E": 283248.607,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2225",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6392.1,
-    "GAUSS_X": 1968811,
-    "LAT_WGS84": -17.802,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8030777.141,
-    "UTM_E": 281605.919,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2224",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 5040.14,
-    "GAUSS_X": 1970887,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 30.952,
-    "UTM_CM": 27,
-    "UTM_N": 8028714.697,
-    "UTM_E": 282980.237,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2230A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 10843.17,
-    "GAUSS_X": 1970786,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.898,
-    "UTM_CM": 27,
-    "UTM_N": 8028754.046,
-    "UTM_E": 277175.311,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2245",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7534.33,
-    "GAUSS_X": 1968354,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8031222.128,
-    "UTM_E": 280458.654,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2441",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8837.95,
-    "GAUSS_X": 1971506,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 30.917,
-    "UTM_CM": 27,
-    "UTM_N": 8028054.984,
-    "UTM_E": 279188.533,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2252",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7362.17,
-    "GAUSS_X": 1968353,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8031224.356,
-    "UTM_E": 280630.833,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2251",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7238.49,
-    "GAUSS_X": 1968366,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8031212.404,
-    "UTM_E": 280754.672,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2250",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7106.46,
-    "GAUSS_X": 1968362,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8031217.904,
-    "UTM_E": 280886.676,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM225",
-    "TOPO": "Pendennis",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5487.29,
-    "GAUSS_X": 1963797,
-    "LAT_WGS84": -17.757,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8035917.85,
-    "UTM_E": 293433.05,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2249",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7088.84,
-    "GAUSS_X": 1968315,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8031264.899,
-    "UTM_E": 280903.799,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2248",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7238.27,
-    "GAUSS_X": 1968307,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8031271.365,
-    "UTM_E": 280754.263,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2237",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8329.8,
-    "GAUSS_X": 1972612,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.921,
-    "UTM_CM": 27,
-    "UTM_N": 8026954.66,
-    "UTM_E": 279708.58,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2246",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7527.38,
-    "GAUSS_X": 1968073,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8031502.561,
-    "UTM_E": 280462.612,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2238",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6752.85,
-    "GAUSS_X": 1968532,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8031051.547,
-    "UTM_E": 281242.15,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2244",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7744.52,
-    "GAUSS_X": 1968344,
-    "LAT_WGS84": -17.798,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8031229.475,
-    "UTM_E": 280248.332,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2243",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7730.76,
-    "GAUSS_X": 1967950,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8031623.497,
-    "UTM_E": 280257.89,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2242",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7519.53,
-    "GAUSS_X": 1967955,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 30.929,
-    "UTM_CM": 27,
-    "UTM_N": 8031620.621,
-    "UTM_E": 280469.204,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2241",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7074.55,
-    "GAUSS_X": 1967971,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 30.933,
-    "UTM_CM": 27,
-    "UTM_N": 8031609.238,
-    "UTM_E": 280914.418,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2240",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6728.69,
-    "GAUSS_X": 1967983,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8031601.188,
-    "UTM_E": 281260.45,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM224",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5565.53,
-    "GAUSS_X": 1963928,
-    "LAT_WGS84": -17.758,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8035788.074,
-    "UTM_E": 293512.686,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2254",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7368.93,
-    "GAUSS_X": 1968636,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 30.93,
-    "UTM_CM": 27,
-    "UTM_N": 8030941.205,
-    "UTM_E": 280627.094,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2247",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7222.84,
-    "GAUSS_X": 1968075,
-    "LAT_WGS84": -17.796,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8031503.551,
-    "UTM_E": 280767.218,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM30A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5938.47,
-    "GAUSS_X": 1972282,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8027436.77,
-    "UTM_E": 293974.819,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM333",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4589.55,
-    "GAUSS_X": 1972916,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8026789.137,
-    "UTM_E": 292632.576,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM315",
-    "TOPO": "Eastlea",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6697.04,
-    "GAUSS_X": 1971098,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8028629.198,
-    "UTM_E": 294720.777,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM314",
-    "TOPO": "Race",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3565.36,
-    "GAUSS_X": 1971795,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8027898.42,
-    "UTM_E": 291596.327,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM313",
-    "TOPO": "Elgon",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10287.6,
-    "GAUSS_X": 1977672,
-    "LAT_WGS84": -17.882,
-    "LON_WGS84": 31.097,
-    "UTM_CM": 27,
-    "UTM_N": 8022093.903,
-    "UTM_E": 298381.899,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM312",
-    "TOPO": "Muhatcha",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8762.27,
-    "GAUSS_X": 1962611,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.083,
-    "UTM_CM": 27,
-    "UTM_N": 8037138.571,
-    "UTM_E": 296695.608,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM311",
-    "TOPO": "Norman Close",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10634.3,
-    "GAUSS_X": 1966711,
-    "LAT_WGS84": -17.783,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8033058.578,
-    "UTM_E": 298611.388,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM317",
-    "TOPO": "Shell",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2547.95,
-    "GAUSS_X": 1974212,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8025470.956,
-    "UTM_E": 290604.685,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM31",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5585.52,
-    "GAUSS_X": 1972344,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8027371.732,
-    "UTM_E": 293622.5,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM318",
-    "TOPO": "Sewer",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2970.13,
-    "GAUSS_X": 1969621,
-    "LAT_WGS84": -17.81,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8030066.246,
-    "UTM_E": 290977.815,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM309",
-    "TOPO": "Oriel",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13895,
-    "GAUSS_X": 1966956,
-    "LAT_WGS84": -17.786,
-    "LON_WGS84": 31.131,
-    "UTM_CM": 27,
-    "UTM_N": 8032848.515,
-    "UTM_E": 301874.832,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM307",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4946.15,
-    "GAUSS_X": 1971842,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027866.42,
-    "UTM_E": 292977.722,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM304",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5516.41,
-    "GAUSS_X": 1972074,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8027641.181,
-    "UTM_E": 293550.496,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM303",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5472.2,
-    "GAUSS_X": 1971886,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8027827.841,
-    "UTM_E": 293504.282,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM302",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5429.45,
-    "GAUSS_X": 1971722,
-    "LAT_WGS84": -17.829,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8027992.086,
-    "UTM_E": 293459.768,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM301",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5072.04,
-    "GAUSS_X": 1971348,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.048,
-    "UTM_CM": 27,
-    "UTM_N": 8028362.311,
-    "UTM_E": 293098.334,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM300",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5323.48,
-    "GAUSS_X": 1971292,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8028420.463,
-    "UTM_E": 293349.199,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM310",
-    "TOPO": "Rolfe",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13468.1,
-    "GAUSS_X": 1965109,
-    "LAT_WGS84": -17.769,
-    "LON_WGS84": 31.127,
-    "UTM_CM": 27,
-    "UTM_N": 8034691.195,
-    "UTM_E": 301428.218,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM324",
-    "TOPO": "Lidrary",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5673.47,
-    "GAUSS_X": 1966425,
-    "LAT_WGS84": -17.781,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8033292.08,
-    "UTM_E": 293647.245,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2605",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 12143.81,
-    "GAUSS_X": 1971911,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 30.885,
-    "UTM_CM": 27,
-    "UTM_N": 8027614.431,
-    "UTM_E": 275886.498,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM331",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9794.93,
-    "GAUSS_X": 1975007,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8024753.495,
-    "UTM_E": 297860.653,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM330",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9310.62,
-    "GAUSS_X": 1974551,
-    "LAT_WGS84": -17.854,
-    "LON_WGS84": 31.088,
-    "UTM_CM": 27,
-    "UTM_N": 8025204.141,
-    "UTM_E": 297371.439,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM33",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5260.14,
-    "GAUSS_X": 1972424,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.05,
-    "UTM_CM": 27,
-    "UTM_N": 8027288.156,
-    "UTM_E": 293297.953,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM329",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8902.8,
-    "GAUSS_X": 1974199,
-    "LAT_WGS84": -17.851,
-    "LON_WGS84": 31.084,
-    "UTM_CM": 27,
-    "UTM_N": 8025552.173,
-    "UTM_E": 296959.827,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM328",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8517.32,
-    "GAUSS_X": 1973926,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8025820.211,
-    "UTM_E": 296571.413,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM316",
-    "TOPO": "Siding",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6304.55,
-    "GAUSS_X": 1971969,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.059,
-    "UTM_CM": 27,
-    "UTM_N": 8027754.466,
-    "UTM_E": 294337.568,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM326",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7232.39,
-    "GAUSS_X": 1973044,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.068,
-    "UTM_CM": 27,
-    "UTM_N": 8026688.852,
-    "UTM_E": 295276.969,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM299",
-    "TOPO": "Furlong",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8556.04,
-    "GAUSS_X": 1966592,
-    "LAT_WGS84": -17.782,
-    "LON_WGS84": 31.081,
-    "UTM_CM": 27,
-    "UTM_N": 8033155.4,
-    "UTM_E": 296531.778,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM323",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6554.48,
-    "GAUSS_X": 1968710,
-    "LAT_WGS84": -17.801,
-    "LON_WGS84": 31.062,
-    "UTM_CM": 27,
-    "UTM_N": 8031015.548,
-    "UTM_E": 294552.702,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM322",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6323.45,
-    "GAUSS_X": 1969208,
-    "LAT_WGS84": -17.806,
-    "LON_WGS84": 31.06,
-    "UTM_CM": 27,
-    "UTM_N": 8030515.329,
-    "UTM_E": 294326.971,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM321",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5806.23,
-    "GAUSS_X": 1969551,
-    "LAT_WGS84": -17.809,
-    "LON_WGS84": 31.055,
-    "UTM_CM": 27,
-    "UTM_N": 8030167.212,
-    "UTM_E": 293813.375,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM320",
-    "TOPO": "Beam E.",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8972.64,
-    "GAUSS_X": 1971886,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.085,
-    "UTM_CM": 27,
-    "UTM_N": 8027865.719,
-    "UTM_E": 297004.929,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM32",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5450.27,
-    "GAUSS_X": 1972376,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 31.051,
-    "UTM_CM": 27,
-    "UTM_N": 8027337.703,
-    "UTM_E": 293487.589,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM31A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5561.93,
-    "GAUSS_X": 1972350,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8027365.409,
-    "UTM_E": 293598.973,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM319",
-    "TOPO": "Pear",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5527.2,
-    "GAUSS_X": 1969032,
-    "LAT_WGS84": -17.804,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8030683.108,
-    "UTM_E": 293528.785,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM327",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7960.67,
-    "GAUSS_X": 1973534,
-    "LAT_WGS84": -17.845,
-    "LON_WGS84": 31.075,
-    "UTM_CM": 27,
-    "UTM_N": 8026206.986,
-    "UTM_E": 296010.53,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2613",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11424.26,
-    "GAUSS_X": 1971686,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 30.892,
-    "UTM_CM": 27,
-    "UTM_N": 8027847.582,
-    "UTM_E": 276603.752,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM263",
-    "TOPO": "ST.Marys",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9511.08,
-    "GAUSS_X": 1968522,
-    "LAT_WGS84": -17.8,
-    "LON_WGS84": 31.09,
-    "UTM_CM": 27,
-    "UTM_N": 8031235.89,
-    "UTM_E": 297507.455,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2620",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 13435.57,
-    "GAUSS_X": 1971024,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.873,
-    "UTM_CM": 27,
-    "UTM_N": 8028488.066,
-    "UTM_E": 274585.037,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2619",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 13163.91,
-    "GAUSS_X": 1971000,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.876,
-    "UTM_CM": 27,
-    "UTM_N": 8028515.384,
-    "UTM_E": 274856.481,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2618",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 12732.19,
-    "GAUSS_X": 1970972,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.88,
-    "UTM_CM": 27,
-    "UTM_N": 8028547.494,
-    "UTM_E": 275287.979,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2617",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 12247.17,
-    "GAUSS_X": 1971025,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.884,
-    "UTM_CM": 27,
-    "UTM_N": 8028500.29,
-    "UTM_E": 275773.639,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2616",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11595.55,
-    "GAUSS_X": 1972612,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.891,
-    "UTM_CM": 27,
-    "UTM_N": 8026919.253,
-    "UTM_E": 276442.343,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM30",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5926.78,
-    "GAUSS_X": 1972245,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 31.056,
-    "UTM_CM": 27,
-    "UTM_N": 8027473.588,
-    "UTM_E": 293962.733,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2614",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11866.61,
-    "GAUSS_X": 1972557,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 30.888,
-    "UTM_CM": 27,
-    "UTM_N": 8026972.132,
-    "UTM_E": 276170.643,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM266",
-    "TOPO": "Oval",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9722.34,
-    "GAUSS_X": 1970662,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8029097.763,
-    "UTM_E": 297741.583,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2612",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11605.58,
-    "GAUSS_X": 1971875,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 30.89,
-    "UTM_CM": 27,
-    "UTM_N": 8027656.373,
-    "UTM_E": 276424.427,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2611",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11782.07,
-    "GAUSS_X": 1972130,
-    "LAT_WGS84": -17.832,
-    "LON_WGS84": 30.889,
-    "UTM_CM": 27,
-    "UTM_N": 8027399.485,
-    "UTM_E": 276250.636,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2610",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11932.87,
-    "GAUSS_X": 1972176,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 30.887,
-    "UTM_CM": 27,
-    "UTM_N": 8027351.875,
-    "UTM_E": 276100.304,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2609",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11986.05,
-    "GAUSS_X": 1972028,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.887,
-    "UTM_CM": 27,
-    "UTM_N": 8027499.88,
-    "UTM_E": 276045.526,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2608",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 12913.76,
-    "GAUSS_X": 1973022,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 30.878,
-    "UTM_CM": 27,
-    "UTM_N": 8026495.293,
-    "UTM_E": 275128.304,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2607",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 12680.74,
-    "GAUSS_X": 1972679,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.88,
-    "UTM_CM": 27,
-    "UTM_N": 8026841.043,
-    "UTM_E": 275357.69,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM244",
-    "TOPO": "Edinburgh Rd.",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -7767.29,
-    "GAUSS_X": 1964423,
-    "LAT_WGS84": -17.763,
-    "LON_WGS84": 31.073,
-    "UTM_CM": 27,
-    "UTM_N": 8035316.065,
-    "UTM_E": 295719.865,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2615",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11782.4,
-    "GAUSS_X": 1972631,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.889,
-    "UTM_CM": 27,
-    "UTM_N": 8026898.421,
-    "UTM_E": 276255.665,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM278",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6451.81,
-    "GAUSS_X": 1970613,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8029111.448,
-    "UTM_E": 294470.35,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM334",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4557.74,
-    "GAUSS_X": 1973133,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8026571.301,
-    "UTM_E": 292603.09,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM296",
-    "TOPO": "ARCHIVES",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6736.01,
-    "GAUSS_X": 1968041,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8031687.128,
-    "UTM_E": 294727.097,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM29",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6334.08,
-    "GAUSS_X": 1971861,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 31.06,
-    "UTM_CM": 27,
-    "UTM_N": 8027861.969,
-    "UTM_E": 294365.953,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM289",
-    "TOPO": "Archives S.E.",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6736.01,
-    "GAUSS_X": 1968041,
-    "LAT_WGS84": -17.795,
-    "LON_WGS84": 31.063,
-    "UTM_CM": 27,
-    "UTM_N": 8031687.128,
-    "UTM_E": 294727.097,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM285",
-    "TOPO": "Metro",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13955.9,
-    "GAUSS_X": 1973023,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.132,
-    "UTM_CM": 27,
-    "UTM_N": 8026782.16,
-    "UTM_E": 302000.487,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM284",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13787.6,
-    "GAUSS_X": 1973234,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8026569.454,
-    "UTM_E": 301834.469,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM283",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14053.6,
-    "GAUSS_X": 1973361,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8026445.257,
-    "UTM_E": 302101.815,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM264",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9973.65,
-    "GAUSS_X": 1970610,
-    "LAT_WGS84": -17.819,
-    "LON_WGS84": 31.094,
-    "UTM_CM": 27,
-    "UTM_N": 8029152.881,
-    "UTM_E": 297992.345,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM28",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6406.35,
-    "GAUSS_X": 1971576,
-    "LAT_WGS84": -17.827,
-    "LON_WGS84": 31.06,
-    "UTM_CM": 27,
-    "UTM_N": 8028147.74,
-    "UTM_E": 294435.181,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM265",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -9767.28,
-    "GAUSS_X": 1970431,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.092,
-    "UTM_CM": 27,
-    "UTM_N": 8029329.184,
-    "UTM_E": 297784.058,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM277",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6482.29,
-    "GAUSS_X": 1970741,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8028983.866,
-    "UTM_E": 294502.198,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM276",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6512.39,
-    "GAUSS_X": 1970863,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8028862.709,
-    "UTM_E": 294533.599,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM27",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6433.37,
-    "GAUSS_X": 1971473,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8028251.815,
-    "UTM_E": 294461.094,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM269",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10428.8,
-    "GAUSS_X": 1962253,
-    "LAT_WGS84": -17.743,
-    "LON_WGS84": 31.098,
-    "UTM_CM": 27,
-    "UTM_N": 8037514.954,
-    "UTM_E": 298358.363,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM268",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10624.2,
-    "GAUSS_X": 1961951,
-    "LAT_WGS84": -17.74,
-    "LON_WGS84": 31.1,
-    "UTM_CM": 27,
-    "UTM_N": 8037818.907,
-    "UTM_E": 298550.6,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM267",
-    "TOPO": "Domboshava Rd",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10526.5,
-    "GAUSS_X": 1962102,
-    "LAT_WGS84": -17.742,
-    "LON_WGS84": 31.099,
-    "UTM_CM": 27,
-    "UTM_N": 8037666.941,
-    "UTM_E": 298454.472,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM3",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4321.28,
-    "GAUSS_X": 1972279,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8027423.376,
-    "UTM_E": 292357.471,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM282",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14161.9,
-    "GAUSS_X": 1973112,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.134,
-    "UTM_CM": 27,
-    "UTM_N": 8026694.822,
-    "UTM_E": 302207.45,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM38",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4375.65,
-    "GAUSS_X": 1973042,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8026660.409,
-    "UTM_E": 292420.012,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM332",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8198.21,
-    "GAUSS_X": 1974603,
-    "LAT_WGS84": -17.855,
-    "LON_WGS84": 31.077,
-    "UTM_CM": 27,
-    "UTM_N": 8025140.689,
-    "UTM_E": 296259.523,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM388",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2327,
-    "GAUSS_X": 1976213,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.022,
-    "UTM_CM": 27,
-    "UTM_N": 8023467.239,
-    "UTM_E": 290405.149,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM387",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2120.79,
-    "GAUSS_X": 1976540,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.02,
-    "UTM_CM": 27,
-    "UTM_N": 8023138.141,
-    "UTM_E": 290202.424,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM384",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1906.09,
-    "GAUSS_X": 1976400,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8023275.502,
-    "UTM_E": 289986.209,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM383",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1755.76,
-    "GAUSS_X": 1976309,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8023365.379,
-    "UTM_E": 289834.885,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM382",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1659.8,
-    "GAUSS_X": 1976406,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 31.016,
-    "UTM_CM": 27,
-    "UTM_N": 8023267.392,
-    "UTM_E": 289739.955,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM390",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2642.43,
-    "GAUSS_X": 1975715,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.025,
-    "UTM_CM": 27,
-    "UTM_N": 8023968.581,
-    "UTM_E": 290715.271,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM380",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1752.83,
-    "GAUSS_X": 1976566,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8023108.205,
-    "UTM_E": 289834.71,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM391",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2710.29,
-    "GAUSS_X": 1975604,
-    "LAT_WGS84": -17.864,
-    "LON_WGS84": 31.026,
-    "UTM_CM": 27,
-    "UTM_N": 8024080.757,
-    "UTM_E": 290781.943,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM379",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1595.23,
-    "GAUSS_X": 1976567,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.015,
-    "UTM_CM": 27,
-    "UTM_N": 8023105.546,
-    "UTM_E": 289677.107,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM378",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1525.04,
-    "GAUSS_X": 1976526,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.014,
-    "UTM_CM": 27,
-    "UTM_N": 8023145.327,
-    "UTM_E": 289606.476,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM377",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3497.55,
-    "GAUSS_X": 1974388,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.033,
-    "UTM_CM": 27,
-    "UTM_N": 8025304.447,
-    "UTM_E": 291556.254,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM376",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1925.95,
-    "GAUSS_X": 1975566,
-    "LAT_WGS84": -17.863,
-    "LON_WGS84": 31.018,
-    "UTM_CM": 27,
-    "UTM_N": 8024110.158,
-    "UTM_E": 289997.131,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM375",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12227.5,
-    "GAUSS_X": 1977164,
-    "LAT_WGS84": -17.878,
-    "LON_WGS84": 31.115,
-    "UTM_CM": 27,
-    "UTM_N": 8022622.5,
-    "UTM_E": 300316.44,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM374",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12280.6,
-    "GAUSS_X": 1976925,
-    "LAT_WGS84": -17.876,
-    "LON_WGS84": 31.116,
-    "UTM_CM": 27,
-    "UTM_N": 8022861.638,
-    "UTM_E": 300366.995,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM373",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12315.9,
-    "GAUSS_X": 1976668,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 31.116,
-    "UTM_CM": 27,
-    "UTM_N": 8023119.155,
-    "UTM_E": 300399.55,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM381",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -1798.78,
-    "GAUSS_X": 1976509,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.017,
-    "UTM_CM": 27,
-    "UTM_N": 8023165.243,
-    "UTM_E": 289880.058,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM399",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3890.84,
-    "GAUSS_X": 1973816,
-    "LAT_WGS84": -17.848,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8025881.342,
-    "UTM_E": 291943.445,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM406",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2926.71,
-    "GAUSS_X": 1970449,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8029238.133,
-    "UTM_E": 290943.233,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM405",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3188.37,
-    "GAUSS_X": 1970384,
-    "LAT_WGS84": -17.817,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8029305.864,
-    "UTM_E": 291204.221,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM404",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2572.57,
-    "GAUSS_X": 1970176,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.024,
-    "UTM_CM": 27,
-    "UTM_N": 8029507.102,
-    "UTM_E": 290586.149,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM403",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2941.09,
-    "GAUSS_X": 1970280,
-    "LAT_WGS84": -17.816,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8029407.231,
-    "UTM_E": 290955.809,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM402",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3150.01,
-    "GAUSS_X": 1970228,
-    "LAT_WGS84": -17.815,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8029461.357,
-    "UTM_E": 291164.192,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM401",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3161.63,
-    "GAUSS_X": 1970772,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8028917.887,
-    "UTM_E": 291181.621,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM389",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2479.28,
-    "GAUSS_X": 1975966,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31.023,
-    "UTM_CM": 27,
-    "UTM_N": 8023716.092,
-    "UTM_E": 290554.793,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM4",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4254.95,
-    "GAUSS_X": 1972268,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8027433.527,
-    "UTM_E": 292291.02,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM370",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11459.4,
-    "GAUSS_X": 1975952,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31.108,
-    "UTM_CM": 27,
-    "UTM_N": 8023825.732,
-    "UTM_E": 299535.281,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM398",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3726.41,
-    "GAUSS_X": 1974021,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.035,
-    "UTM_CM": 27,
-    "UTM_N": 8025674.086,
-    "UTM_E": 291781.202,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM397",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3657.92,
-    "GAUSS_X": 1974117,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8025577.166,
-    "UTM_E": 291713.736,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM396",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3443.19,
-    "GAUSS_X": 1974441,
-    "LAT_WGS84": -17.853,
-    "LON_WGS84": 31.032,
-    "UTM_CM": 27,
-    "UTM_N": 8025250.981,
-    "UTM_E": 291502.456,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM395",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3222.41,
-    "GAUSS_X": 1974795,
-    "LAT_WGS84": -17.856,
-    "LON_WGS84": 31.03,
-    "UTM_CM": 27,
-    "UTM_N": 8024895.109,
-    "UTM_E": 291285.443,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM394",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3089.72,
-    "GAUSS_X": 1975008,
-    "LAT_WGS84": -17.858,
-    "LON_WGS84": 31.029,
-    "UTM_CM": 27,
-    "UTM_N": 8024680.411,
-    "UTM_E": 291155.026,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM393",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2971.03,
-    "GAUSS_X": 1975194,
-    "LAT_WGS84": -17.86,
-    "LON_WGS84": 31.028,
-    "UTM_CM": 27,
-    "UTM_N": 8024492.834,
-    "UTM_E": 291038.321,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM392",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -2854.48,
-    "GAUSS_X": 1975372,
-    "LAT_WGS84": -17.862,
-    "LON_WGS84": 31.027,
-    "UTM_CM": 27,
-    "UTM_N": 8024314.021,
-    "UTM_E": 290923.663,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM400",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3589.58,
-    "GAUSS_X": 1974084,
-    "LAT_WGS84": -17.85,
-    "LON_WGS84": 31.034,
-    "UTM_CM": 27,
-    "UTM_N": 8025610.307,
-    "UTM_E": 291645.028,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM341",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4659.26,
-    "GAUSS_X": 1972919,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8026786.943,
-    "UTM_E": 292702.322,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM349",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4243.5,
-    "GAUSS_X": 1971986,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8027715.076,
-    "UTM_E": 292276.557,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM348",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4131.66,
-    "GAUSS_X": 1972283,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8027416.807,
-    "UTM_E": 292167.885,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM347",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -3875.64,
-    "GAUSS_X": 1972948,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.037,
-    "UTM_CM": 27,
-    "UTM_N": 8026749.197,
-    "UTM_E": 291918.957,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM346",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4790.13,
-    "GAUSS_X": 1972567,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027139.519,
-    "UTM_E": 292829.445,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM345",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5166.06,
-    "GAUSS_X": 1972978,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.049,
-    "UTM_CM": 27,
-    "UTM_N": 8026732.98,
-    "UTM_E": 293209.794,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM344",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4940.47,
-    "GAUSS_X": 1972528,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.047,
-    "UTM_CM": 27,
-    "UTM_N": 8027180.91,
-    "UTM_E": 292979.371,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM372",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12091.7,
-    "GAUSS_X": 1976489,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8023296.078,
-    "UTM_E": 300173.391,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM342",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4172.56,
-    "GAUSS_X": 1973590,
-    "LAT_WGS84": -17.846,
-    "LON_WGS84": 31.039,
-    "UTM_CM": 27,
-    "UTM_N": 8026110.675,
-    "UTM_E": 292222.765,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM356",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11646.4,
-    "GAUSS_X": 1975761,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8024019.063,
-    "UTM_E": 299720.298,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM340",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4229.5,
-    "GAUSS_X": 1973468,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8026232.533,
-    "UTM_E": 292278.412,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM34",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4819.06,
-    "GAUSS_X": 1972584,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 31.045,
-    "UTM_CM": 27,
-    "UTM_N": 8027123.487,
-    "UTM_E": 292858.552,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM339",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4368.04,
-    "GAUSS_X": 1973423,
-    "LAT_WGS84": -17.844,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8026279.479,
-    "UTM_E": 292416.476,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM338",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4314.62,
-    "GAUSS_X": 1973279,
-    "LAT_WGS84": -17.843,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8026422.619,
-    "UTM_E": 292361.515,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM337",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4234.91,
-    "GAUSS_X": 1973233,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8026468.389,
-    "UTM_E": 292281.3,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM336",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4291.66,
-    "GAUSS_X": 1973141,
-    "LAT_WGS84": -17.842,
-    "LON_WGS84": 31.04,
-    "UTM_CM": 27,
-    "UTM_N": 8026560.733,
-    "UTM_E": 292337.073,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM335",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4395.25,
-    "GAUSS_X": 1973128,
-    "LAT_WGS84": -17.841,
-    "LON_WGS84": 31.041,
-    "UTM_CM": 27,
-    "UTM_N": 8026574.193,
-    "UTM_E": 292440.538,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM343",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -8511.06,
-    "GAUSS_X": 1973931,
-    "LAT_WGS84": -17.849,
-    "LON_WGS84": 31.08,
-    "UTM_CM": 27,
-    "UTM_N": 8025815.114,
-    "UTM_E": 296565.207,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM362",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12550.5,
-    "GAUSS_X": 1976213,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8023576.553,
-    "UTM_E": 300629.234,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2604",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11941.01,
-    "GAUSS_X": 1971635,
-    "LAT_WGS84": -17.828,
-    "LON_WGS84": 30.887,
-    "UTM_CM": 27,
-    "UTM_N": 8027892.735,
-    "UTM_E": 276086.378,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM37",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4474.8,
-    "GAUSS_X": 1972928,
-    "LAT_WGS84": -17.84,
-    "LON_WGS84": 31.042,
-    "UTM_CM": 27,
-    "UTM_N": 8026775.539,
-    "UTM_E": 292517.949,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM369",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11975.1,
-    "GAUSS_X": 1976107,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.113,
-    "UTM_CM": 27,
-    "UTM_N": 8023676.611,
-    "UTM_E": 300052.647,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM368",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12136.3,
-    "GAUSS_X": 1976241,
-    "LAT_WGS84": -17.869,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8023544.584,
-    "UTM_E": 300215.325,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM367",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12404,
-    "GAUSS_X": 1976440,
-    "LAT_WGS84": -17.871,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8023347.766,
-    "UTM_E": 300485.174,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM366",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12639.9,
-    "GAUSS_X": 1976604,
-    "LAT_WGS84": -17.873,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8023187.138,
-    "UTM_E": 300722.8,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM365",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12705.4,
-    "GAUSS_X": 1976490,
-    "LAT_WGS84": -17.872,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8023301.754,
-    "UTM_E": 300787.151,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM35",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4666.69,
-    "GAUSS_X": 1972737,
-    "LAT_WGS84": -17.838,
-    "LON_WGS84": 31.044,
-    "UTM_CM": 27,
-    "UTM_N": 8026968.646,
-    "UTM_E": 292707.81,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM363",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12518.3,
-    "GAUSS_X": 1976276,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8023513.426,
-    "UTM_E": 300597.746,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM355",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11299.1,
-    "GAUSS_X": 1975772,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8024004.322,
-    "UTM_E": 299373.053,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM361",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12528.2,
-    "GAUSS_X": 1975958,
-    "LAT_WGS84": -17.867,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8023831.693,
-    "UTM_E": 300604.227,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM360",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12503.6,
-    "GAUSS_X": 1975756,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8024033.366,
-    "UTM_E": 300577.463,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM36",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -4594.34,
-    "GAUSS_X": 1972808,
-    "LAT_WGS84": -17.839,
-    "LON_WGS84": 31.043,
-    "UTM_CM": 27,
-    "UTM_N": 8026896.687,
-    "UTM_E": 292636.216,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM359",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12230.8,
-    "GAUSS_X": 1975768,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.115,
-    "UTM_CM": 27,
-    "UTM_N": 8024018.623,
-    "UTM_E": 300304.771,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM358",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11994,
-    "GAUSS_X": 1975769,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.113,
-    "UTM_CM": 27,
-    "UTM_N": 8024015.246,
-    "UTM_E": 300067.952,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM357",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11773.8,
-    "GAUSS_X": 1975783,
-    "LAT_WGS84": -17.865,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8023998.057,
-    "UTM_E": 299847.963,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM371",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11592.5,
-    "GAUSS_X": 1976087,
-    "LAT_WGS84": -17.868,
-    "LON_WGS84": 31.109,
-    "UTM_CM": 27,
-    "UTM_N": 8023692.523,
-    "UTM_E": 299669.848,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM364",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12632,
-    "GAUSS_X": 1976343,
-    "LAT_WGS84": -17.87,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8023447.883,
-    "UTM_E": 300712.175,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2485",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -165.34,
-    "GAUSS_X": 1978135,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8021521.889,
-    "UTM_E": 288263.897,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2510",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1541.34,
-    "GAUSS_X": 1978288,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 30.985,
-    "UTM_CM": 27,
-    "UTM_N": 8021350.867,
-    "UTM_E": 286558.682,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2491",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 438.86,
-    "GAUSS_X": 1979639,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 30.996,
-    "UTM_CM": 27,
-    "UTM_N": 8020011.468,
-    "UTM_E": 287675.773,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2490",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 536.12,
-    "GAUSS_X": 1979242,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8020407.634,
-    "UTM_E": 287574.24,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM249",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13771.8,
-    "GAUSS_X": 1966890,
-    "LAT_WGS84": -17.785,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8032913.593,
-    "UTM_E": 301750.931,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2489",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 515.94,
-    "GAUSS_X": 1979278,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8020371.587,
-    "UTM_E": 287594.811,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2488",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 340.52,
-    "GAUSS_X": 1979080,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.997,
-    "UTM_CM": 27,
-    "UTM_N": 8020571.059,
-    "UTM_E": 287768.129,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2493",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 816.68,
-    "GAUSS_X": 1980073,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 30.992,
-    "UTM_CM": 27,
-    "UTM_N": 8019572.809,
-    "UTM_E": 287302.58,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2486",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -221.79,
-    "GAUSS_X": 1978391,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 31.002,
-    "UTM_CM": 27,
-    "UTM_N": 8021266.63,
-    "UTM_E": 288323.097,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2494",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 978.87,
-    "GAUSS_X": 1980363,
-    "LAT_WGS84": -17.907,
-    "LON_WGS84": 30.991,
-    "UTM_CM": 27,
-    "UTM_N": 8019281.708,
-    "UTM_E": 287143.48,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2484",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -92.58,
-    "GAUSS_X": 1977891,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 31.001,
-    "UTM_CM": 27,
-    "UTM_N": 8021764.883,
-    "UTM_E": 288188.516,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2483",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 124.1,
-    "GAUSS_X": 1977741,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 30.999,
-    "UTM_CM": 27,
-    "UTM_N": 8021912.594,
-    "UTM_E": 287970.205,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2482",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 642.57,
-    "GAUSS_X": 1977728,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 30.994,
-    "UTM_CM": 27,
-    "UTM_N": 8021920.005,
-    "UTM_E": 287451.545,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2481",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 888.54,
-    "GAUSS_X": 1977507,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 30.992,
-    "UTM_CM": 27,
-    "UTM_N": 8022138.25,
-    "UTM_E": 287203.181,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2480",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1378.49,
-    "GAUSS_X": 1977504,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 30.987,
-    "UTM_CM": 27,
-    "UTM_N": 8022136.727,
-    "UTM_E": 286713.141,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM248",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13812.7,
-    "GAUSS_X": 1966996,
-    "LAT_WGS84": -17.786,
-    "LON_WGS84": 31.13,
-    "UTM_CM": 27,
-    "UTM_N": 8032807.597,
-    "UTM_E": 301792.977,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2479",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1953.09,
-    "GAUSS_X": 1977855,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8021779.617,
-    "UTM_E": 286142.242,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2487",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -115.37,
-    "GAUSS_X": 1978779,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 31.001,
-    "UTM_CM": 27,
-    "UTM_N": 8020877.651,
-    "UTM_E": 288220.827,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2501",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 768.11,
-    "GAUSS_X": 1979495,
-    "LAT_WGS84": -17.899,
-    "LON_WGS84": 30.993,
-    "UTM_CM": 27,
-    "UTM_N": 8020151.329,
-    "UTM_E": 287344.951,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2606",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 12344.67,
-    "GAUSS_X": 1972211,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 30.884,
-    "UTM_CM": 27,
-    "UTM_N": 8027312.464,
-    "UTM_E": 275688.811,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2508",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1185.45,
-    "GAUSS_X": 1977769,
-    "LAT_WGS84": -17.883,
-    "LON_WGS84": 30.989,
-    "UTM_CM": 27,
-    "UTM_N": 8021872.969,
-    "UTM_E": 286909.051,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2507",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 740.94,
-    "GAUSS_X": 1977879,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 30.993,
-    "UTM_CM": 27,
-    "UTM_N": 8021767.755,
-    "UTM_E": 287354.786,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2506",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 325.64,
-    "GAUSS_X": 1978520,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.997,
-    "UTM_CM": 27,
-    "UTM_N": 8021131.255,
-    "UTM_E": 287777.002,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2505",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 219.76,
-    "GAUSS_X": 1978448,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 30.998,
-    "UTM_CM": 27,
-    "UTM_N": 8021204.848,
-    "UTM_E": 287882.115,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2504",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 83.78,
-    "GAUSS_X": 1978416,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 30.999,
-    "UTM_CM": 27,
-    "UTM_N": 8021238.48,
-    "UTM_E": 288017.764,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2492",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 609.45,
-    "GAUSS_X": 1979816,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 30.994,
-    "UTM_CM": 27,
-    "UTM_N": 8019832.59,
-    "UTM_E": 287507.066,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2502",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 788.23,
-    "GAUSS_X": 1979023,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.993,
-    "UTM_CM": 27,
-    "UTM_N": 8020623.551,
-    "UTM_E": 287319.759,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2476",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3237.43,
-    "GAUSS_X": 1978517,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.969,
-    "UTM_CM": 27,
-    "UTM_N": 8021103.827,
-    "UTM_E": 284864.86,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2500",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1021.92,
-    "GAUSS_X": 1979257,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8020386.989,
-    "UTM_E": 287088.557,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM25",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6542.19,
-    "GAUSS_X": 1971137,
-    "LAT_WGS84": -17.823,
-    "LON_WGS84": 31.062,
-    "UTM_CM": 27,
-    "UTM_N": 8028588.94,
-    "UTM_E": 294566.33,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2499",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1334.24,
-    "GAUSS_X": 1979598,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 30.987,
-    "UTM_CM": 27,
-    "UTM_N": 8020043.022,
-    "UTM_E": 286779.86,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2498",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1085.28,
-    "GAUSS_X": 1979829,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8019814.71,
-    "UTM_E": 287031.325,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2497",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1031.38,
-    "GAUSS_X": 1979868,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8019776.085,
-    "UTM_E": 287085.651,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2496",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1202.52,
-    "GAUSS_X": 1980057,
-    "LAT_WGS84": -17.904,
-    "LON_WGS84": 30.989,
-    "UTM_CM": 27,
-    "UTM_N": 8019585.168,
-    "UTM_E": 286916.523,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2495",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1257.68,
-    "GAUSS_X": 1980194,
-    "LAT_WGS84": -17.905,
-    "LON_WGS84": 30.988,
-    "UTM_CM": 27,
-    "UTM_N": 8019447.132,
-    "UTM_E": 286862.833,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2503",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 49.48,
-    "GAUSS_X": 1978156,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8021498.783,
-    "UTM_E": 288049.279,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2449",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7329.48,
-    "GAUSS_X": 1972637,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.931,
-    "UTM_CM": 27,
-    "UTM_N": 8026940.148,
-    "UTM_E": 280709.309,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2457",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9000.01,
-    "GAUSS_X": 1971919,
-    "LAT_WGS84": -17.83,
-    "LON_WGS84": 30.915,
-    "UTM_CM": 27,
-    "UTM_N": 8027640.231,
-    "UTM_E": 279030.865,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2456",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9223.9,
-    "GAUSS_X": 1972167,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 30.913,
-    "UTM_CM": 27,
-    "UTM_N": 8027389.981,
-    "UTM_E": 278809.593,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2455",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7598.88,
-    "GAUSS_X": 1971422,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8028152.304,
-    "UTM_E": 280426.879,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2454",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7170.12,
-    "GAUSS_X": 1970721,
-    "LAT_WGS84": -17.82,
-    "LON_WGS84": 30.932,
-    "UTM_CM": 27,
-    "UTM_N": 8028858.123,
-    "UTM_E": 280848.203,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2453",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6398.33,
-    "GAUSS_X": 1972654,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8026933.247,
-    "UTM_E": 281640.764,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2452",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8566.95,
-    "GAUSS_X": 1971933,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.919,
-    "UTM_CM": 27,
-    "UTM_N": 8027631.061,
-    "UTM_E": 279464.135,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2478",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2418.36,
-    "GAUSS_X": 1977998,
-    "LAT_WGS84": -17.885,
-    "LON_WGS84": 30.977,
-    "UTM_CM": 27,
-    "UTM_N": 8021631.582,
-    "UTM_E": 285678.456,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2450",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7029.71,
-    "GAUSS_X": 1972633,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.934,
-    "UTM_CM": 27,
-    "UTM_N": 8026947.365,
-    "UTM_E": 281009.077,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2461",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -869.19,
-    "GAUSS_X": 1977086,
-    "LAT_WGS84": -17.877,
-    "LON_WGS84": 31.008,
-    "UTM_CM": 27,
-    "UTM_N": 8022578.246,
-    "UTM_E": 288956.568,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2448",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7671.66,
-    "GAUSS_X": 1972617,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.928,
-    "UTM_CM": 27,
-    "UTM_N": 8026956.28,
-    "UTM_E": 280366.87,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2447",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 7784.77,
-    "GAUSS_X": 1972506,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 30.927,
-    "UTM_CM": 27,
-    "UTM_N": 8027066.076,
-    "UTM_E": 280252.557,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2446",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8033.08,
-    "GAUSS_X": 1972516,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 30.924,
-    "UTM_CM": 27,
-    "UTM_N": 8027054.148,
-    "UTM_E": 280004.312,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2445",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9506.09,
-    "GAUSS_X": 1971936,
-    "LAT_WGS84": -17.831,
-    "LON_WGS84": 30.91,
-    "UTM_CM": 27,
-    "UTM_N": 8027618.007,
-    "UTM_E": 278524.89,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2444",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6708.02,
-    "GAUSS_X": 1972279,
-    "LAT_WGS84": -17.834,
-    "LON_WGS84": 30.937,
-    "UTM_CM": 27,
-    "UTM_N": 8027304.584,
-    "UTM_E": 281327.026,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2443",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6379.25,
-    "GAUSS_X": 1972387,
-    "LAT_WGS84": -17.835,
-    "LON_WGS84": 30.94,
-    "UTM_CM": 27,
-    "UTM_N": 8027200.106,
-    "UTM_E": 281656.995,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2442",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6475.95,
-    "GAUSS_X": 1972163,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 30.939,
-    "UTM_CM": 27,
-    "UTM_N": 8027423.842,
-    "UTM_E": 281557.878,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2451",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 6727.8,
-    "GAUSS_X": 1972645,
-    "LAT_WGS84": -17.837,
-    "LON_WGS84": 30.936,
-    "UTM_CM": 27,
-    "UTM_N": 8026938.884,
-    "UTM_E": 281311.153,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2468",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1098.28,
-    "GAUSS_X": 1978955,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8020688.121,
-    "UTM_E": 287008.949,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2511",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1522.81,
-    "GAUSS_X": 1978528,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.986,
-    "UTM_CM": 27,
-    "UTM_N": 8021110.801,
-    "UTM_E": 286579.791,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2475",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3715.83,
-    "GAUSS_X": 1978834,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 30.965,
-    "UTM_CM": 27,
-    "UTM_N": 8020780.778,
-    "UTM_E": 284389.815,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2474",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3315.26,
-    "GAUSS_X": 1979083,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.969,
-    "UTM_CM": 27,
-    "UTM_N": 8020536.257,
-    "UTM_E": 284793.101,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2473",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3179.48,
-    "GAUSS_X": 1979178,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 30.97,
-    "UTM_CM": 27,
-    "UTM_N": 8020443.284,
-    "UTM_E": 284929.91,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2472",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2941.96,
-    "GAUSS_X": 1979312,
-    "LAT_WGS84": -17.897,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8020311.837,
-    "UTM_E": 285168.895,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2471",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2023.33,
-    "GAUSS_X": 1979889,
-    "LAT_WGS84": -17.902,
-    "LON_WGS84": 30.981,
-    "UTM_CM": 27,
-    "UTM_N": 8019744.324,
-    "UTM_E": 286093.823,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2470",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1706.94,
-    "GAUSS_X": 1979583,
-    "LAT_WGS84": -17.9,
-    "LON_WGS84": 30.984,
-    "UTM_CM": 27,
-    "UTM_N": 8020053.793,
-    "UTM_E": 286406.962,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2458",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 8587.66,
-    "GAUSS_X": 1972187,
-    "LAT_WGS84": -17.833,
-    "LON_WGS84": 30.919,
-    "UTM_CM": 27,
-    "UTM_N": 8027376.573,
-    "UTM_E": 279446.141,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2469",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1536.43,
-    "GAUSS_X": 1979403,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 30.985,
-    "UTM_CM": 27,
-    "UTM_N": 8020235.602,
-    "UTM_E": 286575.558,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2459",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 9408.15,
-    "GAUSS_X": 1972577,
-    "LAT_WGS84": -17.836,
-    "LON_WGS84": 30.911,
-    "UTM_CM": 27,
-    "UTM_N": 8026978.269,
-    "UTM_E": 278629.698,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2467",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 986.62,
-    "GAUSS_X": 1978811,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 30.991,
-    "UTM_CM": 27,
-    "UTM_N": 8020833.314,
-    "UTM_E": 287119.075,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2466",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 829.11,
-    "GAUSS_X": 1978649,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 30.992,
-    "UTM_CM": 27,
-    "UTM_N": 8020997.18,
-    "UTM_E": 287274.862,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2465",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 477.23,
-    "GAUSS_X": 1978330,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8021320.188,
-    "UTM_E": 287623.353,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2464",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 214.25,
-    "GAUSS_X": 1978025,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 30.998,
-    "UTM_CM": 27,
-    "UTM_N": 8021627.669,
-    "UTM_E": 287883.092,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2463",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -18.86,
-    "GAUSS_X": 1977813,
-    "LAT_WGS84": -17.884,
-    "LON_WGS84": 31,
-    "UTM_CM": 27,
-    "UTM_N": 8021842.44,
-    "UTM_E": 288113.948,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2462",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -371.34,
-    "GAUSS_X": 1977472,
-    "LAT_WGS84": -17.881,
-    "LON_WGS84": 31.003,
-    "UTM_CM": 27,
-    "UTM_N": 8022187.172,
-    "UTM_E": 288462.807,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2477",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2683.24,
-    "GAUSS_X": 1978168,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 30.975,
-    "UTM_CM": 27,
-    "UTM_N": 8021458.492,
-    "UTM_E": 285415.372,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM247",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13866.4,
-    "GAUSS_X": 1967133,
-    "LAT_WGS84": -17.787,
-    "LON_WGS84": 31.131,
-    "UTM_CM": 27,
-    "UTM_N": 8032671.435,
-    "UTM_E": 301848.077,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2551",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12438.3,
-    "GAUSS_X": 1962832,
-    "LAT_WGS84": -17.748,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8036957.149,
-    "UTM_E": 300374.157,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2509",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1474.09,
-    "GAUSS_X": 1978048,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 30.986,
-    "UTM_CM": 27,
-    "UTM_N": 8021591.744,
-    "UTM_E": 286623.363,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2558",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12787.7,
-    "GAUSS_X": 1960219,
-    "LAT_WGS84": -17.725,
-    "LON_WGS84": 31.121,
-    "UTM_CM": 27,
-    "UTM_N": 8039573.743,
-    "UTM_E": 300695.755,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2557",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12563.8,
-    "GAUSS_X": 1960357,
-    "LAT_WGS84": -17.726,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8039433.538,
-    "UTM_E": 300473.333,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2556",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12303.7,
-    "GAUSS_X": 1960563,
-    "LAT_WGS84": -17.728,
-    "LON_WGS84": 31.116,
-    "UTM_CM": 27,
-    "UTM_N": 8039225.096,
-    "UTM_E": 300215.441,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2555",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12013.6,
-    "GAUSS_X": 1963484,
-    "LAT_WGS84": -17.754,
-    "LON_WGS84": 31.113,
-    "UTM_CM": 27,
-    "UTM_N": 8036299.994,
-    "UTM_E": 299956.349,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2554",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12140.7,
-    "GAUSS_X": 1963416,
-    "LAT_WGS84": -17.754,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8036370.12,
-    "UTM_E": 300082.722,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2560",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13129.1,
-    "GAUSS_X": 1960156,
-    "LAT_WGS84": -17.724,
-    "LON_WGS84": 31.124,
-    "UTM_CM": 27,
-    "UTM_N": 8039640.814,
-    "UTM_E": 301036.492,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2552",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12386.8,
-    "GAUSS_X": 1963108,
-    "LAT_WGS84": -17.751,
-    "LON_WGS84": 31.117,
-    "UTM_CM": 27,
-    "UTM_N": 8036680.001,
-    "UTM_E": 300325.609,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2561",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13273.8,
-    "GAUSS_X": 1960075,
-    "LAT_WGS84": -17.723,
-    "LON_WGS84": 31.125,
-    "UTM_CM": 27,
-    "UTM_N": 8039722.495,
-    "UTM_E": 301180.384,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2550",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12563.4,
-    "GAUSS_X": 1962689,
-    "LAT_WGS84": -17.747,
-    "LON_WGS84": 31.118,
-    "UTM_CM": 27,
-    "UTM_N": 8037101.525,
-    "UTM_E": 300497.749,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM255",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10901.9,
-    "GAUSS_X": 1967738,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8032034.529,
-    "UTM_E": 298889.963,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2549",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12758.3,
-    "GAUSS_X": 1962710,
-    "LAT_WGS84": -17.747,
-    "LON_WGS84": 31.12,
-    "UTM_CM": 27,
-    "UTM_N": 8037082.169,
-    "UTM_E": 300692.853,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2548",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12653.9,
-    "GAUSS_X": 1962569,
-    "LAT_WGS84": -17.746,
-    "LON_WGS84": 31.119,
-    "UTM_CM": 27,
-    "UTM_N": 8037222.472,
-    "UTM_E": 300586.965,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2547",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12319,
-    "GAUSS_X": 1962200,
-    "LAT_WGS84": -17.743,
-    "LON_WGS84": 31.116,
-    "UTM_CM": 27,
-    "UTM_N": 8037588.031,
-    "UTM_E": 300248.125,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2546",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12055.7,
-    "GAUSS_X": 1961867,
-    "LAT_WGS84": -17.74,
-    "LON_WGS84": 31.114,
-    "UTM_CM": 27,
-    "UTM_N": 8037918.271,
-    "UTM_E": 299981.252,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2545",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11790.6,
-    "GAUSS_X": 1961586,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.111,
-    "UTM_CM": 27,
-    "UTM_N": 8038195.911,
-    "UTM_E": 299713.119,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2553",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12295.5,
-    "GAUSS_X": 1963245,
-    "LAT_WGS84": -17.752,
-    "LON_WGS84": 31.116,
-    "UTM_CM": 27,
-    "UTM_N": 8036542.394,
-    "UTM_E": 300235.741,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2569",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14139.2,
-    "GAUSS_X": 1960624,
-    "LAT_WGS84": -17.728,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8039183.58,
-    "UTM_E": 302051.645,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2603",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11792.24,
-    "GAUSS_X": 1971416,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.889,
-    "UTM_CM": 27,
-    "UTM_N": 8028113.491,
-    "UTM_E": 276232.829,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2602",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11768.54,
-    "GAUSS_X": 1971240,
-    "LAT_WGS84": -17.824,
-    "LON_WGS84": 30.889,
-    "UTM_CM": 27,
-    "UTM_N": 8028290.432,
-    "UTM_E": 276254.644,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2601",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11876.86,
-    "GAUSS_X": 1970994,
-    "LAT_WGS84": -17.822,
-    "LON_WGS84": 30.888,
-    "UTM_CM": 27,
-    "UTM_N": 8028534.514,
-    "UTM_E": 276143.685,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2600",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 11382.8,
-    "GAUSS_X": 1970882,
-    "LAT_WGS84": -17.821,
-    "LON_WGS84": 30.893,
-    "UTM_CM": 27,
-    "UTM_N": 8028652.543,
-    "UTM_E": 276636.619,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM26",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -6478.33,
-    "GAUSS_X": 1971299,
-    "LAT_WGS84": -17.825,
-    "LON_WGS84": 31.061,
-    "UTM_CM": 27,
-    "UTM_N": 8028426.187,
-    "UTM_E": 294504.198,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM259",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5603.95,
-    "GAUSS_X": 1966289,
-    "LAT_WGS84": -17.78,
-    "LON_WGS84": 31.053,
-    "UTM_CM": 27,
-    "UTM_N": 8033427.378,
-    "UTM_E": 293576.269,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2559",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13059.1,
-    "GAUSS_X": 1960012,
-    "LAT_WGS84": -17.723,
-    "LON_WGS84": 31.123,
-    "UTM_CM": 27,
-    "UTM_N": 8039783.884,
-    "UTM_E": 300964.971,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2570",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14345.6,
-    "GAUSS_X": 1960838,
-    "LAT_WGS84": -17.73,
-    "LON_WGS84": 31.135,
-    "UTM_CM": 27,
-    "UTM_N": 8038971.558,
-    "UTM_E": 302260.268,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2542",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11364.5,
-    "GAUSS_X": 1961434,
-    "LAT_WGS84": -17.736,
-    "LON_WGS84": 31.107,
-    "UTM_CM": 27,
-    "UTM_N": 8038343.304,
-    "UTM_E": 299285.396,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2568",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14117.4,
-    "GAUSS_X": 1960469,
-    "LAT_WGS84": -17.727,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8039338.262,
-    "UTM_E": 302028.198,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2567",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14200.2,
-    "GAUSS_X": 1960269,
-    "LAT_WGS84": -17.725,
-    "LON_WGS84": 31.134,
-    "UTM_CM": 27,
-    "UTM_N": 8039538.527,
-    "UTM_E": 302108.87,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2566",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14179.5,
-    "GAUSS_X": 1960151,
-    "LAT_WGS84": -17.724,
-    "LON_WGS84": 31.134,
-    "UTM_CM": 27,
-    "UTM_N": 8039656.26,
-    "UTM_E": 302086.856,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2565",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -14147.1,
-    "GAUSS_X": 1960099,
-    "LAT_WGS84": -17.724,
-    "LON_WGS84": 31.133,
-    "UTM_CM": 27,
-    "UTM_N": 8039707.877,
-    "UTM_E": 302053.933,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2564",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13893.3,
-    "GAUSS_X": 1960312,
-    "LAT_WGS84": -17.726,
-    "LON_WGS84": 31.131,
-    "UTM_CM": 27,
-    "UTM_N": 8039492.213,
-    "UTM_E": 301802.36,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2563",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13651.4,
-    "GAUSS_X": 1960068,
-    "LAT_WGS84": -17.723,
-    "LON_WGS84": 31.129,
-    "UTM_CM": 27,
-    "UTM_N": 8039734.228,
-    "UTM_E": 301557.833,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2562",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -13420.2,
-    "GAUSS_X": 1960033,
-    "LAT_WGS84": -17.723,
-    "LON_WGS84": 31.126,
-    "UTM_CM": 27,
-    "UTM_N": 8039766.212,
-    "UTM_E": 301326.34,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM258",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -5561.43,
-    "GAUSS_X": 1963920,
-    "LAT_WGS84": -17.758,
-    "LON_WGS84": 31.052,
-    "UTM_CM": 27,
-    "UTM_N": 8035796.161,
-    "UTM_E": 293508.499,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2519",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1590.64,
-    "GAUSS_X": 1978824,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 30.985,
-    "UTM_CM": 27,
-    "UTM_N": 8020813.602,
-    "UTM_E": 286515.134,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2525",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2093.9,
-    "GAUSS_X": 1979433,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 30.98,
-    "UTM_CM": 27,
-    "UTM_N": 8020199.256,
-    "UTM_E": 286018.354,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2524",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2030.79,
-    "GAUSS_X": 1979406,
-    "LAT_WGS84": -17.898,
-    "LON_WGS84": 30.981,
-    "UTM_CM": 27,
-    "UTM_N": 8020227.526,
-    "UTM_E": 286081.175,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2523A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1947.98,
-    "GAUSS_X": 1978307,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8021327.273,
-    "UTM_E": 286152.205,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2523",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1947.98,
-    "GAUSS_X": 1978307,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8021327.283,
-    "UTM_E": 286152.205,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2522A",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1927.6,
-    "GAUSS_X": 1978532,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8021102.228,
-    "UTM_E": 286175.003,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2522",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1927.63,
-    "GAUSS_X": 1978532,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8021102.277,
-    "UTM_E": 286174.973,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2544",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10813.7,
-    "GAUSS_X": 1961626,
-    "LAT_WGS84": -17.737,
-    "LON_WGS84": 31.102,
-    "UTM_CM": 27,
-    "UTM_N": 8038145.998,
-    "UTM_E": 298736.67,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2520",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1906.27,
-    "GAUSS_X": 1978995,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8020639.397,
-    "UTM_E": 286201.303,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2528",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2886.71,
-    "GAUSS_X": 1979166,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 30.973,
-    "UTM_CM": 27,
-    "UTM_N": 8020458.037,
-    "UTM_E": 285222.588,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2518",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1838.94,
-    "GAUSS_X": 1979097,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.983,
-    "UTM_CM": 27,
-    "UTM_N": 8020538.158,
-    "UTM_E": 286269.735,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2517",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1778.38,
-    "GAUSS_X": 1979144,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 30.983,
-    "UTM_CM": 27,
-    "UTM_N": 8020491.883,
-    "UTM_E": 286330.805,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2516",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 578.29,
-    "GAUSS_X": 1978203,
-    "LAT_WGS84": -17.887,
-    "LON_WGS84": 30.995,
-    "UTM_CM": 27,
-    "UTM_N": 8021445.676,
-    "UTM_E": 287520.925,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2515",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1108.29,
-    "GAUSS_X": 1978070,
-    "LAT_WGS84": -17.886,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8021573.245,
-    "UTM_E": 286989.442,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2514",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1179.54,
-    "GAUSS_X": 1978302,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 30.989,
-    "UTM_CM": 27,
-    "UTM_N": 8021340.337,
-    "UTM_E": 286920.674,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2513",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1103.44,
-    "GAUSS_X": 1978375,
-    "LAT_WGS84": -17.889,
-    "LON_WGS84": 30.99,
-    "UTM_CM": 27,
-    "UTM_N": 8021267.776,
-    "UTM_E": 286997.569,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2512",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1402.18,
-    "GAUSS_X": 1978659,
-    "LAT_WGS84": -17.891,
-    "LON_WGS84": 30.987,
-    "UTM_CM": 27,
-    "UTM_N": 8020981.421,
-    "UTM_E": 286701.835,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2521",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1933.21,
-    "GAUSS_X": 1978824,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 30.982,
-    "UTM_CM": 27,
-    "UTM_N": 8020809.926,
-    "UTM_E": 286172.528,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2534",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2416.28,
-    "GAUSS_X": 1978527,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.977,
-    "UTM_CM": 27,
-    "UTM_N": 8021101.826,
-    "UTM_E": 285686.218,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2154",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 1292.21,
-    "GAUSS_X": 1971452,
-    "LAT_WGS84": -17.826,
-    "LON_WGS84": 30.988,
-    "UTM_CM": 27,
-    "UTM_N": 8028189.726,
-    "UTM_E": 286734.638,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2541",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11648.7,
-    "GAUSS_X": 1961136,
-    "LAT_WGS84": -17.733,
-    "LON_WGS84": 31.11,
-    "UTM_CM": 27,
-    "UTM_N": 8038644.479,
-    "UTM_E": 299566.506,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2540",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11882.2,
-    "GAUSS_X": 1960849,
-    "LAT_WGS84": -17.73,
-    "LON_WGS84": 31.112,
-    "UTM_CM": 27,
-    "UTM_N": 8038934.373,
-    "UTM_E": 299796.929,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM254",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -10976.7,
-    "GAUSS_X": 1967848,
-    "LAT_WGS84": -17.794,
-    "LON_WGS84": 31.103,
-    "UTM_CM": 27,
-    "UTM_N": 8031925.273,
-    "UTM_E": 298965.991,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2539",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11987.3,
-    "GAUSS_X": 1960763,
-    "LAT_WGS84": -17.73,
-    "LON_WGS84": 31.113,
-    "UTM_CM": 27,
-    "UTM_N": 8039021.174,
-    "UTM_E": 299901.162,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2538",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -12236.7,
-    "GAUSS_X": 1960955,
-    "LAT_WGS84": -17.731,
-    "LON_WGS84": 31.115,
-    "UTM_CM": 27,
-    "UTM_N": 8038832.279,
-    "UTM_E": 300152.538,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2537",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2248.06,
-    "GAUSS_X": 1978333,
-    "LAT_WGS84": -17.888,
-    "LON_WGS84": 30.979,
-    "UTM_CM": 27,
-    "UTM_N": 8021298.292,
-    "UTM_E": 285852.368,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2526",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2109.75,
-    "GAUSS_X": 1979102,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.98,
-    "UTM_CM": 27,
-    "UTM_N": 8020530.522,
-    "UTM_E": 285998.946,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2535",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2518.47,
-    "GAUSS_X": 1978476,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.976,
-    "UTM_CM": 27,
-    "UTM_N": 8021151.715,
-    "UTM_E": 285583.47,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2527",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2390.55,
-    "GAUSS_X": 1979143,
-    "LAT_WGS84": -17.896,
-    "LON_WGS84": 30.977,
-    "UTM_CM": 27,
-    "UTM_N": 8020486.154,
-    "UTM_E": 285718.559,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2533",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2395.74,
-    "GAUSS_X": 1978855,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 30.977,
-    "UTM_CM": 27,
-    "UTM_N": 8020774.09,
-    "UTM_E": 285710.279,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2532",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2620.99,
-    "GAUSS_X": 1978861,
-    "LAT_WGS84": -17.893,
-    "LON_WGS84": 30.975,
-    "UTM_CM": 27,
-    "UTM_N": 8020766.162,
-    "UTM_E": 285485.063,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2531",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2803.06,
-    "GAUSS_X": 1978767,
-    "LAT_WGS84": -17.892,
-    "LON_WGS84": 30.974,
-    "UTM_CM": 27,
-    "UTM_N": 8020858.379,
-    "UTM_E": 285301.962,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2530",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3001.58,
-    "GAUSS_X": 1978912,
-    "LAT_WGS84": -17.894,
-    "LON_WGS84": 30.972,
-    "UTM_CM": 27,
-    "UTM_N": 8020710.663,
-    "UTM_E": 285104.982,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM253",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11118.6,
-    "GAUSS_X": 1967720,
-    "LAT_WGS84": -17.793,
-    "LON_WGS84": 31.105,
-    "UTM_CM": 27,
-    "UTM_N": 8032054.881,
-    "UTM_E": 299106.46,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2529",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 3102.84,
-    "GAUSS_X": 1979036,
-    "LAT_WGS84": -17.895,
-    "LON_WGS84": 30.971,
-    "UTM_CM": 27,
-    "UTM_N": 8020585.702,
-    "UTM_E": 285005.039,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2543",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": -11073,
-    "GAUSS_X": 1961644,
-    "LAT_WGS84": -17.738,
-    "LON_WGS84": 31.104,
-    "UTM_CM": 27,
-    "UTM_N": 8038130.685,
-    "UTM_E": 298996.163,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  },
-  {
-    "MONUNUM": "TSM2536",
-    "TOPO": "",
-    "GAUSS_LO": 31,
-    "GAUSS_Y": 2248.56,
-    "GAUSS_X": 1978550,
-    "LAT_WGS84": -17.89,
-    "LON_WGS84": 30.979,
-    "UTM_CM": 27,
-    "UTM_N": 8021080.772,
-    "UTM_E": 285854.202,
-    "DELTA_LAT": "",
-    "DELTA_LON": "",
-    "DELTA_Y": "",
-    "DELTA_X": "",
-    "DELTA_E": "",
-    "DELTA_N": ""
-  }
-]
\ No newline at end of file
@@ -0,0 +1,72 @@
+import shutil
+import sqlite3
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+
+import db_schema
+from db import engine, sqlite_file_name
+from geodetic_monument_finder import create_app
+from geodetic_monument_finder.monuments import bundle, monuments, name_index, spatial_index
+from geodetic_monument_finder.reports import intake, open_reports, reports
+from geodetic_monument_finder.sync import sync
+
+REPO_DATABASE = Path(__file__).resolve().parent.parent / sqlite_file_name
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Path of a scratch copy of database.db that every engine connection uses."""
+    path = tmp_path / sqlite_file_name
+    shutil.copy(REPO_DATABASE, path)
+
+    def connect_to_copy(dialect, connection_record, cargs, cparams):
+        cargs[0] = str(path)
+
+    engine.dispose()
+    event.listen(engine, "do_connect", connect_to_copy)
+    echo, engine.echo = engine.echo, False
+    try:
+        yield path
+    finally:
+        engine.echo = echo
+        event.remove(engine, "do_connect", connect_to_copy)
+        engine.dispose()
+
+
+@pytest.fixture
+def app(database, tmp_path):
+    app = create_app({
+        "TESTING": True,
+        "INTAKE_DIR": str(tmp_path / "intake"),
+        "BUNDLE_DIR": str(tmp_path / "bundle"),
+    })
+    app.register_blueprint(reports.bp)
+    app.register_blueprint(monuments.bp)
+    app.register_blueprint(sync.bp)
+    db_schema.create_all(engine)
+
+    # Per-worker state must not leak between tests' databases
+    for index in (spatial_index.index, name_index.index, open_reports.index):
+        index.reset()
+    enabled, bundle.builder.enabled = bundle.builder.enabled, False
+    try:
+        yield app
+    finally:
+        intake.intake.close()
+        bundle.builder.enabled = enabled
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def connection(database):
+    connection = sqlite3.connect(database)
+    try:
+        yield connection
+    finally:
+        connection.close()
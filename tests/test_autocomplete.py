@@ -0,0 +1,31 @@
+from geodetic_monument_finder.monuments import name_index
+
+
+def _complete(client, q):
+    response = client.get(f"/monuments/autocomplete?q={q}&limit=5")
+    return response, [monument["id"] for monument in response.json["data"]["monuments"]]
+
+
+def test_lookups_run_no_queries(client):
+    name_index.index.warm()
+
+    response, ids = _complete(client, "tsm")
+
+    assert ids
+    assert response.headers["X-Query-Count"] == "0"
+
+
+def test_renames_are_picked_up_on_refresh(client, connection):
+    name_index.index.warm()
+    connection.execute("UPDATE monuments SET monument_name = 'Zzyzx Beacon' WHERE id = 3")
+    connection.commit()
+
+    assert name_index.index.refresh()
+    assert _complete(client, "zzyzx")[1] == [3]
+
+
+def test_condition_writes_keep_the_index(client):
+    name_index.index.warm()
+    client.put("/monuments/condition/3", json={"condition": "MISSING"})
+
+    assert not name_index.index.refresh()
@@ -0,0 +1,55 @@
+import fcntl
+import gzip
+import os
+import shutil
+import sqlite3
+import time
+
+import pytest
+
+from geodetic_monument_finder.monuments import bundle
+from geodetic_monument_finder.reports.intake import intake
+
+
+def _bundled_name(tmp_path, monument_id):
+    copy = tmp_path / "bundle-copy.sqlite"
+    with gzip.open(bundle.builder.path, "rb") as source, open(copy, "wb") as target:
+        shutil.copyfileobj(source, target)
+    with sqlite3.connect(copy) as connection:
+        return connection.execute("SELECT monument_name FROM monuments WHERE id = ?", (monument_id,)).fetchone()[0]
+
+
+@pytest.fixture
+def builder(app, monkeypatch):
+    monkeypatch.setattr(bundle.builder, "enabled", True)
+    monkeypatch.setattr(bundle.builder, "delay", 0)
+    bundle.builder.build()
+    yield bundle.builder
+
+    # Let the background thread finish any build before the database copy goes
+    bundle.builder.enabled = False
+    time.sleep(0.1)
+    with open(os.path.join(bundle.builder.directory, bundle.LOCK_FILE), "w") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+
+
+def test_report_writes_do_not_republish(builder, client):
+    published = os.stat(builder.path).st_mtime_ns
+    client.post("/reports", json={"monument_id": 3, "condition": "MISSING"})
+    intake.flush()
+
+    builder.build()
+
+    assert os.stat(builder.path).st_mtime_ns == published
+
+
+def test_periodic_check_picks_up_writes_made_elsewhere(builder, connection, monkeypatch, tmp_path):
+    monkeypatch.setattr(builder, "check_interval", 0.05)
+    builder.schedule()
+    connection.execute("UPDATE monuments SET monument_name = 'Renamed Elsewhere' WHERE id = 3")
+    connection.commit()
+
+    deadline = time.monotonic() + 5
+    while _bundled_name(tmp_path, 3) != "Renamed Elsewhere":
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
@@ -0,0 +1,77 @@
+import pytest
+
+from geodetic_monument_finder.cache import cache as cache_module
+from geodetic_monument_finder.cache.cache import LocalSharedClient, MemoryCache, SharedCache, cache
+from geodetic_monument_finder.reports.intake import intake
+
+
+def test_shared_cache_invalidation_reaches_every_worker():
+    client = LocalSharedClient()
+    worker_a, worker_b = SharedCache(client), SharedCache(client)
+    worker_a.set("monuments:0:/monuments", ["body", 200], ttl=60)
+
+    assert worker_b.get("monuments:0:/monuments") == ["body", 200]
+    worker_a.incr("monuments:generation")
+    assert worker_b.counter("monuments:generation") == 1
+
+
+def test_local_shared_client_expires_entries(monkeypatch):
+    client = LocalSharedClient()
+    now = [100.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    client.set("key", b"value", ex=10)
+
+    assert client.get("key") == b"value"
+    now[0] += 11
+    assert client.get("key") is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+    memory = MemoryCache(max_entries=2)
+    memory.set("a", 1, ttl=60)
+    memory.set("b", 2, ttl=60)
+    memory.get("a")
+    memory.set("c", 3, ttl=60)
+
+    assert memory.get("a") == 1
+    assert memory.get("b") is None
+
+
+@pytest.fixture
+def shared_app(app):
+    app.config["CACHE_BACKEND"] = "local-shared"
+    cache.init_app(app)
+    return app
+
+
+def test_cached_list_is_invalidated_by_a_condition_update(shared_app):
+    client = shared_app.test_client()
+    url = "/monuments?per_page=5&condition=GOOD&fields=id"
+    first = client.get(url).json["data"]
+    assert client.get(url).json["data"] == first
+
+    client.put(f"/monuments/condition/{first['monuments'][0]['id']}", json={"condition": "DAMAGED"})
+
+    assert client.get(url).json["data"]["total"] == first["total"] - 1
+
+
+def test_report_writes_keep_cached_monuments(shared_app):
+    client = shared_app.test_client()
+    url = "/monuments?per_page=5&fields=id"
+    client.get(url)
+    client.post("/reports", json={"monument_id": 3, "condition": "MISSING"})
+    intake.flush()
+
+    # Version check and revision check only: the page came from the cache
+    assert client.get(url).headers["X-Query-Count"] == "2"
+
+
+def test_writes_outside_the_app_orphan_cached_monuments(shared_app, connection):
+    client = shared_app.test_client()
+    url = "/monuments?per_page=5&condition=GOOD&fields=id"
+    first = client.get(url).json["data"]
+
+    connection.execute("UPDATE monuments SET condition = 'DAMAGED' WHERE id = ?", (first["monuments"][0]["id"],))
+    connection.commit()
+
+    assert client.get(url).json["data"]["total"] == first["total"] - 1
@@ -0,0 +1,14 @@
+def test_etag_answers_not_modified_until_a_write(client):
+    url = "/monuments?per_page=5"
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    client.put("/monuments/condition/1", json={"condition": "DAMAGED"})
+
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_if_modified_since_alone_never_answers_not_modified(client):
+    response = client.get("/monuments?per_page=5", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+
+    assert response.status_code == 200
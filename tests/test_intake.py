@@ -0,0 +1,131 @@
+import glob
+import json
+import os
+
+import pytest
+
+from geodetic_monument_finder.monuments import name_index
+from geodetic_monument_finder.reports import intake as intake_module
+from geodetic_monument_finder.reports.intake import DEAD_LETTER_FILE, intake
+
+
+def _submit(client, monument_id, condition="MISSING"):
+    response = client.post("/reports", json={"monument_id": monument_id, "condition": condition})
+    assert response.status_code == 202
+    return response.json["data"]["intake_id"]
+
+
+def test_submissions_are_acknowledged_then_written(client, connection):
+    before = connection.execute("SELECT count(*) FROM reports").fetchone()[0]
+    intake_id = _submit(client, 3)
+
+    intake.flush()
+    response = client.get(f"/reports/intake/{intake_id}")
+
+    assert response.status_code == 200
+    assert response.json["data"]["monument"]["id"] == 3
+    assert connection.execute("SELECT count(*) FROM reports").fetchone()[0] == before + 1
+    unknown = client.get("/reports/intake/unknown")
+    assert unknown.status_code == 202
+    assert unknown.json["data"]["status"] == "unknown_or_pending"
+
+
+@pytest.mark.parametrize("body, status", [
+    ({"monument_id": 2 ** 63, "condition": "MISSING"}, 400),
+    ({"monument_id": True, "condition": "MISSING"}, 400),
+    ({"monument_id": "3", "condition": "MISSING"}, 400),
+    ({"monument_id": 3, "condition": ""}, 400),
+    ({"monument_id": 999999, "condition": "MISSING"}, 404),
+])
+def test_bad_submissions_are_rejected(client, body, status):
+    assert client.post("/reports", json=body).status_code == status
+
+
+def test_unwritable_record_is_dead_lettered_without_blocking_the_queue(client, app, monkeypatch):
+    upsert = intake_module._upsert_open_report
+
+    def fail_for_monument_8(session, monument_id, condition, count):
+        if monument_id == 8:
+            raise OverflowError("Python int too large to convert to SQLite INTEGER")
+        return upsert(session, monument_id, condition, count)
+
+    monkeypatch.setattr(intake_module, "_upsert_open_report", fail_for_monument_8)
+    poisoned = _submit(client, 8)
+    written = _submit(client, 9)
+    intake.flush()
+
+    assert client.get(f"/reports/intake/{written}").status_code == 200
+    assert client.get(f"/reports/intake/{poisoned}").json["data"]["status"] == "unknown_or_pending"
+    with open(os.path.join(app.config["INTAKE_DIR"], DEAD_LETTER_FILE)) as dead_letter:
+        assert [json.loads(line)["record"]["intake_id"] for line in dead_letter] == [poisoned]
+
+
+def test_recover_replays_a_dead_workers_log_once(client, app, connection):
+    already_written = _submit(client, 3)
+    intake.flush()
+
+    path = os.path.join(app.config["INTAKE_DIR"], "intake-99999-deadbeef.log")
+    with open(path, "w") as log:
+        log.write(json.dumps({"intake_id": already_written, "monument_id": 3, "condition": "MISSING"}) + "\n")
+        log.write(json.dumps({"intake_id": "a" * 32, "monument_id": 4, "condition": "DAMAGED"}) + "\n")
+        log.write(json.dumps({"intake_id": "b" * 32, "monument_id": 2 ** 64, "condition": "DAMAGED"}) + "\n")
+        log.write('{"intake_id": "torn')
+    before = connection.execute("SELECT sum(report_count) FROM reports").fetchone()[0]
+
+    assert intake.recover() == 1
+    assert not os.path.exists(path)
+    assert client.get(f"/reports/intake/{'a' * 32}").json["data"]["condition"] == "DAMAGED"
+    assert connection.execute("SELECT sum(report_count) FROM reports").fetchone()[0] == before + 1
+    assert intake.recover() == 0
+
+
+def test_log_is_emptied_once_the_queue_is_written(client):
+    _submit(client, 3)
+    _submit(client, 4)
+
+    intake.flush()
+
+    assert os.path.getsize(intake._log.name) == 0
+
+
+def test_repeats_are_coalesced_into_report_count(client, connection):
+    intake_ids = [_submit(client, 7) for _ in range(5)]
+    intake.flush()
+    intake_ids += [_submit(client, 7) for _ in range(2)]
+    intake.flush()
+
+    report_ids = {client.get(f"/reports/intake/{intake_id}").json["data"]["id"] for intake_id in intake_ids}
+    assert len(report_ids) == 1
+    assert connection.execute(
+        "SELECT report_count FROM reports WHERE id = ?", (report_ids.pop(),)).fetchone() == (7,)
+
+
+def test_submission_runs_no_queries(client):
+    name_index.index.warm()
+
+    response = client.post("/reports", json={"monument_id": 3, "condition": "MISSING"})
+
+    assert response.status_code == 202
+    assert response.headers["X-Query-Count"] == "0"
+
+
+def test_logs_stay_bounded_while_the_queue_never_empties(client, app, monkeypatch):
+    # Every batch write sees another submission arrive, as under steady load
+    write = intake_module._write
+    log_sizes = []
+
+    def write_while_submitting(records, dead_letter):
+        if len(log_sizes) < 20:
+            intake.submit(3, "MISSING")
+        logs = glob.glob(os.path.join(app.config["INTAKE_DIR"], intake_module.LOG_PATTERN))
+        log_sizes.append(sum(os.path.getsize(path) for path in logs))
+        return write(records, dead_letter)
+
+    monkeypatch.setattr(intake, "max_log_bytes", 1)
+    monkeypatch.setattr(intake_module, "_write", write_while_submitting)
+    line_size = len(json.dumps({"intake_id": "a" * 32, "monument_id": 3, "condition": "MISSING"})) + 1
+    _submit(client, 3)
+    intake.flush()
+
+    assert len(log_sizes) == 21
+    assert max(log_sizes) <= 3 * line_size
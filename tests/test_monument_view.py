@@ -0,0 +1,14 @@
+def test_monument_view_follows_point_updates(client, connection):
+    wgs84_id = connection.execute("SELECT wgs84_id FROM monuments WHERE id = 3").fetchone()[0]
+    connection.execute("UPDATE wgs84points SET wgs84_lat = -17.5, wgs84_lon = 31.5 WHERE id = ?", (wgs84_id,))
+    connection.commit()
+
+    assert connection.execute("SELECT wgs84_lat, wgs84_lon FROM monument_view WHERE id = 3").fetchone() == (-17.5, 31.5)
+    monument = client.get("/monuments/bbox?min_lat=-17.51&min_lon=31.49&max_lat=-17.49&max_lon=31.51").json["data"]
+    assert [row["id"] for row in monument["monuments"]] == [3]
+
+
+def test_monument_view_follows_condition_updates(client, connection):
+    client.put("/monuments/condition/3", json={"condition": "MISSING"})
+
+    assert connection.execute("SELECT condition FROM monument_view WHERE id = 3").fetchone() == ("MISSING",)
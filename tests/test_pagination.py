@@ -0,0 +1,80 @@
+import pytest
+
+from geodetic_monument_finder.pagination.cursor import encode_cursor
+from geodetic_monument_finder.reports.intake import intake
+
+
+def _walk(fetch, key, per_page):
+    """Follow next_cursor from the first page; returns every item seen."""
+    items = []
+    cursor = None
+    while True:
+        data = fetch(per_page, cursor)
+        items.extend(data[key])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            return items
+
+
+def test_monument_cursor_walk_matches_id_order(client, connection):
+    def fetch(per_page, cursor):
+        url = f"/monuments?per_page={per_page}&condition=GOOD&fields=id"
+        return client.get(url + (f"&cursor={cursor}" if cursor else "")).json["data"]
+
+    ids = [monument["id"] for monument in _walk(fetch, "monuments", 97)]
+
+    expected = [row[0] for row in connection.execute(
+        "SELECT id FROM monument_view WHERE condition = 'GOOD' ORDER BY id")]
+    assert ids == expected
+
+
+@pytest.fixture
+def reports(client):
+    for monument_id in range(1, 41):
+        for condition in ("MISSING", "DAMAGED"):
+            client.post("/reports", json={"monument_id": monument_id, "condition": condition})
+    intake.flush()
+    client.put("/reports/resolve/bulk", json={"monument_ids": list(range(1, 11)), "condition": "GOOD"})
+    return client
+
+
+def test_report_cursor_walk_puts_open_reports_first(reports, connection):
+    def fetch(per_page, cursor):
+        url = f"/reports/?per_page={per_page}&fields=id,is_resolved"
+        return reports.get(url + (f"&cursor={cursor}" if cursor else "")).json["data"]
+
+    walked = _walk(fetch, "reports", 7)
+
+    expected = [row[0] for row in connection.execute("SELECT id FROM reports ORDER BY is_resolved, id")]
+    assert [report["id"] for report in walked] == expected
+    assert walked[0]["is_resolved"] is False
+
+
+def test_report_search_cursor_walk(reports, connection):
+    def fetch(per_page, cursor):
+        url = f"/reports/search?per_page={per_page}&fields=id"
+        response = reports.post(url + (f"&cursor={cursor}" if cursor else ""), json={"monument_name": "tsm"})
+        return response.json["data"]
+
+    ids = [report["id"] for report in _walk(fetch, "reports", 3)]
+
+    assert len(ids) == len(set(ids))
+    assert len(ids) == fetch(1, None)["total"]
+
+
+@pytest.mark.parametrize("url", [
+    "/monuments?cursor=not-a-cursor",
+    f"/monuments?cursor={encode_cursor('reports', 0, 1)}",
+    "/reports/?cursor=not-a-cursor",
+])
+def test_invalid_cursor_is_rejected(client, url):
+    assert client.get(url).status_code == 400
+
+
+@pytest.mark.parametrize("per_page, expected", [(0, 1), (-5, 1), (5000, 1000)])
+def test_per_page_is_clamped(client, per_page, expected):
+    response = client.get(f"/monuments?per_page={per_page}&fields=id")
+
+    assert response.status_code == 200
+    assert response.json["data"]["per_page"] == expected
+    assert len(response.json["data"]["monuments"]) == expected
@@ -0,0 +1,59 @@
+import pytest
+
+from geodetic_monument_finder.reports.intake import intake
+
+# (url with {per_page}, queries per request). Every list endpoint runs a
+# fixed number of statements: the dataset version check, the cache's revision
+# check where cached, the page, and its total or eager loads. The count must
+# not grow with the page size.
+LIST_ENDPOINTS = [
+    ("/monuments?per_page={per_page}", 4),
+    ("/monuments?per_page={per_page}&condition=GOOD", 4),
+    ("/monuments?per_page={per_page}&fields=id,monument_name,wgs84points", 4),
+    ("/monuments/nearest?lat=-17.83&lon=31.05&k={per_page}", 2),
+    ("/monuments/bbox?min_lat=-18.5&min_lon=30.5&max_lat=-17.5&max_lon=31.5&per_page={per_page}", 3),
+    ("/reports/?per_page={per_page}", 4),
+    ("/reports/?per_page={per_page}&monument_map=1", 4),
+    ("/reports/?per_page={per_page}&fields=id,condition,monument.monument_name", 3),
+    ("/reports/summary?per_page={per_page}", 3),
+]
+
+
+@pytest.fixture
+def reported(client):
+    for monument_id in range(1, 61):
+        client.post("/reports", json={"monument_id": monument_id, "condition": "MISSING"})
+    intake.flush()
+    return client
+
+
+def _query_count(client, url):
+    response = client.get(url)
+    assert response.status_code == 200
+    return int(response.headers["X-Query-Count"])
+
+
+@pytest.mark.parametrize("url, queries", LIST_ENDPOINTS)
+def test_list_endpoint_query_count(reported, url, queries):
+    # Warm the per-worker indexes so only the request's own queries count
+    _query_count(reported, url.format(per_page=1))
+
+    assert _query_count(reported, url.format(per_page=5)) == queries
+    assert _query_count(reported, url.format(per_page=50)) == queries
+
+
+@pytest.mark.parametrize("url, queries", [("/monuments/search", 4), ("/reports/search", 4)])
+def test_search_query_count(reported, url, queries):
+    for per_page in (5, 50):
+        response = reported.post(f"{url}?per_page={per_page}", json={"monument_name": "tsm"})
+        assert response.status_code == 200
+        assert int(response.headers["X-Query-Count"]) == queries
+
+
+def test_not_modified_costs_one_query(client):
+    etag = client.get("/monuments?per_page=10").headers["ETag"]
+
+    response = client.get("/monuments?per_page=10", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["X-Query-Count"] == "1"
@@ -0,0 +1,62 @@
+"""monument_report_summary stays equal to the reports it summarizes."""
+from geodetic_monument_finder.reports.intake import intake
+
+SUMMARY_FROM_REPORTS = """
+    SELECT monument_id,
+           sum(CASE WHEN is_resolved = 0 AND condition = 'MISSING' THEN report_count ELSE 0 END),
+           sum(CASE WHEN is_resolved = 0 AND condition = 'DAMAGED' THEN report_count ELSE 0 END),
+           sum(report_count)
+    FROM reports GROUP BY monument_id ORDER BY monument_id
+"""
+
+
+def _assert_consistent(connection):
+    summary = connection.execute(
+        "SELECT monument_id, open_missing, open_damaged, total FROM monument_report_summary "
+        "WHERE total > 0 ORDER BY monument_id").fetchall()
+    assert summary == connection.execute(SUMMARY_FROM_REPORTS).fetchall()
+
+
+def _report(client, monument_id, condition, times=1):
+    for _ in range(times):
+        assert client.post("/reports", json={"monument_id": monument_id, "condition": condition}).status_code == 202
+
+
+def test_summary_follows_create_and_resolve(client, connection):
+    _report(client, 5, "MISSING", times=3)
+    _report(client, 5, "DAMAGED")
+    _report(client, 6, "MISSING", times=2)
+    intake.flush()
+    _assert_consistent(connection)
+    assert connection.execute(
+        "SELECT open_missing, open_damaged, total FROM monument_report_summary WHERE monument_id = 5"
+    ).fetchone() == (3, 1, 4)
+
+    client.put("/reports/resolve", json={"monument_id": 5, "condition": "GOOD"})
+    client.put("/reports/resolve/bulk", json={"monument_ids": [6, 7], "condition": "DAMAGED"})
+    _assert_consistent(connection)
+    assert connection.execute(
+        "SELECT open_missing, open_damaged, total FROM monument_report_summary WHERE monument_id = 5"
+    ).fetchone() == (0, 0, 4)
+
+    # A resolved report is closed, so the next one opens a new row
+    _report(client, 5, "MISSING")
+    intake.flush()
+    _assert_consistent(connection)
+    assert connection.execute(
+        "SELECT count(*) FROM reports WHERE monument_id = 5 AND condition = 'MISSING'").fetchone()[0] == 2
+
+
+def test_summary_endpoint_sorts_and_pages(client):
+    _report(client, 1, "MISSING", times=4)
+    _report(client, 2, "MISSING", times=2)
+    _report(client, 3, "DAMAGED", times=3)
+    intake.flush()
+
+    first = client.get("/reports/summary?per_page=2&sort=open_missing&order=desc").json["data"]
+    second = client.get("/reports/summary?per_page=2&page=1&sort=open_missing&order=desc").json["data"]
+
+    assert [row["monument_id"] for row in first["summary"]] == [1, 2]
+    assert first["summary"][0]["open_missing"] == 4
+    assert second["summary"][0]["open_missing"] <= first["summary"][1]["open_missing"]
+    assert client.get("/reports/summary?sort=monument_name").status_code == 400
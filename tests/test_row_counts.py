@@ -0,0 +1,29 @@
+"""rowcounts stays equal to the counts it replaces."""
+from geodetic_monument_finder.reports.intake import intake
+
+
+def _assert_counts_match(connection):
+    counts = dict(connection.execute("SELECT name, count FROM rowcounts"))
+    assert counts["reports"] == connection.execute("SELECT count(*) FROM reports").fetchone()[0]
+    assert counts["monuments"] == connection.execute("SELECT count(*) FROM monuments").fetchone()[0]
+    for condition, count in connection.execute("SELECT condition, count(*) FROM monuments GROUP BY condition"):
+        assert counts[f"monuments.condition.{condition}"] == count
+
+
+def test_counters_follow_writes(client, connection):
+    for monument_id in (5, 6, 7):
+        client.post("/reports", json={"monument_id": monument_id, "condition": "MISSING"})
+    intake.flush()
+    _assert_counts_match(connection)
+
+    client.put("/reports/resolve/bulk", json={"monument_ids": [6, 7], "condition": "DAMAGED"})
+    connection.execute("DELETE FROM reports WHERE monument_id = 5")
+    connection.commit()
+    _assert_counts_match(connection)
+
+
+def test_totals_come_from_the_counters(client, connection):
+    connection.execute("UPDATE rowcounts SET count = 12345 WHERE name = 'monuments'")
+    connection.commit()
+
+    assert client.get("/monuments?per_page=1&fields=id").json["data"]["total"] == 12345
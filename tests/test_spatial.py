@@ -0,0 +1,37 @@
+from geodetic_monument_finder.monuments import spatial_index
+from geodetic_monument_finder.reports.intake import intake
+
+
+def test_bbox_uses_exact_coordinates_at_the_edge(client, connection):
+    lat, lon = connection.execute("SELECT wgs84_lat, wgs84_lon FROM monument_view WHERE id = 3").fetchone()
+
+    def ids(min_lat):
+        url = f"/monuments/bbox?min_lat={min_lat!r}&min_lon={lon!r}&max_lat={lat + 0.01!r}&max_lon={lon!r}&fields=id"
+        return [row["id"] for row in client.get(url).json["data"]["monuments"]]
+
+    assert 3 in ids(lat)
+    # Inside the 32-bit rounding of the R*Tree box, but above the point
+    assert 3 not in ids(lat + 1e-9)
+
+
+def _nearest_id(client, lat, lon):
+    return client.get(f"/monuments/nearest?lat={lat}&lon={lon}&k=1").json["data"]["monuments"][0]["id"]
+
+
+def test_nearest_picks_up_moved_points_on_refresh(client, connection):
+    assert _nearest_id(client, -17.5, 31.5) != 3
+    wgs84_id = connection.execute("SELECT wgs84_id FROM monuments WHERE id = 3").fetchone()[0]
+    connection.execute("UPDATE wgs84points SET wgs84_lat = -17.5, wgs84_lon = 31.5 WHERE id = ?", (wgs84_id,))
+    connection.commit()
+
+    assert spatial_index.index.refresh()
+    assert _nearest_id(client, -17.5, 31.5) == 3
+
+
+def test_condition_and_report_writes_keep_the_tree(client, connection):
+    spatial_index.index.warm()
+    client.put("/monuments/condition/3", json={"condition": "MISSING"})
+    client.post("/reports", json={"monument_id": 3, "condition": "MISSING"})
+    intake.flush()
+
+    assert not spatial_index.index.refresh()
@@ -0,0 +1,14 @@
+def test_sync_returns_changes_and_deletions_since_a_version(client, connection):
+    since = client.get("/sync?since=0").json["data"]["version"]
+    (condition,) = connection.execute("SELECT condition FROM monuments WHERE id = 4").fetchone()
+    changed = "GOOD" if condition != "GOOD" else "DAMAGED"
+
+    client.put("/monuments/condition/4", json={"condition": changed})
+    connection.execute("DELETE FROM reports WHERE id = 1")
+    connection.commit()
+    data = client.get(f"/sync?since={since}").json["data"]
+
+    assert [monument["id"] for monument in data["monuments"]] == [4]
+    assert data["monuments"][0]["condition"] == changed
+    assert [(tombstone["table"], tombstone["id"]) for tombstone in data["tombstones"]] == [("reports", 1)]
+    assert client.get("/sync?since=-1").status_code == 400